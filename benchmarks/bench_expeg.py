@@ -0,0 +1,82 @@
+# -*- coding:utf-8 -*-
+"""
+ExPegParser による expegfiles/expeg.peg の構文解析時間の計測
+
+規則の解析関数をパーサーごとに一度だけ作成して再利用する方式と、
+規則を呼び出すたびに解析関数を作成し直す旧方式とを比較する。
+また、ParserGenerator の direct バックエンドで作成したパーサーとも比較する。
+
+    $ python benchmarks/bench_expeg.py [繰り返し回数]
+"""
+
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import ExPegParser
+from tacparser.parsergenerator import ParserGenerator
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+class _NoReuseDict(dict):
+    """
+    登録した値を保持しない辞書 (旧方式の再現用)
+    """
+    def __setitem__(self, key, value) -> None:
+        pass
+
+
+def load_direct_parser(outdir:str) -> type:
+    """
+    direct バックエンドで ExPeg のパーサーを作成して読み込む
+    """
+    outfilepath = os.path.join(outdir, "expeg_direct.py")
+    ParserGenerator(PEG_FILE, "utf-8").generate_file("ExPegDirect", outfilepath, "direct")
+    spec = importlib.util.spec_from_file_location("expeg_direct", outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ExPegDirect
+
+
+def make_parser(mode:str, direct_class:type) -> ExPegParser:
+    logger = logging.getLogger("bench_expeg")
+    logger.setLevel(logging.CRITICAL)
+    if mode == "direct":
+        return direct_class(logger)
+    parser = ExPegParser(logger)
+    if mode == "rebuild":
+        parser._matchers = _NoReuseDict()
+    return parser
+
+
+def measure(mode:str, count:int, direct_class:type) -> float:
+    parser = make_parser(mode, direct_class)
+    best = float("inf")
+    for _ in range(count):
+        start = time.perf_counter()
+        flg, _ = parser.parse_file(PEG_FILE)
+        best = min(best, time.perf_counter() - start)
+        assert flg
+    return best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as outdir:
+        direct_class = load_direct_parser(outdir)
+        times = {mode: measure(mode, count, direct_class)
+                 for mode in ("rebuild", "reuse", "direct")}
+    print("{:>10} {:>12} {:>10}".format("mode", "best(ms)", "speedup"))
+    for mode, t in times.items():
+        print("{:>10} {:>12.1f} {:>9.2f}x".format(mode, t * 1000, times["rebuild"] / t))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+"""
+選択肢の先頭文字による絞り込み (first dispatch) の有無による構文解析時間の計測
+
+expegfiles/expeg.peg から、絞り込みの有無、backend (combinator / direct) を変えたパーサーを
+一時ディレクトリに生成し、expeg.peg を繰り返した文字列を解析する。
+combinator は ParseVM (use_vm) でも計測する。
+
+    $ python benchmarks/bench_first.py [繰り返し回数]
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+def load_parser(tmpdir:str, backend:str, first_dispatch:bool) -> type:
+    logger = logging.getLogger("bench_first")
+    logger.setLevel(logging.CRITICAL + 1)
+    name = "expeg_{0}_{1}".format(backend, int(first_dispatch))
+    outfilepath = os.path.join(tmpdir, name + ".py")
+    generator = ParserGenerator(PEG_FILE, "utf-8", logger)
+    generator.first_dispatch = first_dispatch
+    generator.generate_file("ExPegParser", outfilepath, backend)
+    spec = importlib.util.spec_from_file_location(name, outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ExPegParser
+
+
+def measure(parser_class:type, contents:str, use_vm:bool) -> float:
+    logger = logging.getLogger("bench_first")
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = parser_class(logger)
+        parser.use_vm = use_vm
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg, _ = parser.parse_string(contents, parser.p_expeg, "ExPeg")
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        contents = fin.read() * count
+
+    print("{:>12} {:>12} {:>12}".format("backend", "plain(ms)", "first(ms)"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for backend, use_vm in (("combinator", False), ("combinator", True), ("direct", False)):
+            times = [measure(load_parser(tmpdir, backend, first_dispatch), contents, use_vm) * 1000
+                     for first_dispatch in (False, True)]
+            print("{:>12} {:>12.1f} {:>12.1f}".format("vm" if use_vm else backend, *times))
+
+
+if __name__ == "__main__":
+    main()
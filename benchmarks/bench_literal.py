@@ -0,0 +1,91 @@
+# -*- coding:utf-8 -*-
+"""
+リテラルのみの選択を一つの正規表現で照合する場合 (literal choice) と、
+リテラルを順に照合する場合の構文解析時間の計測
+
+SQL のキーワードの選択を含む構文規則から、backend (combinator / direct) と
+先頭文字による絞り込み (first dispatch) の有無を変えたパーサーを一時ディレクトリに生成し、
+キーワードと名前を繰り返した文字列を解析する。
+
+    $ python benchmarks/bench_literal.py [単語数]
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+KEYWORDS = ["SELECT", "FROM", "WHERE", "GROUP", "ORDER", "BY", "HAVING", "LIMIT", "OFFSET", "INSERT",
+            "INTO", "VALUES", "UPDATE", "SET", "DELETE", "CREATE", "TABLE", "DROP", "ALTER", "INDEX",
+            "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "ON", "AND", "OR", "NOT", "NULL", "IS", "IN",
+            "LIKE", "BETWEEN", "AS", "DISTINCT", "UNION", "ALL", "CASE", "WHEN", "THEN", "ELSE", "END"]
+
+PEG = "Main <- Spacing? ( Word Spacing? )* _EOF\n" \
+      "Word <- Keyword !r\"[a-zA-Z0-9_]\" / Name\n" \
+      "Keyword <- " + " / ".join(["\"" + k + "\":I" for k in KEYWORDS]) + "\n" \
+      "Name <- r\"[a-zA-Z_][a-zA-Z0-9_]*\"\n" \
+      "Spacing <- r\"\\s+\"\n"
+
+
+def load_parser(tmpdir:str, backend:str, first_dispatch:bool, literal_choice:bool) -> type:
+    logger = logging.getLogger("bench_literal")
+    logger.setLevel(logging.CRITICAL + 1)
+    pegfilepath = os.path.join(tmpdir, "keywords.peg")
+    with open(pegfilepath, "w", encoding="utf-8") as fout:
+        fout.write(PEG)
+    name = "keywords_{0}_{1}_{2}".format(backend, int(first_dispatch), int(literal_choice))
+    outfilepath = os.path.join(tmpdir, name + ".py")
+    generator = ParserGenerator(pegfilepath, "utf-8", logger)
+    generator.first_dispatch = first_dispatch
+    generator.literal_choice = literal_choice
+    generator.generate_file("KeywordsParser", outfilepath, backend)
+    spec = importlib.util.spec_from_file_location(name, outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.KeywordsParser
+
+
+def measure(parser_class:type, contents:str) -> float:
+    logger = logging.getLogger("bench_literal")
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = parser_class(logger)
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg, _ = parser.parse_string(contents, parser.p_main, "Main")
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rnd = random.Random(0)
+    words = [rnd.choice(KEYWORDS).lower() if rnd.random() < 0.5 else "name" + str(i) for i in range(count)]
+    contents = " ".join(words)
+
+    print("{:>18} {:>12} {:>12}".format("backend", "literal(ms)", "regex(ms)"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for backend in ("combinator", "direct"):
+            for first_dispatch in (False, True):
+                times = [measure(load_parser(tmpdir, backend, first_dispatch, literal_choice), contents) * 1000
+                         for literal_choice in (False, True)]
+                name = backend + (" first" if first_dispatch else "")
+                print("{:>18} {:>12.1f} {:>12.1f}".format(name, *times))
+
+
+if __name__ == "__main__":
+    main()
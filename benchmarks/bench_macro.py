@@ -0,0 +1,132 @@
+# -*- coding:utf-8 -*-
+"""
+マクロ (_XXX) の終端ノード作成の時間とメモリの計測
+
+一文字ずつ読み込むマクロの文法から backend (combinator / direct) ごとのパーサーを一時ディレクトリに生成し、
+ソースを繰り返した文字列を解析する。
+combinator は、マクロの本体でも終端ノードを作成し、文字列を連結する場合 (concat) と比較する。
+メモリは tracemalloc の最大使用量を計測する。
+
+    $ python benchmarks/bench_macro.py [繰り返し回数]
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import TerminalNode
+from tacparser.parsergenerator import ParserGenerator
+
+
+GRAMMAR = r"""
+Program <- Spacing? ( Token Spacing? )* _EOF
+
+Token <- Name / Number / String / Symbol
+Name <- _NAME
+Number <- _NUMBER
+String <- _STRING
+Symbol <- _SYMBOL
+
+_NAME <- r"[A-Za-z_]" r"[A-Za-z0-9_]"*
+_NUMBER <- r"[0-9]"+ ( "." r"[0-9]"+ )?
+_STRING <- '"' ( !'"' r"." )* '"'
+_SYMBOL <- "(" / ")" / "=" / "+" / "," / ";"
+
+Spacing <- r"\s+"
+"""
+
+SOURCE = """\
+message = concat("hello, world", user_name, "!");
+total_amount = base_price + 1280.75 + shipping_fee;
+print(message, total_amount, "done");
+"""
+
+
+def load_parser(tmpdir:str, backend:str) -> type:
+    logger = logging.getLogger("bench_macro")
+    logger.setLevel(logging.CRITICAL + 1)
+    name = "macro_{0}".format(backend)
+    pegfilepath = os.path.join(tmpdir, "macro.peg")
+    with open(pegfilepath, "w", encoding="utf-8") as fout:
+        fout.write(GRAMMAR)
+    outfilepath = os.path.join(tmpdir, name + ".py")
+    ParserGenerator(pegfilepath, "utf-8", logger).generate_file("MacroParser", outfilepath, backend)
+    spec = importlib.util.spec_from_file_location(name, outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MacroParser
+
+
+def concat_parser(parser_class:type) -> type:
+    # マクロの本体でも終端ノードを作成し、文字列を連結するパーサー (比較用)
+    class ConcatParser(parser_class):
+        def _trm(self, f):
+            def trm(_f):
+                flg, results = self._get_matcher(_f)()
+                if not flg:
+                    return False, ()
+                termstr = "".join([n.get_str() for n in results])
+                if len(termstr) > 0:
+                    node = TerminalNode(termstr)
+                    node.set_position(self._reader, results[0].startpos, results[-1].endpos,
+                                      self.lazy_linecolumn)
+                    return True, (node,)
+                return True, ()
+
+            return lambda: trm(f)
+
+    return ConcatParser
+
+
+def measure(parser_class:type, contents:str, use_vm:bool) -> tuple[float, int]:
+    logger = logging.getLogger("bench_macro")
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = parser_class(logger)
+        parser.use_vm = use_vm
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg = parser.parse_string(contents, parser.p_program, "Program")[0]
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    parser = parser_class(logger)
+    parser.use_vm = use_vm
+    gc.collect()
+    tracemalloc.start()
+    parser.parse_string(contents, parser.p_program, "Program")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    contents = SOURCE * count
+
+    print("{:>12} {:>8} {:>12} {:>12}".format("backend", "mode", "time(ms)", "peak(KiB)"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for backend in ("combinator", "direct"):
+            parser_class = load_parser(tmpdir, backend)
+            cases = [("slice", parser_class, False)]
+            if backend == "combinator":
+                cases = [("concat", concat_parser(parser_class), False)] + cases \
+                        + [("vm", parser_class, True)]
+            for mode, cls, use_vm in cases:
+                elapsed, peak = measure(cls, contents, use_vm)
+                print("{:>12} {:>8} {:>12.1f} {:>12.1f}".format(backend, mode, elapsed * 1000, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+"""
+メモ化の表の使用メモリと参照時間の計測
+
+規則の番号ごとの表 (成功は位置の辞書、失敗はビット列) を使用する MemoTable と、
+(タイプ名, 位置) のタプルをキーとする旧方式の辞書とを比較する。
+また、メモの件数に上限 (max_memo_entries) を設定した場合の解析時間、削除件数を表示する。
+入力には expegfiles/expeg.peg を繰り返した文字列を使用する。
+
+    $ python benchmarks/bench_memo.py [繰り返し回数]
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import ExPegParser, NonTerminalNode
+from tacparser.memo import BLOCK_BITS, BYTE_MASK
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+class _DictMemoParser(ExPegParser):
+    """
+    (タイプ名, 位置) の辞書でメモ化を行うパーサー (旧方式の再現用)
+    """
+
+    def _create_non_terminal(self, def_function, startpos, typename, rule_id=None):
+        cache_result = self._cache.get((typename, startpos))
+        if cache_result:
+            rc, rr = cache_result
+            if rc:
+                self._reader.set_position(rr[0].endpos)
+            return cache_result
+
+        func = self._get_matcher(def_function)
+        flg, ret = func()
+        if flg:
+            endpos = self._reader.get_position()
+            node = NonTerminalNode(typename, ret)
+            node.nodenum = self._nodenum
+            node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+            self._nodenum += 1
+            self._cache[(typename, startpos)] = True, (node,)
+            return True, (node,)
+
+        self._cache[(typename, startpos)] = False, ()
+        return False, ()
+
+
+def dict_memory_size(cache:dict) -> int:
+    """
+    旧方式の辞書の使用メモリの概算 (ノード、タイプ名の文字列を除く)
+    """
+    size = sys.getsizeof(cache)
+    for key, value in cache.items():
+        size += sys.getsizeof(key) + sys.getsizeof(value)
+        if value[0]:
+            size += sys.getsizeof(value[1])
+    return size
+
+
+def parse(parser:ExPegParser, contents:str) -> float:
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    flg, _ = parser.parse_string(contents, parser.p_expeg, "ExPeg")
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    assert flg
+    return elapsed
+
+
+def lookup_dict(cache:dict, keys:list) -> float:
+    start = time.perf_counter()
+    for typename, pos in keys:
+        cache.get((typename, pos))
+    return time.perf_counter() - start
+
+
+def lookup_memo(tables:dict, keys:list) -> float:
+    # 規則の番号は解析関数の作成時に決まるため、参照時にはタイプ名を使用しない
+    start = time.perf_counter()
+    for rule_id, pos in keys:
+        successes, failures = tables[rule_id]
+        if successes.get(pos) is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logger = logging.getLogger("bench_memo")
+    logger.setLevel(logging.CRITICAL)
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        contents = fin.read() * count
+
+    parser = ExPegParser(logger)
+    dict_parser = _DictMemoParser(logger)
+    t_memo = t_dict = float("inf")
+    for _ in range(3):
+        t_memo = min(t_memo, parse(parser, contents))
+        dict_parser._cache = {}
+        t_dict = min(t_dict, parse(dict_parser, contents))
+
+    keys = list(dict_parser._cache.keys())
+    id_keys = [(parser._rule_ids[typename], pos) for typename, pos in keys]
+    successes, failures = parser._memo.count()
+    assert successes + failures == len(keys)
+
+    print("input : {} chars, memo entries : {} (success {}, failure {})"
+          .format(len(contents), len(keys), successes, failures))
+    print("{:>10} {:>12} {:>12} {:>12}".format("memo", "memory(KiB)", "lookup(ms)", "parse(ms)"))
+    print("{:>10} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+          "dict", dict_memory_size(dict_parser._cache) / 1024,
+          min(lookup_dict(dict_parser._cache, keys) for _ in range(5)) * 1000, t_dict * 1000))
+    print("{:>10} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+          "table", parser._memo.memory_size() / 1024,
+          min(lookup_memo(parser._memo.tables, id_keys) for _ in range(5)) * 1000, t_memo * 1000))
+
+    print("{:>10} {:>12} {:>12} {:>12}".format("max", "peak", "evictions", "parse(ms)"))
+    for max_entries in (100000, 10000, 1000):
+        bounded_parser = ExPegParser(logger)
+        bounded_parser.max_memo_entries = max_entries
+        t_bounded = parse(bounded_parser, contents)
+        stats = bounded_parser.get_parse_stats()
+        print("{:>10} {:>12} {:>12} {:>12.1f}".format(
+              max_entries, stats["memo_peak_entries"], stats["memo_evictions"], t_bounded * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -*- coding:utf-8 -*-
+"""
+parse_files による複数ファイルの並列解析の計測
+
+expegfiles/expeg.peg の写しを一時ディレクトリに作成し、
+1 プロセスで parse_file を繰り返す場合と、ワーカー数を変えた parse_files を比較する。
+
+    $ python benchmarks/bench_parallel.py [ファイル数]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import ExPegParser, parse_files
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+def create_parser() -> ExPegParser:
+    logger = logging.getLogger("bench_parallel")
+    logger.setLevel(logging.CRITICAL)
+    return ExPegParser(logger)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        contents = fin.read()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for i in range(count):
+            path = os.path.join(tmpdir, "expeg{0}.peg".format(i))
+            with open(path, "w", encoding="utf-8") as fout:
+                fout.write(contents)
+            paths.append(path)
+
+        print("{:>16} {:>12}".format("mode", "time(ms)"))
+        parser = create_parser()
+        start = time.perf_counter()
+        for path in paths:
+            flg, _ = parser.parse_file(path, "utf-8", "ExPeg")
+            assert flg
+        print("{:>16} {:>12.1f}".format("sequential", (time.perf_counter() - start) * 1000))
+
+        for workers in (1, 2, 4, os.cpu_count()):
+            for result in ("stats", "tree"):
+                start = time.perf_counter()
+                for res in parse_files(create_parser, paths, workers, typename="ExPeg", result=result,
+                                       chunksize=4, ordered=False):
+                    assert res.success
+                print("{:>16} {:>12.1f}".format("{0} x{1}".format(result, workers),
+                                                (time.perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding:utf-8 -*-
+"""
+Reader.match_regexp のスループット計測
+
+入力サイズを倍々に増やしながら、正規表現のみで入力全体を読み進める。
+スライスを作成する旧方式では入力サイズに対して処理時間が二乗で増加するが、
+pos/endpos を指定する方式では文字数あたりの処理速度がほぼ一定になる。
+
+    $ python benchmarks/bench_reader.py
+"""
+
+import os
+import sys
+import time
+
+import regex
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser.reader import StringReader
+
+
+_reg_token = regex.compile("[a-z]+|[0-9]+", regex.M)
+_reg_space = regex.compile("[ \\n]+", regex.M)
+
+# 旧方式を計測する最大の入力サイズ
+SLICE_MAX_SIZE = 400_000
+
+
+def make_contents(size:int) -> str:
+    line = "select 123 from abc where xyz 4567\n"
+    return line * (size // len(line) + 1)
+
+
+def run_reader(contents:str) -> int:
+    r = StringReader(contents)
+    count = 0
+    while not r.is_end():
+        flg, _ = r.match_regexp(_reg_token, True)
+        if not flg:
+            r.match_regexp(_reg_space, True)
+        count += 1
+    return count
+
+
+def run_slice(contents:str) -> int:
+    # 旧方式 : 読み込みのたびに残りの文字列をスライスする
+    pos = 0
+    count = 0
+    length = len(contents)
+    while pos < length:
+        m = _reg_token.match(contents[pos:])
+        if not m:
+            m = _reg_space.match(contents[pos:])
+        pos += len(m.group(0))
+        count += 1
+    return count
+
+
+def measure(func, contents:str) -> float:
+    start = time.perf_counter()
+    func(contents)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print("{:>10} {:>14} {:>14}".format("chars", "reader(MB/s)", "slice(MB/s)"))
+    for size in [100_000, 200_000, 400_000, 800_000, 1_600_000, 3_200_000]:
+        contents = make_contents(size)
+        t_reader = measure(run_reader, contents)
+        if size <= SLICE_MAX_SIZE:
+            slice_str = "{:>14.2f}".format(len(contents) / measure(run_slice, contents) / 1e6)
+        else:
+            # 旧方式は二乗で遅くなるため、大きな入力では計測しない
+            slice_str = "{:>14}".format("-")
+        print("{:>10} {:>14.2f} {}".format(
+            len(contents), len(contents) / t_reader / 1e6, slice_str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding:utf-8 -*-
+"""
+長い繰り返し (データファイルの行など) の構文解析時間の計測
+
+_rpt で子ノードをリストに追加する方式と、
+タプルを連結する旧方式 (繰り返し回数に対して二乗の複製が発生する) とを比較する。
+
+    $ python benchmarks/bench_repeat.py [行数 ...]
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+import regex
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import Parser
+
+
+class RowsParser(Parser):
+    """
+    Rows <- Row*
+    Row  <- r"[0-9]+" ( "," r"[0-9]+" )* "\\n"
+    """
+
+    _reg_value = regex.compile("[0-9]+")
+
+    def __init__(self, logger:logging.Logger) -> None:
+        Parser.__init__(self, logger)
+        self.top = self.p_rows
+        self.toptypename = "Rows"
+        self.def_dict = {"Rows": self.p_rows, "Row": self.p_row}
+
+    def p_rows(self):
+        return self._rpt(self._p(self.p_row, "Row"), 0)
+
+    def p_row(self):
+        return self._seq(self._r(self._reg_value),
+                         self._rpt(self._seq(self._l(","), self._r(self._reg_value)), 0),
+                         self._l("\n"))
+
+
+class _TupleConcatParser(RowsParser):
+    """
+    タプルを連結して結果を作成するパーサー (旧方式の再現用)
+    """
+
+    def _rpt(self, f, min_num, max_num=-1):
+        def rpt(r, _f, _min_num, _max_num):
+            pos = r.get_position()
+            prev_pos = pos
+            ret = ()
+            i = 0
+            while _max_num < 0 or i < _max_num:
+                flg, results = _f()
+                if not flg or (_max_num < 0 and prev_pos == r.get_position()):
+                    if i >= _min_num:
+                        return True, ret
+                    r.set_position(pos)
+                    return False, ()
+                ret += results
+                prev_pos = r.get_position()
+                i += 1
+            return True, ret
+
+        return lambda: rpt(self._reader, f, min_num, max_num)
+
+
+def measure(cls:type, contents:str) -> float:
+    logger = logging.getLogger("bench_repeat")
+    logger.setLevel(logging.CRITICAL)
+    parser = cls(logger)
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    flg, _ = parser.parse_string(contents, parser.p_rows, "Rows")
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    assert flg
+    return elapsed
+
+
+def main() -> None:
+    counts = [int(a) for a in sys.argv[1:]] or [10000, 20000, 50000]
+    print("{:>10} {:>12} {:>12} {:>10}".format("rows", "tuple(ms)", "list(ms)", "speedup"))
+    for count in counts:
+        contents = "1,2,3\n" * count
+        t_tuple = measure(_TupleConcatParser, contents)
+        t_list = measure(RowsParser, contents)
+        print("{:>10} {:>12.1f} {:>12.1f} {:>9.2f}x".format(
+              count, t_tuple * 1000, t_list * 1000, t_tuple / t_list))
+
+
+if __name__ == "__main__":
+    main()
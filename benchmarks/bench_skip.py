@@ -0,0 +1,127 @@
+# -*- coding:utf-8 -*-
+"""
+読み飛ばし (>>)、先読み (&, !) の中でノードを作成しない解析の時間とメモリの計測
+
+空白とコメントを読み飛ばす文法から backend (combinator / direct) ごとのパーサーを一時ディレクトリに生成し、
+コメントの多いソースを繰り返した文字列を解析する。
+combinator は、読み飛ばし、先読みの中でもノードを作成する場合 (build) と比較する。
+メモリは tracemalloc の最大使用量を計測する。
+
+    $ python benchmarks/bench_skip.py [繰り返し回数]
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+GRAMMAR = r"""
+Program <- >>Spacing? ( Statement >>Spacing? )* _EOF
+
+Statement <- Assign / Call
+Assign <- !Keyword Name >>Spacing? >>"=" >>Spacing? Expr >>Spacing? >>";"
+Call <- Name >>Spacing? >>"(" >>Spacing? Arguments? >>Spacing? >>")" >>Spacing? >>";"
+Arguments <- Expr ( >>Spacing? >>"," >>Spacing? Expr )*
+
+Expr <- Term ( >>Spacing? Operator >>Spacing? Term )*
+Term <- Number / !Keyword Name / "(" >>Spacing? Expr >>Spacing? ")"
+Operator <- r"[-+*/]"
+
+Keyword <- ( "if" / "else" / "while" ) !r"[a-z0-9_]"
+Name <- r"[a-z_][a-z0-9_]*"
+Number <- r"[0-9]+"
+
+Spacing <- ( r"[ \t\r\n]+" / Comment )+
+Comment <- "#" r"[^\n]*" / "/*" ( !"*/" r"[\s\S]" )* "*/"
+"""
+
+SOURCE = """\
+/* 初期値を設定する
+   (複数行のコメント) */
+total = 0;   # 合計
+count = ( 1 + 2 ) * 3 ;
+print( total , count + 1 , ( a - b ) / 2 );
+/* 呼び出し */ update ( total ) ;
+"""
+
+
+def load_parser(tmpdir:str, backend:str) -> type:
+    logger = logging.getLogger("bench_skip")
+    logger.setLevel(logging.CRITICAL + 1)
+    name = "skip_{0}".format(backend)
+    pegfilepath = os.path.join(tmpdir, "skip.peg")
+    with open(pegfilepath, "w", encoding="utf-8") as fout:
+        fout.write(GRAMMAR)
+    outfilepath = os.path.join(tmpdir, name + ".py")
+    ParserGenerator(pegfilepath, "utf-8", logger).generate_file("SkipParser", outfilepath, backend)
+    spec = importlib.util.spec_from_file_location(name, outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.SkipParser
+
+
+def building_parser(parser_class:type) -> type:
+    # 読み飛ばし、先読みの中でもノードを作成するパーサー (比較用)
+    class BuildingParser(parser_class):
+        def _predicate_function(self, f):
+            return f
+
+    return BuildingParser
+
+
+def measure(parser_class:type, contents:str, use_vm:bool) -> tuple[float, int, int]:
+    logger = logging.getLogger("bench_skip")
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = parser_class(logger)
+        parser.use_vm = use_vm
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg = parser.parse_string(contents, parser.p_program, "Program")[0]
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+    nodes = parser.get_parse_stats()["nodes"]
+
+    parser = parser_class(logger)
+    parser.use_vm = use_vm
+    gc.collect()
+    tracemalloc.start()
+    parser.parse_string(contents, parser.p_program, "Program")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, nodes
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    contents = SOURCE * count
+
+    print("{:>12} {:>8} {:>10} {:>12} {:>12}".format("backend", "mode", "nodes", "time(ms)", "peak(KiB)"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for backend in ("combinator", "direct"):
+            parser_class = load_parser(tmpdir, backend)
+            cases = [("skip", parser_class, False)]
+            if backend == "combinator":
+                cases = [("build", building_parser(parser_class), False)] + cases \
+                        + [("vm", parser_class, True)]
+            for mode, cls, use_vm in cases:
+                elapsed, peak, nodes = measure(cls, contents, use_vm)
+                print("{:>12} {:>8} {:>10} {:>12.1f} {:>12.1f}".format(backend, mode, nodes,
+                                                                        elapsed * 1000, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# -*- coding:utf-8 -*-
+"""
+規則の呼び出しの記録 (ParseTracer) による構文解析時間の増加と、記録の件数の計測
+
+記録なし、すべての呼び出しの記録、サンプリング (sample_interval) での記録を比較する。
+入力には expegfiles/expeg.peg を繰り返した文字列を使用する。
+
+    $ python benchmarks/bench_trace.py [繰り返し回数]
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import ExPegParser, ParseTracer
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+def measure(contents:str, sample_interval:"float | None | bool") -> tuple:
+    logger = logging.getLogger("bench_trace")
+    logger.setLevel(logging.CRITICAL)
+    parser = ExPegParser(logger)
+    tracer = None if sample_interval is False else ParseTracer(sample_interval)
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    flg, _ = parser.parse_string(contents, parser.p_expeg, "ExPeg", trace=tracer)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    assert flg
+    return elapsed, 0 if tracer is None else len(tracer.events)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        contents = fin.read() * count
+
+    print("{:>16} {:>12} {:>12}".format("mode", "time(ms)", "events"))
+    for name, sample_interval in [("off", False), ("full", None), ("sample 1ms", 0.001)]:
+        elapsed, events = measure(contents, sample_interval)
+        print("{:>16} {:>12.1f} {:>12}".format(name, elapsed * 1000, events))
+
+
+if __name__ == "__main__":
+    main()
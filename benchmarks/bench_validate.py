@@ -0,0 +1,86 @@
+# -*- coding:utf-8 -*-
+"""
+構文解析 (parse_string) と、ノードを作成しない検証 (validate_string) の時間とメモリの計測
+
+expegfiles/expeg.peg から backend (combinator / direct) ごとのパーサーを一時ディレクトリに生成し、
+expeg.peg を繰り返した文字列を解析する。メモリは tracemalloc の最大使用量を計測する。
+
+    $ python benchmarks/bench_validate.py [繰り返し回数]
+"""
+
+import gc
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+def load_parser(tmpdir:str, backend:str) -> type:
+    logger = logging.getLogger("bench_validate")
+    logger.setLevel(logging.CRITICAL + 1)
+    name = "expeg_{0}".format(backend)
+    outfilepath = os.path.join(tmpdir, name + ".py")
+    ParserGenerator(PEG_FILE, "utf-8", logger).generate_file("ExPegParser", outfilepath, backend)
+    spec = importlib.util.spec_from_file_location(name, outfilepath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ExPegParser
+
+
+def run(parser, contents:str, validate:bool) -> bool:
+    if validate:
+        return parser.validate_string(contents, parser.p_expeg)[0]
+    return parser.parse_string(contents, parser.p_expeg, "ExPeg")[0]
+
+
+def measure(parser_class:type, contents:str, validate:bool) -> tuple[float, int]:
+    logger = logging.getLogger("bench_validate")
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = parser_class(logger)
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg = run(parser, contents, validate)
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    parser = parser_class(logger)
+    gc.collect()
+    tracemalloc.start()
+    run(parser, contents, validate)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        contents = fin.read() * count
+
+    print("{:>12} {:>10} {:>12} {:>12}".format("backend", "mode", "time(ms)", "peak(KiB)"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for backend in ("combinator", "direct"):
+            parser_class = load_parser(tmpdir, backend)
+            for validate in (False, True):
+                elapsed, peak = measure(parser_class, contents, validate)
+                print("{:>12} {:>10} {:>12.1f} {:>12.1f}".format(backend, "validate" if validate else "parse",
+                                                                  elapsed * 1000, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
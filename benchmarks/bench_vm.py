@@ -0,0 +1,64 @@
+# -*- coding:utf-8 -*-
+"""
+解析関数 (再帰呼び出し) と ParseVM (明示的なスタック) の構文解析時間の計測
+
+入力には expegfiles/expeg.peg を繰り返した文字列と、
+括弧の入れ子が深い構文規則の文字列を使用する。
+解析関数で RecursionError になる深さは "-" と表示する。
+
+    $ python benchmarks/bench_vm.py [繰り返し回数]
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tacparser import ExPegParser
+
+
+PEG_FILE = os.path.join(os.path.dirname(__file__), "..", "expegfiles", "expeg.peg")
+
+
+def measure(contents:str, use_vm:bool) -> float:
+    logger = logging.getLogger("bench_vm")
+    logger.setLevel(logging.CRITICAL + 1)
+    elapsed = float("inf")
+    for _ in range(3):
+        parser = ExPegParser(logger)
+        parser.use_vm = use_vm
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        try:
+            flg, _ = parser.parse_string(contents, parser.p_expeg, "ExPeg")
+        except RecursionError:
+            return None
+        finally:
+            gc.enable()
+        assert flg
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with open(PEG_FILE, encoding="utf-8") as fin:
+        inputs = [("expeg x{}".format(count), fin.read() * count)]
+    for depth in (10, 100, 1000):
+        contents = "A <- " + "(" * depth + "'a'" + ")" * depth + "\nB <- 'b'\n"
+        inputs.append(("depth {}".format(depth), contents))
+
+    print("{:>12} {:>12} {:>12}".format("input", "func(ms)", "vm(ms)"))
+    for name, contents in inputs:
+        t_func = measure(contents, False)
+        t_vm = measure(contents, True)
+        print("{:>12} {:>12} {:>12.1f}".format(
+              name, "-" if t_func is None else "{:.1f}".format(t_func * 1000), t_vm * 1000))
+
+
+if __name__ == "__main__":
+    main()
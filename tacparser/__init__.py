@@ -18,6 +18,8 @@ from .exception import (
 
 from .expegparser import ExPegParser
 
+from .memo import MemoTable
+
 from .node import (
     Node, 
     NonTerminalNode, 
@@ -26,15 +28,31 @@ from .node import (
     ReconstructedNode,
 )
 
+from .parallel import (
+    FileResult,
+    parse_files,
+    parse_file_split,
+    serialize_tree,
+    deserialize_tree,
+)
+
 from .parsergenerator import (
     ParserGenerator,
     ParserChecker,
+    FirstCharAnalyzer,
     SyntaxCheckFailedException
 )
 
+from .profiler import RuleHook, RuleProfiler, format_profile
+
 from .reader import (
+    LineIndex,
     Reader,
     FileReader,
     StringReader,
+    MmapFileReader,
 )
 
+from .stream import ParseEventHandler, EventCollector
+
+from .tracer import ParseTracer
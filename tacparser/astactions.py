@@ -4,6 +4,7 @@ from collections.abc import Callable
 from logging import config, getLogger, Logger
 
 from .node import Node, NonTerminalNode
+from .reader import LineIndex
 from .actionsparser import ActionsParser
 
 
@@ -12,7 +13,7 @@ config.fileConfig(os.path.join(os.path.dirname(__file__), 'logging.conf'))
 default_logger = getLogger(__name__)
 
 # 型エイリアス
-ActionFuncType = Callable[[NonTerminalNode, NonTerminalNode]]
+ActionFuncType = Callable[[NonTerminalNode, NonTerminalNode], None]
 SelectResultType = list[ tuple[NonTerminalNode, list[NonTerminalNode] ] ]
 StartSelectorFuncType = Callable[ [NonTerminalNode], SelectResultType ]
 SelectorFuncType = Callable[ [NonTerminalNode],
@@ -33,6 +34,9 @@ class AstActions(object):
         ASTActions 文字列のパーサ
     actions : list[_ActionsDefinition]
         action定義のリスト
+    line_index : LineIndex | None
+        @L, @C, @EL, @EC の条件で使用する行番号、列番号の索引。
+        None の場合、ノードに設定された行番号、列番号を使用する。
 
     Examples
     ----------
@@ -44,7 +48,7 @@ class AstActions(object):
     >>> actions.apply(node)                     # node に対してアクションを実行
 
     """
-    def __init__(self, logger=default_logger) -> None:
+    def __init__(self, logger=default_logger, line_index:LineIndex=None) -> None:
         """
         AstActions の初期化
 
@@ -52,10 +56,13 @@ class AstActions(object):
         ----------
         logger : Logger
             ロガー
+        line_index : LineIndex
+            行番号、列番号の条件で使用する索引 (Parser.get_line_index() など)
         """
         self.logger:Logger = logger
         self.parser:ActionsParser = ActionsParser(self.logger)
         self.actions:list[_ActionDefinition] = []
+        self.line_index:LineIndex = line_index
 
     def read_file(self, filepath:str, encoding="utf-8") -> list["_ActionDefinition"]:
         """
@@ -292,8 +299,23 @@ class AstActions(object):
         
         return lambda n: prt(n, conditions)
 
-    @staticmethod
-    def _get_Conditions(conditions_node:NonTerminalNode
+    def _get_start_linecolumn(self, node:Node) -> tuple[int, int]:
+        """
+        ノードの開始位置の行番号、列番号を返す
+        """
+        if self.line_index is None:
+            return node.get_linecolumn()
+        return self.line_index.linecolumn(node.startpos)
+
+    def _get_end_linecolumn(self, node:Node) -> tuple[int, int]:
+        """
+        ノードの終了位置の行番号、列番号を返す
+        """
+        if self.line_index is None:
+            return node.get_end_linecolumn()
+        return self.line_index.linecolumn(node.endpos)
+
+    def _get_Conditions(self, conditions_node:NonTerminalNode
             ) -> tuple[str, list[list[ConditionFuncType]]]:
         
         def _get_Slice_Condition(slice_node:NonTerminalNode) -> ConditionFuncType:
@@ -350,13 +372,13 @@ class AstActions(object):
 
             lmd_lc:Callable[[NonTerminalNode], int] = None
             if lineorcolumn_node.type == "StartLine":
-                lmd_lc = lambda n: n.linenum
+                lmd_lc = lambda n: self._get_start_linecolumn(n)[0]
             elif lineorcolumn_node.type == "StartColumn":
-                lmd_lc = lambda n: n.column
+                lmd_lc = lambda n: self._get_start_linecolumn(n)[1]
             elif lineorcolumn_node.type == "EndLine":
-                lmd_lc = lambda n: n.end_linenum
+                lmd_lc = lambda n: self._get_end_linecolumn(n)[0]
             elif lineorcolumn_node.type == "EndColumn":
-                lmd_lc = lambda n: n.end_column
+                lmd_lc = lambda n: self._get_end_linecolumn(n)[1]
             else:
                 raise ActionException(
                         "LineColumnLimitation の孫ノードに想定していないノード\"{}\"が存在します。"
@@ -1,10 +1,21 @@
 from collections.abc import Callable
 
 import logging
+import os
 import re
+import sys
 
-from .reader import Reader, FileReader, StringReader
+from .exception import ParseException
+from .memo import (MemoTable, SplicedNodes, BLOCK_BITS, BLOCK_BYTES, BYTE_MASK,
+                   set_failure, result_endpos)
+from .reader import Reader, FileReader, StringReader, MmapFileReader, LineIndex
 from .node import Node, NonTerminalNode, TerminalNode, FailureNode, ReconstructedNode
+from .incremental import MemoReach
+from .profiler import RuleProfiler
+from .tracer import ParseTracer
+from .stream import ParseEventHandler, emit_events, node_items
+from .vm import (ParseVM, with_expr, E_SEQ, E_SEL, E_RPT, E_OPT, E_AND, E_NOT, E_SKIP,
+                 E_TRM, E_LIT, E_REG, E_RULE, E_EOF, E_COMMIT)
 
 
 # 標準の Logger
@@ -19,6 +30,10 @@ class Parser(object):
     構文解析を実行するクラス
     """
 
+    #: True の場合、解析で Reader の contents (str) を直接参照する。
+    #: parse_file は mmap_threshold に関わらず MmapFileReader を使用しない (direct バックエンドのパーサー)
+    needs_str_contents = False
+
     def __init__(self, logger:logging.Logger=default_logger) -> None:
         """
         初期化
@@ -31,7 +46,23 @@ class Parser(object):
         self._reader = None     #: 文字列読み込み用 Reader クラス 
         
         self._nodenum = 0       #: ノードの番号
-        self._cache = {}        #: メモ化に使用する辞書
+        self._memo = MemoTable()    #: メモ化に使用する表
+        self._memo_tables = self._memo.tables   #: メモの規則ごとの表 (_memo.tables)
+        self._memo_entries = 0  #: メモの件数
+        self._memo_limit = sys.maxsize  #: メモの件数の上限 (max_memo_entries)
+        self._stats = {}        #: 解析の統計情報
+        self._rule_ids = {}     #: タイプ名 -> 規則の番号 (メモの表の参照に使用する)
+        self._matchers = {}     #: 規則の関数から作成した解析関数の辞書（一度だけ作成して再利用する）
+        self._recognizers = {}  #: ノードを作成しない解析関数の辞書 (読み飛ばし、先読み、検証で使用する)
+        self._streamers = {}    #: イベントの送信 (stream_file, stream_string) で使用する解析関数の辞書
+        self._stream_handler = None #: イベントを受け取る ParseEventHandler
+        self._stream_depth = 0  #: 実行中の、バックトラックで結果を取り消しうる式の数 (0 の場合はイベントを送信する)
+        self._stream_memo_limit = 0 #: 送信済みの位置より前のメモを破棄するメモの件数
+        self._vm = None         #: 構文規則を明示的なスタックで実行する ParseVM (use_vm=True の場合に作成する)
+        self._rule_hooks = []   #: 解析中に規則の呼び出しを置き換えている RuleHook (profile, trace 指定時)
+        self._memo_reach = None #: メモの参照範囲 (incremental=True の場合に解析時に作成する)
+        self._root_rule = None  #: 直前の構文解析の (起点の関数, タイプ名)。reparse で使用する
+        self._keep = None       #: ノードを作成するタイプ名の集合 (構文解析の keep)、None の場合はすべて作成する
         self.toptypename = ""   #: ルートの規則名（大抵、言語名）
 
         self._parser = None     #: 構文解析を実行するパーサー
@@ -41,20 +72,51 @@ class Parser(object):
         self.def_dict = {}          #: 構文の辞書
         self.def_bk_dict = {}       #: サブ構文の辞書
         self.def_subtypename = []   #: サブ構文のタイプ名
+        #: 左再帰の規則 (タイプ名 -> 左再帰の起点の規則の場合 True, 起点から呼び出される規則の場合 False)
+        self.left_recursion = {}
+        self._lr_seeds = {}         #: 成長中の左再帰の種 ((規則の番号, 開始位置) -> ノードのタプル | None)
+        #: 既に他のノードの子であったノードと元の親ノードのリスト (解析の終了時に親ノード、隣接ノードを設定し直す)
+        self._relinked = []
+
+        #: True の場合、ノードの行番号、列番号を最初の参照時に計算する
+        self.lazy_linecolumn = False
+        #: parse_file で MmapFileReader を使用するファイルサイズ（バイト）の下限、None の場合は使用しない
+        self.mmap_threshold = 64 * 1024 * 1024
+        #: メモの件数の上限、超えた場合は現在位置より前のメモを削除する。None の場合は上限なし
+        self.max_memo_entries = None
+        #: True の場合、構文規則を命令列に変換して明示的なスタックで実行する (ParseVM)。
+        #: 入れ子の深い入力でも RecursionError にならない
+        self.use_vm = False
+        #: True の場合、解析時にメモの参照範囲を記録し、reparse で編集後の文字列を差分で再解析できる。
+        #: 記録のため解析は遅くなり、ParseVM (use_vm) は使用しない
+        self.incremental = False
+        #: stream_file, stream_string で、イベントを送信済みの位置より前のメモを破棄するメモの件数
+        self.stream_memo_entries = 10000
 
         self.type_stack = []        # debug用 type stack
 
 
-    def __initialize(self) -> None:
-        self._nodenum = 0       # ノードの番号
-        self._cache = {}        # メモ化に使用する辞書
+    def __initialize(self, reuse_memo:bool=False) -> None:
+        if not reuse_memo:
+            self._nodenum = 0       # ノードの番号
+            self._memo.clear()      # メモ化に使用する表
+            self._memo_entries = 0  # メモの件数
+        self._memo_limit = sys.maxsize if self.max_memo_entries is None else self.max_memo_entries
         self.type_stack = []    # debug用 type stack
+        self._lr_seeds = {}     # 成長中の左再帰の種
+        self._relinked = []     # 複数のノードの子になったノード
 
         # サブ構文を持つ関数の辞書から、関数を初期化
         if hasattr(self, "def_bk_dict"):
             for def_key, def_func in self.def_bk_dict.items():
                 setattr(self, def_key, def_func)
 
+    def __reset_stats(self) -> None:
+        self._stats = {"memo_evictions": 0,         # 削除したメモの件数
+                       "memo_eviction_runs": 0,     # メモの削除の実行回数
+                       "memo_peak_entries": 0,      # メモの件数の最大値
+                       "commits": 0}                # 確定 (~) の実行回数
+
 
     def get_tree(self) -> "Node":
         """
@@ -67,6 +129,26 @@ class Parser(object):
         """
         return self._tree
     
+    def get_parse_stats(self) -> dict:
+        """
+        直前の構文解析 (parse_file, parse_string) の統計情報を返す。
+
+        Returns
+        ----------
+        stats : dict
+            統計情報
+                nodes : 作成した非終端ノードの数 (最後の解析分)
+                memo_entries : 解析終了時のメモの件数
+                memo_peak_entries : メモの件数の最大値 (メモの削除、確定の直前と解析終了時に計測)
+                memo_evictions : 上限を超えた場合、および確定 (~) で削除したメモの件数
+                memo_eviction_runs : 上限を超えたためメモを削除した回数
+                commits : 確定 (~) の実行回数
+        """
+        stats = dict(self._stats)
+        stats["nodes"] = self._nodenum
+        stats["memo_entries"] = self._memo_entries
+        return stats
+
     def get_contents(self, node:Node) -> str:
         """
         引数Nodeの解析結果に相当する元の文字列をそのまま返す。
@@ -85,7 +167,26 @@ class Parser(object):
         """
         return self._reader.get_contents(node.startpos, node.endpos)
 
-    def parse_file(self, filepath:str, encoding:str="utf-8", typename:str="") -> tuple[bool, "Node"]:
+    def get_line_index(self) -> LineIndex:
+        """
+        構文解析対象の文字列の行番号、列番号の索引を返す。
+
+        AstActions の行番号、列番号の条件などで共有して利用できる。
+
+        Returns
+        ----------
+        line_index : LineIndex
+            行番号、列番号の索引
+        """
+        return self._reader.get_line_index()
+
+    def parse_file(self, 
+                   filepath:str, 
+                   encoding:str="utf-8", 
+                   typename:str="", 
+                   profile:bool=False,
+                   trace:ParseTracer=None,
+                   keep:"set[str] | None"=None) -> tuple:
         """
         与えられたファイルパスを指定したエンコードで読み込み、タイプtypename を起点に構文解析を行う
 
@@ -97,6 +198,15 @@ class Parser(object):
             ファイルのエンコード
         typename : str
             起点ノードのタイプ名
+        profile : bool
+            True の場合、規則ごとの統計情報を計測し、3 番目の戻り値として返す。
+            計測中は ParseVM (use_vm) を使用せずに解析関数で解析する
+        trace : ParseTracer
+            指定した場合、規則の開始、終了を記録する (Chrome Trace Event, folded stack 形式で出力できる)。
+            profile と同じく、ParseVM を使用せずに解析する
+        keep : set[str] | None
+            指定した場合、タイプ名が含まれる規則 (とルート、サブ構文) のみ非終端ノードを作成する。
+            それ以外の規則はノードを作成せず、子ノードを最も近い作成する祖先の子として連結する
 
         Returns
         ----------
@@ -104,11 +214,20 @@ class Parser(object):
             構文解析の成功/失敗
         tree : None | Node
             構文解析結果のルートノード
+        profile : dict[str, dict]
+            profile=True の場合のみ。規則ごとの統計情報 (RuleProfiler.get_report)
         """
+        if (profile or trace is not None or self.incremental) and not self._rule_hooks:
+            memo_reach = MemoReach() if self.incremental else None
+            return self.__run_hooked(profile, trace, memo_reach, self.parse_file,
+                                     filepath, encoding, typename, False, None, keep)
+
         self.__logger.debug("parse_file() called. filepath=\"{0}\",encoding={1},typename={2}, class={3}"
                             .format(filepath, encoding, typename, self.__class__))
         try:
-            self._reader = FileReader(filepath, encoding)
+            self._reader = self._create_file_reader(filepath, encoding)
+            self.__reset_stats()
+            self._memo_reach = None
         except (FileNotFoundError, IOError):
             self.__logger.error("Wrong file or file path. \"{0}\"".format(filepath))
             raise
@@ -123,12 +242,14 @@ class Parser(object):
             raise
 
         self.__logger.info("Parsing file  \"{0}\" started. rule:{1}".format(filepath, typename))
+        self._root_rule = (rootexp, typename)
+        self._keep = self.__keep_types(keep)
 
         # ルートの解析実行
         try:
             self._result, self._tree = self._parse(rootexp, typename)
         except RecursionError:
-            self.__logger.critical("RecursionError!")
+            self.__logger.critical("RecursionError! (use_vm=True parses deeply nested input without recursion)")
             return False, None
 
         if not self._result:
@@ -151,7 +272,66 @@ class Parser(object):
         return self._result, self._tree
 
 
-    def parse_string(self, string:str, rootexp:Callable, typename:str="") -> tuple[bool, "Node"]:
+    def __keep_types(self, keep:"set[str] | None") -> "frozenset[str] | None":
+        """
+        ノードを作成するタイプ名の集合を返す。サブ構文のタイプ名は、再解析するため常に含める。
+        """
+        if keep is None:
+            return None
+        return frozenset(keep).union(self.def_subtypename)
+
+    def _create_file_reader(self, filepath:str, encoding:str) -> Reader:
+        """
+        ファイルを読み込む Reader を作成する。
+        ファイルサイズが mmap_threshold 以上で、メモリマップしたまま解析できる場合は
+        MmapFileReader を、それ以外の場合は FileReader を返す。
+        needs_str_contents が True のパーサーは常に FileReader を返す。
+
+        Parameters
+        ----------
+        filepath : str
+            ファイルパス
+        encoding : str
+            ファイルのエンコード
+
+        Returns
+        ----------
+        reader : Reader
+            ファイルの Reader
+        """
+        if (self.mmap_threshold is not None
+                and not self.needs_str_contents
+                and not self.incremental
+                and MmapFileReader.supports_encoding(encoding)
+                and os.path.getsize(filepath) >= self.mmap_threshold):
+            reader = MmapFileReader(filepath, encoding)
+            if reader.is_usable(self._get_regexps()):
+                self.__logger.debug("MmapFileReader selected. \"{0}\"".format(filepath))
+                return reader
+            reader.close()
+            self.__logger.debug("MmapFileReader is not usable, fall back to FileReader. \"{0}\"".format(filepath))
+
+        return FileReader(filepath, encoding)
+
+    def _get_regexps(self) -> list[re.Pattern]:
+        """
+        構文規則で使用する正規表現（クラス属性 _reg_xxx）のリストを返す
+
+        Returns
+        ----------
+        regs : list[re.Pattern]
+            正規表現のリスト
+        """
+        cls = type(self)
+        return [getattr(cls, name) for name in dir(cls) if name.startswith("_reg_")]
+
+    def parse_string(self, 
+                     string:str, 
+                     rootexp:Callable, 
+                     typename:str="", 
+                     profile:bool=False,
+                     trace:ParseTracer=None,
+                     keep:"set[str] | None"=None) -> tuple:
         """
         与えられた文字列を読み込み、関数 fを起点に構文解析を行う
 
@@ -163,6 +343,12 @@ class Parser(object):
             構文解析の起点となる式
         typename : str
             起点ノードのタイプ名
+        profile : bool
+            True の場合、規則ごとの統計情報を計測し、3 番目の戻り値として返す (parse_file と同じ)
+        trace : ParseTracer
+            指定した場合、規則の開始、終了を記録する (parse_file と同じ)
+        keep : set[str] | None
+            指定した場合、タイプ名が含まれる規則のみ非終端ノードを作成する (parse_file と同じ)
 
         Returns
         ----------
@@ -170,11 +356,22 @@ class Parser(object):
             構文解析の成功/失敗
         tree : None | Node
             構文解析結果のルートノード
+        profile : dict[str, dict]
+            profile=True の場合のみ。規則ごとの統計情報 (RuleProfiler.get_report)
         """
+        if (profile or trace is not None or self.incremental) and not self._rule_hooks:
+            memo_reach = MemoReach() if self.incremental else None
+            return self.__run_hooked(profile, trace, memo_reach, self.parse_string,
+                                     string, rootexp, typename, False, None, keep)
+
         self._reader = StringReader(string)
+        self.__reset_stats()
+        self._memo_reach = None
 
         if not typename:
             typename = self.toptypename
+        self._root_rule = (rootexp, typename)
+        self._keep = self.__keep_types(keep)
 
         self._result, self._tree = self._parse(rootexp, typename)
 
@@ -183,6 +380,359 @@ class Parser(object):
 
         return self._result, self._tree
 
+    def validate_file(self, 
+                      filepath:str, 
+                      encoding:str="utf-8", 
+                      typename:str="") -> tuple[bool, dict]:
+        """
+        与えられたファイルが構文に適合するかを検証する。
+
+        parse_file と同じ規則で解析するが、ノードを作成せず、位置とメモ (成功時は終了位置) のみを記録する。
+        構文解析木、サブ構文の解析の結果は作成しない。ParseVM (use_vm) は使用しない。
+
+        Parameters
+        ----------
+        filepath : str
+            ファイルパス
+        encoding : str
+            ファイルのエンコード
+        typename : str
+            起点の規則のタイプ名
+
+        Returns
+        ----------
+        result : boolean
+            検証の成功/失敗
+        diagnostics : dict | None
+            最大到達位置の情報 (RecursionError の場合は None)
+                endpos : 成功時の終了位置、失敗時は -1
+                maxposition : 最大到達位置
+                linenum : 最大到達位置の行番号
+                column : 最大到達位置の列番号
+        """
+        self.__logger.debug("validate_file() called. filepath=\"{0}\",encoding={1},typename={2}, class={3}"
+                            .format(filepath, encoding, typename, self.__class__))
+        try:
+            self._reader = self._create_file_reader(filepath, encoding)
+        except (FileNotFoundError, IOError):
+            self.__logger.error("Wrong file or file path. \"{0}\"".format(filepath))
+            raise
+
+        if not typename:
+            typename = self.toptypename
+
+        try:
+            rootexp = self.def_dict[typename]
+        except KeyError:
+            self.__logger.critical("TypeName \"{0}\" was not found".format(typename))
+            raise
+
+        try:
+            result, diagnostics = self.__validate(rootexp)
+        except RecursionError:
+            self.__logger.critical("RecursionError! (use_vm=True parses deeply nested input without recursion)")
+            return False, None
+
+        if not result:
+            self.__logger.error("Validation failed. \"{0}\" ( maxposition is line:{1} column:{2})"
+                                .format(filepath, diagnostics["linenum"], diagnostics["column"]))
+        return result, diagnostics
+
+    def validate_string(self, string:str, rootexp:Callable) -> tuple[bool, dict]:
+        """
+        与えられた文字列が、関数 rootexp を起点とする構文に適合するかを検証する (validate_file と同じ)
+
+        Parameters
+        ----------
+        string : str
+            検証対象文字列
+        rootexp : Callable
+            構文解析の起点となる式
+
+        Returns
+        ----------
+        result : boolean
+            検証の成功/失敗
+        diagnostics : dict
+            最大到達位置の情報 (validate_file と同じ)
+        """
+        self._reader = StringReader(string)
+        return self.__validate(rootexp)
+
+    def __validate(self, rootexp:Callable) -> tuple[bool, dict]:
+        """
+        起点の規則のノードを作成しない解析関数 (_get_recognizer) で、構文解析を実行する。
+        """
+        self.__reset_stats()
+        self._memo_reach = None
+        self._root_rule = None      # メモの内容が異なるため、reparse できない
+        self._tree = None
+        self.__initialize()
+
+        self._result = self._get_recognizer(rootexp)()[0]
+        self.__update_peak_entries()
+
+        reader = self._reader
+        maxposition = reader.getmaxposition()
+        linenum, column, _ = reader.getmaxlinecolumn()
+        return self._result, {"endpos": reader.get_position() if self._result else -1,
+                              "maxposition": maxposition,
+                              "linenum": linenum,
+                              "column": column}
+
+    def stream_file(self, 
+                    filepath:str, 
+                    handler:ParseEventHandler, 
+                    encoding:str="utf-8", 
+                    typename:str="") -> tuple[bool, dict]:
+        """
+        与えられたファイルを構文解析し、構文解析木を作成せずに規則の開始、終了、終端のイベントを handler に送信する。
+
+        イベントは、その範囲を取り消しうる選択、繰り返し、オプションの実行が終わった時点で、入力の順に送信する。
+        送信済みの位置より前のメモは破棄するため (stream_memo_entries)、繰り返しの多い大きなファイルも
+        一定のメモリで処理できる。解析に失敗した場合も、失敗までに確定したイベントは送信済みになる。
+        サブ構文の解析は行わない。ParseVM (use_vm) は使用しない。
+        direct バックエンドのパーサーはノードを作成し、規則の関数の終了後にイベントを送信する。
+
+        Parameters
+        ----------
+        filepath : str
+            ファイルパス
+        handler : ParseEventHandler
+            イベントを受け取るクラス
+        encoding : str
+            ファイルのエンコード
+        typename : str
+            起点の規則のタイプ名
+
+        Returns
+        ----------
+        result : boolean
+            構文解析の成功/失敗
+        diagnostics : dict | None
+            最大到達位置の情報 (validate_file と同じ。RecursionError の場合は None)
+        """
+        self.__logger.debug("stream_file() called. filepath=\"{0}\",encoding={1},typename={2}, class={3}"
+                            .format(filepath, encoding, typename, self.__class__))
+        try:
+            self._reader = self._create_file_reader(filepath, encoding)
+        except (FileNotFoundError, IOError):
+            self.__logger.error("Wrong file or file path. \"{0}\"".format(filepath))
+            raise
+
+        if not typename:
+            typename = self.toptypename
+
+        try:
+            rootexp = self.def_dict[typename]
+        except KeyError:
+            self.__logger.critical("TypeName \"{0}\" was not found".format(typename))
+            raise
+
+        try:
+            result, diagnostics = self.__stream(rootexp, typename, handler)
+        except RecursionError:
+            self.__logger.critical("RecursionError! (use_vm=True parses deeply nested input without recursion)")
+            return False, None
+
+        if not result:
+            self.__logger.error("Parsing failed. \"{0}\" ( maxposition is line:{1} column:{2})"
+                                .format(filepath, diagnostics["linenum"], diagnostics["column"]))
+        return result, diagnostics
+
+    def stream_string(self, 
+                      string:str, 
+                      rootexp:Callable, 
+                      handler:ParseEventHandler, 
+                      typename:str="") -> tuple[bool, dict]:
+        """
+        与えられた文字列を関数 rootexp を起点に構文解析し、イベントを handler に送信する (stream_file と同じ)
+
+        Parameters
+        ----------
+        string : str
+            構文解析対象文字列
+        rootexp : Callable
+            構文解析の起点となる式
+        handler : ParseEventHandler
+            イベントを受け取るクラス
+        typename : str
+            起点の規則のタイプ名
+
+        Returns
+        ----------
+        result : boolean
+            構文解析の成功/失敗
+        diagnostics : dict
+            最大到達位置の情報 (validate_file と同じ)
+        """
+        self._reader = StringReader(string)
+        return self.__stream(rootexp, typename or self.toptypename, handler)
+
+    def __stream(self, rootexp:Callable, typename:str, handler:ParseEventHandler) -> tuple[bool, dict]:
+        """
+        ノードを作成する関数をイベントを送信する関数に置き換えて、構文解析を実行する。
+        置き換えはインスタンス属性のみのため、parse_file などの解析処理には影響しない。
+        """
+        self.__reset_stats()
+        self._memo_reach = None
+        self._root_rule = None      # メモの内容が異なるため、reparse できない
+        self._tree = None
+        self.__initialize()
+        self._stream_handler = handler
+        self._stream_depth = 0
+        self._stream_memo_limit = self.stream_memo_entries
+
+        replaced = {"_l": self._stream_literal,
+                    "_r": self._stream_regexp,
+                    "_trm": self._stream_terminal,
+                    "_sel": self._stream_select,
+                    "_rpt": self._stream_repeat,
+                    "_opt": self._stream_option,
+                    "_and": self._stream_and,
+                    "_not": self._stream_not,
+                    "_skip": self._stream_skip,
+                    "_create_non_terminal": self._stream_non_terminal,
+                    "_create_left_recursive": self._stream_left_recursive,
+                    "_create_non_memo": self._stream_non_memo,
+                    "_direct": self._stream_direct}
+        matchers = self._matchers
+        self._matchers = self._streamers
+        for name, func in replaced.items():
+            setattr(self, name, func)
+        reader = self._reader
+        startpos = reader.get_position()
+        try:
+            handler.enter(typename, startpos)
+            self._result = self._get_matcher(rootexp)()[0]
+            if self._result:
+                handler.exit(typename, startpos, reader.get_position())
+        finally:
+            for name in replaced:
+                delattr(self, name)
+            self._matchers = matchers
+            self._stream_handler = None
+        self.__update_peak_entries()
+
+        maxposition = reader.getmaxposition()
+        linenum, column, _ = reader.getmaxlinecolumn()
+        return self._result, {"endpos": reader.get_position() if self._result else -1,
+                              "maxposition": maxposition,
+                              "linenum": linenum,
+                              "column": column}
+
+    def __run_hooked(self, 
+                     profile:bool, 
+                     trace:ParseTracer, 
+                     memo_reach:MemoReach, 
+                     parse:Callable, 
+                     *args) -> tuple:
+        """
+        規則ごとの統計情報の計測、規則の開始、終了の記録、メモの参照範囲の記録を行って構文解析を行う
+
+        Parameters
+        ----------
+        profile : bool
+            True の場合、規則ごとの統計情報を計測する
+        trace : ParseTracer
+            規則の開始、終了を記録する ParseTracer、None の場合は記録しない
+        memo_reach : MemoReach
+            メモの参照範囲を記録する MemoReach、None の場合は記録しない
+        parse : Callable
+            構文解析を行う関数 (parse_file, parse_string)
+        args : tuple
+            parse の引数
+
+        Returns
+        ----------
+        result : boolean
+            構文解析の成功/失敗
+        tree : None | Node
+            構文解析結果のルートノード
+        profile : dict[str, dict]
+            profile=True の場合のみ。規則ごとの統計情報
+        """
+        if memo_reach is not None:
+            self._rule_hooks.append(memo_reach)
+        if trace is not None:
+            self._rule_hooks.append(trace)
+        if profile:
+            self._rule_hooks.append(RuleProfiler())
+        for hook in self._rule_hooks:
+            hook.install(self)
+        try:
+            result, tree = parse(*args)
+        finally:
+            for hook in reversed(self._rule_hooks):
+                hook.uninstall()
+            hooks = self._rule_hooks
+            self._rule_hooks = []
+        self._memo_reach = memo_reach
+
+        if profile:
+            return result, tree, hooks[-1].get_report()
+        return result, tree
+
+    def reparse(self, edits:list[tuple[int, int, str]]) -> tuple[bool, "Node"]:
+        """
+        直前の構文解析 (incremental=True の parse_file, parse_string, reparse) の文字列を編集し、差分で再解析する。
+
+        編集の範囲を参照していないメモを再利用し、編集位置より後ろのメモとノードは位置を移動して使用する。
+        規則を再度実行するのは、編集の範囲を参照した規則と、それを呼び出す規則のみになる。
+        再利用したノードは、直前の構文解析の構文木と共有する。
+        多重解析 (サブ構文) を持つパーサー、direct バックエンドのパーサーの場合は、編集後の文字列全体を解析する。
+
+        Parameters
+        ----------
+        edits : list[tuple[int, int, str]]
+            編集 (編集位置, 削除する文字数, 挿入する文字列) のリスト。
+            編集位置は、リストの前の編集を適用した後の文字列の位置
+
+        Returns
+        ----------
+        result : boolean
+            構文解析の成功/失敗
+        tree : None | Node
+            構文解析結果のルートノード
+        """
+        if self._memo_reach is None or self._root_rule is None:
+            raise ParseException("reparse() requires a previous parse with incremental=True")
+
+        reader = self._reader
+        contents = reader.get_contents(0, reader.length)
+        versions = []       # 各編集の後の文字列
+        for offset, deleted, inserted in edits:
+            if offset < 0 or deleted < 0 or offset + deleted > len(contents):
+                raise ValueError("Edit out of range. offset={0}, deleted={1}".format(offset, deleted))
+            newlines = "\n" in inserted or "\n" in contents[offset:offset + deleted]
+            contents = contents[:offset] + inserted + contents[offset + deleted:]
+            versions.append((contents, newlines))
+
+        rootexp, typename = self._root_rule
+        # direct バックエンドの規則は、生成したコードの中でメモを参照するため、
+        # メモを使用した規則の参照範囲を呼び出し元に反映できない
+        if self.def_subtypename or any(hasattr(self, "d_" + name.lower()) for name in self._rule_ids):
+            return self.parse_string(contents, rootexp, typename, keep=self._keep)
+
+        memo_reach = self._memo_reach
+        for (offset, deleted, inserted), (version, newlines) in zip(edits, versions):
+            self._memo_entries = memo_reach.apply_edit(self._memo, offset, deleted, len(inserted), newlines)
+            # 移動したノードの行番号、列番号を、次の編集でメモが削除される前に、この編集の後の文字列で求める
+            self._reader = StringReader(version)
+            for node in memo_reach.moved.values():
+                node.set_position(self._reader, node.startpos, node.endpos, self.lazy_linecolumn)
+            memo_reach.moved = {}
+
+        self.__reset_stats()
+        self.__logger.debug("reparse() called. edits={0}, reused memo={1}".format(len(edits), self._memo_entries))
+        self._result, self._tree = self.__run_hooked(False, None, memo_reach, self._parse,
+                                                     rootexp, typename, None, True)
+        if not self._result:
+            # 再利用したメモの規則の到達位置は最大到達位置に反映されないため、
+            # 失敗時は全体を解析して最大到達位置 (失敗の位置) を求める
+            return self.parse_string(contents, rootexp, typename, keep=self._keep)
+        return self._result, self._tree
+
     def sub_parse(self, subdef_name:str) -> ParseResult:
         """
         多重解析を実行する
@@ -226,13 +776,21 @@ class Parser(object):
                     newbros.append(n)
 
             node.parent.children = tuple(newbros)
+            # 入れ替えたノードと、その隣接ノードの隣接ノードを設定する
+            chg_node.left_neighbor = node.left_neighbor
+            chg_node.right_neighbor = node.right_neighbor
+            if node.left_neighbor is not None:
+                node.left_neighbor.right_neighbor = chg_node
+            if node.right_neighbor is not None:
+                node.right_neighbor.left_neighbor = chg_node
 
         return retflg, result_list
 
     def _parse(self, 
                 f:Callable[ [], ParseFunction], 
                 typename:str, 
-                end_pos:int=None
+                end_pos:int=None,
+                reuse_memo:bool=False
             ) -> tuple[bool, "Node"]:
         """
         構文解析を実行する。
@@ -245,6 +803,8 @@ class Parser(object):
             ルートノードのタイプ名
         end_pos : int
             対象文字列の指定の位置まで解析する場合に指定。再解析時に使用
+        reuse_memo : bool
+            True の場合、メモとノードの番号を初期化せずに解析する。差分の再解析 (reparse) 時に使用
 
         Returns
         ----------
@@ -253,20 +813,28 @@ class Parser(object):
         tree : None | Node
             構文解析結果のルートノード
         """
-        self.__initialize()
-        func = f()      # 起点の関数を取得
+        self.__initialize(reuse_memo)
         startpos = self._reader.get_position()  # 開始位置
 
         stacktype = typename if end_pos is None else "Sub:" + typename
         self.type_stack.append(stacktype)
 
-        flg, ret = func()       # 構文解析の実行
+        if self.use_vm and not self._rule_hooks:
+            # 明示的なスタックで実行する (規則の呼び出しでは type_stack を更新しない)
+            if self._vm is None:
+                self._vm = ParseVM(self)
+            flg, ret = self._vm.run(f)
+        else:
+            func = self._get_matcher(f)     # 起点の関数を取得
+            flg, ret = func()       # 構文解析の実行
         self.type_stack.pop()
+        self.__update_peak_entries()
         if flg and (end_pos is None or end_pos == self._reader.getmaxposition()):
             endpos = self._reader.get_position()
-            node = NonTerminalNode(typename, ret)
-            node.set_position(self._reader, startpos, endpos)
-            self.__complete_tree(node)
+            node = NonTerminalNode(typename, tuple(ret) if ret.__class__ is SplicedNodes else ret)
+            node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+            self._link_children(node)
+            self.__resolve_links(node)
 
             return flg, node
         else:
@@ -275,37 +843,110 @@ class Parser(object):
             node = FailureNode(s)
             node.set_position(self._reader, 0, self._reader.getmaxposition())
 
+            self._relinked = []
             return False, node
 
-    def __complete_tree(self, root:Node) -> None:
+    def __update_peak_entries(self) -> None:
+        if self._memo_entries > self._stats.get("memo_peak_entries", 0):
+            self._stats["memo_peak_entries"] = self._memo_entries
+
+    def _evict_memo(self, pos:int) -> None:
+        """
+        メモの件数が上限 (max_memo_entries) を超えた場合に、メモを削除する。
+        位置 pos より前のメモを削除し、それでも上限の半分を超える場合はすべて削除する。
+        削除したメモの規則は再度解析されるため、結果は変わらない。
+
+        Parameters
+        ----------
+        pos : int
+            現在の位置
+        """
+        self.__update_peak_entries()
+        evicted = self._memo.evict_before(pos)
+        successes, failures = self._memo.count()
+        remaining = successes + failures
+        if remaining > self._memo_limit // 2:
+            # 現在位置より後ろのメモが多い場合は、すべて削除する
+            self._memo.clear()
+            evicted += remaining
+            remaining = 0
+
+        self._memo_entries = remaining
+        self._stats["memo_evictions"] = self._stats.get("memo_evictions", 0) + evicted
+        self._stats["memo_eviction_runs"] = self._stats.get("memo_eviction_runs", 0) + 1
+        self.__logger.debug("Memo evicted. position={0}, evicted={1}, remaining={2}"
+                            .format(pos, evicted, remaining))
+
+    def _commit_memo(self, pos:int) -> None:
+        """
+        確定 (~) の位置より前のメモを破棄する。
+
+        Parameters
+        ----------
+        pos : int
+            確定した位置
+        """
+        self.__update_peak_entries()
+        evicted = self._memo.evict_before(pos)
+        self._memo_entries = max(self._memo_entries - evicted, 0)
+        self._stats["memo_evictions"] = self._stats.get("memo_evictions", 0) + evicted
+        self._stats["commits"] = self._stats.get("commits", 0) + 1
+
+    def __resolve_links(self, root:Node) -> None:
         """
-        ツリーの各ノードに親ノード、隣接ノードを設定する。
+        複数のノードの子になったノード (メモから再利用したノードなど) に、
+        構文木に含まれる親ノードと隣接ノードを設定し直す。
+        それ以外のノードは、作成時に設定した親ノード、隣接ノード (_link_children) のままで正しいため、
+        構文木全体は走査しない。
 
         Parameters
         ----------
         root : Node
             ルートノード
         """
-        child_cnt = len(root.children)
-        for i in range(child_cnt):
-            cn = root.children[i]
-            # 隣接ノード設定
-            if i >= 0 and i+1 < child_cnt:
-                # right_neighbor の存在確認
-                cn.right_neighbor = root.children[i+1]
-            else:
-                cn.right_neighbor = None
-            if i >= 1:
-                # left_neighbor の存在確認
-                cn.left_neighbor = root.children[i-1]
+        relinked = self._relinked
+        self._relinked = []
+        if not relinked:
+            return
+
+        # ノードごとに、子として含んだことのある親ノードをまとめる
+        candidates = {}
+        for cn, parent in relinked:
+            entry = candidates.get(id(cn))
+            if entry is None:
+                candidates[id(cn)] = (cn, [parent])
             else:
-                cn.left_neighbor = None
-            
-            # 親ノード設定
-            cn.parent = root
-
-            if isinstance(cn, NonTerminalNode):
-                self.__complete_tree(cn)
+                entry[1].append(parent)
+
+        # 祖先になりうるノードから順に (範囲の広い順、同じ範囲は後に作成した順) 設定する。
+        # 親ノードをたどってルートノードに到達する場合、そのノードは構文木に含まれる
+        in_tree = {id(root): True}
+        for cn, parents in sorted(candidates.values(),
+                                  key=lambda entry: (entry[0].startpos - entry[0].endpos, -entry[0].nodenum)):
+            parents.append(cn.parent)
+            found = None
+            for parent in parents:
+                path = []
+                n = parent
+                while n is not None and id(n) not in in_tree:
+                    path.append(n)
+                    n = n.parent
+                flg = n is not None and in_tree[id(n)]
+                for pn in path:
+                    in_tree[id(pn)] = flg
+                if flg:
+                    found = parent
+                    break
+
+            in_tree[id(cn)] = found is not None
+            if found is not None:
+                children = found.children
+                i = 0
+                while children[i] is not cn:
+                    i += 1
+                cn.parent = found
+                cn.left_neighbor = children[i-1] if i > 0 else None
+                cn.right_neighbor = children[i+1] if i+1 < len(children) else None
 
     def top(self):
         """
@@ -314,6 +955,46 @@ class Parser(object):
         """
         pass
 
+    def _get_rule_id(self, typename:str) -> int:
+        """
+        タイプ名に対応する規則の番号を返す。
+        未登録のタイプ名には新しい番号を割り当てる。
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+
+        Returns
+        ----------
+        rule_id : int
+            規則の番号
+        """
+        rule_id = self._rule_ids.get(typename)
+        if rule_id is None:
+            rule_id = self._rule_ids[typename] = len(self._rule_ids)
+        return rule_id
+
+    def _get_matcher(self, def_function:Callable[[], ParseFunction]) -> ParseFunction:
+        """
+        規則の関数 (p_xxx, t_xxx など) から解析関数を取得する。
+        解析関数はパーサーごとに一度だけ作成し、以降は作成済みの関数を返す。
+
+        Parameters
+        ----------
+        def_function : Callable[[], ParseFunction]
+            解析関数を作成する規則の関数
+
+        Returns
+        ----------
+        func : Callable[[], tuple[bool, tuple["Node"]]]
+            結果が[flg, Node]のタプルを返す関数
+        """
+        func = self._matchers.get(def_function)
+        if func is None:
+            func = self._matchers[def_function] = def_function()
+        return func
+
     def _seq(self, *x:tuple[ParseFunction]) -> ParseFunction:
         """
         連続を表現する関数を返す関数。
@@ -350,8 +1031,9 @@ class Parser(object):
             node : tuple[Node]
                 ノードのタプル
             """
-            ret = ()
             n = r.get_position()
+            # 結果はリストに追加し、最後にタプルに変換する (_rpt と同じ)
+            ret = []
             for func in _x:
                 flg, results = func()
                 if not flg:
@@ -360,18 +1042,24 @@ class Parser(object):
                 else:
                     ret += results
 
-            return True, ret
+            return True, tuple(ret)
 
-        return lambda: seq(self._reader, *x)
+        return with_expr(lambda: seq(self._reader, *x), (E_SEQ, x))
 
-    def _sel(self, *x:tuple[ParseFunction]) -> ParseFunction:
+    def _sel(self, *x:tuple[ParseFunction], first:"tuple[str | None] | None"=None) -> ParseFunction:
         """
         選択を表現する関数を返す関数。
 
+        first を指定した場合は、次の文字で実行する選択肢を絞り込む。
+        次の文字が選択肢の先頭文字の集合に含まれない場合、その選択肢は失敗するため、
+        実行しなくても結果は変わらない。
+
         Parameters
         ----------
         x : tuple[Callable]
             結果が[flg, Node]のタプルを返す関数のタプル
+        first : tuple[str | None] | None
+            選択肢ごとの先頭文字の集合 (先頭文字を限定できない選択肢は None)
 
         Returns
         ----------
@@ -409,7 +1097,30 @@ class Parser(object):
 
             return False, ()
 
-        return lambda: sel(self._reader, *x)
+        if first is None:
+            return with_expr(lambda: sel(self._reader, *x), (E_SEL, x, None))
+
+        # 文字 -> 実行する選択肢のタプル の辞書
+        # 辞書にない文字では、先頭文字を限定できない選択肢のみ実行する
+        default = tuple(func for func, chars in zip(x, first) if chars is None)
+        table = {}
+        for c in set().union(*[chars for chars in first if chars is not None]):
+            table[c] = tuple(func for func, chars in zip(x, first) if chars is None or c in chars)
+
+        def dispatch(r:Reader, _x:tuple[ParseFunction]) -> ParseResult:
+            pos = r.get_position()
+            c = r.peek_char()
+            # 終了位置ではすべての選択肢を実行する
+            for func in (table.get(c, default) if c else _x):
+                flg, results = func()
+                if flg:
+                    return True, results
+                else:
+                    r.set_position(pos)
+
+            return False, ()
+
+        return with_expr(lambda: dispatch(self._reader, x), (E_SEL, x, first))
 
     def _rpt(self, f:ParseFunction, min_num:int, max_num:int=-1
             ) -> ParseFunction:
@@ -457,7 +1168,8 @@ class Parser(object):
             """
             pos = r.get_position()
             prev_pos = pos
-            ret = ()
+            # 結果はリストに追加し、最後にタプルに変換する (繰り返し回数に対して線形)
+            ret = []
 
             i = 0
             while _max_num < 0 or i < _max_num:
@@ -465,7 +1177,7 @@ class Parser(object):
                 if not flg or ( _max_num < 0 and prev_pos == r.get_position() ):
                     # 取得失敗 or 内容なしノードの無限ループ
                     if i >= _min_num:
-                        return True, ret
+                        return True, tuple(ret)
                     else:
                         r.set_position(pos)
                         return False, ()
@@ -475,9 +1187,9 @@ class Parser(object):
 
                 i += 1
 
-            return True, ret
+            return True, tuple(ret)
 
-        return lambda: rpt(self._reader, f, min_num, max_num)
+        return with_expr(lambda: rpt(self._reader, f, min_num, max_num), (E_RPT, f, min_num, max_num))
 
     @staticmethod
     def _opt(f:ParseFunction) -> ParseFunction:
@@ -517,7 +1229,7 @@ class Parser(object):
             results = _f()[1]
             return True, results
 
-        return lambda: opt(f)
+        return with_expr(lambda: opt(f), (E_OPT, f))
 
     def _and(self, f:ParseFunction) -> ParseFunction:
         """
@@ -533,6 +1245,8 @@ class Parser(object):
         __and : Callable[[], tuple[bool, tuple["Node"]]]
             関数
         """
+        # 先読みの結果は使用しないため、ノードを作成しない解析関数で実行する
+        recognizer = self._predicate_function(f)
 
         def __and(r:Reader, _f:ParseFunction) -> ParseResult:
             """
@@ -558,7 +1272,7 @@ class Parser(object):
             r.set_position(pos)
             return flg, ()
 
-        return lambda: __and(self._reader, f)
+        return with_expr(lambda: __and(self._reader, recognizer), (E_AND, f))
 
     def _not(self, f:ParseFunction) -> ParseFunction:
         """
@@ -574,6 +1288,8 @@ class Parser(object):
         __not : Callable[[], tuple[bool, tuple["Node"]]]
             関数
         """
+        # 先読みの結果は使用しないため、ノードを作成しない解析関数で実行する
+        recognizer = self._predicate_function(f)
 
         def __not(r:Reader, _f:ParseFunction) -> ParseResult:
             """
@@ -601,11 +1317,13 @@ class Parser(object):
             r.set_position(pos)
             return not flg, ()
 
-        return lambda: __not(self._reader, f)
+        return with_expr(lambda: __not(self._reader, recognizer), (E_NOT, f))
 
     def _trm(self, f:ParseFunction) -> ParseFunction:
         """
         結果を終端ノード化する関数を返す関数。
+        f はノードを作成しない解析関数で実行し、開始位置から終了位置までの文字列を終端ノードにする。
+        (マクロの本体は読み飛ばしを含まないため、読み込んだ終端の文字列を連結したものと同じになる)
 
         Parameters
         ----------
@@ -621,8 +1339,8 @@ class Parser(object):
         def trm(r:Reader, _f:ParseFunction) -> ParseResult:
             """
             input の関数を実行する。
-            実行結果、作成ノード を受け取り、input に成功した場合
-            ノードを終端化して(True, (作成した終端ノード)) を返す。
+            input に成功した場合、読み込んだ範囲の文字列で終端ノードを作成して
+            (True, (作成した終端ノード)) を返す。
             input の実行に失敗した場合、( False, () ) を返す。
 
             Parameters
@@ -639,22 +1357,22 @@ class Parser(object):
             node : Node | ()
                 ノード
             """
-            func = _f()
-            flg, results = func()
-            if not flg:
+            func = self._recognizers.get(_f)
+            if func is None:
+                func = self._get_recognizer(_f)
+            startpos = r.get_position()
+            if not func()[0]:
                 return False, ()
 
-            termstr = ""
-            for s in results:
-                termstr += s.get_str()
-            if len(termstr) > 0:
-                node = TerminalNode(termstr)
-                node.set_position(r, results[0].startpos, results[-1].endpos)
+            endpos = r.get_position()
+            if endpos > startpos:
+                node = TerminalNode(r.get_contents(startpos, endpos))
+                node.set_position(r, startpos, endpos, self.lazy_linecolumn)
                 return True, (node,)
             else:
                 return True, ()
 
-        return lambda: trm(self._reader, f)
+        return with_expr(lambda: trm(self._reader, f), (E_TRM, f))
 
     def _l(self, s:str, nocase:bool=False) -> ParseFunction:
         """
@@ -700,12 +1418,12 @@ class Parser(object):
             if flg:
                 endpos = r.get_position()
                 node = TerminalNode(ret)
-                node.set_position(r, startpos, endpos)
+                node.set_position(r, startpos, endpos, self.lazy_linecolumn)
                 return True, (node,)
 
             return False, ()
 
-        return lambda: l(self._reader, s, nocase)
+        return with_expr(lambda: l(self._reader, s, nocase), (E_LIT, s, nocase))
 
     def _r(self, reg:re.Pattern) -> ParseFunction:
         """
@@ -746,12 +1464,12 @@ class Parser(object):
             if flg:
                 endpos = r.get_position()
                 node = TerminalNode(ret)
-                node.set_position(r, startpos, endpos)
+                node.set_position(r, startpos, endpos, self.lazy_linecolumn)
                 return True, (node,)
 
             return False, ()
 
-        return lambda: _reg(self._reader, reg)
+        return with_expr(lambda: _reg(self._reader, reg), (E_REG, reg))
 
     def _p(self, f:ParseFunction, typename:str) -> ParseFunction:
         """
@@ -770,7 +1488,7 @@ class Parser(object):
             結果が[flg, Node]のタプルを返す関数
         """
 
-        def p(reader:Reader, _f:ParseFunction, _typename:str) -> ParseResult:
+        def p(reader:Reader, _f:ParseFunction, _typename:str, _rule_id:int) -> ParseResult:
             """
             ノンターミナルノードを作成する
             実行結果、作成ノード を受け取り、成功した場合
@@ -782,6 +1500,8 @@ class Parser(object):
                 結果が[flg, Node]のタプルを返す関数
             typename : str
                 ノードのタイプ名
+            _rule_id : int
+                規則の番号
 
             Returns
             ---------- 
@@ -791,14 +1511,24 @@ class Parser(object):
                 _create_non_terminal の実行結果
             """
             startpos = reader.get_position()
-            return self._create_non_terminal(_f, startpos, _typename)
-
-        return lambda: p(self._reader, f, typename)
-
-    @staticmethod
-    def _skip(f:ParseFunction) -> ParseFunction:
+            return self._create_non_terminal(_f, startpos, _typename, _rule_id)
+
+        rule_id = self._get_rule_id(typename)
+        leader = self.left_recursion.get(typename)
+        if leader:
+            # 左再帰の起点の規則は種の成長で解析する
+            return with_expr(lambda: self._create_left_recursive(f, self._reader.get_position(), typename, rule_id),
+                             (E_RULE, f, typename, rule_id))
+        elif leader is not None:
+            # 起点から呼び出される左再帰の規則はメモ化せずに解析する
+            return with_expr(lambda: self._create_non_memo(f, self._reader.get_position(), typename, rule_id),
+                             (E_RULE, f, typename, rule_id))
+        return with_expr(lambda: p(self._reader, f, typename, rule_id), (E_RULE, f, typename, rule_id))
+
+    def _skip(self, f:ParseFunction) -> ParseFunction:
         """
         [fを実行し結果をすべて読み飛ばす関数] を返す関数
+        f はノードを作成しない解析関数で実行する。
 
         Parameters
         ----------
@@ -829,7 +1559,38 @@ class Parser(object):
             flg = _f()[0]
             return flg, ()
 
-        return lambda: skip(f)
+        recognizer = self._predicate_function(f)
+        return with_expr(lambda: skip(recognizer), (E_SKIP, f))
+
+    def _commit(self) -> ParseFunction:
+        """
+        [確定 (~) の位置より前のメモを破棄する関数] を返す関数
+
+        Returns
+        ---------- 
+        commit : Callable[[], tuple[bool, tuple]]
+            文字列を読み取らずに成功する関数
+        """
+        def commit(reader:Reader) -> ParseResult:
+            """
+            現在位置より前のメモを破棄する関数
+
+            Parameters
+            ----------
+            reader : Reader
+                リーダー
+
+            Returns
+            ---------- 
+            result : bool
+                実行結果 (常に True)
+            nodes : ()
+                結果なし
+            """
+            self._commit_memo(reader.get_position())
+            return True, ()
+
+        return with_expr(lambda: commit(self._reader), (E_COMMIT,))
 
     def _eof(self) -> ParseFunction:
         """
@@ -861,12 +1622,13 @@ class Parser(object):
             else:
                 return False, ()
 
-        return lambda: __eof(self._reader)
+        return with_expr(lambda: __eof(self._reader), (E_EOF,))
 
     def _create_non_terminal(self, 
                             def_function:Callable[[], ParseFunction], 
                             startpos:int, 
-                            typename:str) -> ParseResult:
+                            typename:str,
+                            rule_id:int=None) -> ParseResult:
         """
         非終端ノードの作成
 
@@ -878,6 +1640,8 @@ class Parser(object):
             開始位置
         typename : str
             タイプ名
+        rule_id : int
+            規則の番号、省略時はタイプ名から求める
 
         Returns
         ---------- 
@@ -885,16 +1649,30 @@ class Parser(object):
             実行結果
         nodes : tuple(Node)
         """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+
+        # メモの確認 (成功は位置の辞書、失敗はビット列)
+        successes, failures = self._memo_tables[rule_id]
+        memo_nodes = successes.get(startpos)
+        if memo_nodes is not None:
+            if memo_nodes.__class__ is tuple:
+                self._reader.set_position(memo_nodes[0].endpos)
+                return True, memo_nodes
+            if memo_nodes.__class__ is SplicedNodes:
+                self._reader.set_position(memo_nodes.endpos)
+                return True, memo_nodes
+            # ノードを作成せずに登録した終了位置の場合は、規則を再度実行する
+            self._discard_recognized(successes, startpos)
+        block = failures.get(startpos >> BLOCK_BITS)
+        if block is not None and block[(startpos >> 3) & BYTE_MASK] & (1 << (startpos & 7)):
+            return False, ()
 
-        cache_result = self._cache.get((typename, startpos))
-        if cache_result:
-            rc, rr = cache_result
-            if rc:
-                self._reader.set_position(rr[0].endpos)
-            return cache_result
+        # 解析規則を表現する関数 funcを取得 (作成済みの場合は再利用する)
+        func = self._matchers.get(def_function)
+        if func is None:
+            func = self._matchers[def_function] = def_function()
 
-        func = def_function()   # 解析規則を表現する関数 funcを取得
-        
         self.type_stack.append(typename)
         try:
             flg, ret = func()   # 実行して結果ノードを取得する
@@ -904,19 +1682,1139 @@ class Parser(object):
 
         if flg:
             endpos = self._reader.get_position()
-            node = NonTerminalNode(typename, ret)
-            node.nodenum = self._nodenum
-            node.set_position(self._reader, startpos, endpos)
-            self._nodenum += 1
-            self._cache[(typename, startpos)] = True, (node,)
+            if self._keep is None:
+                node = NonTerminalNode(typename, ret)
+                node.nodenum = self._nodenum
+                node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+                self._nodenum += 1
+                self._link_children(node)
+                memo_nodes = successes[startpos] = (node,)
+            else:
+                memo_nodes = successes[startpos] = self._create_result(typename, ret, startpos, endpos)
             self.type_stack.pop()
-            return True, (node,)
+            self._memo_entries += 1
+            if self._memo_entries > self._memo_limit:
+                self._evict_memo(startpos)
+            return True, memo_nodes
 
         self.type_stack.pop()
-        self._cache[(typename, startpos)] = False, ()
+        # 失敗をビット列に登録する (memo.set_failure と同じ処理)
+        # 解析中にメモを削除した場合、ブロックは削除されているため再取得する
+        block = failures.get(startpos >> BLOCK_BITS)
+        if block is None:
+            block = failures[startpos >> BLOCK_BITS] = bytearray(BLOCK_BYTES)
+        block[(startpos >> 3) & BYTE_MASK] |= 1 << (startpos & 7)
+        self._memo_entries += 1
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(startpos)
         return False, ()
 
 
+    def _link_children(self, node:NonTerminalNode) -> None:
+        """
+        作成した非終端ノードの子ノードに、親ノード、隣接ノードを設定する。
+        既に他のノードの子であったノード (メモから再利用したノードなど) は、元の親ノードを記録し、
+        解析の終了時に構文木に含まれる親ノードで設定し直す。
+
+        Parameters
+        ----------
+        node : NonTerminalNode
+            作成したノード
+        """
+        relinked = self._relinked
+        left = None
+        for cn in node.children:
+            if cn.parent is not None:
+                relinked.append((cn, cn.parent))
+            cn.parent = node
+            cn.left_neighbor = left
+            if left is not None:
+                left.right_neighbor = cn
+            left = cn
+        if left is not None:
+            left.right_neighbor = None
+
+    def _create_node(self, typename:str, children:tuple["Node"], startpos:int, endpos:int) -> NonTerminalNode:
+        """
+        非終端ノードを作成し、ノードの番号を割り当てる (メモには登録しない)
+        子ノードには親ノード、隣接ノードを設定する。
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        children : tuple(Node)
+            子ノードのタプル
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+
+        Returns
+        ---------- 
+        node : NonTerminalNode
+            作成したノード
+        """
+        node = NonTerminalNode(typename, children)
+        node.nodenum = self._nodenum
+        node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+        self._nodenum += 1
+        self._link_children(node)
+        return node
+
+    def _create_result(self, typename:str, children:tuple["Node"], startpos:int, endpos:int) -> tuple["Node"]:
+        """
+        規則の結果を作成する。
+        タイプ名が keep に含まれない場合は、ノードを作成せずに子ノードを SplicedNodes で返す。
+        それ以外の場合は、非終端ノードを作成して (ノード,) を返す (メモには登録しない)
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        children : tuple(Node)
+            子ノードのタプル
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+
+        Returns
+        ---------- 
+        nodes : tuple(Node)
+            規則の結果
+        """
+        keep = self._keep
+        if keep is not None:
+            if typename not in keep:
+                return SplicedNodes(children, endpos)
+            if children.__class__ is SplicedNodes:
+                children = tuple(children)
+        return (self._create_node(typename, children, startpos, endpos),)
+
+    def _create_non_memo(self, 
+                         def_function:Callable[[], ParseFunction], 
+                         startpos:int, 
+                         typename:str,
+                         rule_id:int=None) -> ParseResult:
+        """
+        メモ化を行わない非終端ノードの作成
+        左再帰の起点から呼び出される規則に使用する。
+        (種の成長中の結果をメモに登録すると、成長した種を使用できなくなるため)
+
+        Parameters
+        ----------
+        def_function : Callable[[], Callable[[], tuple[bool, tuple["Node"]]]]
+            解析規則を定義する関数 p_xxxx
+        startpos : int
+            開始位置
+        typename : str
+            タイプ名
+        rule_id : int
+            規則の番号 (使用しない)
+
+        Returns
+        ---------- 
+        result : bool
+            実行結果
+        nodes : tuple(Node)
+        """
+        func = self._get_matcher(def_function)
+        self.type_stack.append(typename)
+        flg, ret = func()
+        self.type_stack.pop()
+        if flg:
+            return True, self._create_result(typename, ret, startpos, self._reader.get_position())
+        return False, ()
+
+    def _create_left_recursive(self, 
+                               def_function:Callable[[], ParseFunction], 
+                               startpos:int, 
+                               typename:str,
+                               rule_id:int=None) -> ParseResult:
+        """
+        左再帰の起点の規則の非終端ノードの作成 (種の成長 / seed growing)
+
+        最初に失敗を種として規則を実行し、成功した場合は結果を新しい種として、
+        終了位置が伸びなくなるまで規則を繰り返し実行する。
+        規則の中で同じ位置の自身を呼び出した場合は、その時点の種を返すため、
+        左結合の構文木を一度の解析で作成できる。
+
+        Parameters
+        ----------
+        def_function : Callable[[], Callable[[], tuple[bool, tuple["Node"]]]]
+            解析規則を定義する関数 p_xxxx
+        startpos : int
+            開始位置
+        typename : str
+            タイプ名
+        rule_id : int
+            規則の番号、省略時はタイプ名から求める
+
+        Returns
+        ---------- 
+        result : bool
+            実行結果
+        nodes : tuple(Node)
+        """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+
+        key = (rule_id, startpos)
+        if key in self._lr_seeds:
+            # 成長中の種を返す
+            seed = self._lr_seeds[key]
+            if seed is None:
+                return False, ()
+            self._reader.set_position(result_endpos(seed))
+            return True, seed
+
+        memo_result = self._memo.get(rule_id, startpos)
+        if memo_result is not None and memo_result[1].__class__ is int:
+            # ノードを作成せずに登録した終了位置の場合は、種を再度成長させる
+            self._discard_recognized(self._memo_tables[rule_id][0], startpos)
+            memo_result = None
+        if memo_result is not None:
+            if memo_result[0]:
+                self._reader.set_position(result_endpos(memo_result[1]))
+            return memo_result
+
+        func = self._get_matcher(def_function)
+        self._plant_seed(rule_id, startpos)
+        self.type_stack.append(typename)
+        seed = None
+        while True:
+            flg, ret = func()
+            endpos = self._reader.get_position()
+            if not flg or (seed is not None and endpos <= result_endpos(seed)):
+                break
+            seed = self._lr_seeds[key] = self._create_result(typename, ret, startpos, endpos)
+            self._reader.set_position(startpos)
+        self.type_stack.pop()
+
+        self._harvest_seed(rule_id, startpos, seed)
+        if seed is None:
+            return False, ()
+        self._reader.set_position(result_endpos(seed))
+        return True, seed
+
+    def _plant_seed(self, rule_id:int, startpos:int) -> None:
+        """
+        左再帰の種の成長を開始する (失敗を種として登録する)
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        startpos : int
+            開始位置
+        """
+        self._lr_seeds[(rule_id, startpos)] = None
+
+    def _harvest_seed(self, rule_id:int, startpos:int, seed:"tuple[Node] | None") -> None:
+        """
+        左再帰の種の成長を終了し、結果をメモに登録する
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        startpos : int
+            開始位置
+        seed : tuple(Node) | int | None
+            成長した種 (ノードを作成しない場合は終了位置)、失敗の場合は None
+        """
+        del self._lr_seeds[(rule_id, startpos)]
+        successes, failures = self._memo_tables[rule_id]
+        if seed is not None:
+            successes[startpos] = seed
+        else:
+            set_failure(failures, startpos)
+        self._memo_entries += 1
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(startpos)
+
+    # -----------------------------------------------------------------
+    # direct バックエンド用の関数
+    #   ParserGenerator.generate_file(backend="direct") で作成したパーサーは、
+    #   規則ごとに d_xxx(pos) (サブ構文は ds_xxx, マクロは dt_xxx) を持つ。
+    #   d_xxx は位置を受け取り、成功時 (終了位置, ノードのリスト)、
+    #   失敗時 (-1, None) を返す。
+    #   v_xxx (vs_xxx, vt_xxx) はノードを作成せず、終了位置 (失敗時は -1) を返す。
+    #   v_xxx は読み飛ばし、先読み、検証で使用する。
+    #   規則の呼び出し（メモの確認、登録）は呼び出し側に展開するため、
+    #   type_stack は更新しない。
+    # -----------------------------------------------------------------
+
+    def _direct(self, 
+                d_function:Callable[[int], tuple[int, list]], 
+                v_function:Callable[[int], int]=None) -> ParseFunction:
+        """
+        direct バックエンドの規則の関数を、解析関数として返す関数
+
+        Parameters
+        ----------
+        d_function : Callable[[int], tuple[int, list]]
+            規則の本体 d_xxx
+        v_function : Callable[[int], int]
+            ノードを作成しない規則の本体 v_xxx (_recognize_direct で使用する)
+
+        Returns
+        ----------
+        direct : Callable[[], tuple[bool, tuple["Node"]]]
+            結果が[flg, Node]のタプルを返す関数
+            (属性 recognize に、ノードを作成しない解析関数を持つ)
+        """
+
+        def direct() -> ParseResult:
+            r = self._reader
+            self._contents = r.contents
+            self._endpos = r.get_endposition()
+            endpos, nodes = d_function(r.get_position())
+            if endpos < 0:
+                return False, ()
+            r.set_position(endpos)
+            return True, tuple(nodes)
+
+        direct.recognize = self._recognize_direct(d_function, v_function)
+        return direct
+
+    def _direct_node(self, 
+                     typename:str, 
+                     successes:dict, 
+                     nodes:list["Node"], 
+                     startpos:int, 
+                     endpos:int) -> tuple["Node"]:
+        """
+        規則の解析に成功した場合に、非終端ノードを作成してメモに登録する (direct バックエンド用)
+        メモの形式、作成するノードは _create_non_terminal と同じ。
+        メモの確認と、失敗時のメモへの登録は呼び出し側で行う。
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        successes : dict[int, tuple(Node)]
+            規則のメモの表 (成功)
+        nodes : list[Node]
+            子ノードのリスト
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+
+        Returns
+        ---------- 
+        nodes : tuple(Node)
+            作成したノードのタプル
+        """
+        if startpos in successes:
+            # ノードを作成せずに登録した終了位置を置き換える
+            self._discard_recognized(successes, startpos)
+        if self._keep is None:
+            node = NonTerminalNode(typename, tuple(nodes))
+            node.nodenum = self._nodenum
+            node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+            self._nodenum += 1
+            self._link_children(node)
+            result = successes[startpos] = (node,)
+        else:
+            result = successes[startpos] = self._create_result(typename, tuple(nodes), startpos, endpos)
+        self._memo_entries += 1
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(startpos)
+        return result
+
+    def _direct_failure(self, failures:dict, pos:int) -> None:
+        """
+        規則の解析に失敗した場合に、メモに登録する (direct バックエンド用)
+
+        Parameters
+        ----------
+        failures : dict[int, bytearray]
+            規則のメモの表 (失敗)
+        pos : int
+            開始位置
+        """
+        set_failure(failures, pos)
+        self._memo_entries += 1
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(pos)
+
+    def _direct_left_recursive(self, 
+                               d_function:Callable[[int], tuple[int, list]], 
+                               pos:int, 
+                               typename:str, 
+                               rule_id:int) -> tuple[int, tuple]:
+        """
+        左再帰の起点の規則を種の成長で解析する (direct バックエンド用)
+        _create_left_recursive と同じ処理を、規則の本体 d_xxx に対して行う。
+
+        Parameters
+        ----------
+        d_function : Callable[[int], tuple[int, list]]
+            規則の本体 d_xxx
+        pos : int
+            開始位置
+        typename : str
+            タイプ名
+        rule_id : int
+            規則の番号
+
+        Returns
+        ---------- 
+        endpos : int
+            終了位置、失敗時は -1
+        nodes : tuple(Node) | None
+            作成したノードのタプル、失敗時は None
+        """
+        key = (rule_id, pos)
+        if key in self._lr_seeds:
+            seed = self._lr_seeds[key]
+        else:
+            memo_result = self._memo.get(rule_id, pos)
+            if memo_result is not None and memo_result[1].__class__ is int:
+                # ノードを作成せずに登録した終了位置の場合は、種を再度成長させる
+                self._discard_recognized(self._memo_tables[rule_id][0], pos)
+                memo_result = None
+            if memo_result is not None:
+                seed = memo_result[1] if memo_result[0] else None
+            else:
+                self._plant_seed(rule_id, pos)
+                seed = None
+                while True:
+                    endpos, nodes = d_function(pos)
+                    if endpos < 0 or (seed is not None and endpos <= result_endpos(seed)):
+                        break
+                    seed = self._lr_seeds[key] = self._create_result(typename, tuple(nodes), pos, endpos)
+                self._harvest_seed(rule_id, pos, seed)
+
+        if seed is None:
+            return -1, None
+        return result_endpos(seed), seed
+
+    def _direct_eof(self, pos:int) -> tuple[int, list]:
+        """
+        ファイルの終端を検知する関数 (direct バックエンド用)
+        """
+        if pos >= self._reader.length:
+            return pos, []
+        return -1, None
+
+    def _terminal(self, termstr:str, startpos:int, endpos:int) -> TerminalNode:
+        """
+        終端ノードを作成する (direct バックエンド用)
+        """
+        node = TerminalNode(termstr)
+        node.set_position(self._reader, startpos, endpos, self.lazy_linecolumn)
+        return node
+
+    def _terminalize(self, nodes:list["Node"]) -> list["Node"]:
+        """
+        マクロの結果を一つの終端ノードにまとめる (direct バックエンド用)
+        _trm と同様に、文字列が空の場合はノードを作成しない。
+        (以前に生成したパーサー用。現在は vt_xxx の終了位置までの文字列で終端ノードを作成する)
+        """
+        termstr = "".join([n.get_str() for n in nodes])
+        if len(termstr) > 0:
+            return [self._terminal(termstr, nodes[0].startpos, nodes[-1].endpos)]
+        return []
+
+    # -----------------------------------------------------------------
+    # ノードを作成しない解析関数
+    #   読み飛ばし (>>)、先読み (&, !) と検証 (validate_file, validate_string) では、
+    #   解析関数の構造 (expr) から作成した、ノードを作成しない解析関数を使用する。
+    #   解析関数の結果は常に (flg, ()) になり、メモの成功の表には、ノードのタプルの代わりに
+    #   終了位置を登録する。ノードを作成する呼び出しでは、終了位置のメモは未登録として扱う。
+    # -----------------------------------------------------------------
+
+    def _get_recognizer(self, def_function:Callable[[], ParseFunction]) -> ParseFunction:
+        """
+        規則の関数 (p_xxx, t_xxx など) から、ノードを作成しない解析関数を取得する。
+        解析関数はパーサーごとに一度だけ作成し、以降は作成済みの関数を返す。
+
+        Parameters
+        ----------
+        def_function : Callable[[], ParseFunction]
+            解析関数を作成する規則の関数
+
+        Returns
+        ----------
+        func : Callable[[], tuple[bool, tuple]]
+            結果が[flg, ()]のタプルを返す関数
+        """
+        func = self._recognizers.get(def_function)
+        if func is None:
+            func = self._recognizers[def_function] = self._recognizer(self._get_matcher(def_function))
+        return func
+
+    def _recognizer(self, func:ParseFunction) -> ParseFunction:
+        """
+        解析関数の構造 (expr) から、同じ文字列を読み込み、ノードを作成しない解析関数を作成する。
+        呼び出す規則は、実行時に _get_recognizer で取得する。
+
+        Parameters
+        ----------
+        func : Callable[[], tuple[bool, tuple["Node"]]]
+            解析関数
+
+        Returns
+        ----------
+        recognizer : Callable[[], tuple[bool, tuple]]
+            結果が[flg, ()]のタプルを返す関数
+        """
+        expr = getattr(func, "expr", None)
+        if expr is None:
+            # direct バックエンドの規則は v_xxx を使用し、構造を持たない解析関数はノードを破棄する
+            recognizer = getattr(func, "recognize", None)
+            if recognizer is not None:
+                return recognizer
+            return lambda: (func()[0], ())
+
+        tag = expr[0]
+        if tag == E_LIT:
+            return self._recognize_literal(expr[1], expr[2])
+        elif tag == E_REG:
+            return self._recognize_regexp(expr[1])
+        elif tag == E_RULE:
+            _, def_function, typename, rule_id = expr
+            leader = self.left_recursion.get(typename)
+            if leader:
+                create = self._recognize_left_recursive
+            elif leader is not None:
+                create = self._recognize_non_memo
+            else:
+                create = self._recognize_non_terminal
+            return with_expr(lambda: create(def_function, self._reader.get_position(), typename, rule_id), expr)
+        elif tag == E_SEQ:
+            return self._seq(*[self._recognizer(f) for f in expr[1]])
+        elif tag == E_SEL:
+            return self._sel(*[self._recognizer(f) for f in expr[1]], first=expr[2])
+        elif tag == E_RPT:
+            return self._rpt(self._recognizer(expr[1]), expr[2], expr[3])
+        elif tag == E_OPT:
+            return self._opt(self._recognizer(expr[1]))
+        elif tag == E_AND:
+            return self._and(self._recognizer(expr[1]))
+        elif tag == E_NOT:
+            return self._not(self._recognizer(expr[1]))
+        elif tag == E_SKIP:
+            return self._recognizer(expr[1])
+        elif tag == E_TRM:
+            return self._recognize_terminal(expr[1])
+        # 終端 (E_EOF)、確定 (E_COMMIT) はノードを作成しない
+        return func
+
+    def _predicate_function(self, f:ParseFunction) -> ParseFunction:
+        """
+        読み飛ばし、先読みで実行する解析関数を返す。
+        規則の呼び出しを置き換えている場合 (profile, trace, incremental) は、
+        規則ごとの記録を変えないため f をそのまま返す。
+        """
+        if self._rule_hooks:
+            return f
+        return self._recognizer(f)
+
+    def _discard_recognized(self, successes:dict, pos:int) -> None:
+        """
+        ノードを作成せずに登録した終了位置のメモを削除する
+        (ノードを作成する呼び出しで、規則を再度実行する場合に使用する)
+
+        Parameters
+        ----------
+        successes : dict[int, tuple(Node) | int]
+            規則のメモの表 (成功)
+        pos : int
+            開始位置
+        """
+        del successes[pos]
+        self._memo_entries -= 1
+
+    def _recognize_literal(self, s:str, nocase:bool=False) -> ParseFunction:
+        """
+        リテラルを読み込み、ノードを作成しない関数を返す関数 (_l に対応)
+        """
+        def l(r:Reader, _s:str, _nocase:bool) -> ParseResult:
+            return r.match_literal(_s, True, nocase=_nocase)[0], ()
+
+        return with_expr(lambda: l(self._reader, s, nocase), (E_LIT, s, nocase))
+
+    def _recognize_regexp(self, reg:re.Pattern) -> ParseFunction:
+        """
+        正規表現で読み込み、ノードを作成しない関数を返す関数 (_r に対応)
+        """
+        def _reg(r:Reader, __reg:re.Pattern) -> ParseResult:
+            return r.match_regexp(__reg, True)[0], ()
+
+        return with_expr(lambda: _reg(self._reader, reg), (E_REG, reg))
+
+    def _recognize_terminal(self, f:ParseFunction) -> ParseFunction:
+        """
+        f を実行し、終端ノードを作成しない関数を返す関数 (_trm に対応)
+        """
+        def trm(_f:ParseFunction) -> ParseResult:
+            return self._get_recognizer(_f)()[0], ()
+
+        return with_expr(lambda: trm(f), (E_TRM, f))
+
+    def _recognize_non_terminal(self, 
+                                def_function:Callable[[], ParseFunction], 
+                                startpos:int, 
+                                typename:str,
+                                rule_id:int=None) -> ParseResult:
+        """
+        規則を実行し、結果の終了位置をメモに登録する (_create_non_terminal に対応)
+
+        Parameters
+        ----------
+        def_function : Callable[[], Callable[[], tuple[bool, tuple]]]
+            解析規則を定義する関数 p_xxxx
+        startpos : int
+            開始位置
+        typename : str
+            タイプ名
+        rule_id : int
+            規則の番号、省略時はタイプ名から求める
+
+        Returns
+        ---------- 
+        result : bool
+            実行結果
+        nodes : tuple
+            常に空のタプル
+        """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+
+        successes, failures = self._memo_tables[rule_id]
+        endpos = successes.get(startpos)
+        if endpos is not None:
+            # ノードを作成する呼び出しで登録したメモは、ノードの終了位置を使用する
+            self._reader.set_position(endpos if endpos.__class__ is int else result_endpos(endpos))
+            return True, ()
+        block = failures.get(startpos >> BLOCK_BITS)
+        if block is not None and block[(startpos >> 3) & BYTE_MASK] & (1 << (startpos & 7)):
+            return False, ()
+
+        func = self._recognizers.get(def_function)
+        if func is None:
+            func = self._get_recognizer(def_function)
+
+        if func()[0]:
+            self._recognize_success(successes, startpos, self._reader.get_position())
+            return True, ()
+        self._direct_failure(failures, startpos)
+        return False, ()
+
+    def _recognize_non_memo(self, 
+                            def_function:Callable[[], ParseFunction], 
+                            startpos:int, 
+                            typename:str,
+                            rule_id:int=None) -> ParseResult:
+        """
+        規則をメモ化せずに実行する (_create_non_memo に対応)
+        """
+        return self._get_recognizer(def_function)()[0], ()
+
+    def _recognize_left_recursive(self, 
+                                  def_function:Callable[[], ParseFunction], 
+                                  startpos:int, 
+                                  typename:str,
+                                  rule_id:int=None) -> ParseResult:
+        """
+        左再帰の起点の規則を種の成長で実行する (_create_left_recursive に対応)
+        """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+        reader = self._reader
+
+        def grow(pos:int) -> int:
+            reader.set_position(pos)
+            if self._get_recognizer(def_function)()[0]:
+                return reader.get_position()
+            return -1
+
+        endpos = self._recognize_direct_left_recursive(grow, startpos, rule_id)
+        if endpos < 0:
+            return False, ()
+        reader.set_position(endpos)
+        return True, ()
+
+    def _recognize_direct(self, 
+                          d_function:Callable[[int], tuple[int, list]], 
+                          v_function:Callable[[int], int]=None) -> ParseFunction:
+        """
+        direct バックエンドのノードを作成しない規則の関数 v_xxx を、解析関数として返す関数 (_direct に対応)
+        v_xxx がない場合 (以前に生成したパーサー) は、d_xxx を実行してノードを破棄する。
+        """
+        if v_function is None:
+            v_function = lambda pos: d_function(pos)[0]
+
+        def direct() -> ParseResult:
+            r = self._reader
+            self._contents = r.contents
+            self._endpos = r.get_endposition()
+            endpos = v_function(r.get_position())
+            if endpos < 0:
+                return False, ()
+            r.set_position(endpos)
+            return True, ()
+
+        return direct
+
+    def _recognize_success(self, successes:dict, pos:int, endpos:int) -> None:
+        """
+        規則の成功時の終了位置をメモに登録する
+
+        Parameters
+        ----------
+        successes : dict[int, tuple(Node) | int]
+            規則のメモの表 (成功)
+        pos : int
+            開始位置
+        endpos : int
+            終了位置
+        """
+        successes[pos] = endpos
+        self._memo_entries += 1
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(pos)
+
+    def _recognize_direct_left_recursive(self, 
+                                         v_function:Callable[[int], int], 
+                                         pos:int, 
+                                         rule_id:int) -> int:
+        """
+        左再帰の起点の規則を、ノードを作成せずに種の成長で実行する
+        種は終了位置 (失敗の場合は None) とする。
+        ノードを作成する呼び出しで登録した種、メモは、ノードの終了位置を使用する。
+
+        Parameters
+        ----------
+        v_function : Callable[[int], int]
+            位置を受け取り、終了位置 (失敗時は -1) を返す規則の本体
+        pos : int
+            開始位置
+        rule_id : int
+            規則の番号
+
+        Returns
+        ---------- 
+        endpos : int
+            終了位置、失敗時は -1
+        """
+        key = (rule_id, pos)
+        if key in self._lr_seeds:
+            seed = self._lr_seeds[key]
+        else:
+            memo_result = self._memo.get(rule_id, pos)
+            if memo_result is not None:
+                seed = memo_result[1] if memo_result[0] else None
+            else:
+                self._plant_seed(rule_id, pos)
+                seed = None
+                while True:
+                    endpos = v_function(pos)
+                    if endpos < 0 or (seed is not None and endpos <= seed):
+                        break
+                    seed = self._lr_seeds[key] = endpos
+                self._harvest_seed(rule_id, pos, seed)
+
+        if seed is None:
+            return -1
+        return result_endpos(seed)
+
+    def _recognize_eof(self, pos:int) -> int:
+        """
+        ファイルの終端を検知する関数 (direct バックエンドのノードを作成しない関数用)
+        """
+        if pos >= self._reader.length:
+            return pos
+        return -1
+
+
+    # -----------------------------------------------------------------
+    # イベントの送信 (stream_file, stream_string) 用の関数
+    #   解析中は _l, _r, _trm, _sel, _rpt などを以下の関数で置き換え、ノードを作成せずに解析する。
+    #   選択、繰り返し、オプション、先読み、読み飛ばしの実行中 (_stream_depth > 0) は、
+    #   結果を取り消す可能性があるため、イベントを保留中のタプル (stream.py) として結果で返す。
+    #   _stream_depth が 0 の場合は、イベントをすぐに送信し、結果は空のタプルになる。
+    #   メモの成功の表には、ノードのタプルの代わりに規則の保留中のイベントを登録する。
+    # -----------------------------------------------------------------
+
+    def _stream_flush(self, items:tuple) -> tuple:
+        """
+        _stream_depth が 0 の場合、保留中のイベントを送信して空のタプルを返す。
+        それ以外の場合は items をそのまま返す。
+
+        Parameters
+        ----------
+        items : tuple
+            保留中のイベントのタプル
+
+        Returns
+        ----------
+        items : tuple
+            呼び出し元に返す保留中のイベントのタプル
+        """
+        if self._stream_depth or not items:
+            return items
+        emit_events(self._stream_handler, items)
+        if self._memo_entries > self._stream_memo_limit:
+            # 送信済みの位置より前には戻らないため、メモを破棄する
+            self.__update_peak_entries()
+            pos = self._reader.get_position()
+            evicted = self._memo.evict_before(pos)
+            self._memo_entries = max(self._memo_entries - evicted, 0)
+            self._stream_memo_limit = self._memo_entries + self.stream_memo_entries
+            self._stats["memo_evictions"] = self._stats.get("memo_evictions", 0) + evicted
+        return ()
+
+    def _stream_leaf(self, text:str, startpos:int, endpos:int) -> ParseResult:
+        """
+        終端のイベントを送信する (_stream_depth が 0 以外の場合は保留する)
+        """
+        if self._stream_depth:
+            return True, ((text, startpos, endpos),)
+        self._stream_handler.terminal(text, startpos, endpos)
+        return True, ()
+
+    def _stream_literal(self, s:str, nocase:bool=False) -> ParseFunction:
+        """
+        リテラルを読み込み、終端のイベントを送信する関数を返す関数 (_l のイベント用)
+        """
+        def l(r:Reader, _s:str, _nocase:bool) -> ParseResult:
+            startpos = r.get_position()
+            flg, ret = r.match_literal(_s, True, nocase=_nocase)
+            if flg:
+                return self._stream_leaf(ret, startpos, r.get_position())
+            return False, ()
+
+        return with_expr(lambda: l(self._reader, s, nocase), (E_LIT, s, nocase))
+
+    def _stream_regexp(self, reg:re.Pattern) -> ParseFunction:
+        """
+        正規表現で読み込み、終端のイベントを送信する関数を返す関数 (_r のイベント用)
+        """
+        def _reg(r:Reader, __reg:re.Pattern) -> ParseResult:
+            startpos = r.get_position()
+            flg, ret = r.match_regexp(__reg, True)
+            if flg:
+                return self._stream_leaf(ret, startpos, r.get_position())
+            return False, ()
+
+        return with_expr(lambda: _reg(self._reader, reg), (E_REG, reg))
+
+    def _stream_terminal(self, f:ParseFunction) -> ParseFunction:
+        """
+        f の結果を一つの終端のイベントにまとめる関数を返す関数 (_trm のイベント用)
+        文字列は _trm と同じく、開始位置から終了位置までの文字列になる。
+        """
+        def trm(_f:ParseFunction) -> ParseResult:
+            startpos = self._reader.get_position()
+            self._stream_depth += 1
+            flg = self._get_matcher(_f)()[0]
+            self._stream_depth -= 1
+            if not flg:
+                return False, ()
+
+            endpos = self._reader.get_position()
+            if endpos > startpos:
+                return self._stream_leaf(self._reader.get_contents(startpos, endpos), startpos, endpos)
+            return True, ()
+
+        return with_expr(lambda: trm(f), (E_TRM, f))
+
+    def _stream_select(self, *x:tuple[ParseFunction], first:"tuple[str | None] | None"=None) -> ParseFunction:
+        """
+        選択を表現する関数を返す関数 (_sel のイベント用)
+        最後の選択肢は失敗しても他の選択肢を実行しないため、イベントを保留せずに実行する。
+        """
+        table = None
+        default = x
+        if first is not None:
+            # _sel と同じ 文字 -> 実行する選択肢のタプル の辞書
+            default = tuple(func for func, chars in zip(x, first) if chars is None)
+            table = {}
+            for c in set().union(*[chars for chars in first if chars is not None]):
+                table[c] = tuple(func for func, chars in zip(x, first) if chars is None or c in chars)
+
+        def sel(r:Reader, _x:tuple[ParseFunction]) -> ParseResult:
+            pos = r.get_position()
+            if table is not None:
+                c = r.peek_char()
+                # 終了位置ではすべての選択肢を実行する
+                if c:
+                    _x = table.get(c, default)
+            last = len(_x) - 1
+            for i, func in enumerate(_x):
+                if i == last:
+                    flg, items = func()
+                    if not flg:
+                        r.set_position(pos)
+                    return flg, items
+
+                self._stream_depth += 1
+                flg, items = func()
+                self._stream_depth -= 1
+                if flg:
+                    return True, self._stream_flush(items)
+                r.set_position(pos)
+
+            return False, ()
+
+        return with_expr(lambda: sel(self._reader, x), (E_SEL, x, first))
+
+    def _stream_repeat(self, f:ParseFunction, min_num:int, max_num:int=-1) -> ParseFunction:
+        """
+        繰り返しを表現する関数を返す関数 (_rpt のイベント用)
+        最小回数までの繰り返しは、失敗すると繰り返し全体が失敗するため、イベントを保留せずに実行する。
+        """
+        def rpt(r:Reader, _f:ParseFunction, _min_num:int, _max_num:int) -> ParseResult:
+            pos = r.get_position()
+            prev_pos = pos
+            ret = []
+
+            i = 0
+            while _max_num < 0 or i < _max_num:
+                if i < _min_num:
+                    flg, items = _f()
+                else:
+                    self._stream_depth += 1
+                    flg, items = _f()
+                    self._stream_depth -= 1
+                if not flg or ( _max_num < 0 and prev_pos == r.get_position() ):
+                    # 取得失敗 or 内容なしノードの無限ループ
+                    if i >= _min_num:
+                        return True, tuple(ret)
+                    else:
+                        r.set_position(pos)
+                        return False, ()
+                else:
+                    ret += self._stream_flush(items)
+                    prev_pos = r.get_position()
+
+                i += 1
+
+            return True, tuple(ret)
+
+        return with_expr(lambda: rpt(self._reader, f, min_num, max_num), (E_RPT, f, min_num, max_num))
+
+    def _stream_option(self, f:ParseFunction) -> ParseFunction:
+        """
+        オプションを表現する関数を返す関数 (_opt のイベント用)
+        """
+        def opt(_f:ParseFunction) -> ParseResult:
+            self._stream_depth += 1
+            flg, items = _f()
+            self._stream_depth -= 1
+            if flg:
+                return True, self._stream_flush(items)
+            return True, ()
+
+        return with_expr(lambda: opt(f), (E_OPT, f))
+
+    def _stream_and(self, f:ParseFunction) -> ParseFunction:
+        """
+        「条件：読み込み成功」を表現する関数を返す関数 (_and のイベント用、イベントは破棄する)
+        """
+        def __and(r:Reader, _f:ParseFunction) -> ParseResult:
+            pos = r.get_position()
+            self._stream_depth += 1
+            flg = _f()[0]
+            self._stream_depth -= 1
+            r.set_position(pos)
+            return flg, ()
+
+        return with_expr(lambda: __and(self._reader, f), (E_AND, f))
+
+    def _stream_not(self, f:ParseFunction) -> ParseFunction:
+        """
+        「条件：読み込み失敗」を表現する関数を返す関数 (_not のイベント用、イベントは破棄する)
+        """
+        def __not(r:Reader, _f:ParseFunction) -> ParseResult:
+            pos = r.get_position()
+            self._stream_depth += 1
+            flg = _f()[0]
+            self._stream_depth -= 1
+            r.set_position(pos)
+            return not flg, ()
+
+        return with_expr(lambda: __not(self._reader, f), (E_NOT, f))
+
+    def _stream_skip(self, f:ParseFunction) -> ParseFunction:
+        """
+        f を実行し、イベントを破棄する関数を返す関数 (_skip のイベント用)
+        """
+        def skip(_f:ParseFunction) -> ParseResult:
+            self._stream_depth += 1
+            flg = _f()[0]
+            self._stream_depth -= 1
+            return flg, ()
+
+        return with_expr(lambda: skip(f), (E_SKIP, f))
+
+    def _stream_non_terminal(self, 
+                             def_function:Callable[[], ParseFunction], 
+                             startpos:int, 
+                             typename:str,
+                             rule_id:int=None) -> ParseResult:
+        """
+        規則を実行し、規則の開始、終了のイベントを送信する (_create_non_terminal のイベント用)
+
+        _stream_depth が 0 の場合は、開始のイベントを送信してから規則を実行し、
+        メモには送信済みの規則 (子が None) を登録する。
+        送信済みの規則をメモから参照した場合は、イベントを再度送信するため規則を実行する。
+
+        Parameters
+        ----------
+        def_function : Callable[[], Callable[[], tuple[bool, tuple]]]
+            解析規則を定義する関数 p_xxxx
+        startpos : int
+            開始位置
+        typename : str
+            タイプ名
+        rule_id : int
+            規則の番号、省略時はタイプ名から求める
+
+        Returns
+        ---------- 
+        result : bool
+            実行結果
+        items : tuple
+            保留中のイベントのタプル
+        """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+
+        successes, failures = self._memo_tables[rule_id]
+        item = successes.get(startpos)
+        if item is not None and item[3] is not None:
+            self._reader.set_position(item[2])
+            return True, self._stream_flush((item,))
+        block = failures.get(startpos >> BLOCK_BITS)
+        if block is not None and block[(startpos >> 3) & BYTE_MASK] & (1 << (startpos & 7)):
+            return False, ()
+
+        flg, items = self._stream_rule(def_function, startpos, typename)
+        if flg:
+            self._stream_success(successes, startpos, items[0] if items else
+                                 (typename, startpos, self._reader.get_position(), None))
+            return True, items
+        self._direct_failure(failures, startpos)
+        return False, ()
+
+    def _stream_non_memo(self, 
+                         def_function:Callable[[], ParseFunction], 
+                         startpos:int, 
+                         typename:str,
+                         rule_id:int=None) -> ParseResult:
+        """
+        規則をメモ化せずに実行する (_create_non_memo のイベント用)
+        """
+        return self._stream_rule(def_function, startpos, typename)
+
+    def _stream_rule(self, 
+                     def_function:Callable[[], ParseFunction], 
+                     startpos:int, 
+                     typename:str) -> ParseResult:
+        """
+        規則を実行し、_stream_depth が 0 の場合は開始、終了のイベントを送信する。
+        それ以外の場合は、規則の保留中のイベントを返す。
+        """
+        func = self._matchers.get(def_function)
+        if func is None:
+            func = self._matchers[def_function] = def_function()
+
+        if self._stream_depth:
+            flg, items = func()
+            if flg:
+                return True, ((typename, startpos, self._reader.get_position(), items),)
+            return False, ()
+
+        handler = self._stream_handler
+        handler.enter(typename, startpos)
+        if func()[0]:
+            handler.exit(typename, startpos, self._reader.get_position())
+            return True, ()
+        return False, ()
+
+    def _stream_left_recursive(self, 
+                               def_function:Callable[[], ParseFunction], 
+                               startpos:int, 
+                               typename:str,
+                               rule_id:int=None) -> ParseResult:
+        """
+        左再帰の起点の規則を種の成長で実行する (_create_left_recursive のイベント用)
+        種の成長中はイベントを保留し、種は規則の保留中のイベントとする。
+        """
+        if rule_id is None:
+            rule_id = self._get_rule_id(typename)
+
+        key = (rule_id, startpos)
+        if key in self._lr_seeds:
+            # 成長中の種を返す (成長中は _stream_depth が 0 にならない)
+            seed = self._lr_seeds[key]
+            if seed is None:
+                return False, ()
+            self._reader.set_position(seed[2])
+            return True, (seed,)
+
+        memo_result = self._memo.get(rule_id, startpos)
+        if memo_result is not None:
+            if not memo_result[0]:
+                return False, ()
+            self._reader.set_position(memo_result[1][2])
+            return True, self._stream_flush((memo_result[1],))
+
+        func = self._get_matcher(def_function)
+        self._plant_seed(rule_id, startpos)
+        self._stream_depth += 1
+        seed = None
+        while True:
+            flg, items = func()
+            endpos = self._reader.get_position()
+            if not flg or (seed is not None and endpos <= seed[2]):
+                break
+            seed = self._lr_seeds[key] = (typename, startpos, endpos, items)
+            self._reader.set_position(startpos)
+        self._stream_depth -= 1
+
+        self._harvest_seed(rule_id, startpos, seed)
+        if seed is None:
+            return False, ()
+        self._reader.set_position(seed[2])
+        return True, self._stream_flush((seed,))
+
+    def _stream_direct(self, 
+                       d_function:Callable[[int], tuple[int, list]], 
+                       v_function:Callable[[int], int]=None) -> ParseFunction:
+        """
+        direct バックエンドの規則の関数を、イベントを送信する解析関数として返す関数 (_direct のイベント用)
+        d_xxx で作成したノードを、保留中のイベントに変換する。
+        """
+        def direct() -> ParseResult:
+            r = self._reader
+            self._contents = r.contents
+            self._endpos = r.get_endposition()
+            endpos, nodes = d_function(r.get_position())
+            if endpos < 0:
+                return False, ()
+            r.set_position(endpos)
+            return True, self._stream_flush(node_items(nodes))
+
+        return direct
+
+    def _stream_success(self, successes:dict, pos:int, item:tuple) -> None:
+        """
+        規則の成功時の保留中のイベントをメモに登録する (イベント用)
+        """
+        if pos not in successes:
+            self._memo_entries += 1
+        successes[pos] = item
+        if self._memo_entries > self._memo_limit:
+            self._evict_memo(pos)
+
 def reconstruct_tree(
         rootnode:"Node", typelist:list[str], replace_dict:dict[str, str]=None 
         ) -> "ReconstructedNode":
@@ -945,40 +2843,48 @@ def reconstruct_tree(
             _replace_dict:dict[str, str] = None
         ) -> tuple["ReconstructedNode"]:
 
-        if isinstance(_n, TerminalNode):
-            return ()
-
-        _newchildren = ()
-        for _cn in _n.children:
-            _newchild = reconstructnode(_cn, _typelist, _replace_dict)
-            if _newchild is not None:
-                _newchildren += _newchild
-        
-        if isinstance(_n, NonTerminalNode) and _n.type in _typelist:
-            _retnode = ReconstructedNode(_n)
-            _new_str = _n.get_str(_replace_dict)
-            _retnode.termstr = _new_str
-
-            _retnode.children = _newchildren
-            _children_cnt:int = len(_newchildren)
-            for _retnc in _retnode.children:
-                _retnc.parent = _retnode
-            for _i in range(_children_cnt):
-                _children:ReconstructedNode = _newchildren[_i]
-                if _i >= 0 and _i+1 < _children_cnt:
-                    # right_neighbor の存在確認
-                    _children.right_neighbor = _newchildren[_i+1]
-                else:
-                    _children.right_neighbor = None
-                if _i >= 1:
-                    # left_neighbor の存在確認
-                    _children.left_neighbor = _newchildren[_i-1]
-                else:
-                    _children.left_neighbor = None
+        # 再帰呼び出しを行わず、[ノード, 次の子の位置, 再構成した子のリスト] のスタックで
+        # 帰りがけ順に処理する
+        _stack = [[_n, 0, []]]
+        while True:
+            _frame = _stack[-1]
+            _node, _i, _newchildren = _frame
+            if _i < len(_node.children):
+                _frame[1] = _i + 1
+                _cn = _node.children[_i]
+                if not isinstance(_cn, TerminalNode):
+                    _stack.append([_cn, 0, []])
+                continue
+
+            _stack.pop()
+            if isinstance(_node, NonTerminalNode) and _node.type in _typelist:
+                _retnode = ReconstructedNode(_node)
+                _new_str = _node.get_str(_replace_dict)
+                _retnode.termstr = _new_str
+
+                _retnode.children = tuple(_newchildren)
+                _children_cnt:int = len(_newchildren)
+                for _retnc in _retnode.children:
+                    _retnc.parent = _retnode
+                for _i in range(_children_cnt):
+                    _children:ReconstructedNode = _newchildren[_i]
+                    if _i+1 < _children_cnt:
+                        # right_neighbor の存在確認
+                        _children.right_neighbor = _newchildren[_i+1]
+                    else:
+                        _children.right_neighbor = None
+                    if _i >= 1:
+                        # left_neighbor の存在確認
+                        _children.left_neighbor = _newchildren[_i-1]
+                    else:
+                        _children.left_neighbor = None
+                _result = (_retnode,)
+            else:
+                _result = tuple(_newchildren)
 
-            return _retnode,
-        else:
-            return _newchildren
+            if not _stack:
+                return _result
+            _stack[-1][2].extend(_result)
 
     nc = reconstructnode(rootnode, typelist, replace_dict)
     if isinstance(rootnode, NonTerminalNode) and rootnode.type not in typelist:
@@ -1017,9 +2923,12 @@ def preorder_travel(root:Node, func:Callable, *args) -> None:
     *args : Any
         func に渡す引数
     """
-    func(root, *args)
-    for cn in root.children:
-        preorder_travel(cn, func, *args)
+    # 再帰呼び出しを行わず、未処理のノードのスタックで処理する
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        func(node, *args)
+        stack.extend(reversed(node.children))
 
 
 def postorder_travel(root:Node, func:Callable, *args) -> None:
@@ -1036,6 +2945,12 @@ def postorder_travel(root:Node, func:Callable, *args) -> None:
     *args : Any
         func に渡す引数
     """
-    for cn in root.children:
-        postorder_travel(cn, func, *args)
-    func(root, *args)
+    # 再帰呼び出しを行わず、(ノード, 子を処理済みか否か) のスタックで処理する
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if visited:
+            func(node, *args)
+        else:
+            stack.append((node, True))
+            stack.extend([(cn, False) for cn in reversed(node.children)])
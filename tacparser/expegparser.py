@@ -28,6 +28,7 @@ class ExPegParser(Parser):
                          "AndPrefix": self.p_andprefix,
                          "NotPrefix": self.p_notprefix,
                          "SkipPrefix": self.p_skipprefix,
+                         "Commit": self.p_commit,
                          "Suffix": self.p_suffix,
                          "QuestionSuffix": self.p_questionsuffix,
                          "StarSuffix": self.p_starsuffix,
@@ -73,6 +74,7 @@ class ExPegParser(Parser):
                          "AMPERSAND": self.p_ampersand,
                          "EXCLAMATION": self.p_exclamation,
                          "MUCH_GREATER_THAN": self.p_much_greater_than,
+                         "TILDE": self.p_tilde,
                          "QUESTION": self.p_question,
                          "STAR": self.p_star,
                          "PLUS": self.p_plus,
@@ -99,7 +101,8 @@ class ExPegParser(Parser):
                          self._rpt(self._sel(self._p(self.p_pegcomment, "PegComment"),
                                              self._p(self.p_definition, "Definition"),
                                              self._p(self.p_subdefinition, "SubDefinition"),
-                                             self._p(self.p_macrodefinition, "MacroDefinition")
+                                             self._p(self.p_macrodefinition, "MacroDefinition"),
+                                             first=('#', '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '#_')
                                              ), 1),
                          self._p(self._eof, "_EOF")
                          )
@@ -165,7 +168,8 @@ class ExPegParser(Parser):
         # # Expression : 構文規則の本体
         # Expression <- Selection / Sequence
         return self._sel(self._p(self.p_selection, "Selection"),
-                         self._p(self.p_sequence, "Sequence")
+                         self._p(self.p_sequence, "Sequence"),
+                         first=('!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~', '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~')
                          )
 
     def p_selection(self):
@@ -179,7 +183,8 @@ class ExPegParser(Parser):
     def p_sequence(self):
         # Sequence   <- MultiSequence / SingleSequence
         return self._sel(self._p(self.p_multisequence, "MultiSequence"),
-                         self._p(self.p_singlesequence, "SingleSequence")
+                         self._p(self.p_singlesequence, "SingleSequence"),
+                         first=('!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~', '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~')
                          )
 
     def p_multisequence(self):
@@ -200,12 +205,18 @@ class ExPegParser(Parser):
         # #   (追加構文)
         # #   SkipPrefix : 読み飛ばし >>Xxxxx
         # #                通常の読み取りと同じだが、最後の解析木にノードを登録しない。
-        # #                （メモ化のため、ノード自体は作成する）
-        # Prefix    <- AndPrefix / NotPrefix / SkipPrefix / Suffix
+        # #                （読み飛ばしの中ではノードを作成せず、呼び出した規則のメモには終了位置のみ登録する）
+        # #   Commit : 確定 ~
+        # #            文字列を読み取らずに成功し、現在位置より前のメモを破棄する。
+        # #            例) Statements <- ( Statement ~ )*
+        # #            以降、確定した位置より前に戻って解析する場合は、規則を再度解析する。
+        # Prefix    <- AndPrefix / NotPrefix / SkipPrefix / Commit / Suffix
         return self._sel(self._p(self.p_andprefix, "AndPrefix"),
                          self._p(self.p_notprefix, "NotPrefix"),
                          self._p(self.p_skipprefix, "SkipPrefix"),
-                         self._p(self.p_suffix, "Suffix")
+                         self._p(self.p_commit, "Commit"),
+                         self._p(self.p_suffix, "Suffix"),
+                         first=('&', '!', '>', '~', '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
                          )
 
     def p_andprefix(self):
@@ -226,6 +237,10 @@ class ExPegParser(Parser):
                          self._p(self.p_suffix, "Suffix")
                          )
 
+    def p_commit(self):
+        # Commit <- TILDE
+        return self._p(self.p_tilde, "TILDE")
+
     def p_suffix(self):
         # # Suffix:: 読み込み回数に関する表現
         # #   QuestionSuffix : 省略可能, :: Xxxxx?
@@ -240,7 +255,8 @@ class ExPegParser(Parser):
                          self._p(self.p_starsuffix, "StarSuffix"),
                          self._p(self.p_plussuffix, "PlusSuffix"),
                          self._p(self.p_repeatsuffix, "RepeatSuffix"),
-                         self._p(self.p_primary, "Primary")
+                         self._p(self.p_primary, "Primary"),
+                         first=('"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
                          )
 
     def p_questionsuffix(self):
@@ -279,7 +295,8 @@ class ExPegParser(Parser):
                          self._seq(self._p(self.p_curl_open, "CURL_OPEN"),
                                    self._p(self.p_repeatcnt, "RepeatCnt"),
                                    self._p(self.p_curl_close, "CURL_CLOSE")
-                                   )
+                                   ),
+                         first=('{', '{')
                          )
 
     def p_minrepeat(self):
@@ -324,7 +341,8 @@ class ExPegParser(Parser):
                                    self._p(self.p_expression, "Expression"),
                                    self._p(self.p_close, "CLOSE")
                                    ),
-                         self._p(self.p_literal, "Literal")
+                         self._p(self.p_literal, "Literal"),
+                         first=('r', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '_', '(', '"\'')
                          )
 
     def p_identifiercall(self):
@@ -358,7 +376,8 @@ class ExPegParser(Parser):
     def p_macroexpression(self):
         # MacroExpression     <- MacroSelection / MacroSequence
         return self._sel(self._p(self.p_macroselection, "MacroSelection"),
-                         self._p(self.p_macrosequence, "MacroSequence")
+                         self._p(self.p_macrosequence, "MacroSequence"),
+                         first=('!"&\'(r', '!"&\'(r')
                          )
 
     def p_macroselection(self):
@@ -372,7 +391,8 @@ class ExPegParser(Parser):
     def p_macrosequence(self):
         # MacroSequence       <- MacroMultiSequence / MacroSingleSequence
         return self._sel(self._p(self.p_macromultisequence, "MacroMultiSequence"),
-                         self._p(self.p_macrosinglesequence, "MacroSingleSequence")
+                         self._p(self.p_macrosinglesequence, "MacroSingleSequence"),
+                         first=('!"&\'(r', '!"&\'(r')
                          )
 
     def p_macromultisequence(self):
@@ -393,7 +413,8 @@ class ExPegParser(Parser):
         # MacroPrefix         <- MacroAndPrefix / MacroNotPrefix / MacroSuffix
         return self._sel(self._p(self.p_macroandprefix, "MacroAndPrefix"),
                          self._p(self.p_macronotprefix, "MacroNotPrefix"),
-                         self._p(self.p_macrosuffix, "MacroSuffix")
+                         self._p(self.p_macrosuffix, "MacroSuffix"),
+                         first=('&', '!', '"\'(r')
                          )
 
     def p_macroandprefix(self):
@@ -418,7 +439,8 @@ class ExPegParser(Parser):
                          self._p(self.p_macrostarsuffix, "MacroStarSuffix"),
                          self._p(self.p_macroplussuffix, "MacroPlusSuffix"),
                          self._p(self.p_macrorepeatsuffix, "MacroRepeatSuffix"),
-                         self._p(self.p_macroprimary, "MacroPrimary")
+                         self._p(self.p_macroprimary, "MacroPrimary"),
+                         first=('"\'(r', '"\'(r', '"\'(r', '"\'(r', '"\'(r')
                          )
 
     def p_macroquestionsuffix(self):
@@ -454,7 +476,8 @@ class ExPegParser(Parser):
                                    self._p(self.p_macroexpression, "MacroExpression"),
                                    self._p(self.p_close, "CLOSE")
                                    ),
-                         self._p(self.p_literal, "Literal")
+                         self._p(self.p_literal, "Literal"),
+                         first=('r', '(', '"\'')
                          )
 
     def p_regularexp(self):
@@ -462,7 +485,8 @@ class ExPegParser(Parser):
         # RegularExp <- REGPREFIX ( SingleQuotesLiteral / DoubleQuotesLiteral ) RegularExpOptions Spacing?
         return self._seq(self._p(self.p_regprefix, "REGPREFIX"),
                          self._sel(self._p(self.p_singlequotesliteral, "SingleQuotesLiteral"),
-                                   self._p(self.p_doublequotesliteral, "DoubleQuotesLiteral")
+                                   self._p(self.p_doublequotesliteral, "DoubleQuotesLiteral"),
+                                   first=("'", '"')
                                    ),
                          self._p(self.p_regularexpoptions, "RegularExpOptions"),
                          self._opt(self._p(self.p_spacing, "Spacing"))
@@ -497,7 +521,8 @@ class ExPegParser(Parser):
     def p_identifier(self):
         # Identifier <- ( r"[a-zA-Z][a-zA-Z0-9_]*" / ENDOFFILE ) Spacing?
         return self._seq(self._sel(self._r(self._reg_p_identifier0),
-                                   self._p(self.p_endoffile, "ENDOFFILE")
+                                   self._p(self.p_endoffile, "ENDOFFILE"),
+                                   first=('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz', '_')
                                    ),
                          self._opt(self._p(self.p_spacing, "Spacing"))
                          )
@@ -519,7 +544,8 @@ class ExPegParser(Parser):
         # #   ※「"hoge":I」は hoge, Hoge, hOgE 等にマッチ
         # Literal <- ( SingleQuotesLiteral / DoubleQuotesLiteral ) LiteralOption? Spacing?
         return self._seq(self._sel(self._p(self.p_singlequotesliteral, "SingleQuotesLiteral"),
-                                   self._p(self.p_doublequotesliteral, "DoubleQuotesLiteral")
+                                   self._p(self.p_doublequotesliteral, "DoubleQuotesLiteral"),
+                                   first=("'", '"')
                                    ),
                          self._opt(self._p(self.p_literaloption, "LiteralOption")),
                          self._opt(self._p(self.p_spacing, "Spacing"))
@@ -610,6 +636,12 @@ class ExPegParser(Parser):
                          self._opt(self._p(self.p_spacing, "Spacing"))
                          )
 
+    def p_tilde(self):
+        # TILDE <- '~' Spacing?
+        return self._seq(self._l('~'),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
     def p_question(self):
         # QUESTION <- '?' Spacing?
         return self._seq(self._l('?'),
@@ -690,7 +722,8 @@ class ExPegParser(Parser):
         # Space <- ' ' / r"\t" / EndOfLine
         return self._sel(self._l(' '),
                          self._r(self._reg_p_space0),
-                         self._p(self.p_endofline, "EndOfLine")
+                         self._p(self.p_endofline, "EndOfLine"),
+                         first=(' ', '\t', None)
                          )
 
     _reg_p_endofline0 = regex.compile("\\r\\n|\\n|\\r", regex.M)
@@ -0,0 +1,351 @@
+import re
+from collections.abc import Callable
+
+from .memo import MemoTable, SplicedNodes, set_failure
+from .node import Node, NonTerminalNode
+from .profiler import RuleHook
+from .vm import E_SEQ, E_SEL, E_RPT, E_OPT, E_AND, E_NOT, E_SKIP, E_TRM, E_LIT, E_REG, E_RULE, E_EOF, E_COMMIT
+
+
+#: 改行に一致しうるエスケープの文字
+_NEWLINE_ESCAPES = frozenset("nsWDPXRN")
+#: 改行の文字コードのエスケープ (小文字に変換して比較する)
+_NEWLINE_CODES = ("\\x0a", "\\u000a", "\\u0000000a", "\\012")
+#: 文字クラスに含まれる場合、否定の文字クラスが改行に一致しなくなるエスケープ
+_CLASS_NEWLINE_ESCAPES = ("\\n", "\\s", "\\x0a", "\\x0A", "\\012")
+#: 繰り返しの回数の指定 ({n}, {n,}, {n,m})
+_REPEAT_COUNT = re.compile(r"\{\d*(,\d*)?\}")
+
+
+def _escape_length(pattern:str, i:int) -> int:
+    """
+    位置 i のエスケープ (\\x0a, \\N{...} など) の文字数を返す
+    """
+    c = pattern[i + 1:i + 2]
+    if c == "x":
+        return 4
+    if c == "u":
+        return 6
+    if c == "U":
+        return 10
+    if c == "0":
+        length = 2
+        while length < 4 and pattern[i + length:i + length + 1].isdigit():
+            length += 1
+        return length
+    if c in ("N", "p", "P") and pattern.startswith("{", i + 2):
+        end = pattern.find("}", i + 2)
+        return len(pattern) - i if end < 0 else end + 1 - i
+    return 2
+
+
+def scans_past_newline(pattern:"str | bytes", flags:int=0) -> bool:
+    """
+    正規表現が、改行に一致した後に続けて文字列を参照しうるかを返す。
+
+    改行に一致しうる要素 (否定の文字クラス、\\s、\\n、DOTALL の . など) の後に、
+    同じ選択肢の中で他の要素がある場合 True とする。
+    この場合、照合の失敗 (や一致までのバックトラック) で改行の後ろの行を参照しうる。
+    改行に一致しうる要素がパターンの末尾にある場合 (r"\\s+", r"\\r\\n|\\n" など) は、
+    一致した範囲の先 (終了位置の行) までしか参照しないため False とする。
+    グループの中の選択は区別しない (改行の後ろに要素がある場合は True とする)。
+
+    Parameters
+    ----------
+    pattern : str | bytes
+        正規表現のパターン
+    flags : int
+        正規表現のフラグ
+
+    Returns
+    ----------
+    result : bool
+        改行の後ろを参照しうる場合 True
+    """
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode("latin-1")
+    dotall = bool(flags & re.DOTALL)
+    verbose = bool(flags & re.VERBOSE)
+    pending = False
+    depth = 0
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        newline = False
+        if c == "\\":
+            length = _escape_length(pattern, i)
+            escape = pattern[i:i + length]
+            newline = escape[1:2] in _NEWLINE_ESCAPES or escape.lower() in _NEWLINE_CODES
+            i += length
+        elif c == "[":
+            # 先頭の "^" は否定、"]" は文字として扱われる
+            start = i + 1
+            negated = pattern.startswith("^", start)
+            if negated:
+                start += 1
+            end = start + 1 if pattern.startswith("]", start) else start
+            while end < len(pattern) and pattern[end] != "]":
+                end += 2 if pattern[end] == "\\" else 1
+            body = pattern[start:end]
+            contains = "\n" in body or any(e in body for e in _CLASS_NEWLINE_ESCAPES)
+            if negated:
+                newline = not contains
+            else:
+                newline = contains or "\\W" in body or "\\D" in body
+            i = end + 1
+        elif c == "(":
+            depth += 1
+            i += 1
+            if pattern.startswith("?", i):
+                i += 1
+                if pattern.startswith("#", i):
+                    end = pattern.find(")", i)
+                    i = len(pattern) if end < 0 else end + 1
+                    depth -= 1
+                    continue
+                # インラインのフラグ (?s), (?x:...) など
+                end = i
+                while end < len(pattern) and pattern[end].isalpha():
+                    end += 1
+                inline = pattern[i:end].split("-")[0]
+                dotall = dotall or "s" in inline
+                verbose = verbose or "x" in inline
+                i = end
+            continue
+        elif c == ")":
+            depth -= 1
+            i += 1
+            continue
+        elif c in "*+?":
+            i += 1
+            continue
+        elif c == "{" and _REPEAT_COUNT.match(pattern, i):
+            i = _REPEAT_COUNT.match(pattern, i).end()
+            continue
+        elif c == "|":
+            if depth == 0:
+                pending = False
+            i += 1
+            continue
+        elif verbose and c.isspace():
+            i += 1
+            continue
+        elif verbose and c == "#":
+            end = pattern.find("\n", i)
+            i = len(pattern) if end < 0 else end + 1
+            continue
+        else:
+            newline = c == "\n" or (c == "." and dotall)
+            i += 1
+
+        if pending:
+            return True
+        pending = newline
+    return False
+
+
+class MemoReach(RuleHook):
+    """
+    メモの各項目が参照した文字列の範囲 (参照範囲) を記録するクラス
+    Parser.incremental=True の場合に、解析中に install() して使用する。
+
+    参照範囲の終端は、規則の中で到達した最大位置 (終端記号の照合位置、
+    呼び出した規則の参照範囲) を含む行の終わり (改行の次の位置) とする。
+    正規表現、リテラル、先読みは行をまたいで参照しないものとみなす。
+    ただし、改行の後ろを参照しうる正規表現 (scans_past_newline)、改行の後ろに文字のあるリテラルを
+    含む規則は、照合に失敗した位置を求められないため、参照範囲を 文字数 + 1 とする。
+    ファイルの終端まで到達した場合は、終端の判定 (_EOF) を含むため 文字数 + 1 とする。
+
+    apply_edit() で文字列の編集に合わせて、編集の範囲を参照していないメモを残し、
+    編集位置より後ろのメモ (とノードの位置) を移動する。
+    """
+
+    def __init__(self) -> None:
+        """
+        初期化
+        """
+        RuleHook.__init__(self)
+        #: (規則の番号, 開始位置) -> 参照範囲の終端
+        self.reach = {}
+        self.moved = {}         #: 位置を移動したノード (id -> ノード)
+        self._multiline = {}    # タイプ名 -> 改行の後ろを参照しうる場合 True
+        self._stack = []        # 実行中の規則 [規則の番号, 開始位置, 最大到達位置の退避, 呼び出した規則の到達位置]
+
+    def _get_reach(self, maxreached:int) -> int:
+        contents = self.parser._reader.contents
+        lineend = contents.find("\n", maxreached)
+        if lineend < 0:
+            return len(contents) + 1
+        return lineend + 1
+
+    def _enter(self, typename:str, startpos:int, hit:bool) -> list:
+        rule_id = self.parser._rule_ids.get(typename)
+        if hit:
+            return [rule_id, startpos, None, 0]
+        reader = self.parser._reader
+        frame = [rule_id, startpos, reader.maxposition, startpos]
+        multiline = self._multiline.get(typename)
+        if multiline is None:
+            multiline = self._multiline[typename] = self._rule_scans_lines(typename)
+        if multiline:
+            frame[3] = len(reader.contents)
+        # 規則の中で到達した位置を求めるため、最大到達位置を開始位置に戻して実行する
+        reader.maxposition = startpos
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, frame:list, flg:bool, endpos:int) -> None:
+        if frame[2] is None:
+            # メモを使用した場合は、記録済の参照範囲を呼び出し元に反映する
+            reach = self.reach.get((frame[0], frame[1]))
+            maxreached = frame[1] if reach is None else reach - 1
+        else:
+            self._stack.pop()
+            reader = self.parser._reader
+            maxreached = max(reader.maxposition, frame[3])
+            if flg and endpos > maxreached:
+                maxreached = endpos
+            if frame[2] > reader.maxposition:
+                reader.maxposition = frame[2]
+            if frame[0] is not None:
+                self.reach[(frame[0], frame[1])] = self._get_reach(maxreached)
+        if self._stack and maxreached > self._stack[-1][3]:
+            self._stack[-1][3] = maxreached
+
+    def _rule_scans_lines(self, typename:str) -> bool:
+        """
+        規則の本体 (呼び出す規則を除く) が、改行の後ろを参照しうる正規表現、リテラルを含むかを返す
+        """
+        parser = self.parser
+        # direct バックエンドの規則の本体 (install で置き換える前の関数)
+        d_function = getattr(type(parser), "d_" + typename.lower(), None)
+        if d_function is not None:
+            return self._code_scans_lines(d_function, set())
+        def_function = parser.def_dict.get(typename)
+        if def_function is None:
+            return False
+        return self._expr_scans_lines(parser._get_matcher(def_function))
+
+    def _expr_scans_lines(self, func:Callable) -> bool:
+        expr = getattr(func, "expr", None)
+        if expr is None:
+            return True
+        tag = expr[0]
+        if tag == E_REG:
+            return scans_past_newline(expr[1].pattern, expr[1].flags)
+        if tag == E_LIT:
+            return "\n" in expr[1][:-1]
+        if tag == E_SEQ or tag == E_SEL:
+            return any(self._expr_scans_lines(f) for f in expr[1])
+        if tag == E_TRM:
+            return self._expr_scans_lines(self.parser._get_matcher(expr[1]))
+        if tag in (E_RPT, E_OPT, E_AND, E_NOT, E_SKIP):
+            return self._expr_scans_lines(expr[1])
+        # 呼び出す規則は、その規則の参照範囲を反映する
+        return tag not in (E_RULE, E_EOF, E_COMMIT)
+
+    def _code_scans_lines(self, function:Callable, visited:set) -> bool:
+        code = function.__code__
+        if any(c.__class__ is str and "\n" in c[:-1] for c in code.co_consts):
+            return True
+        for name in code.co_names:
+            if name.startswith("_reg_"):
+                reg = getattr(self.parser, name)
+                if scans_past_newline(reg.pattern, reg.flags):
+                    return True
+            elif name.startswith(("v_", "dt_", "vt_")) and name not in visited:
+                # 読み飛ばし、先読み、マクロは呼び出し元の規則の中で照合する
+                visited.add(name)
+                function = getattr(type(self.parser), name, None)
+                if function is not None and self._code_scans_lines(function, visited):
+                    return True
+        return False
+
+    def apply_edit(self, memo:MemoTable, offset:int, deleted:int, inserted:int, newlines:bool=False) -> int:
+        """
+        文字列の編集に合わせてメモを更新する。
+        編集の範囲を参照したメモを削除し、編集位置より後ろのメモの位置とノードの位置を移動する。
+        移動したノード (行番号、列番号を求め直すノード) は moved に追加する。
+
+        Parameters
+        ----------
+        memo : MemoTable
+            メモの表
+        offset : int
+            編集位置
+        deleted : int
+            削除した文字数
+        inserted : int
+            挿入した文字数
+        newlines : bool
+            削除した文字列または挿入した文字列が改行を含む場合 True。
+            文字数が変わらない場合も、編集位置より後ろのノードの行番号、列番号を求め直すため moved に追加する
+
+        Returns
+        ----------
+        entries : int
+            残ったメモの件数
+        """
+        editend = offset + deleted
+        delta = inserted - deleted
+        reach = {}
+        tables = {}
+        visited = set()
+        for (rule_id, pos), end in self.reach.items():
+            if pos >= editend:
+                newpos = pos + delta
+                end += delta
+            elif pos < offset and end <= offset:
+                newpos = pos
+            else:
+                continue
+            result = memo.get(rule_id, pos)
+            if result is None:
+                continue
+            reach[(rule_id, newpos)] = end
+
+            if rule_id not in tables:
+                tables[rule_id] = {}, {}
+            successes, failures = tables[rule_id]
+            if not result[0]:
+                set_failure(failures, newpos)
+                continue
+            nodes = successes[newpos] = result[1]
+            if (delta != 0 or newlines) and pos >= editend:
+                if nodes.__class__ is int:
+                    # ノードを作成せずに登録した終了位置
+                    successes[newpos] = nodes + delta
+                elif nodes.__class__ is SplicedNodes:
+                    # ノードを作成しない規則は、終了位置と子ノードを移動する
+                    if id(nodes) not in visited:
+                        visited.add(id(nodes))
+                        nodes.endpos += delta
+                    for node in nodes:
+                        self._move(node, delta, visited)
+                else:
+                    self._move(nodes[0], delta, visited)
+
+        # 規則ごとの表は、解析関数が参照しているため入れ替えずに更新する (clear は表を空にするのみ)
+        memo.clear()
+        for rule_id, (successes, failures) in memo.tables.items():
+            new_successes, new_failures = tables.get(rule_id, ({}, {}))
+            successes.update(new_successes)
+            failures.update(new_failures)
+        self.reach = reach
+        return len(reach)
+
+    def _move(self, root:Node, delta:int, visited:set) -> None:
+        """
+        ノードとその子孫の位置を移動する
+        """
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            node.startpos += delta
+            node.endpos += delta
+            self.moved[id(node)] = node
+            if isinstance(node, NonTerminalNode):
+                stack.extend(node.children)
@@ -0,0 +1,320 @@
+import sys
+from bisect import bisect_left
+
+
+#: 失敗を記録するビット列の 1 ブロックあたりの位置数 (2 の BLOCK_BITS 乗)
+BLOCK_BITS = 12
+#: 1 ブロックのバイト数
+BLOCK_BYTES = (1 << BLOCK_BITS) >> 3
+#: ブロック内のバイト位置を求めるマスク
+BYTE_MASK = BLOCK_BYTES - 1
+
+
+class SplicedNodes(tuple):
+    """
+    ノードを作成しない規則 (構文解析の keep に含まれない規則) の結果
+
+    規則の子のタプルに、規則の終了位置 endpos を持たせたもの。
+    ノードのタプルの代わりにメモの成功の表、左再帰の種に登録し、呼び出し側は子を親の子として連結する。
+    """
+
+    def __new__(cls, nodes:tuple, endpos:int) -> "SplicedNodes":
+        self = tuple.__new__(cls, nodes)
+        self.endpos = endpos
+        return self
+
+
+def result_endpos(nodes:tuple) -> int:
+    """
+    規則の結果 (ノードのタプル、SplicedNodes、またはノードを作成せずに登録した終了位置) の終了位置を返す
+
+    Parameters
+    ----------
+    nodes : tuple | int
+        メモの成功の表、左再帰の種に登録した規則の結果
+
+    Returns
+    ----------
+    endpos : int
+        終了位置
+    """
+    if nodes.__class__ is SplicedNodes:
+        return nodes.endpos
+    if nodes.__class__ is int:
+        return nodes
+    return nodes[0].endpos
+
+
+class _RuleTables(dict):
+    """
+    規則の番号から、規則ごとの表 (成功の辞書, 失敗のビット列) を返す辞書
+    未登録の番号を参照した場合は空の表を作成する。
+    """
+
+    def __missing__(self, rule_id:int) -> tuple[dict, dict]:
+        table = self[rule_id] = {}, {}
+        return table
+
+
+class MemoTable(object):
+    """
+    構文解析のメモ化に使用する表
+
+    規則ごとに番号を割り当て、規則ごとの表を位置で参照する。
+
+    * 成功 : 位置 -> ノードのタプル (ノードを作成しない規則は SplicedNodes) の辞書
+      読み飛ばし、先読み、検証でノードを作成せずに実行した規則は、終了位置 (int) を登録する。
+      ノードを作成する呼び出しでは、終了位置のメモは未登録として扱い、規則を再度実行する。
+    * 失敗 : ブロック番号 (位置 >> BLOCK_BITS) -> bytearray のビット列の辞書
+
+    規則の表は tables[規則の番号] で (成功の辞書, 失敗の辞書) として取得する。
+    失敗の確認は is_failure() と同じ処理を呼び出し側で展開してもよい。
+    """
+
+    def __init__(self) -> None:
+        """
+        初期化
+        """
+        #: 規則の番号 -> (成功の辞書, 失敗の辞書)
+        self.tables = _RuleTables()
+        #: 規則の番号 -> [成功の位置の昇順のリスト, 成功の辞書の最後の位置, その位置の結果]
+        #: (evict_before で、削除する位置のみを参照するために使用する)
+        self._positions = {}
+
+    def clear(self) -> None:
+        """
+        すべてのメモを削除する
+        規則ごとの表は削除せずに空にする (解析中に参照している表も有効なまま残る)
+        """
+        for success_dict, failure_dict in self.tables.values():
+            success_dict.clear()
+            failure_dict.clear()
+        self._positions.clear()
+
+    def get(self, rule_id:int, pos:int) -> "tuple[bool, tuple] | None":
+        """
+        メモの内容を (True, (node,)) または (False, ()) の形式で返す。
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        pos : int
+            開始位置
+
+        Returns
+        ----------
+        result : tuple[bool, tuple] | None
+            メモの内容、未登録の場合は None
+        """
+        successes, failures = self.tables[rule_id]
+        if is_failure(failures, pos):
+            return False, ()
+        nodes = successes.get(pos)
+        if nodes is None:
+            return None
+        return True, nodes
+
+    def set_success(self, rule_id:int, pos:int, nodes:tuple) -> None:
+        """
+        成功をメモに登録する
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        pos : int
+            開始位置
+        nodes : tuple(Node)
+            結果のノードのタプル
+        """
+        self.tables[rule_id][0][pos] = nodes
+
+    def set_failure(self, rule_id:int, pos:int) -> None:
+        """
+        失敗をメモに登録する
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        pos : int
+            開始位置
+        """
+        set_failure(self.tables[rule_id][1], pos)
+
+    def count(self) -> tuple[int, int]:
+        """
+        メモの件数を返す
+
+        Returns
+        ----------
+        successes : int
+            成功の件数
+        failures : int
+            失敗の件数
+        """
+        successes = 0
+        failures = 0
+        for success_dict, failure_dict in self.tables.values():
+            successes += len(success_dict)
+            for block in failure_dict.values():
+                failures += _count_bits(block)
+        return successes, failures
+
+    def evict_before(self, pos:int) -> int:
+        """
+        開始位置が pos より前のメモを削除する。
+        成功は位置の昇順のリスト (_sorted_positions) から pos より前の位置を求めて削除し、
+        pos 以降の成功は参照しない。
+        失敗のビット列は、ブロック全体が pos より前にあるものを削除し、
+        pos を含むブロックは pos より前のビットを消去する。
+
+        Parameters
+        ----------
+        pos : int
+            位置
+
+        Returns
+        ----------
+        evicted : int
+            削除した件数
+        """
+        evicted = 0
+        limit_block = pos >> BLOCK_BITS
+        for rule_id, (success_dict, failure_dict) in self.tables.items():
+            if success_dict:
+                entry = self._sorted_positions(rule_id, success_dict)
+                positions = entry[0]
+                index = bisect_left(positions, pos)
+                if index > 0:
+                    for p in positions[:index]:
+                        # 他の処理で削除済みの位置は数えない
+                        if success_dict.pop(p, None) is not None:
+                            evicted += 1
+                    del positions[:index]
+                    last = entry[1] = next(reversed(success_dict), None)
+                    entry[2] = success_dict.get(last)
+            elif rule_id in self._positions:
+                del self._positions[rule_id]
+
+            old_blocks = [b for b in failure_dict if b < limit_block]
+            for b in old_blocks:
+                evicted += _count_bits(failure_dict.pop(b))
+
+            block = failure_dict.get(limit_block)
+            if block is not None:
+                nbytes = (pos >> 3) & BYTE_MASK
+                if nbytes > 0:
+                    evicted += _count_bits(block[:nbytes])
+                    block[:nbytes] = bytes(nbytes)
+                mask = (1 << (pos & 7)) - 1
+                if block[nbytes] & mask:
+                    evicted += bin(block[nbytes] & mask).count("1")
+                    block[nbytes] &= ~mask & 0xff
+        return evicted
+
+    def _sorted_positions(self, rule_id:int, success_dict:dict) -> list:
+        """
+        規則の成功の位置の昇順のリストを、前回の evict_before 以降に登録された位置を加えて返す。
+
+        成功の辞書は登録順に並ぶため、前回の最後の位置 (とその結果) より後ろの位置のみを追加する。
+        最後の位置が削除または再登録されている場合は、すべての位置から作成し直す。
+
+        Parameters
+        ----------
+        rule_id : int
+            規則の番号
+        success_dict : dict[int, tuple(Node) | int]
+            規則のメモの表 (成功)
+
+        Returns
+        ----------
+        entry : list
+            [成功の位置の昇順のリスト, 成功の辞書の最後の位置, その位置の結果]
+        """
+        entry = self._positions.get(rule_id)
+        if entry is not None:
+            positions, last, value = entry
+            added = []
+            for p in reversed(success_dict):
+                if p == last and success_dict[p] is value:
+                    break
+                added.append(p)
+            else:
+                entry = None
+
+            if entry is not None and added:
+                added.sort()
+                if positions and added[0] < positions[-1]:
+                    positions.extend(added)
+                    positions.sort()
+                else:
+                    positions.extend(added)
+
+        if entry is None:
+            entry = self._positions[rule_id] = [sorted(success_dict), None, None]
+        last = entry[1] = next(reversed(success_dict))
+        entry[2] = success_dict[last]
+        return entry
+
+    def memory_size(self) -> int:
+        """
+        メモが使用するメモリの概算 (バイト) を返す。
+        ノード自体のサイズは含まない。
+
+        Returns
+        ----------
+        size : int
+            使用メモリの概算
+        """
+        size = sys.getsizeof(self.tables)
+        for success_dict, failure_dict in self.tables.values():
+            size += sys.getsizeof(success_dict) + sys.getsizeof(failure_dict)
+            size += sum(sys.getsizeof(nodes) for nodes in success_dict.values())
+            size += sum(sys.getsizeof(block) for block in failure_dict.values())
+        return size
+
+
+def _count_bits(block:bytearray) -> int:
+    """
+    ビット列の 1 のビットの数を返す
+    """
+    return bin(int.from_bytes(block, "little")).count("1")
+
+
+def is_failure(failures:dict, pos:int) -> bool:
+    """
+    失敗のビット列に位置 pos が登録されているかを返す
+
+    Parameters
+    ----------
+    failures : dict[int, bytearray]
+        規則の失敗のビット列
+    pos : int
+        開始位置
+
+    Returns
+    ----------
+    result : bool
+        登録されている場合 True
+    """
+    block = failures.get(pos >> BLOCK_BITS)
+    return block is not None and bool(block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)))
+
+
+def set_failure(failures:dict, pos:int) -> None:
+    """
+    失敗のビット列に位置 pos を登録する
+
+    Parameters
+    ----------
+    failures : dict[int, bytearray]
+        規則の失敗のビット列
+    pos : int
+        開始位置
+    """
+    block = failures.get(pos >> BLOCK_BITS)
+    if block is None:
+        block = failures[pos >> BLOCK_BITS] = bytearray(BLOCK_BYTES)
+    block[(pos >> 3) & BYTE_MASK] |= 1 << (pos & 7)
@@ -1,12 +1,23 @@
-from .reader import Reader
+from .reader import Reader, LineIndex
 from .exception import ParseException
 
 
 class Node(object):
     """
     ノードを示す基底クラス
+
+    行番号、列番号は、set_position で即時に計算するか、
+    行番号の索引 (LineIndex) のみを保持して最初の参照時に計算する。
     """
 
+    # 行番号、列番号の既定値
+    # (遅延計算時はインスタンスに値を持たず、索引のみを保持する)
+    _line_index:LineIndex = None
+    _linenum:int = 0
+    _column:int = 0
+    _end_linenum:int = 0
+    _end_column:int = 0
+
     def __init__(self) -> None:
         #: ノードの開始位置
         self.startpos:int = 0
@@ -20,14 +31,6 @@ class Node(object):
         self.children:tuple[Node] = ()
         #: ノードの種類
         self.type:str = ""
-        #: 開始位置の行番号
-        self.linenum:int = 0
-        #: 開始位置の列番号
-        self.column:int = 0
-        #: 終了位置の行番号
-        self.end_linenum:int = 0
-        #: 終了位置の列番号
-        self.end_column:int = 0
         #: 左側の隣接ノード
         self.left_neighbor:Node = None
         #: 右側の隣接ノード。
@@ -35,15 +38,98 @@ class Node(object):
         # 付加情報辞書
         self._attribute:dict[str,str] = {}
 
-    def set_position(self, r:"Reader", startpos:int, endpos:int) -> None:
+    def set_position(self, r:"Reader", startpos:int, endpos:int, lazy:bool=False) -> None:
+        """
+        ノードの開始位置、終了位置を設定する
+
+        Parameters
+        ----------
+        r : Reader
+            リーダー
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+        lazy : bool
+            True の場合、行番号、列番号は最初に参照されたときに計算する
+        """
         self.startpos = startpos
         self.endpos = endpos
-        sl, sc, _ = r.pos2linecolumn(startpos)
-        el, ec, _ = r.pos2linecolumn(endpos)
-        self.linenum = sl
-        self.column = sc
-        self.end_linenum = el
-        self.end_column = ec
+        if lazy:
+            self._line_index = r.get_line_index()
+        else:
+            line_index = r.get_line_index()
+            self._linenum, self._column = line_index.linecolumn(startpos)
+            self._end_linenum, self._end_column = line_index.linecolumn(endpos)
+
+    def _resolve_linecolumn(self) -> None:
+        """
+        保持している索引から行番号、列番号を計算する
+        """
+        line_index = self._line_index
+        self._linenum, self._column = line_index.linecolumn(self.startpos)
+        self._end_linenum, self._end_column = line_index.linecolumn(self.endpos)
+        self._line_index = None
+
+    @property
+    def linenum(self) -> int:
+        """
+        開始位置の行番号
+        """
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        return self._linenum
+
+    @linenum.setter
+    def linenum(self, value:int) -> None:
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        self._linenum = value
+
+    @property
+    def column(self) -> int:
+        """
+        開始位置の列番号
+        """
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        return self._column
+
+    @column.setter
+    def column(self, value:int) -> None:
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        self._column = value
+
+    @property
+    def end_linenum(self) -> int:
+        """
+        終了位置の行番号
+        """
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        return self._end_linenum
+
+    @end_linenum.setter
+    def end_linenum(self, value:int) -> None:
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        self._end_linenum = value
+
+    @property
+    def end_column(self) -> int:
+        """
+        終了位置の列番号
+        """
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        return self._end_column
+
+    @end_column.setter
+    def end_column(self, value:int) -> None:
+        if self._line_index is not None:
+            self._resolve_linecolumn()
+        self._end_column = value
 
     def get_linecolumn(self) -> tuple[int, int]:
         return self.linenum, self.column
@@ -119,10 +205,16 @@ class NonTerminalNode(Node):
         if _dict is not None and self.type in _dict:
             return _dict[self.type]
 
-        ret = ""
-        for r in self.children:
-            ret += r.get_str(_dict)
-        return ret
+        # 再帰呼び出しを行わず、未処理のノードのスタックで子孫の文字列を順に取得する
+        strs = []
+        stack = list(reversed(self.children))
+        while stack:
+            n = stack.pop()
+            if type(n) is NonTerminalNode and (_dict is None or n.type not in _dict):
+                stack.extend(reversed(n.children))
+            else:
+                strs.append(n.get_str(_dict))
+        return "".join(strs)
 
     def _get_node_str(self, detail_flg:bool) -> str:
         if detail_flg:
@@ -152,15 +244,20 @@ class NonTerminalNode(Node):
         ret : str
             階層を表現した文字列
         """        
-        if node_list is None or self.type in node_list:
-            ret = " " * 4 * level + self._get_node_str(detail_flg) + "\n"
-            level += 1
-        else:
-            ret = ""
-        for n in self.children:
-            if n:
-                ret += n.print_tree(level, node_list, detail_flg)
-        return ret
+        # 再帰呼び出しを行わず、(ノード, 階層の深さ) のスタックで処理する
+        # print_tree を再定義したノードは、そのノードの print_tree で出力する
+        ret = []
+        stack = [(self, level)]
+        while stack:
+            n, lv = stack.pop()
+            if type(n).print_tree is not NonTerminalNode.print_tree:
+                ret.append(n.print_tree(lv, node_list, detail_flg))
+                continue
+            if node_list is None or n.type in node_list:
+                ret.append(" " * 4 * lv + n._get_node_str(detail_flg) + "\n")
+                lv += 1
+            stack.extend([(cn, lv) for cn in reversed(n.children) if cn])
+        return "".join(ret)
 
     def get_childnode(self, nodetype:str) -> list["Node"]:
         """
@@ -194,15 +291,16 @@ class NonTerminalNode(Node):
         nl : list[Node]
             ノードのリスト
         """
-        # TODO : [課題] 遅いと思う。ロジック改善
+        # 再帰呼び出しを行わず、未処理の非終端ノードのスタックで行きがけ順に探索する
         nl = []
-        if self.type == nodetype:
-            nl.append(self)
-            if not deepsearch_flg:
-                return nl
-        for cn in self.children:
-            if isinstance(cn, NonTerminalNode):
-                nl.extend(cn.search_node(nodetype, deepsearch_flg))
+        stack = [self]
+        while stack:
+            n = stack.pop()
+            if n.type == nodetype:
+                nl.append(n)
+                if not deepsearch_flg:
+                    continue
+            stack.extend([cn for cn in reversed(n.children) if isinstance(cn, NonTerminalNode)])
         return nl
 
 
@@ -310,10 +408,14 @@ class ReconstructedNode(NonTerminalNode):
         self.parent = None
         self.children = ()
         self.type = node.type
-        self.linenum = node.linenum
-        self.column = node.column
-        self.end_linenum = node.end_linenum
-        self.end_column = node.end_column
+        if node._line_index is not None:
+            # 行番号、列番号は元のノードと同様に遅延計算する
+            self._line_index = node._line_index
+        else:
+            self._linenum = node._linenum
+            self._column = node._column
+            self._end_linenum = node._end_linenum
+            self._end_column = node._end_column
         self._attribute = node._attribute
 
         self.termstr:str = ""
@@ -349,31 +451,3 @@ class ReconstructedNode(NonTerminalNode):
             return str(self.nodenum) + " : " + self.type \
                     + " : " + self._get_position_str(detail_flg) \
                     + " : \"" + self.get_str() + "\""
-
-    def print_tree(self, level:int=0, node_list:list[str]=None, detail_flg:bool=False) -> str:
-        """
-        ツリー情報を返す
-
-        Parameters
-        ----------
-        level : int
-            階層の深さ
-        node_list : list[str]
-            出力するノードタイプのリスト
-        
-        Returns
-        ---------- 
-        ret : str
-            階層を表現した文字列
-        """
-        if node_list is None or self.type in node_list:
-            ret = " " * 4 * level + self._get_node_str(detail_flg) + "\n"
-            level += 1
-        else:
-            ret = ""
-        for n in self.children:
-            if n:
-                ret += n.print_tree(level, node_list, detail_flg)
-        return ret
-
-
@@ -0,0 +1,687 @@
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from time import perf_counter
+
+import importlib
+import os
+import regex
+import sys
+
+from .node import Node, NonTerminalNode, TerminalNode, FailureNode
+from .reader import LineIndex
+
+
+#: 解析結果の返し方
+#:   tree    : 構文木 (Node) を返す
+#:   compact : 構文木を serialize_tree の形式 (タプルの入れ子) で返す
+#:   stats   : 構文木を返さず、成功/失敗と統計情報のみ返す
+RESULT_MODES = ("tree", "compact", "stats")
+
+# serialize_tree のノードの種類
+_KIND_NONTERMINAL = 0
+_KIND_TERMINAL = 1
+_KIND_FAILURE = 2
+
+# ワーカープロセスで使用するパーサー (ワーカーの初期化時に一度だけ作成する)
+_worker_parser = None
+# parse_file_split のワーカープロセスで部分文字列を解析する (規則の関数, タイプ名)
+_worker_rule = None
+
+
+class FileResult(object):
+    """
+    parse_files の 1 ファイル分の解析結果
+    """
+
+    def __init__(self, index:int, path:str) -> None:
+        """
+        初期化
+
+        Parameters
+        ----------
+        index : int
+            parse_files に渡したパスの順番
+        path : str
+            ファイルパス
+        """
+        self.index = index      #: parse_files に渡したパスの順番
+        self.path = path        #: ファイルパス
+        self.success = False    #: 構文解析の成功/失敗
+        #: 構文解析結果のルートノード (result="tree")、serialize_tree の形式 (result="compact")、
+        #: または None (result="stats", 例外発生時)
+        self.tree = None
+        self.stats = {}         #: 構文解析の統計情報 (Parser.get_parse_stats)
+        self.error = None       #: 解析中に発生した例外の文字列 (例外が発生しなかった場合は None)
+        self.elapsed = 0.0      #: 解析時間 (秒)
+
+    def __repr__(self) -> str:
+        return "FileResult(index={0}, path={1!r}, success={2}, error={3!r})".format(
+            self.index, self.path, self.success, self.error)
+
+
+def serialize_tree(root:Node) -> tuple:
+    """
+    構文木を、プロセス間で受け渡しやすいタプルの入れ子に変換する。
+    親ノード、隣接ノードの参照を持たないため、pickle のサイズが小さく、深い木でも再帰しない。
+
+    各ノードは (種類, タイプ名 | 文字列, ノード番号, 開始位置, 終了位置,
+    行番号, 列番号, 終了行番号, 終了列番号, 子ノードのタプル) で表す。
+    種類は 0 : 非終端ノード, 1 : 終端ノード, 2 : 解析失敗ノード。
+
+    Parameters
+    ----------
+    root : Node
+        ルートノード
+
+    Returns
+    ----------
+    data : tuple
+        変換した構文木
+    """
+    return _serialize(root)
+
+
+def _serialize(root:Node, line_index:LineIndex=None, pos_offset:int=0, base_line:int=1, base_col:int=0) -> tuple:
+    """
+    構文木をタプルの入れ子に変換する。
+    line_index を指定した場合は、部分文字列の構文木として、行番号、列番号を line_index で求め、
+    部分文字列の開始位置 (pos_offset, 行番号 base_line, 列番号 base_col) からの位置に移動する。
+    """
+    # 再帰呼び出しを行わず、帰りがけ順に変換する
+    converted = {}
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, NonTerminalNode) and not visited:
+            stack.append((node, True))
+            stack.extend([(cn, False) for cn in node.children])
+            continue
+
+        if line_index is None:
+            linenum, column = node.linenum, node.column
+            end_linenum, end_column = node.end_linenum, node.end_column
+        else:
+            linenum, column = _shift_linecolumn(line_index, node.startpos, base_line, base_col)
+            end_linenum, end_column = _shift_linecolumn(line_index, node.endpos, base_line, base_col)
+
+        if isinstance(node, NonTerminalNode):
+            kind, value = _KIND_NONTERMINAL, node.type
+            children = tuple([converted.pop(id(cn)) if cn is not None else None for cn in node.children])
+        else:
+            kind = _KIND_FAILURE if isinstance(node, FailureNode) else _KIND_TERMINAL
+            value = node.termstr
+            children = ()
+        converted[id(node)] = (kind, value, node.nodenum, node.startpos + pos_offset, node.endpos + pos_offset,
+                               linenum, column, end_linenum, end_column, children)
+    return converted[id(root)]
+
+
+def _shift_linecolumn(line_index:LineIndex, pos:int, base_line:int, base_col:int) -> tuple[int, int]:
+    """
+    部分文字列の位置の行番号、列番号を、文字列全体の行番号、列番号に変換する
+    """
+    linenum, column = line_index.linecolumn(pos)
+    if linenum == 0:
+        # 空の文字列
+        return linenum, column
+    if linenum == 1:
+        return base_line, base_col + column
+    return base_line + linenum - 1, column
+
+
+def deserialize_tree(data:tuple, nodenum_offset:int=0) -> Node:
+    """
+    serialize_tree で変換した構文木からノードを作成し、親ノード、隣接ノードを設定する。
+
+    Parameters
+    ----------
+    data : tuple
+        serialize_tree で変換した構文木
+    nodenum_offset : int
+        ノード番号に加算する値
+
+    Returns
+    ----------
+    root : Node
+        ルートノード
+    """
+    # 再帰呼び出しを行わず、帰りがけ順にノードを作成する
+    created = {}
+    stack = [(data, False)]
+    while stack:
+        item, visited = stack.pop()
+        if item is None:
+            continue
+        kind, value, nodenum, startpos, endpos, linenum, column, end_linenum, end_column, children = item
+        if kind == _KIND_NONTERMINAL and not visited:
+            stack.append((item, True))
+            stack.extend([(cn, False) for cn in children])
+            continue
+
+        if kind == _KIND_NONTERMINAL:
+            node = NonTerminalNode(value, tuple([created.pop(id(cn)) if cn is not None else None
+                                                 for cn in children]))
+            _link_children(node)
+        elif kind == _KIND_TERMINAL:
+            node = TerminalNode(value)
+        else:
+            node = FailureNode(value)
+        node.nodenum = nodenum + nodenum_offset
+        node.startpos = startpos
+        node.endpos = endpos
+        node.linenum, node.column = linenum, column
+        node.end_linenum, node.end_column = end_linenum, end_column
+        created[id(item)] = node
+    return created[id(data)]
+
+
+def _link_children(node:NonTerminalNode) -> None:
+    """
+    子ノードに親ノード、隣接ノードを設定する
+    """
+    children = node.children
+    left = None
+    for cn in children:
+        if cn is None:
+            continue
+        cn.parent = node
+        cn.left_neighbor = left
+        cn.right_neighbor = None
+        if left is not None:
+            left.right_neighbor = cn
+        left = cn
+
+
+def _init_worker(parser_factory:Callable[[], "Parser"], parser_options:dict) -> None:
+    """
+    ワーカープロセスの初期化。パーサーを作成し、以降のファイルの解析で再利用する。
+    """
+    global _worker_parser
+    _worker_parser = _create_parser(parser_factory, parser_options)
+
+
+def _create_parser(parser_factory:Callable[[], "Parser"], parser_options:dict) -> "Parser":
+    parser = parser_factory()
+    for name, value in (parser_options or {}).items():
+        setattr(parser, name, value)
+    return parser
+
+
+def _parse_chunk(tasks:list[tuple[int, str]], encoding:str, typename:str, result:str,
+                 parser:"Parser"=None) -> list[FileResult]:
+    """
+    ファイルのまとまりを順に解析する。ファイルごとに例外を捕捉し、他のファイルの解析を続ける。
+    """
+    if parser is None:
+        parser = _worker_parser
+    results = []
+    for index, path in tasks:
+        res = FileResult(index, path)
+        start = perf_counter()
+        try:
+            flg, tree = parser.parse_file(path, encoding, typename)
+            res.success = bool(flg)
+            res.stats = parser.get_parse_stats()
+            if tree is not None and result != "stats":
+                res.tree = serialize_tree(tree)
+        except Exception as e:
+            res.success = False
+            res.error = "{0}: {1}".format(type(e).__name__, e)
+        res.elapsed = perf_counter() - start
+        results.append(res)
+    return results
+
+
+def parse_files(parser_factory:Callable[[], "Parser"],
+                paths:Iterable[str],
+                workers:int=None,
+                encoding:str="utf-8",
+                typename:str="",
+                result:str="tree",
+                chunksize:int=1,
+                ordered:bool=True,
+                parser_options:dict=None) -> Iterator[FileResult]:
+    """
+    複数のファイルを、プロセスプールで並列に構文解析する。
+    解析が終わったファイルから順に、FileResult を返す。
+
+    各ワーカープロセスでは、初期化時に parser_factory でパーサーを一度だけ作成し、
+    割り当てられたファイルの解析で再利用する。
+    ファイルごとに例外を捕捉するため、1 ファイルの例外で他のファイルの解析は中断しない。
+    (ワーカープロセスが異常終了した場合は、そのプロセスに割り当てたファイルを例外として返す)
+
+        for res in parse_files(MyParser, paths, workers=8, result="stats"):
+            print(res.path, res.success, res.stats["nodes"])
+
+    Parameters
+    ----------
+    parser_factory : Callable[[], Parser]
+        パーサーを作成する関数 (生成したパーサーのクラスなど)。
+        ワーカープロセスに渡すため、pickle 可能 (モジュールの最上位で定義) である必要がある
+    paths : Iterable[str]
+        ファイルパス
+    workers : int
+        ワーカープロセス数。None の場合は CPU 数、0 の場合はプロセスプールを使わず、このプロセスで解析する
+    encoding : str
+        ファイルのエンコード
+    typename : str
+        起点ノードのタイプ名
+    result : str
+        解析結果の返し方 (RESULT_MODES)。
+        "tree" : 構文木 (Node)、"compact" : serialize_tree の形式、"stats" : 統計情報のみ
+    chunksize : int
+        ワーカープロセスに一度に割り当てるファイル数。小さなファイルが多い場合は大きくすると
+        プロセス間通信の回数が減る
+    ordered : bool
+        True の場合は paths の順に返す。False の場合は解析が終わった順に返す
+    parser_options : dict
+        作成したパーサーに設定する属性 (例 : {"use_vm": True})
+
+    Returns
+    ----------
+    results : Iterator[FileResult]
+        ファイルごとの解析結果
+    """
+    if result not in RESULT_MODES:
+        raise ValueError("result must be one of {0}. result={1!r}".format(RESULT_MODES, result))
+    if chunksize < 1:
+        raise ValueError("chunksize must be 1 or more. chunksize={0}".format(chunksize))
+
+    chunks = _iter_chunks(paths, chunksize)
+    if workers == 0:
+        parser = _create_parser(parser_factory, parser_options)
+        for tasks in chunks:
+            yield from _convert_results(_parse_chunk(tasks, encoding, typename, result, parser), result)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(parser_factory, parser_options)) as executor:
+        # 未完了のまとまりの数を制限し、パスを必要な分だけ読み進める
+        max_pending = (workers or os.cpu_count() or 1) * 2
+        pending = deque()
+        for tasks in chunks:
+            pending.append((executor.submit(_parse_chunk, tasks, encoding, typename, result), tasks))
+            while len(pending) >= max_pending:
+                yield from _pop_results(pending, ordered, result)
+        while pending:
+            yield from _pop_results(pending, ordered, result)
+
+
+def _iter_chunks(paths:Iterable[str], chunksize:int) -> Iterator[list[tuple[int, str]]]:
+    chunk = []
+    for index, path in enumerate(paths):
+        chunk.append((index, path))
+        if len(chunk) >= chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _pop_results(pending:deque, ordered:bool, result:str) -> Iterator[FileResult]:
+    """
+    完了したまとまりの解析結果を返す。ordered の場合は先頭のまとまりの完了を待つ
+    """
+    if ordered:
+        done = [pending[0]]
+    else:
+        wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+        done = [item for item in pending if item[0].done()]
+    for item in done:
+        pending.remove(item)
+        future, tasks = item
+        try:
+            results = future.result()
+        except Exception as e:
+            # ワーカープロセスの異常終了、解析結果の受け渡しの失敗
+            results = []
+            for index, path in tasks:
+                res = FileResult(index, path)
+                res.error = "{0}: {1}".format(type(e).__name__, e)
+                results.append(res)
+        yield from _convert_results(results, result)
+
+
+def _convert_results(results:list[FileResult], result:str) -> Iterator[FileResult]:
+    for res in results:
+        if result == "tree" and res.tree is not None:
+            res.tree = deserialize_tree(res.tree)
+        yield res
+
+
+class _Chunk(object):
+    """
+    parse_file_split で分割した部分文字列
+    """
+
+    def __init__(self, text:str, offset:int, base_line:int, base_col:int, is_last:bool) -> None:
+        self.text = text            # 部分文字列
+        self.offset = offset        # 開始位置
+        self.base_line = base_line  # 開始位置の行番号
+        self.base_col = base_col    # 開始位置の列番号
+        self.is_last = is_last      # ファイルの終端までの部分文字列の場合 True
+        self.result = None          # 解析結果 (_parse_split_chunk の戻り値)
+        self.prev = None            # 直前の部分文字列
+
+
+def _init_split_worker(parser_factory:Callable[[], "Parser"], parser_options:dict,
+                       typename:str, record:str) -> None:
+    """
+    parse_file_split のワーカープロセスの初期化。パーサーと部分文字列を解析する規則を作成する。
+    """
+    global _worker_parser, _worker_rule
+    _worker_parser = _create_parser(parser_factory, parser_options)
+    _worker_rule = _create_split_rule(_worker_parser, typename, record)
+
+
+def _create_split_rule(parser:"Parser", typename:str, record:str) -> tuple[Callable, str]:
+    """
+    部分文字列を解析する (規則の関数, タイプ名) を返す。
+    record を指定した場合は、record の 0 回以上の繰り返しとファイルの終端の規則を作成する。
+    """
+    if not typename:
+        typename = parser.toptypename
+    if not record:
+        return parser.def_dict[typename], typename
+
+    record_function = parser.def_dict[record]
+
+    def split_rule():
+        # record* _EOF
+        return parser._seq(parser._rpt(parser._p(record_function, record), 0),
+                           parser._p(parser._eof, "_EOF"))
+
+    return split_rule, typename
+
+
+def _parse_split_chunk(text:str, offset:int, base_line:int, base_col:int, is_last:bool,
+                       parser:"Parser"=None, rule:tuple[Callable, str]=None) -> tuple:
+    """
+    部分文字列を解析し、(成功/失敗, 構文木 | 失敗位置, 作成したノード数) を返す。
+    構文木は serialize_tree の形式で、位置、行番号、列番号をファイル全体の位置に移動する。
+    失敗位置は (位置, 行番号, 列番号, その次の文字)。
+    """
+    if parser is None:
+        parser, rule = _worker_parser, _worker_rule
+    rootexp, typename = rule
+    flg, tree = parser.parse_string(text, rootexp, typename)
+    # ファイルの途中で終わる部分文字列は、終端の位置を次の部分文字列の開始位置として扱う
+    line_index = LineIndex(text if is_last else text + "\0")
+    if not flg:
+        maxposition = parser._reader.getmaxposition()
+        linenum, column = _shift_linecolumn(line_index, maxposition, base_line, base_col)
+        return False, (offset + maxposition, linenum, column, text[maxposition:maxposition + 1]), 0
+    return True, _serialize(tree, line_index, offset, base_line, base_col), parser.get_parse_stats()["nodes"]
+
+
+def _iter_split(fin:"io.TextIOBase", resync:"regex.Pattern", chunk_size:int) -> Iterator[_Chunk]:
+    """
+    ファイルを読み進めながら、chunk_size 文字以上の位置で resync に一致した位置で分割する
+    """
+    buf = ""
+    offset = 0
+    base_line, base_col = 1, 0
+    eof = False
+    while not eof:
+        data = fin.read(chunk_size)
+        eof = not data
+        buf += data
+        while len(buf) > chunk_size:
+            m = resync.search(buf, chunk_size)
+            # 一致が文字列の終わりに接する場合は、続きを読み込んでから判定する
+            if m is None or (m.end() >= len(buf) and not eof):
+                break
+            text, buf = buf[:m.start()], buf[m.start():]
+            yield _Chunk(text, offset, base_line, base_col, False)
+            offset += len(text)
+            base_line, base_col = _shift_linecolumn(LineIndex(text + "\0"), len(text), base_line, base_col)
+    if buf or offset == 0:
+        yield _Chunk(buf, offset, base_line, base_col, True)
+
+
+def parse_file_split(parser_factory:Callable[[], "Parser"],
+                     filepath:str,
+                     resync:"str | regex.Pattern"=None,
+                     encoding:str="utf-8",
+                     typename:str="",
+                     record:str="",
+                     chunk_size:int=1 << 20,
+                     workers:int=None,
+                     parser_options:dict=None) -> tuple[bool, Node]:
+    """
+    独立したレコードが並んだ 1 つの大きなファイルを分割し、プロセスプールで並列に構文解析する。
+    部分文字列の構文木のノードをルートノードの下に連結し、ファイル全体を解析した場合と同じ位置、
+    行番号、列番号の構文木を返す。
+
+    ファイルは chunk_size 文字以上の位置で、resync (再同期の正規表現) に一致した位置の前で分割する。
+    各部分文字列は、record を指定した場合は record の 0 回以上の繰り返しとして、
+    指定しない場合は typename の規則で解析するため、レコードの並びを解析できる規則である必要がある。
+    resync を指定しない場合は、行の先頭で分割する (record の指定が必要)。
+
+    各部分文字列の終端 (_EOF) のノードは、ファイルの終端のもののみ残す。
+
+    分割位置がレコードの途中だった場合など、部分文字列の解析が失敗した場合は、続けて失敗した部分文字列と、
+    その次の部分文字列 (分割位置の後ろが単独で解析できた場合も含む) を連結して再度解析する。
+    連結しても失敗する場合は、解析失敗とする。
+
+        flg, tree = parse_file_split(MyParser, filepath, r"^(?=BEGIN)", workers=8)
+
+    Parameters
+    ----------
+    parser_factory : Callable[[], Parser]
+        パーサーを作成する関数 (生成したパーサーのクラスなど)。pickle 可能である必要がある
+    filepath : str
+        ファイルパス
+    resync : str | regex.Pattern
+        レコードの開始位置に一致する正規表現。文字列の場合は MULTILINE で作成する
+    encoding : str
+        ファイルのエンコード
+    typename : str
+        ルートノードのタイプ名 (record を指定しない場合は、部分文字列を解析する規則)
+    record : str
+        レコードの規則のタイプ名
+    chunk_size : int
+        部分文字列の最小の文字数
+    workers : int
+        ワーカープロセス数。None の場合は CPU 数、0 の場合はプロセスプールを使わず、このプロセスで解析する
+    parser_options : dict
+        作成したパーサーに設定する属性 (例 : {"use_vm": True})
+
+    Returns
+    ----------
+    result : boolean
+        構文解析の成功/失敗
+    tree : Node
+        構文解析結果のルートノード (失敗時は FailureNode)
+    """
+    if resync is None:
+        if not record:
+            raise ValueError("resync or record must be specified.")
+        resync = "^"
+    if isinstance(resync, str):
+        resync = regex.compile(resync, regex.M)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be 1 or more. chunk_size={0}".format(chunk_size))
+
+    if workers == 0:
+        parser = _create_parser(parser_factory, parser_options)
+        rule = _create_split_rule(parser, typename, record)
+        submit = lambda c: _Done(_parse_split_chunk(c.text, c.offset, c.base_line, c.base_col,
+                                                    c.is_last, parser, rule))
+        return _run_split(filepath, encoding, resync, chunk_size, submit, 2, rule[1])
+
+    with ProcessPoolExecutor(workers, initializer=_init_split_worker,
+                             initargs=(parser_factory, parser_options, typename, record)) as executor:
+        submit = lambda c: executor.submit(_parse_split_chunk, c.text, c.offset, c.base_line, c.base_col,
+                                           c.is_last)
+        return _run_split(filepath, encoding, resync, chunk_size, submit, (workers or os.cpu_count() or 1) * 2,
+                          typename or parser_factory().toptypename)
+
+
+class _Done(object):
+    """
+    プロセスプールを使用しない場合の、完了済の解析結果
+    """
+
+    def __init__(self, value:object) -> None:
+        self.value = value
+
+    def result(self) -> object:
+        return self.value
+
+
+def _run_split(filepath:str, encoding:str, resync:"regex.Pattern", chunk_size:int,
+               submit:Callable, max_pending:int, typename:str) -> tuple[bool, Node]:
+    """
+    ファイルを分割して解析し、失敗した部分文字列を連結して再度解析した後、構文木を連結する
+    """
+    chunks = []
+    pending = deque()
+    with open(filepath, "r", encoding=encoding) as fin:
+        for chunk in _iter_split(fin, resync, chunk_size):
+            if chunks:
+                chunk.prev = chunks[-1]
+            chunks.append(chunk)
+            pending.append((submit(chunk), chunk))
+            while len(pending) >= max_pending:
+                _receive(pending.popleft())
+    while pending:
+        _receive(pending.popleft())
+
+    # 失敗した部分文字列に、続けて失敗した部分文字列と、その次の成功した部分文字列を連結して再度解析する
+    # (分割位置がレコードの途中でも、分割位置の後ろは単独で解析できる場合がある)
+    merged = []
+    retry = []
+    joining = False     # 直前の部分文字列が失敗し、連結を続ける場合 True
+    for chunk in chunks:
+        chunk.prev = None
+        if joining:
+            prev = merged[-1]
+            if not retry or retry[-1] is not prev:
+                retry.append(prev)
+            prev.text += chunk.text
+            prev.is_last = chunk.is_last
+        else:
+            merged.append(chunk)
+        joining = not chunk.result[0]
+    for chunk in retry:
+        pending.append((submit(chunk), chunk))
+    while pending:
+        _receive(pending.popleft())
+
+    for chunk in merged:
+        flg, data, _ = chunk.result
+        if not flg:
+            pos, linenum, column, char = data
+            node = FailureNode("Parse failed! ( maxposition is line:%s column:%s @[%s])" % (linenum, column, char))
+            node.startpos, node.endpos = 0, pos
+            node.linenum, node.column = 1, 0
+            node.end_linenum, node.end_column = linenum, column
+            return False, node
+
+    # 部分文字列のルートノードの子を、ファイル全体のルートノードの子として連結する
+    children = []
+    nodenum_offset = 0
+    last = merged[-1]
+    for chunk in merged:
+        _, data, nodes = chunk.result
+        data_children = data[9]
+        if chunk is not last and data_children and data_children[-1] is not None \
+                and data_children[-1][1] == "_EOF":
+            # 部分文字列の終端 (_EOF) のノードは、ファイルの終端のみ残す
+            data_children = data_children[:-1]
+        children.extend([deserialize_tree(cn, nodenum_offset) if cn is not None else None for cn in data_children])
+        nodenum_offset += nodes
+        if chunk is merged[0]:
+            start = (data[5], data[6])
+        end = (data[4], data[7], data[8])
+        chunk.result = None
+    root = NonTerminalNode(typename, tuple(children))
+    _link_children(root)
+    root.startpos, root.endpos = 0, end[0]
+    root.linenum, root.column = start
+    root.end_linenum, root.end_column = end[1], end[2]
+    return True, root
+
+
+def _receive(item:tuple) -> None:
+    future, chunk = item
+    chunk.result = future.result()
+    if chunk.result[0] and (chunk.prev is None or chunk.prev.result[0]):
+        # 成功した部分文字列は、直前の部分文字列が失敗した場合 (連結して再度解析する) を除き、文字列を保持しない
+        chunk.text = ""
+
+
+def load_parser_class(spec:str) -> type:
+    """
+    "モジュール名:クラス名" 形式の指定からパーサーのクラスを読み込む。
+    モジュールはカレントディレクトリからも検索する。
+
+    Parameters
+    ----------
+    spec : str
+        "モジュール名:クラス名" (例 : "mypackage.myparser:MyParser")
+
+    Returns
+    ----------
+    parser_class : type
+        パーサーのクラス
+    """
+    modulename, sep, classname = spec.partition(":")
+    if not sep or not modulename or not classname:
+        raise ValueError("parser must be \"module:ClassName\". parser={0!r}".format(spec))
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    return getattr(importlib.import_module(modulename), classname)
+
+
+def main() -> None:
+    argparser = ArgumentParser("Parallel Parser")
+    argparser.add_argument("parser", help="parser class (\"module:ClassName\").")
+    argparser.add_argument("input", nargs="+", help="input filepaths.")
+    argparser.add_argument("-e", "--encoding", default="utf-8", help="input file encoding")
+    argparser.add_argument("-t", "--typename", default="", help="root rule name (default : top rule).")
+    argparser.add_argument("-w", "--workers", type=int, help="number of worker processes (default : cpu count).")
+    argparser.add_argument("-c", "--chunksize", type=int, default=1, help="files per task (default : 1).")
+    argparser.add_argument("-u", "--unordered", action="store_true", help="output results as they complete.")
+    argparser.add_argument("--tree", action="store_true", help="output the parse tree of each file.")
+    argparser.add_argument("--resync", help="split each file before matches of this pattern and parse the parts "
+                                            "in parallel.")
+    argparser.add_argument("--record", help="split each file and parse the parts as repetitions of this rule.")
+    argparser.add_argument("--split-size", type=int, default=1 << 20,
+                           help="minimum characters of a split part (default : 1048576).")
+
+    args = argparser.parse_args()
+    parser_class = load_parser_class(args.parser)
+    failed = 0
+    if args.resync is not None or args.record is not None:
+        for path in args.input:
+            start = perf_counter()
+            flg, tree = parse_file_split(parser_class, path, args.resync, args.encoding, args.typename,
+                                         args.record or "", args.split_size, args.workers)
+            print("{0}\t{1}\t{2:.3f}".format(path, "OK" if flg else "NG", perf_counter() - start))
+            if args.tree or not flg:
+                sys.stdout.write(tree.print_tree(1))
+            if not flg:
+                failed += 1
+        sys.exit(1 if failed else 0)
+
+    for res in parse_files(parser_class, args.input, args.workers, args.encoding, args.typename,
+                           "tree" if args.tree else "stats", args.chunksize, not args.unordered):
+        status = "ERROR" if res.error is not None else "OK" if res.success else "NG"
+        print("{0}\t{1}\t{2}\t{3:.3f}".format(res.path, status, res.stats.get("nodes", 0), res.elapsed))
+        if res.error is not None:
+            print("    " + res.error)
+        if args.tree and res.tree is not None:
+            sys.stdout.write(res.tree.print_tree(1))
+        if not res.success:
+            failed += 1
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from logging import config, getLogger, Logger
 from argparse import ArgumentParser
 
+import ast
 import os
 import regex
 
@@ -9,6 +10,7 @@ from .exception import TacParserException, ParseException
 from .baseparser import postorder_travel
 from .expegparser import ExPegParser
 from .astactions import AstActions
+from .reader import refers_before
 
 # 標準の Logger
 config.fileConfig(os.path.join(os.path.dirname(__file__), 'logging.conf'))
@@ -18,7 +20,16 @@ default_logger = getLogger(__name__)
 class ParserGenerator(object):
     """
     指定されたpeg形式ファイルからParserスクリプトを生成するクラス。
+
+    生成するスクリプトの形式 (backend)
+        combinator : 規則ごとに _seq, _sel などの関数の組み合わせを返す関数を生成する。
+        direct     : 規則ごとに位置を受け取って直接解析する関数を生成する。
+                     ループ、位置の変数、正規表現の呼び出しを展開するため、高速に動作する。
+                     作成する構文解析木は combinator と同じ。
     """
+
+    #: 生成するスクリプトの形式
+    BACKENDS = ("combinator", "direct")
     def __init__(self, 
                  pegfilepath:str, 
                  encoding:str="utf-8", 
@@ -43,6 +54,8 @@ class ParserGenerator(object):
 
         # 正規表現の名称、表現の辞書
         self.__regdict = {}
+        # direct バックエンドで bounded_pattern を使用する正規表現がある場合 True
+        self.__bounded = False
 
         # 構文規則リスト
         self.__definition = []
@@ -50,13 +63,30 @@ class ParserGenerator(object):
         # サブ構文規則リスト
         self.__sub_definition = []
 
+        # 生成するスクリプトの形式
+        self.backend = "combinator"
+        # direct バックエンドの一時変数の番号
+        self.__direct_varcount = 0
+        # direct バックエンドで、検証用の関数 (ノードを作成しない v_xxx) を作成中の場合 True
+        self.__recognize = False
+        # direct バックエンドの規則の番号 (タイプ名 -> 番号)
+        self.__rule_ids = {}
+        # 左再帰の規則 (規則名 -> 左再帰の起点の規則の場合 True)
+        self.__left_recursion = {}
+        # 選択肢の先頭文字の集合を求めるクラス
+        self.__first = None
+        #: 選択で、次の文字により実行する選択肢を絞り込む処理を生成する場合 True
+        self.first_dispatch = True
+        #: リテラルのみの選択を、一つの正規表現で照合する処理を生成する場合 True
+        self.literal_choice = True
+
         if not os.path.isfile(pegfilepath):
             err_msg = "File %s not found" % pegfilepath
             self.__logger.critical(err_msg)
             raise ParseException(err_msg)
         self.parser = ExPegParser(logger)
 
-    def generate_file(self, parsername:str="", outfilepath:str="") -> str:
+    def generate_file(self, parsername:str="", outfilepath:str="", backend:str="combinator") -> str:
         """
         構文解析実行スクリプトを作成する
 
@@ -67,12 +97,19 @@ class ParserGenerator(object):
         outfilepath : str
             出力ファイルパスを指定する。
             指定なしの場合、peg のルートの名称 + parser を使用する
+        backend : str
+            生成するスクリプトの形式 ("combinator" または "direct")
 
         Returns
         ---------- 
         file : str
             出力したスクリプトの内容
         """
+        if backend not in self.BACKENDS:
+            raise ValueError("Unknown backend <{0}>".format(backend))
+        self.backend = backend
+        self.__bounded = False
+
         self.__logger.info("Start generating Parser. \"{0}\"".format(self.pegfilepath))
 
         parse_result, tree = self.parser.parse_file(
@@ -84,6 +121,8 @@ class ParserGenerator(object):
         self.__logger.debug("Check tree start.")
         checker = ParserChecker(tree, self.__logger)
         checker.check_tree(tree)
+        self.__left_recursion = checker.left_recursion
+        self.__first = FirstCharAnalyzer(tree) if self.first_dispatch else None
 
         strparser = self._travel_generate_file(tree)
 
@@ -96,16 +135,30 @@ class ParserGenerator(object):
         self.__logger.debug("Generate file string start.")
         impstr = "from tacparser import Parser\n" \
                  "import regex\n\n\n"
-
-        preparserstr = "class " + parsername + "(Parser):\n\n" \
-                                               "    def __init__(self, logger=None):\n" \
-                                               "        if logger is not None:\n" \
-                                               "            Parser.__init__(self, logger)\n" \
-                                               "        else:\n" \
-                                               "            Parser.__init__(self)\n" \
-                                               "        self.top = self.p_{0}\n" \
-                                               "        self.toptypename = \"{1}\"\n" \
-                                               "".format(self.rootname.lower(), self.rootname)
+        if backend == "direct":
+            impstr = "from tacparser import Parser\n" \
+                     "from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes\n"
+            if self.__bounded:
+                impstr += "from tacparser.reader import bounded_pattern\n"
+            impstr += "import regex\n\n\n"
+
+        preparserstr = "class " + parsername + "(Parser):\n\n"
+        if backend == "direct":
+            # direct バックエンドは文字列 (str) に対して直接照合するため、MmapFileReader を使用しない
+            preparserstr += "    needs_str_contents = True\n\n"
+        preparserstr += "    def __init__(self, logger=None):\n" \
+                         "        if logger is not None:\n" \
+                         "            Parser.__init__(self, logger)\n" \
+                         "        else:\n" \
+                         "            Parser.__init__(self)\n" \
+                         "        self.top = self.p_{0}\n" \
+                         "        self.toptypename = \"{1}\"\n" \
+                         "".format(self.rootname.lower(), self.rootname)
+        if backend == "direct":
+            # メモの表の参照に使用する規則の番号
+            ids_str = (",\n" + " " * 26).join(["\"" + typename + "\": " + str(rule_id)
+                                                for typename, rule_id in self.__rule_ids.items()])
+            preparserstr += "        self._rule_ids = {" + ids_str + "}\n"
         # 構文辞書の追加
         dict_str = (",\n" + " " * 25).join(["\"" + d_name + "\": self.p_" + d_name.lower()
                                              for d_name in self.__definition])
@@ -122,6 +175,12 @@ class ParserGenerator(object):
                 subtype_str = "\"" + self.__sub_definition[0] + "\""
             str_subdef_list += "        self.def_subtypename = [" + subtype_str + "]\n"
 
+        # 左再帰の規則の追加
+        if len(self.__left_recursion) > 0:
+            lr_str = (",\n" + " " * 31).join(["\"" + lr_name + "\": " + str(leader)
+                                               for lr_name, leader in self.__left_recursion.items()])
+            str_subdef_list += "        self.left_recursion = {" + lr_str + "}\n"
+
         self.__logger.debug("Output to file \"{0}\" start.".format(outfilepath))
         with open(outfilepath, "w", encoding='utf-8', newline="\n") as fout:
             fout.write(impstr + preparserstr + str_def_list + str_subdef_list + strparser)
@@ -159,17 +218,24 @@ class ParserGenerator(object):
             defname = tree.get_childnode("DefinitionIdentifier")[0].get_str({'Spacing': ""})
             def_funcname = "p_" + defname.lower()
             self.__definition.append(defname)
+            if self.backend == "direct":
+                return self._get_direct_defstring(tree, def_funcname, level)
             return self._get_defstring(tree, def_funcname, level)
 
         elif tree.type == "MacroDefinition":
             defname = tree.get_childnode("MacroIdentifier")[0].get_str({'Spacing': ""})
             def_funcname = "t_" + defname.lower()
+            if self.backend == "direct":
+                return self._get_direct_defstring(tree, def_funcname, level)
             return self._get_defstring(tree, def_funcname, level)
 
         elif tree.type == "SubDefinition":
             basename = tree.get_childnode("DefinitionIdentifier")[0].get_str({'Spacing': ""})
             def_funcname = "s_" + basename.lower()
-            defstring = self._get_defstring(tree, def_funcname, level)
+            if self.backend == "direct":
+                defstring = self._get_direct_defstring(tree, def_funcname, level)
+            else:
+                defstring = self._get_defstring(tree, def_funcname, level)
 
             self.__sub_definition.append(basename)
             return defstring
@@ -178,12 +244,21 @@ class ParserGenerator(object):
             return "".join([self._travel_generate_file(cn, level) for cn in tree.children])
 
         elif tree.type in {"Selection", "MacroSelection"}:
+            reg_value = self._get_literal_choice(tree)
+            if reg_value is not None:
+                # リテラルのみの選択は、一つの正規表現で照合する
+                return "self._r(self." + self.__regdict[reg_value] + ")"
+
             start = "self._sel("
             end = " " * (level + 10) + ")"
 
             joinstr = ",\n" + " " * (level + 10)
-            s = joinstr.join([self._travel_generate_file(cn, level + 10)
-                              for cn in tree.children if cn.type in {"Sequence", "MacroSequence"}])
+            alts = [self._travel_generate_file(cn, level + 10)
+                    for cn in tree.children if cn.type in {"Sequence", "MacroSequence"}]
+            first = self._get_first_chars(tree)
+            if first is not None:
+                alts.append("first=(" + ", ".join([repr(chars) for chars in first]) + ")")
+            s = joinstr.join(alts)
             s += "\n"
             return start + s + end
 
@@ -204,6 +279,9 @@ class ParserGenerator(object):
             return "self._not(" + \
                    "".join([self._travel_generate_file(cn, level + 10) for cn in tree.children]) + ")"
 
+        elif tree.type == "Commit":
+            return "self._commit()"
+
         elif tree.type == "SkipPrefix":
             return "self._skip(" + \
                    "".join([self._travel_generate_file(cn, level + 10) for cn in tree.children]) + ")"
@@ -266,7 +344,8 @@ class ParserGenerator(object):
 
         return "".join([self._travel_generate_file(cn, level) for cn in tree.children])
 
-    def _get_literal_value(self, tree:NonTerminalNode) -> str:
+    @staticmethod
+    def _get_literal_value(tree:NonTerminalNode) -> str:
         """
         リテラル文字列を取得
 
@@ -293,7 +372,7 @@ class ParserGenerator(object):
         else:
             s = ""
             for cn in tree.children:
-                s += self._get_literal_value(cn)
+                s += ParserGenerator._get_literal_value(cn)
             return s
 
     def _get_defstring(self, tree:NonTerminalNode, defname:str, level:int) -> str:
@@ -314,6 +393,35 @@ class ParserGenerator(object):
         retstr : str
             定義に対応する文字列
         """
+        cmtline = self._get_comment_lines(tree, level)
+        regstr = self._get_regstring(tree, defname, level)
+
+        defnode = tree.get_childnode("DefinitionExpression")
+        if len(defnode) == 0:
+            defnode = tree.get_childnode("MacroExpression")
+
+        expstr = self._travel_generate_file(defnode[0], level + 11)
+        retstr = " " * level + "def " + defname + "(self):\n" \
+                 + cmtline \
+                 + " " * (level + 4) + "return " + expstr + "\n"
+        return "\n" + regstr + retstr
+
+    def _get_comment_lines(self, tree:NonTerminalNode, level:int) -> str:
+        """
+        構文解析定義の原文をコメントとして取得する
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            構文解析木
+        level : int
+            深さ
+
+        Returns
+        ---------- 
+        cmtline : str
+            コメント行の文字列
+        """
         # ツリー全体を取得
         orig = self.parser.get_contents(tree).splitlines()
         # コメント
@@ -321,27 +429,596 @@ class ParserGenerator(object):
         for l in orig:
             if len(l) != 0:
                 cmtline += " " * (level + 4) + "# " + l + "\n"
+        return cmtline
+
+    def _get_regstring(self, tree:NonTerminalNode, defname:str, level:int) -> str:
+        """
+        構文解析定義で使用する正規表現の定義を取得し、正規表現の辞書に登録する
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            構文解析木
+        defname : str
+            定義名
+        level : int
+            深さ
 
-        reglist = tree.search_node("RegularExp")
+        Returns
+        ---------- 
+        regstr : str
+            正規表現の定義の文字列
+        """
+        reglist = [self._get_reg_value(reg) for reg in tree.search_node("RegularExp")]
+        # リテラルのみの選択を照合する正規表現
+        for sel in tree.search_node("Selection", True) + tree.search_node("MacroSelection", True):
+            reg_value = self._get_literal_choice(sel)
+            if reg_value is not None:
+                reglist.append(reg_value)
         regstr = ""
         for i in range(0, len(reglist)):
-            strreg = self._get_reg_value(reglist[i])
+            strreg = reglist[i]
             regtitle = "_reg_" + defname + str(i)
             self.__regdict[strreg] = regtitle
+            compiled = "regex.compile(" + strreg + ")"
+            if self.backend == "direct" and refers_before(eval(compiled).pattern):
+                # direct バックエンドは pos を指定して照合するため、照合位置より前を参照する正規表現は
+                # 照合範囲を切り出して照合する
+                compiled = "bounded_pattern(" + compiled + ")"
+                self.__bounded = True
             regstr += " " * level \
                       + "_reg_" + defname + str(i) \
-                      + " = regex.compile(" + strreg + ")\n\n"
+                      + " = " + compiled + "\n\n"
+        return regstr
+
+    @staticmethod
+    def _get_direct_funcname(defname:str, recognize:bool=False) -> str:
+        """
+        direct バックエンドの規則の本体の関数名を返す
+        (p_xxx -> d_xxx, s_xxx -> ds_xxx, t_xxx -> dt_xxx)
+        recognize=True の場合は検証用の関数名 (v_xxx, vs_xxx, vt_xxx) を返す
+        """
+        head = "v" if recognize else "d"
+        prefix, name = defname.split("_", 1)
+        if prefix == "p":
+            return head + "_" + name
+        return head + prefix + "_" + name
+
+    def _get_direct_defstring(self, tree:NonTerminalNode, defname:str, level:int) -> str:
+        """
+        一つの構文解析定義の実装部を取得する (direct バックエンド)
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            構文解析木
+        defname : str
+            定義名
+        level : int
+            深さ
+
+        Returns
+        ---------- 
+        retstr : str
+            定義に対応する文字列
+        """
+        cmtline = self._get_comment_lines(tree, level)
+        regstr = self._get_regstring(tree, defname, level)
 
         defnode = tree.get_childnode("DefinitionExpression")
         if len(defnode) == 0:
             defnode = tree.get_childnode("MacroExpression")
 
-        expstr = self._travel_generate_file(defnode[0], level + 11)
-        retstr = " " * level + "def " + defname + "(self):\n" \
-                 + cmtline \
-                 + " " * (level + 4) + "return " + expstr + "\n"
+        if defname.startswith("t_"):
+            # マクロはノードを作成せずに解析し、読み込んだ範囲の文字列を一つの終端ノードにする
+            lines = ["e = self." + self._get_direct_funcname(defname, True) + "(pos)",
+                     "if e < 0:",
+                     "    return -1, None",
+                     "if e > pos:",
+                     "    return e, [self._terminal(self._contents[pos:e], pos, e)]",
+                     "return e, []"]
+        else:
+            lines = self._get_direct_body(defnode[0], defname)
+        # 検証用の関数 (validate_file, validate_string で使用する) はノードを作成しない
+        self.__recognize = True
+        try:
+            recognize_lines = self._get_direct_body(defnode[0], defname)
+        finally:
+            self.__recognize = False
+
+        indent = " " * (level + 4)
+        direct_funcname = self._get_direct_funcname(defname)
+        recognize_funcname = self._get_direct_funcname(defname, True)
+        retstr = ""
+        if defname.startswith("t_"):
+            retstr += " " * level + "def " + direct_funcname + "(self, pos):\n" + cmtline
+        else:
+            retstr += " " * level + "def " + defname + "(self):\n" \
+                      + cmtline \
+                      + indent + "return self._direct(self." + direct_funcname \
+                      + ", self." + recognize_funcname + ")\n\n" \
+                      + " " * level + "def " + direct_funcname + "(self, pos):\n"
+        retstr += "".join([indent + l + "\n" for l in lines])
+        retstr += "\n" + " " * level + "def " + recognize_funcname + "(self, pos):\n"
+        retstr += "".join([indent + l + "\n" for l in recognize_lines])
         return "\n" + regstr + retstr
 
+    def _get_direct_body(self, tree:NonTerminalNode, defname:str) -> list[str]:
+        """
+        direct バックエンドの規則の本体の関数の処理を返す。
+        検証用の関数の作成中は、ノードを作成せずに成功時の終了位置 (失敗時は -1) を返す処理を作成する。
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            定義の式のノード (DefinitionExpression, MacroExpression)
+        defname : str
+            定義名
+
+        Returns
+        ---------- 
+        lines : list[str]
+            処理の各行 (インデントは相対)
+        """
+        self.__direct_varcount = 0
+        body = self._travel_generate_direct(tree)
+        bodystr = "\n".join(body)
+
+        # 使用する変数のみ用意する
+        lines = []
+        if regex.search(r"\br\.", bodystr):
+            lines.append("r = self._reader")
+        if regex.search(r"\bcontents\b", bodystr):
+            lines.append("contents = self._contents")
+        if regex.search(r"\bend\b", bodystr):
+            lines.append("end = self._endpos")
+        if regex.search(r"\btables\b", bodystr):
+            lines.append("tables = self._memo_tables")
+        if self.__recognize:
+            lines.extend(body)
+            lines.extend(["if ok:",
+                          "    return pos",
+                          "return -1"])
+            return lines
+
+        lines.append("nodes = []")
+        lines.extend(body)
+        lines.extend(["if ok:",
+                      "    return pos, nodes",
+                      "return -1, None"])
+        return lines
+
+    def _next_direct_var(self) -> int:
+        """
+        direct バックエンドの一時変数の番号を返す
+        """
+        self.__direct_varcount += 1
+        return self.__direct_varcount
+
+    def _travel_generate_direct(self, tree:NonTerminalNode) -> list[str]:
+        """
+        Node 探索し direct バックエンドの解析処理を作成する。
+
+        作成する処理は、変数 pos (現在位置) と nodes (作成したノードのリスト) を更新し、
+        成否を変数 ok に設定する。失敗時は pos と nodes を実行前の状態に戻す。
+        検証用の関数の作成中は nodes を使用しない。
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            探索するツリー
+
+        Returns
+        ---------- 
+        lines : list[str]
+            処理の各行 (インデントは相対)
+        """
+        ind = " " * 4
+
+        if tree.type in {"Selection", "MacroSelection"}:
+            reg_value = self._get_literal_choice(tree)
+            if reg_value is not None:
+                return self._get_direct_regexp(self.__regdict[reg_value])
+
+            alts = [cn for cn in tree.children if cn.type in {"Sequence", "MacroSequence"}]
+            first = self._get_first_chars(tree)
+            lines = []
+            if first is not None:
+                # 次の文字 (終了位置では "") が先頭文字の集合にない選択肢は実行しない
+                n = self._next_direct_var()
+                lines.extend(["c{0} = contents[pos] if pos < end else \"\"".format(n),
+                              "ok = False"])
+            for i, cn in enumerate(alts):
+                sub = self._travel_generate_direct(cn)
+                cond = "" if i == 0 else "not ok"
+                if first is not None and first[i] is not None:
+                    guard = "not c{0} or c{0} in {1}".format(n, repr(first[i]))
+                    cond = guard if i == 0 else cond + " and (" + guard + ")"
+                if len(cond) == 0:
+                    lines.extend(sub)
+                else:
+                    lines.append("if " + cond + ":")
+                    lines.extend([ind + l for l in sub])
+            return lines
+
+        elif tree.type in {"MultiSequence", "MacroMultiSequence"}:
+            n = self._next_direct_var()
+            lines = ["p{0} = pos".format(n)] + self._get_direct_mark(n)
+            first = True
+            for cn in tree.children:
+                sub = self._travel_generate_direct(cn)
+                if len(sub) == 0:
+                    continue
+                if first:
+                    lines.extend(sub)
+                    first = False
+                else:
+                    lines.append("if ok:")
+                    lines.extend([ind + l for l in sub])
+            lines.extend(["if not ok:",
+                          ind + "pos = p{0}".format(n)])
+            lines.extend([ind + l for l in self._get_direct_rewind(n)])
+            return lines
+
+        elif tree.type in {"AndPrefix", "MacroAndPrefix", "NotPrefix", "MacroNotPrefix"}:
+            n = self._next_direct_var()
+            lines = ["p{0} = pos".format(n)]
+            lines.extend(self._get_direct_recognize_children(tree))
+            lines.append("pos = p{0}".format(n))
+            if tree.type in {"NotPrefix", "MacroNotPrefix"}:
+                lines.append("ok = not ok")
+            return lines
+
+        elif tree.type == "Commit":
+            return ["self._commit_memo(pos)", "ok = True"]
+
+        elif tree.type == "SkipPrefix":
+            return self._get_direct_recognize_children(tree)
+
+        elif tree.type in {"QuestionSuffix", "MacroQuestionSuffix"}:
+            return self._get_direct_children(tree) + ["ok = True"]
+
+        elif tree.type in {"StarSuffix", "MacroStarSuffix"}:
+            return self._get_direct_repeat(tree, 0, -1)
+
+        elif tree.type in {"PlusSuffix", "MacroPlusSuffix"}:
+            return self._get_direct_repeat(tree, 1, -1)
+
+        elif tree.type in {"RepeatSuffix", "MacroRepeatSuffix"}:
+            d = {"Spacing": ""}
+            rc = tree.search_node("RepeatCnt")
+            rmin = tree.search_node("MinRepeat")
+            rmax = tree.search_node("MaxRepeat")
+
+            if len(rc) == 1:
+                min_num = max_num = int(rc[0].get_str(d))
+            elif len(rmin) == 1 and len(rmax) == 1:
+                min_num = int(rmin[0].get_str(d))
+                max_num = int(rmax[0].get_str(d))
+            else:
+                errmsg = "RepeatCnt の値が正常に取得できませんでした。line : {} - column : {}".format(tree.linenum, tree.column)
+                raise SyntaxCheckFailedException([errmsg])
+            return self._get_direct_repeat(tree, min_num, max_num)
+
+        elif tree.type == "RegularExp":
+            regkey = self._get_reg_value(tree)
+            return self._get_direct_regexp(self.__regdict[regkey])
+
+        elif tree.type in {"Identifier", "MacroIdentifier"}:
+            d = {"Spacing": ""}
+            typename = tree.get_str(d)
+            funcname = typename.lower()
+            if self.__recognize:
+                return self._get_direct_recognize_call(tree.type, typename)
+            if tree.type == "MacroIdentifier":
+                lines = ["e, res = self.dt_" + funcname + "(pos)"]
+            else:
+                if funcname.startswith("_"):
+                    d_funcname = "self._direct" + funcname
+                else:
+                    d_funcname = "self.d_" + funcname
+                rule_id = self.__rule_ids.setdefault(typename, len(self.__rule_ids))
+                leader = self.__left_recursion.get(typename)
+                if leader:
+                    # 左再帰の起点の規則は種の成長で解析する (メモの確認、登録を含む)
+                    lines = ["e, res = self._direct_left_recursive(" + d_funcname + ", pos, \""
+                             + typename + "\", " + str(rule_id) + ")"]
+                elif leader is not None:
+                    # 起点から呼び出される左再帰の規則はメモ化しない
+                    lines = ["e, res = " + d_funcname + "(pos)",
+                             "if e >= 0:",
+                             ind + "res = self._create_result(\"" + typename + "\", tuple(res), pos, e)"]
+                else:
+                    # メモ化済みの場合は規則を呼び出さない
+                    # ノードを作成せずに登録した終了位置 (int) のメモは使用しない
+                    lines = ["successes, failures = tables[" + str(rule_id) + "]",
+                             "res = successes.get(pos)",
+                             "if res is not None and res.__class__ is not int:",
+                             ind + "e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos",
+                             "else:",
+                             ind + "block = failures.get(pos >> BLOCK_BITS)",
+                             ind + "if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):",
+                             ind * 2 + "e = -1",
+                             ind + "else:",
+                             ind * 2 + "e, res = " + d_funcname + "(pos)",
+                             ind * 2 + "if e >= 0:",
+                             ind * 3 + "res = self._direct_node(\"" + typename + "\", successes, res, pos, e)",
+                             ind * 2 + "else:",
+                             ind * 3 + "self._direct_failure(failures, pos)"]
+            return lines + ["ok = e >= 0",
+                            "if ok:",
+                            ind + "nodes += res",
+                            ind + "pos = e"]
+
+        elif tree.type == "Literal":
+            str_literal = self._get_literal_value(tree)
+            length = len(ast.literal_eval(str_literal))
+            option = tree.search_node("LiteralOption")
+            if len(option) == 0:
+                lines = ["if contents.startswith(" + str_literal + ", pos, end):",
+                         ind + "nodes.append(self._terminal(" + str_literal + ", pos, pos + " + str(length) + "))"]
+            else:
+                lower = repr(ast.literal_eval(str_literal).lower())
+                lines = ["t = contents[pos:pos + " + str(length) + "]",
+                         "if pos + " + str(length) + " <= end and t.lower() == " + lower + ":",
+                         ind + "nodes.append(self._terminal(t, pos, pos + " + str(length) + "))"]
+            if self.__recognize:
+                del lines[-1]
+            if length > 0:
+                lines.extend([ind + "pos += " + str(length),
+                              ind + "if pos > r.maxposition:",
+                              ind * 2 + "r.maxposition = pos"])
+            lines.extend([ind + "ok = True",
+                          "else:",
+                          ind + "ok = False"])
+            return lines
+
+        return self._get_direct_children(tree)
+
+    def _get_direct_regexp(self, regname:str) -> list[str]:
+        """
+        正規表現の照合に対応する direct バックエンドの解析処理を返す
+        """
+        ind = " " * 4
+        if self.__recognize:
+            lines = ["m = self." + regname + ".match(contents, pos, end)",
+                     "if m:",
+                     ind + "pos = m.end()"]
+        else:
+            lines = ["m = self." + regname + ".match(contents, pos, end)",
+                     "if m:",
+                     ind + "e = m.end()",
+                     ind + "nodes.append(self._terminal(m.group(), pos, e))",
+                     ind + "pos = e"]
+        return lines + [ind + "if pos > r.maxposition:",
+                        ind * 2 + "r.maxposition = pos",
+                        ind + "ok = True",
+                        "else:",
+                        ind + "ok = False"]
+
+    def _get_direct_recognize_call(self, treetype:str, typename:str) -> list[str]:
+        """
+        規則の呼び出しに対応する検証用の解析処理を返す。
+        メモには、成功時はノードのタプルの代わりに終了位置を登録する。
+
+        Parameters
+        ----------
+        treetype : str
+            呼び出しのノードのタイプ (Identifier, MacroIdentifier)
+        typename : str
+            呼び出す規則のタイプ名
+
+        Returns
+        ---------- 
+        lines : list[str]
+            処理の各行 (インデントは相対)
+        """
+        ind = " " * 4
+        funcname = typename.lower()
+        if treetype == "MacroIdentifier":
+            lines = ["e = self.vt_" + funcname + "(pos)"]
+        else:
+            if funcname.startswith("_"):
+                v_funcname = "self._recognize" + funcname
+            else:
+                v_funcname = "self.v_" + funcname
+            rule_id = self.__rule_ids.setdefault(typename, len(self.__rule_ids))
+            leader = self.__left_recursion.get(typename)
+            if leader:
+                lines = ["e = self._recognize_direct_left_recursive(" + v_funcname + ", pos, "
+                         + str(rule_id) + ")"]
+            elif leader is not None:
+                lines = ["e = " + v_funcname + "(pos)"]
+            else:
+                # ノードを作成して登録したメモは、ノードの終了位置を使用する
+                lines = ["successes, failures = tables[" + str(rule_id) + "]",
+                         "e = successes.get(pos)",
+                         "if e is None:",
+                         ind + "block = failures.get(pos >> BLOCK_BITS)",
+                         ind + "if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):",
+                         ind * 2 + "e = -1",
+                         ind + "else:",
+                         ind * 2 + "e = " + v_funcname + "(pos)",
+                         ind * 2 + "if e >= 0:",
+                         ind * 3 + "self._recognize_success(successes, pos, e)",
+                         ind * 2 + "else:",
+                         ind * 3 + "self._direct_failure(failures, pos)",
+                         "elif e.__class__ is not int:",
+                         ind + "e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos"]
+        return lines + ["ok = e >= 0",
+                        "if ok:",
+                        ind + "pos = e"]
+
+    def _get_direct_mark(self, n:int) -> list[str]:
+        """
+        ノードのリストの長さを記録する処理を返す (検証用の関数の作成中は何もしない)
+        """
+        if self.__recognize:
+            return []
+        return ["n{0} = len(nodes)".format(n)]
+
+    def _get_direct_rewind(self, n:int) -> list[str]:
+        """
+        ノードのリストを記録した長さに戻す処理を返す (検証用の関数の作成中は何もしない)
+        """
+        if self.__recognize:
+            return []
+        return ["del nodes[n{0}:]".format(n)]
+
+    def _get_direct_children(self, tree:NonTerminalNode) -> list[str]:
+        """
+        子ノードに対応する direct バックエンドの解析処理を連結して返す
+        """
+        lines = []
+        for cn in tree.children:
+            if isinstance(cn, NonTerminalNode):
+                lines.extend(self._travel_generate_direct(cn))
+        return lines
+
+    def _get_direct_recognize_children(self, tree:NonTerminalNode) -> list[str]:
+        """
+        子ノードに対応する、ノードを作成しない解析処理を連結して返す (読み飛ばし、先読み)
+        """
+        recognize = self.__recognize
+        self.__recognize = True
+        try:
+            return self._get_direct_children(tree)
+        finally:
+            self.__recognize = recognize
+
+    def _get_direct_repeat(self, tree:NonTerminalNode, min_num:int, max_num:int) -> list[str]:
+        """
+        繰り返しに対応する direct バックエンドの解析処理を返す。
+        Parser._rpt と同様に、回数の制限がない場合は位置が進まなかった時点で終了する。
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            繰り返しのノード
+        min_num : int
+            繰り返し回数の最小値
+        max_num : int
+            繰り返し回数の最大値、-1 の場合は制限なし
+
+        Returns
+        ---------- 
+        lines : list[str]
+            処理の各行 (インデントは相対)
+        """
+        ind = " " * 4
+        n = self._next_direct_var()
+        sub = [ind + l for l in self._get_direct_children(tree)]
+        lines = []
+        if min_num > 0 or max_num >= 0:
+            lines.append("i{0} = 0".format(n))
+        if min_num > 0:
+            lines.append("p{0} = pos".format(n))
+            lines.extend(self._get_direct_mark(n))
+        restore = ["pos = p{0}".format(n)] + self._get_direct_rewind(n)
+
+        if max_num < 0:
+            lines.extend(["while True:",
+                          ind + "q{0} = pos".format(n)])
+            if not self.__recognize:
+                lines.append(ind + "m{0} = len(nodes)".format(n))
+            lines.extend(sub)
+            lines.extend([ind + "if not ok:",
+                          ind * 2 + "break",
+                          ind + "if pos == q{0}:".format(n)])
+            if not self.__recognize:
+                # 位置が進まない場合、その回の結果は使用しない
+                lines.append(ind * 2 + "del nodes[m{0}:]".format(n))
+            lines.append(ind * 2 + "break")
+            if min_num > 0:
+                lines.append(ind + "i{0} += 1".format(n))
+                lines.append("ok = i{0} >= {1}".format(n, min_num))
+                lines.append("if not ok:")
+                lines.extend([ind + l for l in restore])
+            else:
+                lines.append("ok = True")
+        else:
+            lines.extend(["ok = True",
+                          "while i{0} < {1}:".format(n, max_num)])
+            lines.extend(sub)
+            lines.extend([ind + "if not ok:",
+                          ind * 2 + "break",
+                          ind + "i{0} += 1".format(n),
+                          "if not ok:"])
+            if min_num > 0:
+                lines.append(ind + "ok = i{0} >= {1}".format(n, min_num))
+                lines.append(ind + "if not ok:")
+                lines.extend([ind * 2 + l for l in restore])
+            else:
+                lines.append(ind + "ok = True")
+        return lines
+
+    def _get_literal_choice(self, tree:NonTerminalNode) -> "str | None":
+        """
+        リテラルのみの選択 ("SELECT" / "FROM" / ...) を照合する正規表現を返す。
+
+        正規表現の選択 (|) は左から順に照合し、最初に一致した選択肢を結果とするため、
+        PEG の選択と同じ結果になる。
+        大文字小文字を区別しないリテラルは、文字ごとに str.lower() が一致する文字のクラスにする。
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            選択のノード
+
+        Returns
+        ---------- 
+        reg_value : str | None
+            正規表現の定義の引数の文字列 (_get_reg_value と同じ形式)。
+            リテラルのみの選択でない場合、または正規表現にできないリテラルを含む場合は None
+        """
+        if not self.literal_choice or tree.type not in {"Selection", "MacroSelection"}:
+            return None
+        d = {"Spacing": ""}
+        patterns = []
+        for cn in tree.children:
+            if cn.type not in {"Sequence", "MacroSequence"}:
+                continue
+            literals = cn.search_node("Literal")
+            # 先読み、繰り返しなどを含まない、リテラルのみの選択肢
+            if len(literals) != 1 or cn.get_str(d) != literals[0].get_str(d):
+                return None
+            value = ast.literal_eval(self._get_literal_value(literals[0]))
+            if len(literals[0].search_node("LiteralOption")) == 0:
+                patterns.append(regex.escape(value))
+                continue
+
+            pattern = ""
+            for c in value:
+                if not c.isascii():
+                    # ASCII 以外の文字は、str.lower() と正規表現の照合の違いを考慮しない
+                    return None
+                if c.isalpha():
+                    # ASCII の英字に str.lower() が一致する ASCII 以外の文字は K (U+212A) のみ
+                    pattern += "[" + c.lower() + c.upper() + ("\u212a" if c.lower() == "k" else "") + "]"
+                else:
+                    pattern += regex.escape(c)
+            patterns.append(pattern)
+        return repr("|".join(patterns))
+
+    def _get_first_chars(self, tree:NonTerminalNode) -> "list[str | None] | None":
+        """
+        選択の選択肢ごとの先頭文字の集合を返す
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            選択のノード
+
+        Returns
+        ---------- 
+        first : list[str | None] | None
+            選択肢ごとの先頭文字を連結した文字列 (限定できない選択肢は None)。
+            絞り込みを行わない場合は None
+        """
+        if self.__first is None:
+            return None
+        return self.__first.get_first_chars(tree)
+
     @staticmethod
     def _get_reg_value(tree:NonTerminalNode) -> str:
         """
@@ -390,10 +1067,10 @@ class ParserChecker(object):
 
     def __init__(self, tree:NonTerminalNode, logger:Logger) -> None:
         self.tree = tree
-        # チェック対象の定義（未評価の定義）
+        # チェック対象の定義の構造式
         self.check_def_dic = {}
-        # チェック結果（評価済の定義）
-        self.defchecked = {}
+        #: 左再帰の規則 (規則名 -> 左再帰の起点の規則の場合 True)
+        self.left_recursion = {}
         self.__logger = logger
 
     def check_tree(self, tree:NonTerminalNode) -> bool:
@@ -475,6 +1152,13 @@ class ParserChecker(object):
         """
         左再帰チェック
 
+        同じ位置で自身を呼び出す規則 (左再帰) を求め、left_recursion に登録する。
+        相互に左再帰となる規則の集まりごとに、すべての循環に含まれる規則を起点 (leader) とする。
+        左再帰は構文解析時に起点の規則の種の成長で解析するため、エラーにしない。
+        ただし、以下の場合は解析できないため、エラーとする。
+            1. 規則の集まりに、すべての循環に含まれる規則がない
+            2. 左再帰の規則に、多重解析の規則 (SubDefinition) がある
+
         Parameters
         ----------
         tree : NonTerminalNode
@@ -486,67 +1170,158 @@ class ParserChecker(object):
             チェック結果のエラーリスト
         """
         errmsgs = []
+        subdefset = set()
 
         if tree.type == "ExPeg":
-            # 各定義を探索し、check_def_dic に登録する。重複があればエラーメッセージを追加。
-            definitionlist = tree.get_childnode("Definition")
+            # 各定義の構造式を求め、check_def_dic に登録する。
+            definitionlist = tree.search_node("Definition")
             for definition in definitionlist:
                 def_expression = definition.get_childnode("DefinitionExpression")[0]
                 postorder_travel(def_expression, self._add_leftrecursive_chk_list)
-                chk_list = def_expression.identifierlist
+                chk_list = getattr(def_expression, "identifierlist", 0)
                 def_identifier = definition.get_childnode("DefinitionIdentifier")[0]
                 defstr = def_identifier.get_str({'Spacing': ""})
                 self.check_def_dic[defstr] = chk_list
 
-        check_def_dic_count = 0
-        while True:
-            chg_chk = True
-            while chg_chk:
-                chg_chk = False
-                # check_def_dic に登録した構造式から値を評価する。
-                for def_name, def_exp in self.check_def_dic.items():
-                    value = self._eval_def(def_exp)
-                    if isinstance(value, int):
-                        self.defchecked[def_name] = value
-                        chg_chk = True
-
-                # 評価済の定義を 未評価定義の辞書から削除
-                for checked_def in self.defchecked.keys():
-                    if checked_def in self.check_def_dic:
-                        del self.check_def_dic[checked_def]
-
-                # 評価済定義を未評価定義に適用
-                for def_name, def_exp in self.check_def_dic.items():
-                    value = self._assignment_checked_value(def_exp)
-                    self.check_def_dic[def_name] = value
-
-                self.__logger.debug("----- Left Recursion Check Loop -----")
-                for def_name, def_exp in self.check_def_dic.items():
-                    self.__logger.debug(def_name + " : " + str(def_exp))
-
-            if check_def_dic_count > 0 and check_def_dic_count == len(self.check_def_dic):
-                unresolved_def_str = ""
-                for def_name, def_exp in self.check_def_dic.items():
-                    unresolved_def_str += def_name + " : " + str(def_exp) + "\n"
-                err_msg = "!Error : Can't found Left Recurcive! :\n{0}".format(unresolved_def_str)
+            for subdefinition in tree.search_node("SubDefinition"):
+                def_identifier = subdefinition.get_childnode("DefinitionIdentifier")[0]
+                subdefset.add(def_identifier.get_str({'Spacing': ""}))
+
+        # 文字列を読み込まずに成功する可能性がある規則を求める
+        nullable = {}
+        chg_chk = True
+        while chg_chk:
+            chg_chk = False
+            for def_name, def_exp in self.check_def_dic.items():
+                if not nullable.get(def_name) and self._is_nullable(def_exp, nullable):
+                    nullable[def_name] = True
+                    chg_chk = True
+
+        # 規則の開始位置で呼び出す規則 (左側の呼び出し) のグラフから、左再帰の規則の集まりを求める
+        left_calls = {def_name: [name for name in self._get_left_calls(def_exp, nullable)
+                                 if name in self.check_def_dic]
+                      for def_name, def_exp in self.check_def_dic.items()}
+        reachable = {def_name: self._get_reachable(left_calls, def_name) for def_name in left_calls}
+
+        checked = set()
+        for def_name in self.check_def_dic:
+            if def_name in checked or def_name not in reachable[def_name]:
+                continue
+            group = [name for name in self.check_def_dic
+                     if name in reachable[def_name] and def_name in reachable[name]]
+            checked.update(group)
+
+            # すべての循環に含まれる規則 (その規則を除くと循環がなくなる規則) を起点とする
+            leaders = [name for name in group if self._is_acyclic(left_calls, set(group) - {name})]
+            self.__logger.debug("Left Recursion Found : {0} (leader : {1})".format(", ".join(group), leaders[:1]))
+            if len(leaders) == 0:
+                err_msg = "!Unsupported Left Recursion! : {0} " \
+                          "(no rule is included in all the recursive cycles)".format(", ".join(group))
                 errmsgs.append(err_msg)
-                self.__logger.debug(err_msg)
-                break
-            # ループ終了後、未評価定義が残っていた場合、ループあり
-            if len(self.check_def_dic) > 0:
-                loop_list = self._find_left_recursive_loop_list()
-                self.check_def_dic[loop_list[0]] = 1
-
-                err_msg = "!Left Recursive Found! : {0}".format("->".join(loop_list))
+                continue
+
+            subdefs = [name for name in group if name in subdefset]
+            if len(subdefs) > 0:
+                err_msg = "!Unsupported Left Recursion! : {0} " \
+                          "(sub definition of left recursive rule)".format(", ".join(subdefs))
                 errmsgs.append(err_msg)
-                self.__logger.debug(err_msg)
-            else:
-                break
+                continue
 
-            check_def_dic_count = len(self.check_def_dic)
+            for name in group:
+                self.left_recursion[name] = name == leaders[0]
 
         return errmsgs
 
+    def _is_nullable(self, def_exp, nullable:dict) -> bool:
+        """
+        構造式が文字列を読み込まずに成功する可能性があるか否かを返す。
+
+        Parameters
+        ----------
+        def_exp : list | tuple | str | int
+            構造式 (list : 連続、tuple : 選択、str : 規則の呼び出し、int : 最小の文字数)
+        nullable : dict[str, bool]
+            文字列を読み込まずに成功する可能性がある規則
+
+        Returns
+        ----------
+        result : bool
+            文字列を読み込まずに成功する可能性がある場合 True
+        """
+        if isinstance(def_exp, list):
+            return all(self._is_nullable(child_exp, nullable) for child_exp in def_exp)
+        elif isinstance(def_exp, tuple):
+            return any(self._is_nullable(child_exp, nullable) for child_exp in def_exp)
+        elif isinstance(def_exp, str):
+            return nullable.get(def_exp, False)
+        return def_exp == 0
+
+    def _get_left_calls(self, def_exp, nullable:dict) -> list[str]:
+        """
+        構造式の開始位置で呼び出す可能性がある規則のリストを返す。
+
+        Parameters
+        ----------
+        def_exp : list | tuple | str | int
+            構造式
+        nullable : dict[str, bool]
+            文字列を読み込まずに成功する可能性がある規則
+
+        Returns
+        ----------
+        calls : list[str]
+            規則名のリスト
+        """
+        if isinstance(def_exp, list):
+            calls = []
+            for child_exp in def_exp:
+                calls.extend(self._get_left_calls(child_exp, nullable))
+                if not self._is_nullable(child_exp, nullable):
+                    break
+            return calls
+        elif isinstance(def_exp, tuple):
+            calls = []
+            for child_exp in def_exp:
+                calls.extend(self._get_left_calls(child_exp, nullable))
+            return calls
+        elif isinstance(def_exp, str):
+            return [def_exp]
+        return []
+
+    @staticmethod
+    def _get_reachable(left_calls:dict, def_name:str, names:set=None) -> set:
+        """
+        規則から左側の呼び出しをたどって到達できる規則の集合を返す。
+
+        Parameters
+        ----------
+        left_calls : dict[str, list[str]]
+            規則名 -> 左側の呼び出しの規則名のリスト
+        def_name : str
+            起点の規則名
+        names : set[str]
+            たどる規則名の集合、None の場合はすべての規則
+
+        Returns
+        ----------
+        reachable : set[str]
+            到達できる規則名の集合 (起点を含むのは循環がある場合のみ)
+        """
+        reachable = set()
+        stack = [def_name]
+        while stack:
+            for name in left_calls[stack.pop()]:
+                if name not in reachable and (names is None or name in names):
+                    reachable.add(name)
+                    stack.append(name)
+        return reachable
+
+    def _is_acyclic(self, left_calls:dict, names:set) -> bool:
+        """
+        規則の集合の中に、左側の呼び出しの循環がないか否かを返す。
+        """
+        return all(name not in self._get_reachable(left_calls, name, names) for name in names)
+
     @staticmethod
     def _add_leftrecursive_chk_list(tree:NonTerminalNode) -> None:
         """
@@ -643,134 +1418,306 @@ class ParserChecker(object):
                     identifierlist = identifierlist[0]
                 setattr(tree, 'identifierlist', identifierlist)
 
-    def _eval_def(self, def_exp):
-        """
-        構造式を構成するリスト、タプル、文字列、数値を評価し、
-        文字列を1文字以上取得する場合は 1
-        文字列を取得しない場合は 0
-        評価できない場合は式をそのまま返す。
 
-        Parameters
-        ----------
-        def_exp : list | tuple | str | int
-            構造式
+class FirstCharAnalyzer(object):
+    """
+    ASTを探索し、選択の選択肢ごとの先頭文字の集合 (FIRST) を求める。
 
-        Returns
-        ----------
-        def_exp : list | tuple | str | int
-            構造式
-        """
-        if isinstance(def_exp, list):
-            for child_exp in def_exp:
-                count_child = self._eval_def(child_exp)
-                if isinstance(count_child, int):
-                    if count_child > 0:
-                        return 1
-                    elif count_child == 0:
-                        continue
-                else:
-                    return def_exp
-            return 0
+    構造式ごとに (先頭文字の集合, 文字列を読み込まずに成功する可能性) を求める。
+    先頭文字の集合は、構造式が文字列を読み込む場合の最初の文字をすべて含む。
+    任意の文字に一致しうる正規表現など、先頭文字を限定できない場合の集合は None とする。
+    先読み (&, !) は文字列を読み込まずに成功しうるが、先読みで読み込む文字を集合に含める。
+    (読み込んだ最大位置 maxposition も、絞り込みを行わない場合と変わらない)
 
-        elif isinstance(def_exp, tuple):
-            min_value = 1
-            for child_exp in def_exp:
-                count_child = self._eval_def(child_exp)
-                if isinstance(count_child, int):
-                    if count_child > 0:
-                        continue
-                    elif count_child == 0:
-                        min_value = 0
-                else:
-                    return def_exp
-            return min_value
+    文字列を読み込まずに成功しうる選択肢は、次の文字によらず実行する。
+    """
 
-        elif isinstance(def_exp, str):
-            return def_exp
+    #: 先頭文字の集合の最大の文字数 (超える場合は限定しない)
+    MAX_CHARS = 256
 
-        elif isinstance(def_exp, int):
-            return def_exp
+    # 大文字小文字を区別しない照合で ASCII の英字と一致する、ASCII 以外の文字
+    _CASE_SPECIALS = {"i": "\u0130\u0131", "k": "\u212a", "s": "\u017f"}
+    # 正規表現のエスケープシーケンスのうち、1 文字に一致するもの
+    _REG_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
 
-    def _assignment_checked_value(self, def_exp):
+    def __init__(self, tree:NonTerminalNode) -> None:
         """
-        構造式に、評価した値を代入する
+        初期化。規則ごとの先頭文字の集合を求める。
 
         Parameters
         ----------
-        def_exp : list | tuple | str | int
-            構造式
-
-        Returns
-        ----------
-        def_exp : list | tuple | str | int
-            構造式
+        tree : NonTerminalNode
+            pegファイルの構文解析木 (ExPeg)
         """
-        if isinstance(def_exp, list):
-            return [self._assignment_checked_value(child_exp) for child_exp in def_exp]
-
-        elif isinstance(def_exp, tuple):
-            return tuple([self._assignment_checked_value(child_exp) for child_exp in def_exp])
+        self.tree = tree
+        # (規則の種類 "p" / "t", 規則名の小文字) -> 構造式のノードのリスト
+        # 多重解析の規則 (SubDefinition) は同名の規則に含める
+        self.__rules = {}
+        for definition in tree.search_node("Definition") + tree.search_node("SubDefinition"):
+            name = definition.get_childnode("DefinitionIdentifier")[0].get_str({'Spacing': ""})
+            exp = definition.get_childnode("DefinitionExpression")[0]
+            self.__rules.setdefault(("p", name.lower()), []).append(exp)
+        for definition in tree.search_node("MacroDefinition"):
+            name = definition.get_childnode("MacroIdentifier")[0].get_str({'Spacing': ""})
+            exp = definition.get_childnode("MacroExpression")[0]
+            self.__rules.setdefault(("t", name.lower()), []).append(exp)
+
+        # 規則 -> (先頭文字の集合, 文字列を読み込まずに成功する可能性)
+        # 集合は空集合から、変化がなくなるまで広げる
+        self.__values = {key: (frozenset(), False) for key in self.__rules}
+        chg_chk = True
+        while chg_chk:
+            chg_chk = False
+            for key, exps in self.__rules.items():
+                value = self._union([self.get_first(exp) for exp in exps])
+                if value != self.__values[key]:
+                    self.__values[key] = value
+                    chg_chk = True
+
+    def get_first_chars(self, tree:NonTerminalNode) -> "list[str | None] | None":
+        """
+        選択の選択肢ごとの先頭文字の集合を返す
 
-        elif isinstance(def_exp, str):
-            if def_exp in self.defchecked:
-                return self.defchecked[def_exp]
-            else:
-                return def_exp
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            選択のノード (Selection / MacroSelection)
 
-        elif isinstance(def_exp, int):
-            return def_exp
+        Returns
+        ---------- 
+        first : list[str | None] | None
+            選択肢ごとの先頭文字を連結した文字列。
+            先頭文字を限定できない選択肢、文字列を読み込まずに成功しうる選択肢は None。
+            すべての選択肢が None の場合は None
+        """
+        first = []
+        for cn in tree.children:
+            if cn.type not in {"Sequence", "MacroSequence"}:
+                continue
+            chars, nullable = self.get_first(cn)
+            first.append(None if chars is None or nullable else "".join(sorted(chars)))
+        if all(chars is None for chars in first):
+            return None
+        return first
 
-    def _find_left_recursive_loop_list(self):
+    def get_first(self, tree:NonTerminalNode) -> "tuple[frozenset | None, bool]":
         """
-        左再帰となる定義をたどった結果を返す
+        構造式の先頭文字の集合を返す
+
+        Parameters
+        ----------
+        tree : NonTerminalNode
+            構造式のノード
 
         Returns
         ---------- 
-        loop_list : list
-            左再帰の定義
+        chars : frozenset[str] | None
+            先頭文字の集合 (限定できない場合は None)
+        nullable : bool
+            文字列を読み込まずに成功する可能性がある場合 True
         """
-        loop_list = []
-        # 最初のキーを取得
-        check_def_name = sorted(self.check_def_dic.keys())[0]
+        if tree.type in {"Selection", "MacroSelection"}:
+            return self._union([self.get_first(cn) for cn in tree.children
+                                if cn.type in {"Sequence", "MacroSequence"}])
+
+        elif tree.type == "Literal":
+            value = ast.literal_eval(ParserGenerator._get_literal_value(tree))
+            if len(value) == 0:
+                return frozenset(), True
+            if len(tree.search_node("LiteralOption")) > 0:
+                return self._get_case_variants(value[0]), False
+            return frozenset(value[0]), False
 
-        while check_def_name not in loop_list:
-            loop_list.append(check_def_name)
-            unresolve_def_exp = self.check_def_dic[check_def_name]
-            next_def_name = self._search_unresolve_call(unresolve_def_exp)
+        elif tree.type == "RegularExp":
+            chars = self._get_regex_first(tree)
+            return chars, chars is None
+
+        elif tree.type in {"Identifier", "MacroIdentifier"}:
+            name = tree.get_str({"Spacing": ""}).lower()
+            if name == "_eof":
+                return frozenset(), False
+            key = ("t" if tree.type == "MacroIdentifier" else "p", name)
+            return self.__values.get(key, (None, True))
 
-            if not isinstance(next_def_name, str):
-                err_msg = "!Unexpected Error! @search_unresolve_call {0}: {1} -> {2}" \
-                    .format(check_def_name, unresolve_def_exp, str(next_def_name))
-                raise SyntaxCheckFailedException([err_msg])
+        elif tree.type == "IdentifierCall":
+            return None, True
 
-            check_def_name = next_def_name
+        elif tree.type == "Commit":
+            return frozenset(), True
 
-        loop_list.append(check_def_name)
+        elif tree.type in {"AndPrefix", "MacroAndPrefix", "NotPrefix", "MacroNotPrefix",
+                           "QuestionSuffix", "MacroQuestionSuffix", "StarSuffix", "MacroStarSuffix"}:
+            chars, _ = self._get_first_children(tree)
+            return chars, True
 
-        # 配列を返す
-        return loop_list[loop_list.index(check_def_name):]
+        elif tree.type in {"RepeatSuffix", "MacroRepeatSuffix"}:
+            chars, nullable = self._get_first_children(tree)
+            rc = tree.search_node("RepeatCnt") + tree.search_node("MinRepeat")
+            if len(rc) == 0 or int(rc[0].get_str({"Spacing": ""})) == 0:
+                nullable = True
+            return chars, nullable
 
-    def _search_unresolve_call(self, unresolve_def):
+        return self._get_first_children(tree)
+
+    def _get_first_children(self, tree:NonTerminalNode) -> "tuple[frozenset | None, bool]":
+        """
+        子ノードの連続の先頭文字の集合を返す
+        (記号などの構造式でない子ノードは、文字列を読み込まずに成功する構造式として扱う)
+        """
+        chars = frozenset()
+        for cn in tree.children:
+            if not isinstance(cn, NonTerminalNode):
+                continue
+            cn_chars, cn_nullable = self.get_first(cn)
+            chars = self._merge(chars, cn_chars)
+            if not cn_nullable:
+                return chars, False
+        return chars, True
+
+    def _union(self, values:list) -> "tuple[frozenset | None, bool]":
+        """
+        選択の先頭文字の集合を返す
+        """
+        chars = frozenset()
+        nullable = False
+        for cn_chars, cn_nullable in values:
+            chars = self._merge(chars, cn_chars)
+            nullable = nullable or cn_nullable
+        return chars, nullable
+
+    def _merge(self, chars:"frozenset | None", other:"frozenset | None") -> "frozenset | None":
         """
-        構造式から、評価した値を代入する
+        先頭文字の集合の和を返す
+        """
+        if chars is None or other is None:
+            return None
+        chars = chars | other
+        if len(chars) > self.MAX_CHARS:
+            return None
+        return chars
 
-        Returns
+    def _get_case_variants(self, c:str) -> "frozenset | None":
+        """
+        大文字小文字を区別しない照合で、文字 c と一致しうる文字の集合を返す
+        (ASCII 以外の大文字小文字の区別がある文字は None)
+        """
+        if c.isascii():
+            if not c.isalpha():
+                return frozenset(c)
+            return frozenset(c.lower() + c.upper() + self._CASE_SPECIALS.get(c.lower(), ""))
+        if c.lower() == c and c.upper() == c and c.casefold() == c:
+            return frozenset(c)
+        return None
+
+    def _get_regex_first(self, tree:NonTerminalNode) -> "frozenset | None":
+        """
+        正規表現の先頭文字の集合を返す
+
+        パターンの先頭の要素が、1 文字、エスケープした記号、否定でない文字クラスで、
+        必ず 1 回以上一致する場合のみ求める。
+        それ以外 (選択 |、グループ、'.'、\\d などの文字クラス、X オプションなど) は None を返す。
+
+        Parameters
         ----------
-        unresolve_def : list | tuple | str | int | None
-            構造式
+        tree : NonTerminalNode
+            正規表現のノード
+
+        Returns
+        ---------- 
+        chars : frozenset[str] | None
+            先頭文字の集合
         """
-        if isinstance(unresolve_def, list) or isinstance(unresolve_def, tuple):
-            for child_exp in unresolve_def:
-                child_result = self._search_unresolve_call(child_exp)
-                if isinstance(child_result, str):
-                    return child_result
+        d = {"Spacing": ""}
+        cont = tree.search_node("SingleQuotesLiteralContents") + tree.search_node("DoubleQuotesLiteralContents")
+        pattern = cont[0].get_str(d)
+        options = tree.search_node("RegularExpOptions")
+        opt_str = options[0].get_str({"Spacing": "", "COLON": ""}) if len(options) > 0 else ""
+        if "X" in opt_str or "|" in pattern:
+            return None
+
+        i = 0
+        # 行頭 (幅 0) は読み飛ばす
+        while pattern.startswith("^", i):
+            i += 1
+        if i >= len(pattern):
+            return None
+        c = pattern[i]
+        if c == "[":
+            chars, i = self._get_regex_class(pattern, i + 1)
+        elif c == "\\":
+            chars = None
+            if i + 1 < len(pattern):
+                chars = self._get_regex_escape(pattern[i + 1])
+            chars, i = (frozenset(chars) if chars is not None else None), i + 2
+        elif c in ".^$*+?{()":
+            return None
+        else:
+            chars, i = frozenset(c), i + 1
+        if chars is None:
             return None
 
-        elif isinstance(unresolve_def, str):
-            return unresolve_def
+        # 0 回の一致を許す量指定子
+        if pattern.startswith(("*", "?", "{0", "{,"), i):
+            return None
+
+        if "I" in opt_str:
+            variants = frozenset()
+            for c in chars:
+                variants = self._merge(variants, self._get_case_variants(c))
+                if variants is None:
+                    return None
+            chars = variants
+        return chars if len(chars) <= self.MAX_CHARS else None
+
+    def _get_regex_class(self, pattern:str, i:int) -> "tuple[frozenset | None, int]":
+        """
+        正規表現の文字クラス [...] の文字の集合と、文字クラスの次の位置を返す
+        """
+        if pattern.startswith("^", i):
+            return None, i
+        chars = set()
+        start = i
+        while i < len(pattern):
+            c = pattern[i]
+            if c == "]" and i > start:
+                return frozenset(chars), i + 1
+            lo, i = self._get_regex_class_char(pattern, i)
+            if lo is None:
+                return None, i
+            if pattern.startswith("-", i) and i + 1 < len(pattern) and pattern[i + 1] != "]":
+                hi, i = self._get_regex_class_char(pattern, i + 1)
+                if hi is None or ord(hi) < ord(lo) or ord(hi) - ord(lo) >= self.MAX_CHARS:
+                    return None, i
+                chars.update([chr(code) for code in range(ord(lo), ord(hi) + 1)])
+            else:
+                chars.add(lo)
+            if len(chars) > self.MAX_CHARS:
+                return None, i
+        return None, i
 
-        elif isinstance(unresolve_def, int):
+    def _get_regex_class_char(self, pattern:str, i:int) -> "tuple[str | None, int]":
+        """
+        正規表現の文字クラス内の 1 文字と、次の位置を返す
+        """
+        c = pattern[i]
+        if c == "[":
+            # 入れ子の集合、POSIX 文字クラス [:alpha:] は扱わない
+            return None, i + 1
+        if c == "\\":
+            if i + 1 >= len(pattern):
+                return None, i + 1
+            return self._get_regex_escape(pattern[i + 1]), i + 2
+        return c, i + 1
+
+    def _get_regex_escape(self, c:str) -> "str | None":
+        """
+        正規表現のエスケープシーケンス \\c が一致する 1 文字を返す (文字クラスなどは None)
+        """
+        if c in self._REG_ESCAPES:
+            return self._REG_ESCAPES[c]
+        if c.isalnum():
             return None
+        return c
 
 
 class SyntaxCheckFailedException(TacParserException):
@@ -793,9 +1740,12 @@ def main() -> None:
     argparser.add_argument("-e", "--encoding", default="utf-8", help="input peg file encoding")
     argparser.add_argument("-o", "--output", help="output perser script filepath (.py).")
     argparser.add_argument("-n", "--parsername", help="output perser class name (default : [root node ID]  + \"Parser\").")
+    argparser.add_argument("-b", "--backend", default="combinator", choices=ParserGenerator.BACKENDS,
+                           help="output parser style (default : combinator). "
+                                "\"direct\" generates straight-line functions for each rule.")
 
     args = argparser.parse_args()
-    ParserGenerator(args.input, args.encoding).generate_file(args.parsername, args.output)
+    ParserGenerator(args.input, args.encoding).generate_file(args.parsername, args.output, args.backend)
 
 
 if __name__ == "__main__":
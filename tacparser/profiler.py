@@ -0,0 +1,273 @@
+from collections.abc import Callable
+from time import perf_counter
+
+
+#: 規則ごとの統計情報の項目
+RULE_STATS_KEYS = ("calls", "memo_hits", "memo_misses", "successes", "failures",
+                   "consumed", "rescanned", "inclusive_time", "exclusive_time")
+
+
+class RuleHook(object):
+    """
+    構文規則の呼び出しの前後で処理を行うクラスの基底クラス
+
+    install() でパーサーの規則の呼び出し (_parse, _create_non_terminal など) を
+    インスタンス属性で置き換え、uninstall() で元に戻す。
+    置き換えはインスタンス属性のみのため、使用しない場合の解析処理には影響しない。
+    複数のクラスを同時に install() した場合は、後から install() したものが外側で呼び出される。
+
+    サブクラスは _enter (規則の開始時) と _exit (規則の終了時) を実装する。
+    direct バックエンドのパーサーではメモの確認を規則の関数内で行うため、
+    規則の本体 (d_xxx) の実行のみを対象にする。
+    """
+
+    #: 置き換える規則の呼び出し
+    HOOKED_METHODS = ("_parse", "_create_non_terminal", "_create_left_recursive", "_create_non_memo")
+
+    def __init__(self) -> None:
+        """
+        初期化
+        """
+        self.parser = None      #: 対象のパーサー
+        self._saved = []        # (置き換えたインスタンス属性の名前, 置き換え前の値 | None)
+        self._matchers = None   # 置き換え前のパーサーの解析関数の辞書
+
+    def install(self, parser:"Parser") -> None:
+        """
+        パーサーの規則の呼び出しを置き換える
+
+        Parameters
+        ----------
+        parser : Parser
+            対象のパーサー
+        """
+        self.parser = parser
+        memo = parser._memo
+        create_non_terminal, create_left_recursive, create_non_memo, parse = \
+            [getattr(parser, name) for name in ("_create_non_terminal", "_create_left_recursive",
+                                                "_create_non_memo", "_parse")]
+
+        def hooked_parse(f, typename, end_pos=None, reuse_memo=False):
+            stacktype = typename if end_pos is None else "Sub:" + typename
+            frame = self._enter(stacktype, parser._reader.get_position(), False)
+            flg, node = parse(f, typename, end_pos, reuse_memo)
+            self._exit(frame, flg, parser._reader.get_position())
+            return flg, node
+
+        def hooked_create_non_terminal(def_function, startpos, typename, rule_id=None):
+            if rule_id is None:
+                rule_id = parser._get_rule_id(typename)
+            frame = self._enter(typename, startpos, memo.get(rule_id, startpos) is not None)
+            flg, nodes = create_non_terminal(def_function, startpos, typename, rule_id)
+            self._exit(frame, flg, parser._reader.get_position())
+            return flg, nodes
+
+        def hooked_create_left_recursive(def_function, startpos, typename, rule_id=None):
+            if rule_id is None:
+                rule_id = parser._get_rule_id(typename)
+            hit = (rule_id, startpos) in parser._lr_seeds or memo.get(rule_id, startpos) is not None
+            frame = self._enter(typename, startpos, hit)
+            flg, nodes = create_left_recursive(def_function, startpos, typename, rule_id)
+            self._exit(frame, flg, parser._reader.get_position())
+            return flg, nodes
+
+        def hooked_create_non_memo(def_function, startpos, typename, rule_id=None):
+            frame = self._enter(typename, startpos, False)
+            flg, nodes = create_non_memo(def_function, startpos, typename, rule_id)
+            self._exit(frame, flg, parser._reader.get_position())
+            return flg, nodes
+
+        # 置き換えた関数を参照する解析関数は、置き換え中のみ使用する
+        self._matchers = parser._matchers
+        parser._matchers = {}
+
+        self._set("_parse", hooked_parse)
+        self._set("_create_non_terminal", hooked_create_non_terminal)
+        self._set("_create_left_recursive", hooked_create_left_recursive)
+        self._set("_create_non_memo", hooked_create_non_memo)
+
+        # direct バックエンドの規則の本体
+        for typename in parser._rule_ids:
+            name = "d_" + typename.lower()
+            d_function = getattr(parser, name, None)
+            if d_function is not None:
+                self._set(name, self._wrap_direct(d_function, typename))
+
+    def uninstall(self) -> None:
+        """
+        置き換えた規則の呼び出しを元に戻す
+        """
+        for name, value in reversed(self._saved):
+            if value is None:
+                delattr(self.parser, name)
+            else:
+                setattr(self.parser, name, value)
+        self._saved = []
+        if self._matchers is not None:
+            self.parser._matchers = self._matchers
+            self._matchers = None
+
+    def _set(self, name:str, func:Callable) -> None:
+        self._saved.append((name, vars(self.parser).get(name)))
+        setattr(self.parser, name, func)
+
+    def _wrap_direct(self, d_function:Callable[[int], tuple[int, list]], typename:str) -> Callable:
+        """
+        direct バックエンドの規則の本体 d_xxx の前後で処理を行う関数を返す
+        """
+        def hooked_direct(pos):
+            frame = self._enter(typename, pos, False)
+            endpos, nodes = d_function(pos)
+            self._exit(frame, endpos >= 0, endpos)
+            return endpos, nodes
+
+        return hooked_direct
+
+    def _enter(self, typename:str, startpos:int, hit:bool) -> object:
+        """
+        規則の開始時の処理
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        startpos : int
+            開始位置
+        hit : bool
+            メモを使用する場合 True
+
+        Returns
+        ----------
+        frame : object
+            _exit に渡す値
+        """
+        raise NotImplementedError()
+
+    def _exit(self, frame:object, flg:bool, endpos:int) -> None:
+        """
+        規則の終了時の処理
+
+        Parameters
+        ----------
+        frame : object
+            _enter の戻り値
+        flg : bool
+            実行結果
+        endpos : int
+            終了位置 (失敗時は不定)
+        """
+        raise NotImplementedError()
+
+
+class RuleProfiler(RuleHook):
+    """
+    構文規則ごとの解析の統計情報を記録するクラス
+
+    規則ごとの統計情報
+        calls : 呼び出し回数
+        memo_hits : メモを使用した回数
+        memo_misses : 規則を実行した回数
+        successes : 成功した回数
+        failures : 失敗した回数
+        consumed : 成功時に読み進めた文字数の合計
+        rescanned : 失敗時に失敗するまでに読み進めた文字数の合計 (バックトラックで再度読み込まれる文字数)
+        inclusive_time : 規則の実行時間の合計 (秒、呼び出した規則の時間を含む)
+        exclusive_time : 規則の実行時間の合計 (秒、呼び出した規則の時間を含まない)
+
+    ルートの規則 (_parse) も、呼び出し回数 1 回の規則として記録する。
+    """
+
+    def __init__(self) -> None:
+        """
+        初期化
+        """
+        RuleHook.__init__(self)
+        self.rules = {}         #: タイプ名 -> 統計情報の辞書
+        self._child_times = []  # 実行中の規則ごとの、呼び出した規則の実行時間の合計
+
+    def _get_stats(self, typename:str) -> dict:
+        stats = self.rules.get(typename)
+        if stats is None:
+            stats = self.rules[typename] = dict.fromkeys(RULE_STATS_KEYS, 0)
+            stats["inclusive_time"] = stats["exclusive_time"] = 0.0
+        return stats
+
+    def _enter(self, typename:str, startpos:int, hit:bool) -> list:
+        stats = self._get_stats(typename)
+        stats["calls"] += 1
+        if hit:
+            stats["memo_hits"] += 1
+            return [stats, None]
+
+        stats["memo_misses"] += 1
+        # 規則の中で到達した位置を求めるため、最大到達位置を開始位置に戻して実行する
+        reader = self.parser._reader
+        frame = [stats, startpos, reader.maxposition]
+        reader.maxposition = startpos
+        self._child_times.append(0.0)
+        frame.append(perf_counter())
+        return frame
+
+    def _exit(self, frame:list, flg:bool, endpos:int) -> None:
+        stats = frame[0]
+        if frame[1] is None:
+            stats["successes" if flg else "failures"] += 1
+            return
+
+        elapsed = perf_counter() - frame[3]
+        child_time = self._child_times.pop()
+        stats["inclusive_time"] += elapsed
+        stats["exclusive_time"] += elapsed - child_time
+        if self._child_times:
+            self._child_times[-1] += elapsed
+
+        reader = self.parser._reader
+        startpos = frame[1]
+        reached = reader.maxposition
+        if frame[2] > reached:
+            reader.maxposition = frame[2]
+        if flg:
+            stats["successes"] += 1
+            stats["consumed"] += endpos - startpos
+        else:
+            stats["failures"] += 1
+            stats["rescanned"] += max(reached - startpos, 0)
+
+    def get_report(self) -> dict:
+        """
+        規則ごとの統計情報を、exclusive_time の降順で返す
+
+        Returns
+        ----------
+        report : dict[str, dict]
+            タイプ名 -> 統計情報の辞書
+        """
+        ordered = sorted(self.rules.items(), key=lambda item: item[1]["exclusive_time"], reverse=True)
+        return {typename: dict(stats) for typename, stats in ordered}
+
+
+def format_profile(report:dict) -> str:
+    """
+    規則ごとの統計情報を表形式の文字列にする
+
+    Parameters
+    ----------
+    report : dict[str, dict]
+        RuleProfiler.get_report() の結果
+
+    Returns
+    ----------
+    table : str
+        表形式の文字列
+    """
+    width = max([len("rule")] + [len(typename) for typename in report])
+    header = "{0:<{w}} {1:>8} {2:>8} {3:>8} {4:>8} {5:>8} {6:>10} {7:>10} {8:>10} {9:>10}".format(
+             "rule", "calls", "hits", "misses", "success", "failure",
+             "consumed", "rescanned", "incl(ms)", "excl(ms)", w=width)
+    lines = [header]
+    for typename, s in report.items():
+        lines.append("{0:<{w}} {1:>8} {2:>8} {3:>8} {4:>8} {5:>8} {6:>10} {7:>10} {8:>10.3f} {9:>10.3f}".format(
+                     typename, s["calls"], s["memo_hits"], s["memo_misses"], s["successes"], s["failures"],
+                     s["consumed"], s["rescanned"], s["inclusive_time"] * 1000, s["exclusive_time"] * 1000,
+                     w=width))
+    return "\n".join(lines) + "\n"
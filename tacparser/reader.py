@@ -1,5 +1,253 @@
+from collections.abc import Iterable
+
+import codecs
+import mmap
+import os
 import re
 
+from array import array
+from bisect import bisect_right
+
+import regex
+
+
+class SlicedPattern(object):
+    """
+    照合範囲を切り出した文字列に照合する正規表現
+
+    行頭 (^)、文字列の先頭 (\\A)、単語境界 (\\b, \\B)、後読み ((?<=, (?<!) などは照合位置より前の文字列を参照するため、
+    pos を指定して元の文字列に照合すると、照合位置を文字列の先頭とみなす場合と結果が変わる。
+    これらを含む正規表現は、照合範囲を切り出して照合する。
+    match の結果の位置 (start, end, span) は、元の文字列での位置になる。
+    """
+
+    __slots__ = ("reg", "pattern", "flags")
+
+    def __init__(self, reg:re.Pattern) -> None:
+        self.reg = reg
+        self.pattern = reg.pattern
+        self.flags = reg.flags
+
+    def match(self, string, pos:int=0, endpos:int=None) -> "SlicedMatch | None":
+        m = self.reg.match(string[pos:endpos])
+        if m is None:
+            return None
+        return SlicedMatch(m, pos)
+
+
+class SlicedMatch(object):
+    """
+    SlicedPattern の照合結果。位置は元の文字列での位置を返す。
+    """
+
+    __slots__ = ("_m", "_pos")
+
+    def __init__(self, m, pos:int) -> None:
+        self._m = m
+        self._pos = pos
+
+    def group(self, *args):
+        return self._m.group(*args)
+
+    def start(self, group=0) -> int:
+        start = self._m.start(group)
+        return start if start < 0 else start + self._pos
+
+    def end(self, group=0) -> int:
+        end = self._m.end(group)
+        return end if end < 0 else end + self._pos
+
+    def span(self, group=0) -> tuple[int, int]:
+        return self.start(group), self.end(group)
+
+
+#: 照合位置より前の文字列を参照するエスケープ (文字クラスの外)
+_CONTEXT_ESCAPES = frozenset("AbBGmM")
+
+#: 正規表現 -> 照合に使用する正規表現 (bounded_pattern の結果)
+_bounded_patterns = {}
+
+
+def refers_before(pattern:"str | bytes") -> bool:
+    """
+    正規表現のパターンが、照合位置より前の文字列を参照する構文
+    (^, \\A, \\b, \\B, \\G, \\m, \\M, 後読み) を含むかを返す。
+    """
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode("latin-1")
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if not in_class and pattern[i + 1:i + 2] in _CONTEXT_ESCAPES:
+                return True
+            i += 2
+            continue
+        if in_class:
+            if c == "]":
+                in_class = False
+        elif c == "[":
+            in_class = True
+            # 先頭の "^" は否定、"]" は文字として扱われる
+            if pattern.startswith("^", i + 1):
+                i += 1
+            if pattern.startswith("]", i + 1):
+                i += 1
+        elif c == "^":
+            return True
+        elif pattern.startswith("(?<=", i) or pattern.startswith("(?<!", i):
+            return True
+        i += 1
+    return False
+
+
+def bounded_pattern(reg:re.Pattern) -> "re.Pattern | SlicedPattern":
+    """
+    match(string, pos, endpos) で、string[pos:endpos] に照合した場合と同じ結果になる正規表現を返す。
+    照合位置より前の文字列を参照しない正規表現はそのまま返し、参照する正規表現は SlicedPattern で返す。
+
+    Parameters
+    ----------
+    reg : re.Pattern
+        正規表現オブジェクト (re / regex)
+
+    Returns
+    ---------- 
+    reg : re.Pattern | SlicedPattern
+        照合に使用する正規表現
+    """
+    bounded = _bounded_patterns.get(reg)
+    if bounded is None:
+        if reg.__class__ is SlicedPattern:
+            return reg
+        bounded = _bounded_patterns[reg] = SlicedPattern(reg) if refers_before(reg.pattern) else reg
+    return bounded
+
+
+class LineIndex(object):
+    """
+    文字カウントから行番号、列番号を求めるための索引クラス
+    各行の開始位置を array('q') で保持し、二分探索で行を特定する。
+    行の区切りは str.splitlines と同じ文字を用いる。
+    """
+
+    #: 行の区切り文字 (str.splitlines と同じ)
+    _reg_linebreak = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+    def __init__(self, contents:str) -> None:
+        """
+        初期化
+
+        Parameters
+        ----------
+        contents : str
+            索引を作成する文字列全体
+        """
+        self.length = len(contents)
+        #: 各行の開始位置
+        self.linestarts = array("q")
+        if self.length > 0:
+            self.linestarts.append(0)
+            for m in self._reg_linebreak.finditer(contents):
+                if m.end() < self.length:
+                    self.linestarts.append(m.end())
+
+    @classmethod
+    def from_chunks(cls, chunks:Iterable[str]) -> "LineIndex":
+        """
+        分割された文字列から索引を作成する。
+        文字列全体を一度にメモリ上に置けない場合に使用する。
+
+        Parameters
+        ----------
+        chunks : Iterable[str]
+            先頭から順に並んだ部分文字列
+
+        Returns
+        ---------- 
+        line_index : LineIndex
+            連結した文字列全体の索引
+        """
+        index = cls("")
+        linestarts = index.linestarts
+        linestarts.append(0)
+        offset = 0
+        carry = ""
+        for chunk in chunks:
+            text = carry + chunk
+            # "\r\n" が部分文字列の境界で分かれる場合に備え、末尾の "\r" は次に回す
+            if text.endswith("\r"):
+                carry = "\r"
+                text = text[:-1]
+            else:
+                carry = ""
+            for m in cls._reg_linebreak.finditer(text):
+                linestarts.append(offset + m.end())
+            offset += len(text)
+        if carry:
+            offset += 1
+            linestarts.append(offset)
+
+        index.length = offset
+        if linestarts[-1] == offset:
+            linestarts.pop()
+        return index
+
+    def __len__(self) -> int:
+        """
+        行数を返す
+        """
+        return len(self.linestarts)
+
+    def linecolumn(self, pos:int) -> tuple[int, int]:
+        """
+        文字カウント を 行番号、列番号に変換する
+
+        Parameters
+        ----------
+        pos : int
+            位置情報（文字カウント）
+
+        Returns
+        ---------- 
+        linenum : int
+            行数
+        colum : int
+            行のカラム数
+        """
+        if 0 <= pos < self.length:
+            i = bisect_right(self.linestarts, pos) - 1
+            return i + 1, pos - self.linestarts[i]
+
+        if pos == self.length:
+            linecount = len(self.linestarts)
+            if linecount < 2:
+                # 空ファイルまたは1行のみのファイル
+                return linecount, pos
+            return linecount, pos - self.linestarts[-1]
+
+        raise IndexError("over File length <{0}>, contents length={1}".format(pos, self.length))
+
+    def line_startpos(self, linenum:int) -> int:
+        """
+        行番号から行の開始位置を返す
+
+        Parameters
+        ----------
+        linenum : int
+            行番号（1始まり）
+
+        Returns
+        ---------- 
+        pos : int
+            行の開始位置（文字カウント）
+        """
+        if not 1 <= linenum <= len(self.linestarts):
+            raise IndexError("line number out of range <{0}>".format(linenum))
+        return self.linestarts[linenum - 1]
+
+
 class Reader(object):
     """
     文字列解析のための読み込みクラス
@@ -21,7 +269,8 @@ class Reader(object):
         self.__position = 0
         self.maxposition = 0
         self.length = len(self.contents)
-        self.__linepos__ = []
+        # 行番号、列番号の索引（初回使用時に作成する）
+        self._line_index = None
         # 部分的な構文解析時に使用する終了判定位置
         self.__endposition = -1
 
@@ -45,15 +294,21 @@ class Reader(object):
         literal : str
             読み込んだ文字列
         """
-        nextstr = self.contents[self.__position:self.__position + len(literal)]
-        if 0 < self.__endposition < self.__position + len(literal):
+        pos = self.__position
+        endpos = self.get_endposition()
+        if not nocase:
+            # startswith は contents のコピーを作成せずに比較する
+            if self.contents.startswith(literal, pos, endpos):
+                if flg:
+                    self.__position += len(literal)
+                    self.getmaxposition()
+                return True, literal
             return False, None
-        if (not nocase) and nextstr == literal:
-            if flg:
-                self.__position += len(literal)
-                self.getmaxposition()
-            return True, literal
-        elif nocase and nextstr.lower() == literal.lower():
+
+        if endpos < pos + len(literal):
+            return False, None
+        nextstr = self.contents[pos:pos + len(literal)]
+        if nextstr.lower() == literal.lower():
             if flg:
                 self.__position += len(literal)
                 self.getmaxposition()
@@ -79,10 +334,13 @@ class Reader(object):
         literal : str | None
             読み込んだ文字列
         """
-        if self.__endposition < 0:
-            m = reg.match(self.contents[self.__position:])
-        else:
-            m = reg.match(self.contents[self.__position:self.__endposition])
+        # pos, endpos を指定して元の文字列に対して直接マッチさせる。
+        # (スライスによる残り文字列全体のコピーを作成しない)
+        # 照合位置より前を参照する正規表現は、照合範囲を切り出して照合する (bounded_pattern)
+        bounded = _bounded_patterns.get(reg)
+        if bounded is None:
+            bounded = bounded_pattern(reg)
+        m = bounded.match(self.contents, self.__position, self.get_endposition())
         if m:
             mg = m.group(0)
             if flg:
@@ -92,6 +350,34 @@ class Reader(object):
         else:
             return False, None
 
+    def peek_char(self) -> str:
+        """
+        読み取り位置の次の 1 文字を返す。読み進めない。
+
+        Returns
+        ---------- 
+        char : str
+            次の文字。終了位置に達している場合は ""
+        """
+        if self.__position >= self.get_endposition():
+            return ""
+        return self.contents[self.__position]
+
+    def get_endposition(self) -> int:
+        """
+        読み込み可能な終了位置を返す。
+        部分的な構文解析時は partial_reposition で指定した終了位置、
+        それ以外の場合は contents の長さを返す。
+
+        Returns
+        ---------- 
+        endposition : int
+            読み込み可能な終了位置
+        """
+        if self.__endposition < 0:
+            return self.length
+        return self.__endposition
+
     def getmaxposition(self) -> int:
         """
         それまでに読み進めることができた位置の最大値を返す。
@@ -123,27 +409,24 @@ class Reader(object):
         content : str
             その次の文字
         """
-        if len(self.__linepos__) == 0:
-            line_pos = 0
-            for l in self.contents.splitlines(True):
-                line_pos += len(l)
-                self.__linepos__.append(line_pos)
-
-        linepos_l, linenum, column = 0, 0, 0
-        for linepos in self.__linepos__:
-            if linepos > pos >= linepos_l:
-                column = pos - linepos_l
-                return linenum + 1, column, self.contents[pos]
-            linenum += 1
-            linepos_l = linepos
-
-        if pos == linepos_l:
-            if linenum < 2:
-                # 空ファイルまたは1行のみのファイル
-                return linenum, pos, ""
-            return linenum, pos - self.__linepos__[-2], ""
+        linenum, column = self.get_line_index().linecolumn(pos)
+        if pos < self.length:
+            return linenum, column, self.contents[pos]
+        return linenum, column, ""
 
-        raise IndexError("over File length <{0}>, contents length={1}".format(pos, len(self.contents)))
+    def get_line_index(self) -> LineIndex:
+        """
+        行番号、列番号の索引を返す。
+        索引は初回呼び出し時に一度だけ作成する。
+
+        Returns
+        ---------- 
+        line_index : LineIndex
+            contents 全体の行番号、列番号の索引
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex(self.contents)
+        return self._line_index
 
     def getmaxlinecolumn(self) -> tuple[int, int, str]:
         """
@@ -256,3 +539,544 @@ class StringReader(Reader):
     def __init__(self, string:str) -> None:
         Reader.__init__(self, string)
 
+
+
+class MmapFileReader(Reader):
+    """
+    ファイルをメモリマップして読み込むクラス
+    ファイル全体を str に変換せず、マップしたバイト列に対して
+    リテラル、正規表現を直接照合する。
+
+    位置情報は他の Reader と同様に文字カウントで扱う。
+    読み進めた文字数は照合した部分のみをデコードして求め、
+    任意の位置への移動はチェックポイント（一定バイトごとの文字カウント）から変換する。
+
+    対応するエンコードは UTF-8 と ASCII のみ。
+    FileReader はテキストモードで改行を変換するため、
+    "\r" を含むファイルは位置情報が一致しない。(is_usable が False を返す)
+    """
+
+    # 文字カウントとバイト位置の対応を記録する間隔（バイト数）
+    _CHECKPOINT_INTERVAL = 4096
+    # 読み込み時の走査、索引作成に使用する単位（バイト数）
+    _BLOCK_SIZE = 1 << 20
+    # バイト位置のキャッシュの上限
+    _POSITION_CACHE_SIZE = 65536
+    # FileReader と結果が一致しなくなるバイト
+    # "\r" は改行の変換、"\x1c"-"\x1f" は str パターンの \s が一致するため
+    _UNSUPPORTED_BYTES = (b"\r", b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+    # 非ASCII文字を含むファイルで、str と bytes の照合結果が異なりうるエスケープ
+    _UNSAFE_ESCAPES = "wWsSdDbBpPXNuUxLo"
+    _reg_inline_ignorecase = re.compile("\\(\\?[a-zA-Z]*i")
+
+    @staticmethod
+    def supports_encoding(encoding:str) -> bool:
+        """
+        エンコードに対応しているかを返す
+
+        Parameters
+        ----------
+        encoding : str
+            ファイルのエンコード
+
+        Returns
+        ---------- 
+        result : bool
+            UTF-8 または ASCII の場合 True
+        """
+        try:
+            return codecs.lookup(encoding).name in ("utf-8", "ascii")
+        except LookupError:
+            return False
+
+    def __init__(self, filepath:str, encoding:str="utf-8") -> None:
+        """
+        初期化
+        ファイルを一度走査し、文字コードの検証とチェックポイントの作成を行う。
+
+        Parameters
+        ----------
+        filepath : str
+            ファイルパス
+        encoding : str
+            ファイルのエンコード ("utf-8" または "ascii")
+        """
+        if not self.supports_encoding(encoding):
+            raise ValueError("MmapFileReader does not support encoding <{0}>".format(encoding))
+        self.__codec = codecs.lookup(encoding).name
+
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > 0:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # 空ファイルはマップできない
+                self._mm = b""
+        self.__size = size
+
+        self.__position = 0
+        self.__bytepos = 0
+        self.maxposition = 0
+        # 行番号、列番号の索引（初回使用時に作成する）
+        self._line_index = None
+        # 部分的な構文解析時に使用する終了判定位置
+        self.__endposition = -1
+        self.__byte_endposition = size
+
+        # チェックポイント : 文字カウントと対応するバイト位置
+        self.__cp_chars = array("q")
+        self.__cp_bytes = array("q")
+        # 文字カウントからバイト位置へのキャッシュ
+        self.__bytepos_cache = {0: 0}
+        # 変換済みの正規表現、リテラル
+        self.__patterns = {}
+        self.__literals = {}
+
+        #: ASCII 文字のみのファイルの場合 True (文字カウントとバイト位置が一致する)
+        self.is_ascii = True
+        #: FileReader と結果が一致しないバイトを含む場合 True
+        self.has_unsupported_bytes = False
+        self.length = self.__scan()
+        if self.is_ascii:
+            self.__cp_chars = array("q")
+            self.__cp_bytes = array("q")
+
+    def __align(self, bpos:int, lower:int) -> int:
+        """
+        バイト位置を文字の先頭に合わせる（UTF-8 の後続バイトの分だけ戻す）
+        """
+        mm = self._mm
+        pos = bpos
+        while lower < pos < self.__size and mm[pos] & 0xC0 == 0x80:
+            pos -= 1
+        return pos if pos > lower else bpos
+
+    def __scan(self) -> int:
+        """
+        ファイル全体を走査して文字数を返す
+        """
+        mm = self._mm
+        size = self.__size
+        interval = self._CHECKPOINT_INTERVAL
+        cp_chars = self.__cp_chars
+        cp_bytes = self.__cp_bytes
+        chars = 0
+        bpos = 0
+        while bpos < size:
+            end = self.__align(min(bpos + self._BLOCK_SIZE, size), bpos)
+            block = mm[bpos:end]
+            if not self.has_unsupported_bytes:
+                self.has_unsupported_bytes = any(b in block for b in self._UNSUPPORTED_BYTES)
+
+            if block.isascii():
+                for offset in range(0, len(block), interval):
+                    cp_chars.append(chars + offset)
+                    cp_bytes.append(bpos + offset)
+                chars += len(block)
+            else:
+                self.is_ascii = False
+                if self.__codec == "ascii":
+                    block.decode("ascii")   # UnicodeDecodeError を送出させる
+                start = 0
+                while start < len(block):
+                    stop = self.__align(min(start + interval, len(block)) + bpos, start + bpos) - bpos
+                    cp_chars.append(chars)
+                    cp_bytes.append(bpos + start)
+                    chars += len(block[start:stop].decode("utf-8"))
+                    start = stop
+            bpos = end
+        return chars
+
+    def __iter_text(self) -> Iterable[str]:
+        """
+        ファイル全体を部分文字列に分けて返す
+        """
+        bpos = 0
+        while bpos < self.__size:
+            end = self.__align(min(bpos + self._BLOCK_SIZE, self.__size), bpos)
+            yield self._mm[bpos:end].decode(self.__codec)
+            bpos = end
+
+    def close(self) -> None:
+        """
+        メモリマップを閉じる
+        """
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def is_byte_safe(self, reg:re.Pattern) -> bool:
+        """
+        正規表現をマップしたバイト列に対して照合できるかを返す。
+
+        ASCII 文字のみのファイルでは bytes パターンにコンパイルできればよい。
+        非ASCII文字を含むファイルでは、照合結果が str の場合と変わらないことを
+        保証できるパターン（ASCII のみで構成され、任意の1文字に一致しうる構文と
+        Unicode 文字クラスを含まないパターン）のみ照合できる。
+
+        Parameters
+        ----------
+        reg : re.Pattern
+            正規表現オブジェクト (re / regex)
+
+        Returns
+        ---------- 
+        result : bool
+            照合できる場合 True
+        """
+        if self.__compile(reg) is None:
+            return False
+        if self.is_ascii:
+            return True
+
+        pattern = reg.pattern
+        if not isinstance(pattern, str) or not pattern.isascii():
+            return False
+        if reg.flags & re.IGNORECASE or self._reg_inline_ignorecase.search(pattern):
+            return False
+
+        i = 0
+        in_class = False
+        while i < len(pattern):
+            c = pattern[i]
+            if c == "\\":
+                if pattern[i + 1:i + 2] in self._UNSAFE_ESCAPES:
+                    return False
+                i += 2
+                continue
+            if in_class:
+                if c == "]":
+                    in_class = False
+                elif pattern.startswith("[:", i):
+                    # POSIX 文字クラス
+                    return False
+            elif c == "[":
+                if pattern.startswith("[^", i):
+                    return False
+                in_class = True
+                if pattern.startswith("[]", i):
+                    # 先頭の "]" は文字として扱われる
+                    i += 1
+            elif c == ".":
+                return False
+            i += 1
+        return True
+
+    def is_usable(self, regs:Iterable[re.Pattern]) -> bool:
+        """
+        指定した正規表現を使用する構文解析で、FileReader と同じ結果が得られるかを返す
+
+        Parameters
+        ----------
+        regs : Iterable[re.Pattern]
+            構文解析で使用する正規表現
+
+        Returns
+        ---------- 
+        result : bool
+            使用できる場合 True
+        """
+        if self.has_unsupported_bytes:
+            return False
+        return all(self.is_byte_safe(reg) for reg in regs)
+
+    def __compile(self, reg:re.Pattern) -> "re.Pattern | None":
+        """
+        str の正規表現から bytes の正規表現を作成する。作成できない場合は None を返す。
+        """
+        try:
+            return self.__patterns[reg]
+        except KeyError:
+            pass
+
+        source = reg.reg if reg.__class__ is SlicedPattern else reg
+        pattern = source.pattern
+        if isinstance(pattern, str):
+            module = regex if isinstance(source, regex.Pattern) else re
+            try:
+                breg = module.compile(pattern.encode("utf-8"), source.flags & ~module.UNICODE)
+            except (re.error, regex.error):
+                breg = None
+        else:
+            breg = source
+        if breg is not None:
+            # 照合位置より前を参照する正規表現は、照合範囲を切り出して照合する
+            breg = bounded_pattern(breg)
+        self.__patterns[reg] = breg
+        return breg
+
+    def __to_bytepos(self, n:int) -> int:
+        """
+        文字カウントをバイト位置に変換する
+        """
+        if self.is_ascii:
+            return n
+        b = self.__bytepos_cache.get(n)
+        if b is None:
+            cp_chars = self.__cp_chars
+            i = bisect_right(cp_chars, n) - 1
+            b0 = self.__cp_bytes[i]
+            b1 = self.__cp_bytes[i + 1] if i + 1 < len(cp_chars) else self.__size
+            text = self._mm[b0:b1].decode("utf-8")
+            b = b0 + len(text[:n - cp_chars[i]].encode("utf-8"))
+            self.__cache_position(n, b)
+        return b
+
+    def __cache_position(self, n:int, b:int) -> None:
+        cache = self.__bytepos_cache
+        if len(cache) >= self._POSITION_CACHE_SIZE:
+            cache.clear()
+        cache[n] = b
+
+    def __advance(self, nchars:int, nbytes:int) -> None:
+        self.__position += nchars
+        self.__bytepos += nbytes
+        if not self.is_ascii:
+            self.__cache_position(self.__position, self.__bytepos)
+        self.getmaxposition()
+
+    def match_literal(self, literal:str, flg:bool=False, nocase:bool=False) -> tuple[bool, str]:
+        """
+        contentsの次が指定したリテラルにマッチした場合、読み進める。
+
+        Parameters
+        ----------
+        literal : str
+            Unicode文字列
+        flg : bool
+            成功時ファイルを読み進めるか否か
+        nocase : bool
+            大文字小文字を区別するか否か(true=区別しない)
+
+        Returns
+        ---------- 
+        result : bool
+            先頭matchの成否
+        literal : str
+            読み込んだ文字列
+        """
+        if self.get_endposition() < self.__position + len(literal):
+            return False, None
+
+        bpos = self.__bytepos
+        if not nocase:
+            lb = self.__literals.get(literal)
+            if lb is None:
+                try:
+                    lb = literal.encode(self.__codec)
+                except UnicodeEncodeError:
+                    # ファイルのエンコードで表現できないリテラルは一致しない
+                    lb = False
+                self.__literals[literal] = lb
+            if lb is not False and self._mm[bpos:bpos + len(lb)] == lb:
+                if flg:
+                    self.__advance(len(literal), len(lb))
+                return True, literal
+            return False, None
+
+        # UTF-8 では1文字が最大4バイト
+        width = 1 if self.is_ascii else 4
+        nextstr = self._mm[bpos:bpos + len(literal) * width].decode(self.__codec, "ignore")[:len(literal)]
+        if len(nextstr) == len(literal) and nextstr.lower() == literal.lower():
+            if flg:
+                self.__advance(len(nextstr), len(nextstr.encode(self.__codec)))
+            return True, nextstr
+        else:
+            return False, None
+
+    def match_regexp(self, reg:re.Pattern, flg:bool=False) -> tuple[bool, str]:
+        """
+        contentsの次が指定した正規表現にマッチした場合、読み進める。
+        正規表現は bytes のパターンに変換して、マップしたバイト列に直接照合する。
+
+        Parameters
+        ----------
+        reg : re.Pattern
+            正規表現
+        flg : bool
+            成功時ファイルを読み進めるか否か
+
+        Returns
+        ---------- 
+        result : bool
+            先頭matchの成否
+        literal : str | None
+            読み込んだ文字列
+        """
+        breg = self.__patterns.get(reg)
+        if breg is None:
+            if not self.is_byte_safe(reg):
+                raise ValueError("MmapFileReader cannot match the pattern <{0}>".format(reg.pattern))
+            breg = self.__patterns[reg]
+
+        m = breg.match(self._mm, self.__bytepos, self.__byte_endposition)
+        if m:
+            mb = m.group(0)
+            mg = mb.decode(self.__codec)
+            if flg:
+                self.__advance(len(mg), len(mb))
+            self.getmaxposition()
+            return True, mg
+        else:
+            return False, None
+
+    def peek_char(self) -> str:
+        """
+        読み取り位置の次の 1 文字を返す。読み進めない。
+
+        Returns
+        ---------- 
+        char : str
+            次の文字。終了位置に達している場合は ""
+        """
+        if self.__position >= self.get_endposition():
+            return ""
+        b = self._mm[self.__bytepos]
+        if b < 0x80:
+            return chr(b)
+        # UTF-8 の先頭バイトから文字のバイト数を求める
+        nbytes = 2 if b < 0xE0 else 3 if b < 0xF0 else 4
+        return self._mm[self.__bytepos:self.__bytepos + nbytes].decode(self.__codec)
+
+    def get_endposition(self) -> int:
+        """
+        読み込み可能な終了位置を返す。
+
+        Returns
+        ---------- 
+        endposition : int
+            読み込み可能な終了位置
+        """
+        if self.__endposition < 0:
+            return self.length
+        return self.__endposition
+
+    def getmaxposition(self) -> int:
+        """
+        それまでに読み進めることができた位置の最大値を返す。
+
+        Returns
+        ---------- 
+        maxposition : int
+            position の最大値
+        """
+        if self.__position > self.maxposition:
+            self.maxposition = self.__position
+        return self.maxposition
+
+    def pos2linecolumn(self, pos:int) -> tuple[int, int, str]:
+        """
+        文字カウント を 行番号、列番号に変換する
+
+        Parameters
+        ----------
+        pos : int
+            位置情報（文字カウント）
+
+        Returns
+        ---------- 
+        linenum : int
+            行数
+        colum : int
+            行のカラム数
+        content : str
+            その次の文字
+        """
+        linenum, column = self.get_line_index().linecolumn(pos)
+        if pos < self.length:
+            return linenum, column, self.get_contents(pos, pos + 1)
+        return linenum, column, ""
+
+    def get_line_index(self) -> LineIndex:
+        """
+        行番号、列番号の索引を返す。
+        索引は初回呼び出し時に、ファイルを部分ごとにデコードして作成する。
+
+        Returns
+        ---------- 
+        line_index : LineIndex
+            ファイル全体の行番号、列番号の索引
+        """
+        if self._line_index is None:
+            self._line_index = LineIndex.from_chunks(self.__iter_text())
+        return self._line_index
+
+    def get_position(self) -> int:
+        """
+        読み取り位置を返す
+
+        Returns
+        ---------- 
+        __position : int
+            ファイル位置（文字カウント）
+        """
+        return self.__position
+
+    def set_position(self, n:int) -> None:
+        """
+        読み取り位置を設定する。
+
+        Parameters
+        ----------
+        n : int
+            読み取り位置（文字カウント）
+        """
+        if n > self.length:
+            raise ValueError
+        if n != self.__position:
+            self.__bytepos = self.__to_bytepos(n)
+            self.__position = n
+        self.getmaxposition()
+
+    def partial_reposition(self, startpos:int, endpos:int) -> None:
+        """
+        開始位置、終了位置、maxlengthを再設定する。
+
+        Parameters
+        ----------
+        startpos : int
+            設定する開始位置（文字カウント）
+        endpos : int
+            設定する終了位置（文字カウント）
+        """
+        if startpos > self.length:
+            raise ValueError
+        if endpos > self.length:
+            raise ValueError
+
+        self.__bytepos = self.__to_bytepos(startpos)
+        self.__position = startpos
+        self.__endposition = endpos
+        self.__byte_endposition = self.__to_bytepos(endpos)
+        self.maxposition = startpos
+
+    def is_end(self) -> bool:
+        """
+        終端に達しているか否かを判断する関数
+
+        Returns
+        ---------- 
+        result : bool
+            読み込み位置が終端とイコールの場合、True, それ以外の場合、False
+        """
+        return self.__position >= self.length
+
+    def get_contents(self, startpos:int, endpos:int) -> str:
+        """
+        開始位置と終了位置から対応する文字列を返す
+        該当する範囲のみをデコードする
+
+        Parameters
+        ----------
+        startpos : int
+            開始位置（文字カウント）
+        endpos : int
+            終了位置（文字カウント）
+
+        Returns
+        ---------- 
+        contents : str
+            開始位置と終了位置に対応する文字列
+        """
+        startpos = min(max(startpos, 0), self.length)
+        endpos = min(max(endpos, startpos), self.length)
+        return self._mm[self.__to_bytepos(startpos):self.__to_bytepos(endpos)].decode(self.__codec)
@@ -0,0 +1,162 @@
+from .node import Node, NonTerminalNode
+
+
+class ParseEventHandler(object):
+    """
+    構文解析のイベントを受け取るクラスの基底クラス
+
+    stream_file, stream_string の引数 handler に指定して使用する。
+    サブクラスで enter (規則の開始), exit (規則の終了), terminal (終端) を実装する。
+    各イベントは、バックトラックで取り消されることがなくなった時点で、入力の順に呼び出される。
+
+        class LineCounter(ParseEventHandler):
+            def __init__(self):
+                self.lines = 0
+
+            def exit(self, typename, startpos, endpos):
+                if typename == "Line":
+                    self.lines += 1
+
+        flg, diagnostics = parser.stream_file(filepath, LineCounter())
+    """
+
+    def enter(self, typename:str, startpos:int) -> None:
+        """
+        規則の開始
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        startpos : int
+            開始位置
+        """
+        pass
+
+    def exit(self, typename:str, startpos:int, endpos:int) -> None:
+        """
+        規則の終了 (成功時のみ)
+
+        Parameters
+        ----------
+        typename : str
+            タイプ名
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+        """
+        pass
+
+    def terminal(self, text:str, startpos:int, endpos:int) -> None:
+        """
+        終端 (リテラル、正規表現、マクロ)
+
+        Parameters
+        ----------
+        text : str
+            終端の文字列
+        startpos : int
+            開始位置
+        endpos : int
+            終了位置
+        """
+        pass
+
+
+class EventCollector(ParseEventHandler):
+    """
+    イベントをタプルのリストに記録するクラス (確認、テスト用)
+
+    記録の形式は ("enter", タイプ名, 開始位置), ("exit", タイプ名, 開始位置, 終了位置),
+    ("terminal", 文字列, 開始位置, 終了位置)
+    """
+
+    def __init__(self) -> None:
+        """
+        初期化
+        """
+        self.events = []    #: 記録したイベントのリスト
+
+    def enter(self, typename:str, startpos:int) -> None:
+        self.events.append(("enter", typename, startpos))
+
+    def exit(self, typename:str, startpos:int, endpos:int) -> None:
+        self.events.append(("exit", typename, startpos, endpos))
+
+    def terminal(self, text:str, startpos:int, endpos:int) -> None:
+        self.events.append(("terminal", text, startpos, endpos))
+
+
+# -----------------------------------------------------------------
+# 保留中のイベント
+#   バックトラックで取り消される可能性がある間は、イベントをタプルで保持する。
+#     終端 : (文字列, 開始位置, 終了位置)
+#     規則 : (タイプ名, 開始位置, 終了位置, 子のタプル)
+#   規則の子が None の場合は、イベントを送信済みであることを表す (メモにのみ登録する)。
+# -----------------------------------------------------------------
+
+def emit_events(handler:ParseEventHandler, items:tuple) -> None:
+    """
+    保留中のイベントを先行順に handler に送信する
+
+    Parameters
+    ----------
+    handler : ParseEventHandler
+        イベントを受け取るクラス
+    items : tuple
+        保留中のイベントのタプル
+    """
+    # 再帰呼び出しを行わず、(子のイテレーター, 規則) のスタックで処理する
+    stack = [(iter(items), None)]
+    while stack:
+        children, rule = stack[-1]
+        for item in children:
+            if len(item) == 3:
+                handler.terminal(item[0], item[1], item[2])
+            else:
+                handler.enter(item[0], item[1])
+                stack.append((iter(item[3]), item))
+                break
+        else:
+            stack.pop()
+            if rule is not None:
+                handler.exit(rule[0], rule[1], rule[2])
+
+
+def node_items(nodes:tuple[Node]) -> tuple:
+    """
+    ノードのタプルを保留中のイベントのタプルに変換する (direct バックエンド用)
+
+    Parameters
+    ----------
+    nodes : tuple[Node]
+        ノードのタプル
+
+    Returns
+    ----------
+    items : tuple
+        保留中のイベントのタプル
+    """
+    # 再帰呼び出しを行わず、[ノード, 次の子の位置, 変換した子のリスト] のスタックで
+    # 帰りがけ順に処理する
+    result = []
+    stack = [[nodes, 0, result]]
+    while stack:
+        frame = stack[-1]
+        children, i, items = frame
+        if i < len(children):
+            frame[1] = i + 1
+            node = children[i]
+            if isinstance(node, NonTerminalNode):
+                stack.append([node.children, 0, []])
+            else:
+                items.append((node.get_str(), node.startpos, node.endpos))
+            continue
+
+        stack.pop()
+        if stack:
+            parent = stack[-1]
+            node = parent[0][parent[1] - 1]
+            parent[2].append((node.type, node.startpos, node.endpos, tuple(items)))
+    return tuple(result)
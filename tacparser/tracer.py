@@ -0,0 +1,165 @@
+import json
+
+from time import perf_counter
+
+from .profiler import RuleHook
+
+
+class ParseTracer(RuleHook):
+    """
+    構文規則の開始、終了を記録し、Chrome Trace Event 形式 (JSON) または
+    folded stack 形式 (flamegraph.pl, speedscope などの入力) で出力するクラス
+
+    parse_file, parse_string の引数 trace に指定して使用する。
+
+        tracer = ParseTracer()
+        flg, tree = parser.parse_file(filepath, trace=tracer)
+        tracer.write_chrome_trace("parse.json")
+        tracer.write_folded("parse.folded")
+
+    sample_interval を指定しない場合は、すべての規則の呼び出しを記録する。
+    folded stack の値は、呼び出し階層ごとの実行時間 (マイクロ秒、呼び出した規則の時間を含まない)。
+
+    sample_interval (秒) を指定した場合は、指定した間隔ごとに実行中の規則の呼び出し階層を記録する。
+    Chrome Trace Event には記録した時点で実行中だった規則の呼び出しのみを出力し、
+    folded stack の値は記録した回数になる。大きなファイルでも記録の件数を抑えられる。
+    """
+
+    def __init__(self, sample_interval:float=None) -> None:
+        """
+        初期化
+
+        Parameters
+        ----------
+        sample_interval : float
+            呼び出し階層を記録する間隔 (秒)、None の場合はすべての呼び出しを記録する
+        """
+        RuleHook.__init__(self)
+        self.sample_interval = sample_interval  #: 呼び出し階層を記録する間隔 (秒)
+        self.events = []        #: Chrome Trace Event のリスト
+        self.samples = 0        #: 呼び出し階層を記録した回数 (sample_interval 指定時)
+        self._stack = []        # 実行中の規則 [タイプ名, 開始位置, 開始時刻, 呼び出した規則の時間, 記録済, メモ使用, 階層]
+        self._root = [None, None, {}, 0]    # 呼び出し階層の木 [タイプ名, 親, 子の辞書, 実行時間 | 記録した回数]
+        self._origin = None     # 記録の開始時刻
+        self._next_sample = 0.0 # 次に呼び出し階層を記録する時刻
+
+    def install(self, parser:"Parser") -> None:
+        if self._origin is None:
+            self._origin = perf_counter()
+            if self.sample_interval is not None:
+                self._next_sample = self._origin + self.sample_interval
+        RuleHook.install(self, parser)
+
+    def _enter(self, typename:str, startpos:int, hit:bool) -> list:
+        parent = self._stack[-1][6] if self._stack else self._root
+        node = parent[2].get(typename)
+        if node is None:
+            node = parent[2][typename] = [typename, parent, {}, 0]
+        now = perf_counter()
+        frame = [typename, startpos, now, 0.0, False, hit, node]
+        self._stack.append(frame)
+        if self.sample_interval is not None and now >= self._next_sample:
+            self._sample(frame, now)
+        return frame
+
+    def _exit(self, frame:list, flg:bool, endpos:int) -> None:
+        now = perf_counter()
+        self._stack.pop()
+        duration = now - frame[2]
+        if self._stack:
+            self._stack[-1][3] += duration
+
+        if self.sample_interval is None:
+            frame[6][3] += duration - frame[3]
+        elif now >= self._next_sample:
+            self._sample(frame, now)
+
+        if self.sample_interval is None or frame[4]:
+            args = {"start": frame[1], "result": flg, "memo": frame[5]}
+            if flg:
+                args["end"] = endpos
+            self.events.append({"name": frame[0], "cat": "rule", "ph": "X",
+                                "ts": (frame[2] - self._origin) * 1000000, "dur": duration * 1000000,
+                                "pid": 0, "tid": 0, "args": args})
+
+    def _sample(self, frame:list, now:float) -> None:
+        """
+        規則の呼び出し階層を記録し、規則とその外側の規則を Chrome Trace Event の出力対象にする
+
+        Parameters
+        ----------
+        frame : list
+            実行中の規則
+        now : float
+            現在時刻
+        """
+        self.samples += 1
+        self._next_sample = now + self.sample_interval
+        frame[6][3] += 1
+        if frame[4]:
+            return
+        frame[4] = True
+        for f in reversed(self._stack):
+            if f is frame:
+                continue
+            if f[4]:
+                # 記録済の規則より外側の規則は、記録済
+                break
+            f[4] = True
+
+    def get_chrome_trace(self) -> dict:
+        """
+        Chrome Trace Event 形式のデータを返す (chrome://tracing, Perfetto で表示できる)
+
+        Returns
+        ----------
+        trace : dict
+            {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def get_folded(self) -> str:
+        """
+        folded stack 形式の文字列を返す ("規則;規則;... 値" の行)
+
+        Returns
+        ----------
+        folded : str
+            folded stack 形式の文字列
+        """
+        lines = []
+        # すべての呼び出しを記録した場合の値は、秒からマイクロ秒に変換する
+        scale = 1 if self.sample_interval is not None else 1000000
+        stack = [(node, node[0]) for node in reversed(list(self._root[2].values()))]
+        while stack:
+            node, path = stack.pop()
+            value = int(node[3] * scale)
+            if value > 0:
+                lines.append("{0} {1}".format(path, value))
+            for child in reversed(list(node[2].values())):
+                stack.append((child, path + ";" + child[0]))
+        return "".join(line + "\n" for line in lines)
+
+    def write_chrome_trace(self, filepath:str) -> None:
+        """
+        Chrome Trace Event 形式のファイルを出力する
+
+        Parameters
+        ----------
+        filepath : str
+            出力ファイルパス
+        """
+        with open(filepath, "w", encoding="utf-8", newline="\n") as fout:
+            json.dump(self.get_chrome_trace(), fout)
+
+    def write_folded(self, filepath:str) -> None:
+        """
+        folded stack 形式のファイルを出力する
+
+        Parameters
+        ----------
+        filepath : str
+            出力ファイルパス
+        """
+        with open(filepath, "w", encoding="utf-8", newline="\n") as fout:
+            fout.write(self.get_folded())
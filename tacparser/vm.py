@@ -0,0 +1,713 @@
+from collections.abc import Callable
+
+from .memo import BLOCK_BITS, BYTE_MASK, SplicedNodes, set_failure, result_endpos
+from .reader import Reader, bounded_pattern
+from .node import NonTerminalNode, TerminalNode
+
+
+# -----------------------------------------------------------------
+# 解析関数の構造 (Parser._seq などが作成する解析関数の属性 expr)
+#   (E_SEQ, (f, ...))           連続
+#   (E_SEL, (f, ...), first)    選択 (first : 選択肢ごとの先頭文字の集合 | None のタプル、または None)
+#   (E_RPT, f, min, max)        繰り返し
+#   (E_OPT, f)                  省略可能
+#   (E_AND, f) / (E_NOT, f)     先読み
+#   (E_SKIP, f)                 読み飛ばし
+#   (E_TRM, def_function)       終端ノード化 (マクロ)
+#   (E_LIT, s, nocase)          リテラル
+#   (E_REG, reg)                正規表現
+#   (E_RULE, def_function, typename, rule_id)   規則の呼び出し
+#   (E_EOF,) / (E_COMMIT,)      終端 / 確定 (~)
+# -----------------------------------------------------------------
+E_SEQ, E_SEL, E_RPT, E_OPT, E_AND, E_NOT, E_SKIP, E_TRM, E_LIT, E_REG, E_RULE, E_EOF, E_COMMIT = range(13)
+
+# 命令コード
+#   OP_RLIT, OP_RREG, OP_RCALL, OP_RLRCALL, OP_RSUBCALL はノードを作成しない命令
+#   (読み飛ばし、先読みの中で使用する)
+(OP_LIT, OP_REG, OP_CALL, OP_RET, OP_CHOICE, OP_COMMIT, OP_RPT, OP_RPTNEXT,
+ OP_MARK, OP_BACKCOMMIT, OP_FAILTWICE, OP_DROP, OP_TRMCALL, OP_EOF,
+ OP_COMMITMEMO, OP_FUNC, OP_LRCALL, OP_NMCALL, OP_FIRST,
+ OP_RLIT, OP_RREG, OP_RCALL, OP_RLRCALL, OP_RSUBCALL) = range(24)
+
+# スタックの要素の種類
+#   K_CHOICE : (K_CHOICE, 失敗時の命令位置, 位置, ノード数)
+#   K_MARK   : (K_MARK, None, 位置, ノード数)
+#   K_RPT    : [K_RPT, 終了時の命令位置, 位置, ノード数, 最小回数, 回数]
+#   K_CALL   : (K_CALL, 戻り先の命令位置, 開始位置, ノード数, 規則の番号, タイプ名)
+#   K_TRM    : (K_TRM, 戻り先の命令位置, 開始位置, ノード数)
+#   K_ROOT   : (K_ROOT, None, 開始位置, 0)
+#   K_LR     : (K_LR, 戻り先の命令位置, 開始位置, ノード数, 規則の番号, タイプ名, 規則の命令列の開始位置)
+#   K_NOMEMO : (K_NOMEMO, 戻り先の命令位置, 開始位置, ノード数, 規則の番号, タイプ名)
+#   K_RCALL  : (K_RCALL, 戻り先の命令位置, 開始位置, ノード数, 規則の番号, タイプ名)
+#   K_RLR    : (K_RLR, 戻り先の命令位置, 開始位置, ノード数, 規則の番号, タイプ名, 規則の命令列の開始位置)
+#   K_RSUB   : (K_RSUB, 戻り先の命令位置, 開始位置, ノード数)
+#   K_RCALL, K_RLR, K_RSUB はノードを作成しない規則の呼び出し (メモには終了位置を登録する)
+K_CHOICE, K_MARK, K_RPT, K_CALL, K_TRM, K_ROOT, K_LR, K_NOMEMO, K_RCALL, K_RLR, K_RSUB = range(11)
+
+
+def with_expr(func:Callable, expr:tuple) -> Callable:
+    """
+    解析関数に構造 (expr) を設定して返す
+
+    Parameters
+    ----------
+    func : Callable[[], tuple[bool, tuple["Node"]]]
+        解析関数
+    expr : tuple
+        解析関数の構造
+
+    Returns
+    ----------
+    func : Callable[[], tuple[bool, tuple["Node"]]]
+        構造を設定した解析関数
+    """
+    func.expr = expr
+    return func
+
+
+class ParseVM(object):
+    """
+    構文規則を命令列に変換し、明示的なスタックで実行するクラス
+
+    解析関数の構造 (expr) から命令列を作成し、Python の関数呼び出しを行わずに実行する。
+    規則の呼び出し、選択、繰り返しの状態はすべてスタック (リスト) に保持するため、
+    入力の入れ子の深さは再帰の上限 (sys.getrecursionlimit) の影響を受けない。
+    作成するノード、ノード番号、メモの内容、最大到達位置は解析関数で実行した場合と同じになる。
+    構造を持たない解析関数 (独自に定義した関数、direct バックエンドの規則) は、そのまま呼び出す。
+    読み飛ばし、先読みの中は、規則ごとにノードを作成しない命令列を作成して実行する。
+    """
+
+    def __init__(self, parser) -> None:
+        """
+        初期化
+
+        Parameters
+        ----------
+        parser : Parser
+            構文解析を実行するパーサー
+        """
+        self._parser = parser
+        #: 命令列（すべての規則の命令を連結したもの）
+        self.code = []
+        #: 規則の関数 -> 命令列の開始位置
+        self.entries = {}
+        #: 規則の関数 -> ノードを作成しない命令列の開始位置
+        self.recognize_entries = {}
+
+    def get_entry(self, def_function:Callable, recognize:bool=False) -> int:
+        """
+        規則の関数の命令列の開始位置を返す。
+        未作成の場合は、規則から参照するすべての規則の命令列を作成する。
+
+        Parameters
+        ----------
+        def_function : Callable[[], ParseFunction]
+            規則の関数 (p_xxx, s_xxx, t_xxx)
+        recognize : bool
+            True の場合、ノードを作成しない命令列の開始位置を返す
+
+        Returns
+        ----------
+        entry : int
+            命令列の開始位置
+        """
+        entries = self.recognize_entries if recognize else self.entries
+        entry = entries.get(def_function)
+        if entry is not None:
+            return entry
+
+        pending = [(def_function, recognize)]
+        calls = []  # (命令の位置, 規則の関数, ノードを作成しない場合 True)
+        while pending:
+            f, rec = pending.pop()
+            entries = self.recognize_entries if rec else self.entries
+            if f in entries:
+                continue
+            entries[f] = len(self.code)
+            self._compile(self._parser._get_matcher(f), pending, calls, rec)
+            self.code.append((OP_RET,))
+
+        # 規則の呼び出し先の位置を設定する
+        for index, f, rec in calls:
+            ins = self.code[index]
+            self.code[index] = ins[:-1] + ((self.recognize_entries if rec else self.entries)[f],)
+
+        return (self.recognize_entries if recognize else self.entries)[def_function]
+
+    def _compile(self, func:Callable, pending:list, calls:list, recognize:bool=False) -> None:
+        """
+        解析関数の命令列を作成し、命令列の末尾に追加する
+
+        Parameters
+        ----------
+        func : Callable[[], tuple[bool, tuple["Node"]]]
+            解析関数
+        pending : list[tuple[Callable, bool]]
+            命令列を作成する (規則の関数, ノードを作成しない場合 True) のリスト
+        calls : list[tuple[int, Callable, bool]]
+            呼び出し先の位置を設定する命令のリスト
+        recognize : bool
+            True の場合、ノードを作成しない命令列を作成する (読み飛ばし、先読みの中)
+        """
+        code = self.code
+        expr = getattr(func, "expr", None)
+        if expr is None:
+            code.append((OP_FUNC, self._parser._recognizer(func) if recognize else func))
+            return
+
+        tag = expr[0]
+        if tag == E_LIT:
+            code.append((OP_RLIT if recognize else OP_LIT, expr[1], expr[2], len(expr[1])))
+
+        elif tag == E_REG:
+            # 照合位置より前を参照する正規表現は、照合範囲を切り出して照合する
+            code.append((OP_RREG if recognize else OP_REG, bounded_pattern(expr[1])))
+
+        elif tag == E_RULE:
+            calls.append((len(code), expr[1], recognize))
+            pending.append((expr[1], recognize))
+            # 左再帰の起点の規則は種の成長で、起点から呼び出される規則はメモ化せずに解析する
+            leader = self._parser.left_recursion.get(expr[2])
+            if recognize:
+                op = OP_RCALL if leader is None else OP_RLRCALL if leader else OP_RSUBCALL
+            else:
+                op = OP_CALL if leader is None else OP_LRCALL if leader else OP_NMCALL
+            code.append((op, expr[3], expr[2], None))
+
+        elif tag == E_SEQ:
+            for f in expr[1]:
+                self._compile(f, pending, calls, recognize)
+
+        elif tag == E_SEL:
+            # CHOICE L1, x1, COMMIT end, L1: CHOICE L2, x2, COMMIT end, L2: x3, end:
+            # 先頭文字の集合がある選択肢は、先頭で次の文字を確認する (FIRST chars x)
+            first = expr[2] if len(expr) > 2 and expr[2] is not None else (None,) * len(expr[1])
+            commits = []
+            for f, chars in zip(expr[1][:-1], first):
+                choice = len(code)
+                code.append(None)
+                if chars is not None:
+                    code.append((OP_FIRST, frozenset(chars)))
+                self._compile(f, pending, calls, recognize)
+                commits.append(len(code))
+                code.append(None)
+                code[choice] = (OP_CHOICE, len(code))
+            if expr[1]:
+                if first[-1] is not None:
+                    code.append((OP_FIRST, frozenset(first[-1])))
+                self._compile(expr[1][-1], pending, calls, recognize)
+            else:
+                # 選択肢がない場合は失敗する
+                code.append((OP_MARK,))
+                code.append((OP_FAILTWICE,))
+            for index in commits:
+                code[index] = (OP_COMMIT, len(code))
+
+        elif tag == E_RPT:
+            _, f, min_num, max_num = expr
+            start = len(code)
+            code.append(None)
+            self._compile(f, pending, calls, recognize)
+            code.append((OP_RPTNEXT, start + 1, min_num, max_num))
+            code[start] = (OP_RPT, len(code), min_num, max_num)
+
+        elif tag == E_OPT:
+            choice = len(code)
+            code.append(None)
+            self._compile(expr[1], pending, calls, recognize)
+            code.append((OP_COMMIT, len(code) + 1))
+            code[choice] = (OP_CHOICE, len(code))
+
+        elif tag == E_AND:
+            # 先読み、読み飛ばしの中はノードを作成しない
+            code.append((OP_MARK,))
+            self._compile(expr[1], pending, calls, True)
+            code.append((OP_BACKCOMMIT,))
+
+        elif tag == E_NOT:
+            choice = len(code)
+            code.append(None)
+            self._compile(expr[1], pending, calls, True)
+            code.append((OP_FAILTWICE,))
+            code[choice] = (OP_CHOICE, len(code))
+
+        elif tag == E_SKIP:
+            if recognize:
+                self._compile(expr[1], pending, calls, True)
+            else:
+                code.append((OP_MARK,))
+                self._compile(expr[1], pending, calls, True)
+                code.append((OP_DROP,))
+
+        elif tag == E_TRM:
+            # マクロの本体はノードを作成せず、読み込んだ範囲の文字列を終端ノードにする
+            calls.append((len(code), expr[1], True))
+            pending.append((expr[1], True))
+            code.append((OP_RSUBCALL if recognize else OP_TRMCALL, None))
+
+        elif tag == E_EOF:
+            code.append((OP_EOF,))
+
+        elif tag == E_COMMIT:
+            code.append((OP_COMMITMEMO,))
+
+        else:
+            code.append((OP_FUNC, func))
+
+    def run(self, def_function:Callable) -> tuple[bool, tuple]:
+        """
+        規則の関数を、リーダーの現在位置から実行する。
+        結果は規則の解析関数を実行した場合と同じ形式で返す。
+
+        Parameters
+        ----------
+        def_function : Callable[[], ParseFunction]
+            規則の関数
+
+        Returns
+        ----------
+        result : bool
+            実行結果
+        nodes : tuple[Node]
+            作成したノードのタプル
+        """
+        parser = self._parser
+        pc = self.get_entry(def_function)
+        code = self.code
+
+        reader = parser._reader
+        tables = parser._memo_tables
+        lazy = parser.lazy_linecolumn
+        # Reader の照合処理を変更していない場合は、文字列を直接照合する
+        # (MmapFileReader などは contents を持たないため、Reader の照合処理を使用する)
+        fast = (type(reader).match_literal is Reader.match_literal
+                and type(reader).match_regexp is Reader.match_regexp)
+        contents = reader.contents if fast else None
+        endpos = reader.get_endposition()
+        length = reader.length
+        pos = reader.get_position()
+        maxpos = reader.maxposition
+
+        nodes = []
+        stack = [(K_ROOT, None, pos, 0)]
+
+        while True:
+            ins = code[pc]
+            op = ins[0]
+
+            if op == OP_LIT:
+                if fast:
+                    s = ins[1]
+                    if not ins[2]:
+                        if contents.startswith(s, pos, endpos):
+                            node = TerminalNode(s)
+                            node.set_position(reader, pos, pos + ins[3], lazy)
+                            nodes.append(node)
+                            pos += ins[3]
+                            if pos > maxpos:
+                                maxpos = pos
+                            pc += 1
+                            continue
+                    elif pos + ins[3] <= endpos:
+                        s = contents[pos:pos + ins[3]]
+                        if s.lower() == ins[1].lower():
+                            node = TerminalNode(s)
+                            node.set_position(reader, pos, pos + ins[3], lazy)
+                            nodes.append(node)
+                            pos += ins[3]
+                            if pos > maxpos:
+                                maxpos = pos
+                            pc += 1
+                            continue
+                else:
+                    reader.set_position(pos)
+                    flg, s = reader.match_literal(ins[1], True, nocase=ins[2])
+                    if flg:
+                        node = TerminalNode(s)
+                        node.set_position(reader, pos, reader.get_position(), lazy)
+                        nodes.append(node)
+                        pos = reader.get_position()
+                        maxpos = reader.maxposition
+                        pc += 1
+                        continue
+
+            elif op == OP_REG:
+                if fast:
+                    m = ins[1].match(contents, pos, endpos)
+                    if m:
+                        s = m.group(0)
+                        node = TerminalNode(s)
+                        node.set_position(reader, pos, pos + len(s), lazy)
+                        nodes.append(node)
+                        pos += len(s)
+                        if pos > maxpos:
+                            maxpos = pos
+                        pc += 1
+                        continue
+                else:
+                    reader.set_position(pos)
+                    flg, s = reader.match_regexp(ins[1], True)
+                    if flg:
+                        node = TerminalNode(s)
+                        node.set_position(reader, pos, reader.get_position(), lazy)
+                        nodes.append(node)
+                        pos = reader.get_position()
+                        maxpos = reader.maxposition
+                        pc += 1
+                        continue
+
+            elif op == OP_RLIT:
+                if fast:
+                    if not ins[2]:
+                        if contents.startswith(ins[1], pos, endpos):
+                            pos += ins[3]
+                            if pos > maxpos:
+                                maxpos = pos
+                            pc += 1
+                            continue
+                    elif pos + ins[3] <= endpos and contents[pos:pos + ins[3]].lower() == ins[1].lower():
+                        pos += ins[3]
+                        if pos > maxpos:
+                            maxpos = pos
+                        pc += 1
+                        continue
+                else:
+                    reader.set_position(pos)
+                    if reader.match_literal(ins[1], True, nocase=ins[2])[0]:
+                        pos = reader.get_position()
+                        maxpos = reader.maxposition
+                        pc += 1
+                        continue
+
+            elif op == OP_RREG:
+                if fast:
+                    m = ins[1].match(contents, pos, endpos)
+                    if m:
+                        pos = m.end()
+                        if pos > maxpos:
+                            maxpos = pos
+                        pc += 1
+                        continue
+                else:
+                    reader.set_position(pos)
+                    if reader.match_regexp(ins[1], True)[0]:
+                        pos = reader.get_position()
+                        maxpos = reader.maxposition
+                        pc += 1
+                        continue
+
+            elif op == OP_CALL:
+                # メモの確認 (Parser._create_non_terminal と同じ)
+                successes, failures = tables[ins[1]]
+                memo_nodes = successes.get(pos)
+                if memo_nodes is not None:
+                    if memo_nodes.__class__ is tuple:
+                        nodes.append(memo_nodes[0])
+                        pos = memo_nodes[0].endpos
+                        pc += 1
+                        continue
+                    if memo_nodes.__class__ is SplicedNodes:
+                        nodes.extend(memo_nodes)
+                        pos = memo_nodes.endpos
+                        pc += 1
+                        continue
+                    # ノードを作成せずに登録した終了位置の場合は、規則を再度実行する
+                    parser._discard_recognized(successes, pos)
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is None or not block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    stack.append((K_CALL, pc + 1, pos, len(nodes), ins[1], ins[2]))
+                    pc = ins[3]
+                    continue
+
+            elif op == OP_CHOICE:
+                stack.append((K_CHOICE, ins[1], pos, len(nodes)))
+                pc += 1
+                continue
+
+            elif op == OP_FIRST:
+                # 終了位置では選択肢を実行する
+                if fast:
+                    if pos >= endpos or contents[pos] in ins[1]:
+                        pc += 1
+                        continue
+                else:
+                    reader.set_position(pos)
+                    c = reader.peek_char()
+                    if not c or c in ins[1]:
+                        pc += 1
+                        continue
+
+            elif op == OP_COMMIT:
+                stack.pop()
+                pc = ins[1]
+                continue
+
+            elif op == OP_RPTNEXT:
+                e = stack[-1]
+                if ins[3] < 0 and pos == e[2]:
+                    # 内容なしの繰り返し (無限ループ) : この回の結果を破棄して終了する
+                    stack.pop()
+                    if e[5] >= e[4]:
+                        del nodes[e[3]:]
+                        pc = e[1]
+                        continue
+                else:
+                    e[5] += 1
+                    if 0 <= ins[3] <= e[5]:
+                        stack.pop()
+                        pc = e[1]
+                    else:
+                        e[2] = pos
+                        e[3] = len(nodes)
+                        pc = ins[1]
+                    continue
+
+            elif op == OP_RPT:
+                if ins[3] == 0:
+                    pc = ins[1]
+                else:
+                    stack.append([K_RPT, ins[1], pos, len(nodes), ins[2], 0])
+                    pc += 1
+                continue
+
+            elif op == OP_RET:
+                e = stack.pop()
+                kind = e[0]
+                startpos = e[2]
+                if kind == K_CALL:
+                    if parser._keep is None:
+                        node = NonTerminalNode(e[5], tuple(nodes[e[3]:]))
+                        del nodes[e[3]:]
+                        node.nodenum = parser._nodenum
+                        node.set_position(reader, startpos, pos, lazy)
+                        parser._link_children(node)
+                        parser._nodenum += 1
+                        tables[e[4]][0][startpos] = (node,)
+                        nodes.append(node)
+                    else:
+                        # ノードを作成しない規則は、子ノードをそのまま残す
+                        result = tables[e[4]][0][startpos] = \
+                            parser._create_result(e[5], tuple(nodes[e[3]:]), startpos, pos)
+                        del nodes[e[3]:]
+                        nodes.extend(result)
+                    parser._memo_entries += 1
+                    if parser._memo_entries > parser._memo_limit:
+                        parser._evict_memo(startpos)
+                    pc = e[1]
+                    continue
+
+                if kind == K_TRM:
+                    if pos > startpos:
+                        node = TerminalNode(reader.get_contents(startpos, pos))
+                        node.set_position(reader, startpos, pos, lazy)
+                        nodes.append(node)
+                    pc = e[1]
+                    continue
+
+                if kind == K_LR:
+                    seed = parser._lr_seeds[(e[4], startpos)]
+                    if seed is None or pos > result_endpos(seed):
+                        # 種が成長した場合は、新しい種で規則を再度実行する
+                        parser._lr_seeds[(e[4], startpos)] = \
+                            parser._create_result(e[5], tuple(nodes[e[3]:]), startpos, pos)
+                        del nodes[e[3]:]
+                        pos = startpos
+                        stack.append(e)
+                        pc = e[6]
+                    else:
+                        parser._harvest_seed(e[4], startpos, seed)
+                        del nodes[e[3]:]
+                        nodes.extend(seed)
+                        pos = result_endpos(seed)
+                        pc = e[1]
+                    continue
+
+                if kind == K_NOMEMO:
+                    result = parser._create_result(e[5], tuple(nodes[e[3]:]), startpos, pos)
+                    del nodes[e[3]:]
+                    nodes.extend(result)
+                    pc = e[1]
+                    continue
+
+                if kind == K_RCALL:
+                    parser._recognize_success(tables[e[4]][0], startpos, pos)
+                    pc = e[1]
+                    continue
+
+                if kind == K_RSUB:
+                    pc = e[1]
+                    continue
+
+                if kind == K_RLR:
+                    seed = parser._lr_seeds[(e[4], startpos)]
+                    if seed is None or pos > seed:
+                        parser._lr_seeds[(e[4], startpos)] = pos
+                        pos = startpos
+                        stack.append(e)
+                        pc = e[6]
+                    else:
+                        parser._harvest_seed(e[4], startpos, seed)
+                        pos = seed
+                        pc = e[1]
+                    continue
+
+                # K_ROOT : 解析の終了
+                reader.set_position(pos)
+                reader.maxposition = maxpos
+                return True, tuple(nodes)
+
+            elif op == OP_MARK:
+                stack.append((K_MARK, None, pos, len(nodes)))
+                pc += 1
+                continue
+
+            elif op == OP_BACKCOMMIT:
+                e = stack.pop()
+                pos = e[2]
+                del nodes[e[3]:]
+                pc += 1
+                continue
+
+            elif op == OP_DROP:
+                e = stack.pop()
+                del nodes[e[3]:]
+                pc += 1
+                continue
+
+            elif op == OP_FAILTWICE:
+                stack.pop()
+
+            elif op == OP_TRMCALL:
+                stack.append((K_TRM, pc + 1, pos, len(nodes)))
+                pc = ins[1]
+                continue
+
+            elif op == OP_EOF:
+                if pos >= length:
+                    pc += 1
+                    continue
+
+            elif op == OP_COMMITMEMO:
+                parser._commit_memo(pos)
+                pc += 1
+                continue
+
+            elif op == OP_LRCALL:
+                # 成長中の種、メモの確認 (Parser._create_left_recursive と同じ)
+                key = (ins[1], pos)
+                if key in parser._lr_seeds:
+                    seed = parser._lr_seeds[key]
+                else:
+                    memo_result = parser._memo.get(ins[1], pos)
+                    if memo_result is not None and memo_result[1].__class__ is int:
+                        # ノードを作成せずに登録した終了位置の場合は、種を再度成長させる
+                        parser._discard_recognized(tables[ins[1]][0], pos)
+                        memo_result = None
+                    if memo_result is None:
+                        parser._plant_seed(ins[1], pos)
+                        stack.append((K_LR, pc + 1, pos, len(nodes), ins[1], ins[2], ins[3]))
+                        pc = ins[3]
+                        continue
+                    seed = memo_result[1] if memo_result[0] else None
+                if seed is not None:
+                    nodes.extend(seed)
+                    pos = result_endpos(seed)
+                    pc += 1
+                    continue
+
+            elif op == OP_NMCALL:
+                stack.append((K_NOMEMO, pc + 1, pos, len(nodes), ins[1], ins[2]))
+                pc = ins[3]
+                continue
+
+            elif op == OP_RCALL:
+                # メモの確認 (Parser._recognize_non_terminal と同じ)
+                successes, failures = tables[ins[1]]
+                memo_endpos = successes.get(pos)
+                if memo_endpos is not None:
+                    pos = memo_endpos if memo_endpos.__class__ is int else result_endpos(memo_endpos)
+                    pc += 1
+                    continue
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is None or not block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    stack.append((K_RCALL, pc + 1, pos, len(nodes), ins[1], ins[2]))
+                    pc = ins[3]
+                    continue
+
+            elif op == OP_RSUBCALL:
+                stack.append((K_RSUB, pc + 1, pos, len(nodes)))
+                pc = ins[-1]
+                continue
+
+            elif op == OP_RLRCALL:
+                # 成長中の種、メモの確認 (Parser._recognize_direct_left_recursive と同じ)
+                key = (ins[1], pos)
+                if key in parser._lr_seeds:
+                    seed = parser._lr_seeds[key]
+                else:
+                    memo_result = parser._memo.get(ins[1], pos)
+                    if memo_result is None:
+                        parser._plant_seed(ins[1], pos)
+                        stack.append((K_RLR, pc + 1, pos, len(nodes), ins[1], ins[2], ins[3]))
+                        pc = ins[3]
+                        continue
+                    seed = memo_result[1] if memo_result[0] else None
+                if seed is not None:
+                    pos = result_endpos(seed)
+                    pc += 1
+                    continue
+
+            else:
+                # OP_FUNC : 構造を持たない解析関数を呼び出す
+                reader.set_position(pos)
+                reader.maxposition = maxpos
+                flg, results = ins[1]()
+                pos = reader.get_position()
+                maxpos = reader.maxposition
+                if flg:
+                    nodes.extend(results)
+                    pc += 1
+                    continue
+
+            # 失敗 : スタックを戻し、失敗時の処理が登録された位置から再開する
+            while True:
+                e = stack.pop()
+                kind = e[0]
+                if kind == K_CHOICE:
+                    pos = e[2]
+                    del nodes[e[3]:]
+                    pc = e[1]
+                    break
+                elif kind == K_CALL or kind == K_RCALL:
+                    # 失敗をメモに登録する
+                    set_failure(tables[e[4]][1], e[2])
+                    parser._memo_entries += 1
+                    if parser._memo_entries > parser._memo_limit:
+                        parser._evict_memo(e[2])
+                elif kind == K_RPT:
+                    if e[5] >= e[4]:
+                        pos = e[2]
+                        del nodes[e[3]:]
+                        pc = e[1]
+                        break
+                elif kind == K_LR:
+                    # 種が成長しなかった場合は、それまでの種を結果とする
+                    seed = parser._lr_seeds[(e[4], e[2])]
+                    parser._harvest_seed(e[4], e[2], seed)
+                    if seed is not None:
+                        del nodes[e[3]:]
+                        nodes.extend(seed)
+                        pos = result_endpos(seed)
+                        pc = e[1]
+                        break
+                elif kind == K_RLR:
+                    seed = parser._lr_seeds[(e[4], e[2])]
+                    parser._harvest_seed(e[4], e[2], seed)
+                    if seed is not None:
+                        pos = seed
+                        pc = e[1]
+                        break
+                elif kind == K_ROOT:
+                    reader.set_position(e[2])
+                    reader.maxposition = maxpos
+                    return False, ()
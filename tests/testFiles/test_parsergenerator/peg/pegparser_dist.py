@@ -71,7 +71,8 @@ class PegParser(Parser):
     def p_prefix(self):
         # Prefix    <- (AND / NOT)? Suffix
         return self._seq(self._opt(self._sel(self._p(self.p_and, "AND"),
-                                             self._p(self.p_not, "NOT")
+                                             self._p(self.p_not, "NOT"),
+                                             first=('&', '!')
                                              )),
                          self._p(self.p_suffix, "Suffix")
                          )
@@ -81,7 +82,8 @@ class PegParser(Parser):
         return self._seq(self._p(self.p_primary, "Primary"),
                          self._opt(self._sel(self._p(self.p_question, "QUESTION"),
                                              self._p(self.p_star, "STAR"),
-                                             self._p(self.p_plus, "PLUS")
+                                             self._p(self.p_plus, "PLUS"),
+                                             first=('?', '*', '+')
                                              ))
                          )
 
@@ -98,7 +100,8 @@ class PegParser(Parser):
                                    ),
                          self._p(self.p_literal, "Literal"),
                          self._p(self.p_class, "Class"),
-                         self._p(self.p_dot, "DOT")
+                         self._p(self.p_dot, "DOT"),
+                         first=('ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '(', '"\'', '[', '.')
                          )
 
     def p_identifier(self):
@@ -120,7 +123,8 @@ class PegParser(Parser):
     def p_identcont(self):
         # IdentCont <- IdentStart / r"[0-9]"
         return self._sel(self._p(self.p_identstart, "IdentStart"),
-                         self._r(self._reg_p_identcont0)
+                         self._r(self._reg_p_identcont0),
+                         first=('ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz', '0123456789')
                          )
 
     _reg_p_literal0 = regex.compile("[']", regex.M)
@@ -151,7 +155,8 @@ class PegParser(Parser):
                                                        ), 0),
                                    self._r(self._reg_p_literal5),
                                    self._p(self.p_spacing, "Spacing")
-                                   )
+                                   ),
+                         first=("'", '"')
                          )
 
     def p_class(self):
@@ -197,7 +202,8 @@ class PegParser(Parser):
                                    ),
                          self._seq(self._not(self._l('\\\\')),
                                    self._r(self._reg_p_char3)
-                                   )
+                                   ),
+                         first=('\\', '\\', '\\', None)
                          )
 
     def p_leftarrow(self):
@@ -263,7 +269,8 @@ class PegParser(Parser):
     def p_spacing(self):
         # Spacing <- (Space / Comment)*
         return self._rpt(self._sel(self._p(self.p_space, "Space"),
-                                   self._p(self.p_comment, "Comment")
+                                   self._p(self.p_comment, "Comment"),
+                                   first=(' \\', '#')
                                    ), 0)
 
     _reg_p_comment0 = regex.compile(".", regex.M)
@@ -281,15 +288,15 @@ class PegParser(Parser):
         # Space <- ' ' / '\t' / EndOfLine
         return self._sel(self._l(' '),
                          self._l('\\t'),
-                         self._p(self.p_endofline, "EndOfLine")
+                         self._p(self.p_endofline, "EndOfLine"),
+                         first=(' ', '\\', '\\')
                          )
 
+    _reg_p_endofline0 = regex.compile('\\\\r\\\\n|\\\\n|\\\\r')
+
     def p_endofline(self):
         # EndOfLine <- '\r\n' / '\n' / '\r'
-        return self._sel(self._l('\\r\\n'),
-                         self._l('\\n'),
-                         self._l('\\r')
-                         )
+        return self._r(self._reg_p_endofline0)
 
     _reg_p_endoffile0 = regex.compile(".", regex.M)
 
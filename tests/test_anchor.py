@@ -0,0 +1,54 @@
+import os
+import importlib
+import tempfile
+import unittest
+
+from tests.testmodules import anchor, anchor_direct
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestAnchor(unittest.TestCase):
+    string = "abC cd12 ef-g\nhi"
+
+    def setUp(self):
+        generate()
+
+    def assertHeads(self, flg, node):
+        self.assertTrue(flg)
+        self.assertEqual([n.get_str() for n in node.search_node("Head", True)], ["C", "12", "-g"])
+
+    def test_parse_string(self):
+        # 行の途中の位置でも、照合位置より前の文字列を参照しない
+        vm_parser = anchor.Anchor()
+        vm_parser.use_vm = True
+        for p in (anchor.Anchor(), vm_parser, anchor_direct.AnchorDirect()):
+            flg, node = p.parse_string(self.string, p.p_main, "Main")
+            self.assertHeads(flg, node)
+            self.assertTrue(p.validate_string(self.string, p.p_main)[0])
+
+    def test_mmap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "anchor.txt")
+            with open(filepath, "w", encoding="utf-8", newline="\n") as fout:
+                fout.write(self.string)
+            parser = anchor.Anchor()
+            parser.mmap_threshold = 0
+            self.assertHeads(*parser.parse_file(filepath, "utf-8", "Main"))
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "anchor.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("Anchor", os.path.join(path, "anchor.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("AnchorDirect",
+                                                     os.path.join(path, "anchor_direct.py"), "direct")
+
+    importlib.reload(anchor)
+    importlib.reload(anchor_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
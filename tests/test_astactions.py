@@ -311,6 +311,18 @@ class TestASTActionsString(unittest.TestCase):
         actionfilename = "test_astactions07action.txt"
         self.apply_astactionstest_file(datafilename, actionfilename)
 
+    def test_actions07file_line_index(self):
+        # Parser の LineIndex を共有した場合も同じ結果になる
+        datafilename = "test_astactions07data.txt"
+        actionfilename = "test_astactions07action.txt"
+        self.apply_astactionstest_file(datafilename, actionfilename, True)
+
+    def test_actions07file_lazy_linecolumn(self):
+        # 行番号、列番号を遅延計算した場合も結果は変わらない
+        datafilename = "test_astactions07data.txt"
+        actionfilename = "test_astactions07action.txt"
+        self.apply_astactionstest_file(datafilename, actionfilename, lazy_linecolumn=True)
+
     def test_actions08file(self):
         datafilename = "test_astactions08data.txt"
         actionfilename = "test_astactions08action.txt"
@@ -348,14 +360,22 @@ class TestASTActionsString(unittest.TestCase):
         self.assertTrue(filecmp.cmp(pathoutfile, pathoutfile_dist))
 
 
-    def apply_astactionstest_file(self, sourcefilename, actionfilename):
+    def apply_astactionstest_file(self, sourcefilename, actionfilename, share_line_index=False,
+                                  lazy_linecolumn=False):
         filepath = os.path.join(self.test_dir, "files", sourcefilename)
         actionfilepath = os.path.join(self.test_dir, "files", actionfilename)
         parser = astactionstest.ASTActionsTest(test_logger)
+        parser.lazy_linecolumn = lazy_linecolumn
         result, test_node = parser.parse_file(filepath)
         self.assertTrue(result)
-
-        ast_actions = AstActions(logger=test_logger)
+        if lazy_linecolumn:
+            # 参照されるまで行番号、列番号は計算されない
+            self.assertNotIn("_linenum", vars(test_node))
+
+        if share_line_index:
+            ast_actions = AstActions(logger=test_logger, line_index=parser.get_line_index())
+        else:
+            ast_actions = AstActions(logger=test_logger)
         ast_actions.read_file(actionfilepath)
         ast_actions.apply(test_node)
 
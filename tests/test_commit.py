@@ -0,0 +1,59 @@
+import os
+import importlib
+import unittest
+
+from tests.testmodules import commit, commit_direct
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestCommit(unittest.TestCase):
+    def setUp(self):
+        generate()
+        self.statements = 500
+        self.string = "".join(["a = {0};\nf({0});\ng();\n".format(i) for i in range(self.statements)])
+
+    def test_commit(self):
+        parser = commit.Commit()
+        flg, node = parser.parse_string(self.string, parser.p_program, "Program")
+        self.assertTrue(flg)
+        self.assertEqual(len(node.search_node("Statement")), self.statements * 3)
+
+        # 文ごとにメモを破棄するため、メモの件数は入力の大きさに比例しない
+        stats = parser.get_parse_stats()
+        self.assertEqual(stats["commits"], self.statements * 3)
+        self.assertGreater(stats["memo_evictions"], 0)
+        self.assertLess(stats["memo_peak_entries"], 100)
+
+    def test_commit_direct(self):
+        parser = commit.Commit()
+        _, node = parser.parse_string(self.string, parser.p_program, "Program")
+        direct_parser = commit_direct.CommitDirect()
+        flg, d_node = direct_parser.parse_string(self.string, direct_parser.p_program, "Program")
+
+        self.assertTrue(flg)
+        self.assertEqual(node.print_tree(detail_flg=True), d_node.print_tree(detail_flg=True))
+        self.assertEqual(parser.get_parse_stats(), direct_parser.get_parse_stats())
+
+    def test_commit_backtrack(self):
+        # 確定した後の文で失敗した場合は、解析失敗になる
+        parser = commit.Commit()
+        flg, node = parser.parse_string("a = 1;\nb(;\n", parser.p_program, "Program")
+        self.assertFalse(flg)
+        self.assertTrue(node.is_failure())
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "commit.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("Commit", os.path.join(path, "commit.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("CommitDirect", os.path.join(path, "commit_direct.py"), "direct")
+
+    importlib.reload(commit)
+    importlib.reload(commit_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
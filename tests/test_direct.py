@@ -0,0 +1,110 @@
+import filecmp
+import os
+import importlib
+import unittest
+
+from tests.testmodules import loop, macro01, subdef01
+from tests.testmodules import expeg_direct, loop_direct, macro01_direct, subdef01_direct
+
+from tacparser import EventCollector
+from tacparser.expegparser import ExPegParser
+from tacparser.reader import FileReader
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestDirectBackend(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def setUp(self):
+        generate()
+
+    def assertSameParse(self, parser, direct_parser, filepath, root):
+        # combinator と direct で同じ構文木が作成されること
+        flg, node = parser.parse_file(filepath, "utf-8", root)
+        d_flg, d_node = direct_parser.parse_file(filepath, "utf-8", root)
+
+        self.assertEqual(flg, d_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), d_node.print_tree(detail_flg=True))
+        self.assertEqual(parser._reader.maxposition, direct_parser._reader.maxposition)
+        return d_node
+
+    def test_expeg(self):
+        curdir = os.path.join(self.test_path, "test_expegparser")
+        filepath = os.path.join(curdir, "expeg_test.in")
+        node = self.assertSameParse(ExPegParser(), expeg_direct.ExPegDirect(), filepath, "ExPeg")
+
+        pathoutfile = os.path.join(curdir, "expeg_direct_src.out")
+        pathoutfile_dist = os.path.join(curdir, "expeg_test_dist.out")
+
+        with open(pathoutfile, "w", encoding="utf-8", newline="\n") as fout:
+            fout.write(node.print_tree())
+
+        self.assertTrue(filecmp.cmp(pathoutfile, pathoutfile_dist))
+
+    def test_expeg_failure(self):
+        # 解析失敗時の最大到達位置も同じになること
+        string = u"r'aaaa:I "
+        parser = ExPegParser()
+        direct_parser = expeg_direct.ExPegDirect()
+        flg, node = parser.parse_string(string, parser.p_regularexp, "RegularExp")
+        d_flg, d_node = direct_parser.parse_string(string, direct_parser.p_regularexp, "RegularExp")
+
+        self.assertFalse(d_flg)
+        self.assertTrue(d_node.is_failure())
+        self.assertEqual((flg, node.get_str()), (d_flg, d_node.get_str()))
+
+    def test_macro01(self):
+        filepath = os.path.join(self.test_path, "test_macro", "test01.txt")
+        self.assertSameParse(macro01.Macro01(), macro01_direct.Macro01Direct(), filepath, "Main")
+
+    def test_loop(self):
+        filepath = os.path.join(self.test_path, "test_loop", "test01.txt")
+        self.assertSameParse(loop.Loop(), loop_direct.LoopDirect(), filepath, "Loop")
+
+    def test_subdef01(self):
+        filepath = os.path.join(self.test_path, "test_reuse_def", "subdef01", "test01.txt")
+        self.assertSameParse(subdef01.SubDef01(), subdef01_direct.SubDef01Direct(), filepath, "Main")
+
+    def test_mmap_threshold(self):
+        # direct バックエンドのパーサーは mmap_threshold を設定しても FileReader で解析すること
+        filepath = os.path.join(self.test_path, "test_loop", "test01.txt")
+        direct_parser = loop_direct.LoopDirect()
+        direct_parser.mmap_threshold = 0
+        self.assertSameParse(loop.Loop(), direct_parser, filepath, "Loop")
+        self.assertIs(direct_parser._reader.__class__, FileReader)
+
+        self.assertTrue(direct_parser.validate_file(filepath, "utf-8", "Loop")[0])
+        self.assertIs(direct_parser._reader.__class__, FileReader)
+
+        self.assertTrue(direct_parser.stream_file(filepath, EventCollector(), "utf-8", "Loop")[0])
+        self.assertIs(direct_parser._reader.__class__, FileReader)
+
+    def test_unknown_backend(self):
+        path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testmodules"))
+        generator = ParserGenerator(os.path.join(path, "loop.peg"), "utf-8")
+        with self.assertRaises(ValueError):
+            generator.generate_file("Loop", "dummy.py", "unknown")
+
+
+def generate():
+    root = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+    path = os.path.join(root, "tests", "testmodules")
+
+    targets = [
+        (os.path.join(root, "expegfiles", "expeg.peg"), "ExPegDirect", "expeg_direct.py"),
+        (os.path.join(path, "macro01.peg"), "Macro01Direct", "macro01_direct.py"),
+        (os.path.join(path, "loop.peg"), "LoopDirect", "loop_direct.py"),
+        (os.path.join(path, "subdef01.peg"), "SubDef01Direct", "subdef01_direct.py"),
+    ]
+    for filepath, parsername, filename in targets:
+        outfilepath = os.path.join(path, filename)
+        ParserGenerator(filepath, "utf-8").generate_file(parsername, outfilepath, "direct")
+
+    importlib.reload(expeg_direct)
+    importlib.reload(macro01_direct)
+    importlib.reload(loop_direct)
+    importlib.reload(subdef01_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -107,6 +107,30 @@ class TestExPegParser(unittest.TestCase):
 
         self.assertTrue(filecmp.cmp(pathoutfile, pathoutfile_dist))
 
+    def test_reuse_matchers(self):
+        # 規則の解析関数は一度だけ作成し、再度の解析でも再利用する
+        filepath = os.path.join(self.path, "expeg_test.in")
+
+        _, result = self.parser.parse_file(filepath, "utf-8")
+        matchers = dict(self.parser._matchers)
+        self.assertIn(self.parser.p_expeg, matchers)
+
+        _, result2 = self.parser.parse_file(filepath, "utf-8")
+        self.assertEqual(self.parser._matchers, matchers)
+        for def_function, func in matchers.items():
+            self.assertIs(self.parser._matchers[def_function], func)
+        self.assertEqual(result2.print_tree(), result.print_tree())
+
+    def test_long_repetition(self):
+        # 繰り返しの結果は、回数が多い場合もタプルで子ノードに設定する
+        count = 2000
+        string = "A <- B\n" * count
+        flg, node = self.parser.parse_string(string, self.parser.p_expeg, "ExPeg")
+        self.assertTrue(flg)
+        self.assertIsInstance(node.children, tuple)
+        self.assertEqual(len(node.children), count + 1)
+        self.assertEqual(node.children[-1].type, "_EOF")
+
     def test_print_tree(self):
         curdir = self.path
         filepath = os.path.join(curdir, "expeg_test.in")
@@ -0,0 +1,96 @@
+import os
+import importlib
+import importlib.util
+import tempfile
+import unittest
+
+from tests.testmodules import first, first_direct
+
+from tacparser.expegparser import ExPegParser
+from tacparser.parsergenerator import ParserGenerator, FirstCharAnalyzer
+
+
+class TestFirstDispatch(unittest.TestCase):
+    pegfilepath = os.path.normpath(os.path.join(os.path.dirname(__file__), "testmodules", "first.peg"))
+
+    def setUp(self):
+        generate()
+        # 絞り込みを行わないパーサー
+        self.tmpdir = tempfile.TemporaryDirectory()
+        outfilepath = os.path.join(self.tmpdir.name, "first_plain.py")
+        generator = ParserGenerator(self.pegfilepath, "utf-8")
+        generator.first_dispatch = False
+        generator.generate_file("First", outfilepath)
+        spec = importlib.util.spec_from_file_location("first_plain", outfilepath)
+        self.first_plain = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.first_plain)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def get_selection(self, tree, name):
+        for definition in tree.search_node("Definition"):
+            if definition.get_childnode("DefinitionIdentifier")[0].get_str({"Spacing": ""}) == name:
+                return definition.search_node("Selection")[0]
+        return None
+
+    def test_first_chars(self):
+        _, tree = ExPegParser().parse_file(self.pegfilepath, "utf-8")
+        analyzer = FirstCharAnalyzer(tree)
+
+        keyword, number, name, string, op, empty = analyzer.get_first_chars(self.get_selection(tree, "Item"))
+        # 大文字小文字を区別しない照合では、一致しうる ASCII 以外の文字を含む
+        self.assertEqual(keyword, "EIKeikİıK")
+        self.assertEqual(number, "0123456789")
+        self.assertTrue(set(keyword) < set(name))
+        self.assertIn("_", name)
+        self.assertIn("ſ", name)
+        self.assertEqual(string, "\"'")
+        self.assertEqual(op, "()*+-/=")
+        # 文字列を読み込まずに成功しうる選択肢は限定しない
+        self.assertIsNone(empty)
+        self.assertEqual(analyzer.get_first_chars(self.get_selection(tree, "Empty")), [";", None])
+        self.assertEqual(analyzer.get_first(self.get_selection(tree, "Empty")), (frozenset(";"), True))
+
+        # 選択 (|) を含む正規表現は限定しない
+        spacing = tree.search_node("RegularExp")[-1]
+        self.assertEqual(analyzer.get_first(spacing), (None, True))
+
+    def assertSameParse(self, string):
+        # 絞り込みの有無、バックエンドによらず、同じ結果になること
+        plain = self.first_plain.First()
+        flg, node = plain.parse_string(string, plain.p_main, "Main")
+
+        parser = first.First()
+        vm_parser = first.First()
+        vm_parser.use_vm = True
+        direct_parser = first_direct.FirstDirect()
+        for p in (parser, vm_parser, direct_parser):
+            p_flg, p_node = p.parse_string(string, p.p_main, "Main")
+            self.assertEqual(flg, p_flg)
+            self.assertEqual(node.print_tree(detail_flg=True), p_node.print_tree(detail_flg=True))
+            self.assertEqual(plain._reader.maxposition, p._reader.maxposition)
+        self.assertEqual(parser.get_parse_stats(), vm_parser.get_parse_stats())
+        return flg
+
+    def test_same_parse(self):
+        self.assertTrue(self.assertSameParse("if x == 1.5 ; ELSE y = 'a' + \"b\"\n(Kelvin) ifx"))
+        # K (U+212A) は "kelvin":I、r"[a-z]":I に一致する
+        self.assertTrue(self.assertSameParse("Kelvin ſx Ky"))
+        self.assertTrue(self.assertSameParse(""))
+        self.assertFalse(self.assertSameParse("x = 1 @ 2"))
+        self.assertFalse(self.assertSameParse("x = 'abc"))
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__), "testmodules"))
+    pegfilepath = os.path.join(path, "first.peg")
+    ParserGenerator(pegfilepath, "utf-8").generate_file("First", os.path.join(path, "first.py"))
+    ParserGenerator(pegfilepath, "utf-8").generate_file("FirstDirect", os.path.join(path, "first_direct.py"), "direct")
+
+    importlib.reload(first)
+    importlib.reload(first_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
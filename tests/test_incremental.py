@@ -0,0 +1,188 @@
+import os
+import importlib
+import random
+import unittest
+
+from tests.testmodules import commit, expeg_direct, leftrecursion, reach, reach_direct, subdef02
+
+from tacparser.exception import ParseException
+from tacparser.expegparser import ExPegParser
+from tacparser.incremental import scans_past_newline
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestIncremental(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def setUp(self):
+        generate()
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        with open(filepath, encoding="utf-8") as fin:
+            self.string = fin.read()
+
+    def assertReparse(self, parser, rootexp, typename, string, edits):
+        # 差分の再解析と、編集後の文字列全体の解析で同じ構文木になること
+        parser.incremental = True
+        parser.parse_string(string, rootexp, typename)
+        for offset, deleted, inserted in edits:
+            string = string[:offset] + inserted + string[offset + deleted:]
+        before = parser._nodenum
+        flg, node = parser.reparse(edits)
+        reparsed = parser._nodenum - before
+
+        full_parser = type(parser)()
+        full_flg, full_node = full_parser.parse_string(string, getattr(full_parser, rootexp.__name__), typename)
+        self.assertEqual(flg, full_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), full_node.print_tree(detail_flg=True))
+        # 失敗時は、最大到達位置のメッセージも同じになること
+        self.assertEqual(node.get_str(), full_node.get_str())
+        if flg:
+            self.assertEqual(node.get_str(), string)
+            for n in node.search_node("Identifier", True):
+                self.assertIs(n.parent.children[n.parent.children.index(n)], n)
+        return node, reparsed, full_parser.get_parse_stats()["nodes"]
+
+    def test_edit(self):
+        offset = self.string.index("Definition")
+        edits = [(offset, len("Definition"), "Def")]
+        parser = ExPegParser()
+        node, reparsed, nodes = self.assertReparse(parser, parser.p_expeg, "ExPeg", self.string, edits)
+        # 編集の範囲を参照した規則のみ再度実行する
+        self.assertLess(reparsed, nodes // 10)
+
+    def test_insert_delete(self):
+        parser = ExPegParser()
+        string = self.string
+        edits = [(0, 0, "Head <- Body\n"),
+                 (len(string) // 2, 0, "\n"),
+                 (len(string), 0, "Tail <- 'tail'\n")]
+        self.assertReparse(parser, parser.p_expeg, "ExPeg", string, edits)
+
+        definition = string.index("\n", len(string) // 3) + 1
+        end = string.index("\n", definition) + 1
+        parser = ExPegParser()
+        self.assertReparse(parser, parser.p_expeg, "ExPeg", string, [(definition, end - definition, "")])
+
+    def test_random_edits(self):
+        # 複数の編集、改行を増減する同じ長さの置換を、繰り返し再解析しても全体の解析と同じ結果になること
+        rand = random.Random(20251018)
+        base = 'A <- "x" B?\nB <- "y" / C\nC <- r"[a-z]+" A*\n\nD <- ( A / B ) ~ C\n'
+        pieces = ["\n", " ", "A", "B <- ", '"z"', " / ", "<-", "x", "#c\n"]
+        for _ in range(40):
+            parser = ExPegParser()
+            parser.incremental = True
+            string = base
+            parser.parse_string(string, parser.p_expeg, "ExPeg")
+            for _ in range(3):
+                edits = []
+                for _ in range(rand.randint(2, 4)):
+                    offset = rand.randint(0, len(string))
+                    deleted = rand.randint(0, min(4, len(string) - offset))
+                    if deleted > 0 and rand.random() < 0.4:
+                        # 同じ長さで、改行を増減する置換
+                        removed = string[offset:offset + deleted]
+                        inserted = removed.replace("\n", " ") if "\n" in removed else "\n" + removed[1:]
+                    else:
+                        inserted = rand.choice(pieces) if rand.random() < 0.7 else ""
+                    string = string[:offset] + inserted + string[offset + deleted:]
+                    edits.append((offset, deleted, inserted))
+
+                flg, node = parser.reparse(edits)
+                full_parser = ExPegParser()
+                full_flg, full_node = full_parser.parse_string(string, full_parser.p_expeg, "ExPeg")
+                message = "edits={0!r}".format(edits)
+                self.assertEqual(flg, full_flg, message)
+                self.assertEqual(node.print_tree(detail_flg=True), full_node.print_tree(detail_flg=True), message)
+                self.assertEqual(node.get_str(), full_node.get_str(), message)
+
+    def test_repeated_reparse(self):
+        parser = ExPegParser()
+        parser.incremental = True
+        string = self.string
+        parser.parse_string(string, parser.p_expeg, "ExPeg")
+        for i in range(5):
+            offset = string.index("\n", len(string) * i // 5) + 1
+            inserted = "Added{0} <- 'x' Added{0}?\n".format(i)
+            string = string[:offset] + inserted + string[offset:]
+            flg, node = parser.reparse([(offset, 0, inserted)])
+            self.assertTrue(flg)
+
+        full_parser = ExPegParser()
+        _, full_node = full_parser.parse_string(string, full_parser.p_expeg, "ExPeg")
+        self.assertEqual(node.print_tree(detail_flg=True), full_node.print_tree(detail_flg=True))
+
+    def test_failure(self):
+        parser = ExPegParser()
+        offset = self.string.index("<-")
+        self.assertReparse(parser, parser.p_expeg, "ExPeg", self.string, [(offset, 2, "<")])
+
+    def test_direct(self):
+        parser = expeg_direct.ExPegDirect()
+        offset = self.string.index("Definition")
+        self.assertReparse(parser, parser.p_expeg, "ExPeg", self.string, [(offset, 0, "X")])
+
+    def test_memo_hit(self):
+        # Y は X で失敗した A のメモを使用する。A の参照範囲は Y の参照範囲にも含まれること
+        # (direct バックエンドは、編集後の文字列全体を解析する)
+        string = "a\nb\nc\nX?"
+        for parser in (reach.Reach(), reach_direct.ReachDirect()):
+            node, _, _ = self.assertReparse(parser, parser.p_s, "S", string, [(6, 1, "d")])
+            self.assertEqual(node.children[0].type, "Y")
+
+    def test_left_recursion(self):
+        parser = leftrecursion.LeftRecursion()
+        string = "+".join(str(i) for i in range(100))
+        edits = [(string.index("+50+"), 1, "*"), (0, 1, "(1-2)")]
+        self.assertReparse(parser, parser.p_program, "Program", string, edits)
+
+    def test_commit(self):
+        parser = commit.Commit()
+        string = "".join(["a = {0};\nf({0});\n".format(i) for i in range(50)])
+        offset = string.index("f(25)")
+        self.assertReparse(parser, parser.p_program, "Program", string, [(offset, 1, "g")])
+
+    def test_subdef(self):
+        # 多重解析を持つパーサーは全体を解析する
+        parser = subdef02.SubDef02()
+        string = 'abc "def" # ghi\njkl\n'
+        self.assertReparse(parser, parser.p_subdef02, "Subdef02", string, [(0, 3, "xyz")])
+
+    def test_multiline_regexp(self):
+        # 閉じていない引用符から改行をまたいで失敗した正規表現のメモは、後ろの行の編集で再度解析する
+        string = 'ab "cd\nef\ngh\n'
+        for parser in (reach.Reach(), reach_direct.ReachDirect()):
+            node, _, _ = self.assertReparse(parser, parser.p_main, "Main", string, [(len(string), 0, '"')])
+            self.assertEqual(node.search_node("Str")[0].get_str(), '"cd\nef\ngh\n"')
+
+    def test_scans_past_newline(self):
+        self.assertTrue(scans_past_newline(r'"[^"]*"'))
+        self.assertTrue(scans_past_newline(r"a\s+b"))
+        self.assertTrue(scans_past_newline(r"(?s).*x"))
+        self.assertFalse(scans_past_newline(r".*x"))
+        self.assertFalse(scans_past_newline(r"\s+"))
+        self.assertFalse(scans_past_newline(r"\r\n|\n|\r"))
+        self.assertFalse(scans_past_newline(r"[^\r\n]*x"))
+        self.assertFalse(scans_past_newline(r"(\\.|[^'\\])*"))
+
+    def test_not_incremental(self):
+        parser = ExPegParser()
+        parser.parse_string(self.string, parser.p_expeg, "ExPeg")
+        with self.assertRaises(ParseException):
+            parser.reparse([(0, 0, "A")])
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "reach.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("Reach", os.path.join(path, "reach.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("ReachDirect",
+                                                     os.path.join(path, "reach_direct.py"), "direct")
+
+    importlib.reload(reach)
+    importlib.reload(reach_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
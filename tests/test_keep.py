@@ -0,0 +1,105 @@
+import os
+import unittest
+
+from tests.testmodules import expeg_direct, leftrecursion, leftrecursion_direct, subdef01
+
+from tacparser import NonTerminalNode
+from tacparser.expegparser import ExPegParser
+
+
+def spliced_tree(node, keep, root=True):
+    # 構文解析木から keep に含まれない非終端ノードを取り除き、子を親に連結した構造を返す
+    if not isinstance(node, NonTerminalNode):
+        return [(node.get_str(), node.startpos, node.endpos)]
+    children = []
+    for cn in node.children:
+        children.extend(spliced_tree(cn, keep, False))
+    if root or node.type in keep:
+        return [(node.type, node.startpos, node.endpos, children)]
+    return children
+
+
+def check_links(tree):
+    # 親ノード、隣接ノードが設定されていること
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        children = node.children
+        for i, cn in enumerate(children):
+            assert cn.parent is node
+            assert cn.left_neighbor is (children[i - 1] if i > 0 else None)
+            assert cn.right_neighbor is (children[i + 1] if i + 1 < len(children) else None)
+            if isinstance(cn, NonTerminalNode):
+                stack.append(cn)
+
+
+class TestKeep(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def assertSpliced(self, parser_class, string, rootexp, typename, keep, use_vm=False):
+        parser = parser_class()
+        flg, tree = parser.parse_string(string, rootexp(parser), typename)
+        self.assertTrue(flg)
+        nodes = parser.get_parse_stats()["nodes"]
+
+        parser = parser_class()
+        parser.use_vm = use_vm
+        k_flg, k_tree = parser.parse_string(string, rootexp(parser), typename, keep=keep)
+        self.assertTrue(k_flg)
+        self.assertEqual(spliced_tree(k_tree, keep), spliced_tree(tree, keep))
+        check_links(k_tree)
+        self.assertLess(parser.get_parse_stats()["nodes"], nodes)
+        return parser
+
+    def test_expeg(self):
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        with open(filepath, encoding="utf-8") as fin:
+            string = fin.read()
+        keep = {"Definition", "Identifier", "Literal"}
+        for cls, use_vm in ((ExPegParser, False), (ExPegParser, True), (expeg_direct.ExPegDirect, False)):
+            self.assertSpliced(cls, string, lambda p: p.p_expeg, "ExPeg", keep, use_vm)
+
+    def test_left_recursion(self):
+        strings = ["1-2-3", "a.b[1+2]*3", "(1+a[2])/b.c"]
+        for cls in (leftrecursion.LeftRecursion, leftrecursion_direct.LeftRecursionDirect):
+            for keep in ({"Expr"}, {"Term", "Primary"}, set()):
+                for string in strings:
+                    self.assertSpliced(cls, string, lambda p: p.p_program, "Program", keep)
+        for keep in ({"Expr"}, {"Term", "Primary"}):
+            self.assertSpliced(leftrecursion.LeftRecursion, strings[1], lambda p: p.p_program, "Program",
+                               keep, True)
+
+    def test_sub_parse(self):
+        # サブ構文のタイプ名は常にノードを作成し、再解析する
+        filepath = os.path.join(self.test_path, "test_reuse_def", "subdef01", "test01.txt")
+        parser = subdef01.SubDef01()
+        flg, tree = parser.parse_file(filepath, "utf-8", "Main")
+        self.assertTrue(flg)
+        k_flg, k_tree = parser.parse_file(filepath, "utf-8", "Main", keep=set())
+        self.assertTrue(k_flg)
+        keep = set(parser.def_subtypename)
+        self.assertEqual(spliced_tree(k_tree, keep), spliced_tree(tree, keep))
+
+    def test_reparse(self):
+        string = "a.b[1+2]*3"
+        parser = leftrecursion.LeftRecursion()
+        parser.incremental = True
+        parser.parse_string("x+" + string, parser.p_program, "Program", keep={"Term"})
+        flg, tree = parser.reparse([(0, 2, "")])
+        self.assertTrue(flg)
+
+        expected = leftrecursion.LeftRecursion()
+        e_flg, e_tree = expected.parse_string(string, expected.p_program, "Program")
+        self.assertEqual(spliced_tree(tree, {"Term"}), spliced_tree(e_tree, {"Term"}))
+
+    def test_profile(self):
+        parser = leftrecursion.LeftRecursion()
+        flg, tree, profile = parser.parse_string("1-2-3", parser.p_program, "Program", profile=True,
+                                                 keep={"Term"})
+        self.assertTrue(flg)
+        self.assertEqual([cn.type for cn in tree.children if isinstance(cn, NonTerminalNode)],
+                         ["Term", "Term", "Term"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import importlib
+import unittest
+
+from tests.testmodules import leftrecursion, leftrecursion_direct
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestLeftRecursion(unittest.TestCase):
+    def setUp(self):
+        generate()
+
+    def parse(self, parser, string):
+        flg, node = parser.parse_string(string, parser.p_program, "Program")
+        self.assertTrue(flg)
+        return node
+
+    def test_left_associative(self):
+        # 左再帰の規則は左結合の構文木になる
+        parser = leftrecursion.LeftRecursion()
+        node = self.parse(parser, "1-2-3")
+
+        expr = node.children[0]
+        self.assertEqual(expr.type, "Expr")
+        self.assertEqual(expr.get_str(), "1-2-3")
+        self.assertEqual(expr.children[0].type, "Expr")
+        self.assertEqual(expr.children[0].get_str(), "1-2")
+        self.assertEqual(expr.children[2].get_str(), "3")
+        self.assertEqual(expr.children[0].children[0].get_str(), "1")
+
+    def test_indirect(self):
+        # Primary と Postfix の間接左再帰
+        parser = leftrecursion.LeftRecursion()
+        node = self.parse(parser, "a.b[1+2]*3")
+
+        postfixes = node.search_node("Postfix", True)
+        self.assertEqual([n.get_str() for n in postfixes], ["a.b[1+2]", "a.b"])
+        term = node.search_node("Term")[0]
+        self.assertEqual(term.get_str(), "a.b[1+2]*3")
+        self.assertEqual(term.children[0].get_str(), "a.b[1+2]")
+
+    def test_failure(self):
+        parser = leftrecursion.LeftRecursion()
+        flg, node = parser.parse_string("1+*2", parser.p_program, "Program")
+        self.assertFalse(flg)
+        self.assertTrue(node.is_failure())
+        self.assertEqual(parser._reader.maxposition, 2)
+
+    def test_backends(self):
+        # combinator、ParseVM、direct で同じ構文木、統計情報になること
+        string = "(a.b[1+2]*3-x/y)[0].z-4*5*6+(7)"
+        parser = leftrecursion.LeftRecursion()
+        node = self.parse(parser, string)
+        vm_parser = leftrecursion.LeftRecursion()
+        vm_parser.use_vm = True
+        direct_parser = leftrecursion_direct.LeftRecursionDirect()
+
+        for other in [vm_parser, direct_parser]:
+            other_node = self.parse(other, string)
+            self.assertEqual(node.print_tree(detail_flg=True), other_node.print_tree(detail_flg=True))
+            self.assertEqual(parser._reader.maxposition, other._reader.maxposition)
+            self.assertEqual(parser.get_parse_stats(), other.get_parse_stats())
+
+    def test_long_chain(self):
+        # 繰り返しの長さに対して再帰が深くならないこと
+        count = 2000
+        string = "+".join(str(i) for i in range(count))
+        vm_parser = leftrecursion.LeftRecursion()
+        vm_parser.use_vm = True
+        parsers = [leftrecursion.LeftRecursion(), vm_parser, leftrecursion_direct.LeftRecursionDirect()]
+        for parser in parsers:
+            node = self.parse(parser, string)
+            self.assertEqual(len(node.search_node("Expr", True)), count)
+            self.assertEqual(node.children[0].get_str(), string)
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "leftrecursion.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("LeftRecursion",
+                                                     os.path.join(path, "leftrecursion.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("LeftRecursionDirect",
+                                                     os.path.join(path, "leftrecursion_direct.py"), "direct")
+
+    importlib.reload(leftrecursion)
+    importlib.reload(leftrecursion_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import importlib
+import unittest
+
+from tests.testmodules import links, links_direct, subdef01
+
+from tacparser import NonTerminalNode
+from tacparser.expegparser import ExPegParser
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestLinks(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+    strings = ["f(a b) .", "f(a) ; g(b + c) .", "a + b!", "f ( x + y z ) . a+b!"]
+
+    def setUp(self):
+        generate()
+
+    def assertLinks(self, tree):
+        # 構文木を走査して求めた親ノード、隣接ノードと一致すること
+        self.assertIsNone(tree.parent)
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            children = node.children
+            for i, cn in enumerate(children):
+                self.assertIs(cn.parent, node)
+                self.assertIs(cn.left_neighbor, children[i - 1] if i > 0 else None)
+                self.assertIs(cn.right_neighbor, children[i + 1] if i + 1 < len(children) else None)
+                if isinstance(cn, NonTerminalNode):
+                    stack.append(cn)
+
+    def parsers(self):
+        vm_parser = links.Links()
+        vm_parser.use_vm = True
+        return [links.Links(), vm_parser, links_direct.LinksDirect()]
+
+    def test_reused_node(self):
+        # 解析に失敗した選択肢の Other の子になった Call も、構文木の Wrap を親ノードにする
+        for parser in self.parsers():
+            flg, tree = parser.parse_string(self.strings[0], parser.p_program, "Program")
+            self.assertTrue(flg)
+            self.assertLinks(tree)
+            call = tree.search_node("Call", True)[0]
+            self.assertEqual(call.parent.type, "Wrap")
+            self.assertIsNone(call.right_neighbor)
+
+    def test_same_tree(self):
+        for string in self.strings:
+            for parser in self.parsers():
+                flg, tree = parser.parse_string(string, parser.p_program, "Program")
+                self.assertTrue(flg)
+                self.assertLinks(tree)
+
+    def test_keep(self):
+        for keep in ({"Call", "Expr"}, {"Wrap", "Name"}, set()):
+            for string in self.strings:
+                for parser in self.parsers():
+                    flg, tree = parser.parse_string(string, parser.p_program, "Program", keep=keep)
+                    self.assertTrue(flg)
+                    self.assertLinks(tree)
+
+    def test_memo_limit(self):
+        string = " ".join(self.strings) * 5
+        for parser in self.parsers():
+            parser.max_memo_entries = 8
+            flg, tree = parser.parse_string(string, parser.p_program, "Program")
+            self.assertTrue(flg)
+            self.assertLinks(tree)
+
+    def test_expeg(self):
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        parser = ExPegParser()
+        flg, tree = parser.parse_file(filepath, "utf-8", "ExPeg")
+        self.assertTrue(flg)
+        self.assertLinks(tree)
+
+    def test_sub_parse(self):
+        # サブ構文の解析結果で入れ替えたノードも、親ノード、隣接ノードを設定する
+        filepath = os.path.join(self.test_path, "test_reuse_def", "subdef01", "test01.txt")
+        parser = subdef01.SubDef01()
+        flg, tree = parser.parse_file(filepath, "utf-8", "Main")
+        self.assertTrue(flg)
+        self.assertLinks(tree)
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "links.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("Links", os.path.join(path, "links.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("LinksDirect",
+                                                     os.path.join(path, "links_direct.py"), "direct")
+
+    importlib.reload(links)
+    importlib.reload(links_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import importlib
+import unittest
+
+from tests.testmodules import literalchoice, literalchoice_direct
+
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestLiteralChoice(unittest.TestCase):
+
+    def setUp(self):
+        generate()
+
+    def get_reference(self, parser, literals):
+        # リテラルを順に照合する選択
+        return lambda: parser._sel(*[parser._l(s, nocase=nocase) for s, nocase in literals])
+
+    def assertSameChoice(self, typename, literals, strings):
+        # 正規表現での照合と、リテラルを順に照合する選択で同じ結果になること
+        vm_parser = literalchoice.LiteralChoice()
+        vm_parser.use_vm = True
+        parsers = [literalchoice.LiteralChoice(), vm_parser, literalchoice_direct.LiteralChoiceDirect()]
+        for string in strings:
+            ref_parser = literalchoice.LiteralChoice()
+            flg, node = ref_parser.parse_string(string, self.get_reference(ref_parser, literals), typename)
+            for parser in parsers:
+                p_flg, p_node = parser.parse_string(string, getattr(parser, "p_" + typename.lower()), typename)
+                self.assertEqual(flg, p_flg, string)
+                self.assertEqual(node.print_tree(detail_flg=True), p_node.print_tree(detail_flg=True))
+                self.assertEqual(ref_parser._reader.maxposition, parser._reader.maxposition)
+
+    def test_generate(self):
+        path = os.path.join(os.path.dirname(__file__), "testmodules", "literalchoice.py")
+        with open(path, encoding="utf-8") as fin:
+            contents = fin.read()
+        self.assertIn("return self._r(self._reg_p_keyword0)", contents)
+        self.assertIn("return self._r(self._reg_p_op0)", contents)
+
+    def test_keyword(self):
+        literals = [("select", True), ("from", True), ("k", False), ("kelvin", True), ("in", False), ("int", False)]
+        # 先に書かれた選択肢を優先する ("k" / "kelvin", "in" / "int")
+        # K (U+212A) は str.lower() で "k" になり、ſ (U+017F) はならない
+        self.assertSameChoice("Keyword", literals,
+                              ["select", "SeLeCt x", "from", "kelvin", "Kelvin", "KELVIN", "\u212aELVIN",
+                               "int", "in", "\u017felect", "sel", ""])
+
+    def test_op(self):
+        literals = [("<", False), ("<=", False), ("<>", False), ("=", False), (".", False), ("*", False)]
+        self.assertSameChoice("Op", literals, ["<=", "<>", "=", ".", "*", "a", ""])
+
+    def test_main(self):
+        string = "SELECT * FROM kelvin WHERE x <= 1 int"
+        parser = literalchoice.LiteralChoice()
+        direct_parser = literalchoice_direct.LiteralChoiceDirect()
+        flg, node = parser.parse_string(string, parser.p_main, "Main")
+        d_flg, d_node = direct_parser.parse_string(string, direct_parser.p_main, "Main")
+        self.assertFalse(flg)
+        self.assertEqual((flg, node.get_str()), (d_flg, d_node.get_str()))
+
+        string = "SELECT * FROM kelvin int"
+        flg, node = parser.parse_string(string, parser.p_main, "Main")
+        self.assertTrue(flg)
+        self.assertEqual([n.get_str() for n in node.search_node("Keyword")], ["SELECT", "FROM", "k", "in"])
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__), "testmodules"))
+    pegfilepath = os.path.join(path, "literalchoice.peg")
+    ParserGenerator(pegfilepath, "utf-8").generate_file("LiteralChoice", os.path.join(path, "literalchoice.py"))
+    ParserGenerator(pegfilepath, "utf-8").generate_file("LiteralChoiceDirect",
+                                                        os.path.join(path, "literalchoice_direct.py"), "direct")
+
+    importlib.reload(literalchoice)
+    importlib.reload(literalchoice_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,7 @@ import os
 import importlib
 import unittest
 
-from tests.testmodules import macro01, macro02
+from tests.testmodules import macro01, macro01_direct, macro02
 
 from tacparser.parsergenerator import ParserGenerator
 
@@ -39,6 +39,29 @@ class TestMacroDefinition(unittest.TestCase):
 
         self.assertTrue(filecmp.cmp(pathoutfile, pathoutfile_dist))
 
+    def test_terminal_string(self):
+        # マクロの終端ノードは、読み込んだ範囲の文字列 (大文字小文字の区別なしを含む) になる
+        # 空文字列の場合はノードを作成しない
+        strings = ["HogeHOGE FUGAFUGA PIYOpiyo", "hOgE piyo", "hoge FUGA", "HOGE"]
+        for string in strings:
+            expected = macro01.Macro01()
+            flg, node, _ = expected.parse_string(string, expected.p_main, "Main", profile=True)
+            self.assertTrue(flg)
+            for typename in ("Hoge", "Fuga", "Piyo"):
+                for n in node.search_node(typename):
+                    for cn in n.children:
+                        if not cn.is_terminal():
+                            continue
+                        self.assertEqual(cn.get_str(), string[cn.startpos:cn.endpos])
+                        self.assertGreater(cn.endpos, cn.startpos)
+
+            vm_parser = macro01.Macro01()
+            vm_parser.use_vm = True
+            for p in (macro01.Macro01(), vm_parser, macro01_direct.Macro01Direct()):
+                p_flg, p_node = p.parse_string(string, p.p_main, "Main")
+                self.assertEqual(p_flg, flg)
+                self.assertEqual(p_node.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+
 
 def generate():
     path = os.path.normpath(os.path.join(os.path.dirname(__file__),
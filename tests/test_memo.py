@@ -0,0 +1,124 @@
+import os
+import unittest
+
+from tacparser.expegparser import ExPegParser
+from tacparser.memo import MemoTable, BLOCK_BITS, is_failure, set_failure
+
+
+class TestMemoTable(unittest.TestCase):
+    def test_success_failure(self):
+        memo = MemoTable()
+        self.assertIsNone(memo.get(0, 10))
+
+        nodes = ("node",)
+        memo.set_success(0, 10, nodes)
+        memo.set_failure(0, 11)
+        memo.set_failure(1, 10)
+        self.assertEqual(memo.get(0, 10), (True, nodes))
+        self.assertEqual(memo.get(0, 11), (False, ()))
+        self.assertEqual(memo.get(1, 10), (False, ()))
+        self.assertIsNone(memo.get(1, 11))
+        self.assertEqual(memo.count(), (1, 2))
+
+        memo.clear()
+        self.assertIsNone(memo.get(0, 10))
+        self.assertEqual(memo.count(), (0, 0))
+
+    def test_evict_before(self):
+        memo = MemoTable()
+        block_size = 1 << BLOCK_BITS
+        for pos in (0, 10, block_size, block_size * 3):
+            memo.set_success(0, pos, ("node",))
+            memo.set_failure(1, pos)
+
+        # 指定位置を含むブロックの失敗は、指定位置より前のビットのみ消去する
+        memo.set_failure(1, block_size + 9)
+        self.assertEqual(memo.evict_before(block_size + 9), 6)
+        self.assertIsNone(memo.get(0, 10))
+        self.assertIsNone(memo.get(1, 10))
+        self.assertIsNone(memo.get(0, block_size))
+        self.assertIsNone(memo.get(1, block_size))
+        self.assertEqual(memo.get(1, block_size + 9), (False, ()))
+        self.assertEqual(memo.get(1, block_size * 3), (False, ()))
+        self.assertEqual(memo.count(), (1, 2))
+
+    def test_evict_before_repeated(self):
+        # 登録順と位置の順が異なるメモ、表に直接登録したメモ、再登録したメモを繰り返し削除する
+        memo = MemoTable()
+        for pos in (50, 10, 30):
+            memo.set_success(0, pos, ("node",))
+        self.assertEqual(memo.evict_before(20), 1)
+        self.assertEqual(memo.count(), (2, 0))
+
+        successes = memo.tables[0][0]
+        successes[25] = 25
+        successes[60] = ("node",)
+        del successes[30]
+        successes[30] = ("other",)
+        self.assertEqual(memo.evict_before(40), 2)
+        self.assertIsNone(memo.get(0, 25))
+        self.assertIsNone(memo.get(0, 30))
+        self.assertEqual(sorted(successes), [50, 60])
+
+        self.assertEqual(memo.evict_before(40), 0)
+        del successes[60]
+        successes[5] = 5
+        self.assertEqual(memo.evict_before(55), 2)
+        self.assertEqual(memo.count(), (0, 0))
+
+        memo.set_success(0, 100, ("node",))
+        self.assertEqual(memo.evict_before(101), 1)
+
+    def test_failure_bits(self):
+        # ブロックの境界をまたぐ位置
+        failures = {}
+        positions = [0, 7, 8, (1 << BLOCK_BITS) - 1, 1 << BLOCK_BITS, 100000]
+        for pos in positions:
+            set_failure(failures, pos)
+        for pos in range(0, 100001):
+            self.assertEqual(is_failure(failures, pos), pos in positions)
+        self.assertEqual(len(failures), 3)
+
+
+class TestParserMemo(unittest.TestCase):
+    def test_parser_memo(self):
+        path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                             "./testFiles/test_expegparser"))
+        parser = ExPegParser()
+        _, result = parser.parse_file(os.path.join(path, "expeg_test.in"), "utf-8")
+
+        # 規則ごとの表から、作成したノードを参照できる
+        definition = result.search_node("Definition")[0]
+        rule_id = parser._rule_ids["Definition"]
+        self.assertEqual(parser._memo.get(rule_id, definition.startpos), (True, (definition,)))
+
+        successes, failures = parser._memo.count()
+        self.assertGreater(successes, 0)
+        self.assertGreater(failures, 0)
+        self.assertGreater(parser._memo.memory_size(), 0)
+
+    def test_max_memo_entries(self):
+        # メモの件数に上限を設定しても、同じ構文木を作成する
+        path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                             "./testFiles/test_expegparser"))
+        filepath = os.path.join(path, "expeg_test.in")
+        parser = ExPegParser()
+        _, result = parser.parse_file(filepath, "utf-8")
+        stats = parser.get_parse_stats()
+        self.assertEqual(stats["memo_evictions"], 0)
+        self.assertEqual(stats["memo_peak_entries"], stats["memo_entries"])
+
+        bounded_parser = ExPegParser()
+        bounded_parser.max_memo_entries = 500
+        flg, bounded_result = bounded_parser.parse_file(filepath, "utf-8")
+        self.assertTrue(flg)
+        self.assertEqual(bounded_result.print_tree(detail_flg=True), result.print_tree(detail_flg=True))
+
+        bounded_stats = bounded_parser.get_parse_stats()
+        self.assertGreater(bounded_stats["memo_evictions"], 0)
+        self.assertGreater(bounded_stats["memo_eviction_runs"], 0)
+        self.assertLessEqual(bounded_stats["memo_peak_entries"], 501)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+from tests.testmodules import commit
+
+from tacparser.expegparser import ExPegParser
+from tacparser.parallel import parse_files, parse_file_split, serialize_tree, deserialize_tree, main
+
+
+class TestParseFiles(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(7):
+            path = os.path.join(self.tmpdir.name, "input{0}.txt".format(i))
+            with open(path, "w", encoding="utf-8") as fout:
+                fout.write("".join(["a{0} = {1};\nf({1});\n".format("x" * i, j) for j in range(i * 3)]))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def get_expected(self, path):
+        parser = commit.Commit()
+        flg, node = parser.parse_file(path, "utf-8")
+        return flg, node.print_tree(detail_flg=True)
+
+    def test_tree(self):
+        results = list(parse_files(commit.Commit, self.paths, workers=2))
+        self.assertEqual([res.index for res in results], list(range(len(self.paths))))
+        for res, path in zip(results, self.paths):
+            self.assertEqual(res.path, path)
+            self.assertIsNone(res.error)
+            flg, tree = self.get_expected(path)
+            self.assertEqual(res.success, flg)
+            self.assertEqual(res.tree.print_tree(detail_flg=True), tree)
+            for n in res.tree.search_node("Statement", True):
+                self.assertIs(n.parent.children[n.parent.children.index(n)], n)
+                if n.left_neighbor is not None:
+                    self.assertIs(n.left_neighbor.right_neighbor, n)
+
+    def test_unordered_chunks(self):
+        results = list(parse_files(commit.Commit, self.paths, workers=2, result="stats",
+                                   chunksize=3, ordered=False))
+        self.assertEqual(sorted(res.index for res in results), list(range(len(self.paths))))
+        for res in results:
+            self.assertTrue(res.success)
+            self.assertIsNone(res.tree)
+            parser = commit.Commit()
+            parser.parse_file(res.path)
+            self.assertEqual(res.stats, parser.get_parse_stats())
+
+    def test_error_isolation(self):
+        broken = os.path.join(self.tmpdir.name, "broken.txt")
+        with open(broken, "w", encoding="utf-8") as fout:
+            fout.write("a = ;\n")
+        paths = [self.paths[1], os.path.join(self.tmpdir.name, "missing.txt"), broken, self.paths[2]]
+        results = list(parse_files(commit.Commit, paths, workers=2, result="compact", chunksize=2))
+        self.assertEqual([res.success for res in results], [True, False, False, True])
+        self.assertIn("FileNotFoundError", results[1].error)
+        self.assertIsNone(results[2].error)
+        self.assertTrue(deserialize_tree(results[2].tree).is_failure())
+        self.assertEqual(deserialize_tree(results[3].tree).print_tree(detail_flg=True),
+                         self.get_expected(paths[3])[1])
+
+    def test_in_process(self):
+        parser_options = {"use_vm": True}
+        results = list(parse_files(commit.Commit, self.paths, workers=0, parser_options=parser_options))
+        for res, path in zip(results, self.paths):
+            self.assertEqual(res.tree.print_tree(detail_flg=True), self.get_expected(path)[1])
+        with self.assertRaises(ValueError):
+            list(parse_files(commit.Commit, self.paths, result="node"))
+
+    def test_serialize(self):
+        parser = ExPegParser()
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        _, node = parser.parse_file(filepath, "utf-8", "ExPeg")
+        tree = deserialize_tree(serialize_tree(node))
+        self.assertEqual(tree.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+        self.assertEqual(tree.get_str(), node.get_str())
+        self.assertEqual([n.nodenum for n in tree.search_node("Definition")],
+                         [n.nodenum for n in node.search_node("Definition")])
+
+    def test_main(self):
+        argv = sys.argv
+        stdout = io.StringIO()
+        sys.argv = ["tacparser-parse", "tests.testmodules.commit:Commit", "-w", "2"] + self.paths[:3]
+        try:
+            with contextlib.redirect_stdout(stdout), self.assertRaises(SystemExit) as cm:
+                main()
+        finally:
+            sys.argv = argv
+        self.assertEqual(cm.exception.code, 0)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual([line.split("\t")[:2] for line in lines], [[path, "OK"] for path in self.paths[:3]])
+
+
+class TestParseFileSplit(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.tmpdir.name, "input.txt")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, contents):
+        with open(self.filepath, "w", encoding="utf-8") as fout:
+            fout.write(contents)
+
+    def assertSplit(self, contents, **kwargs):
+        # ファイル全体を解析した場合と同じ構文木 (位置、行番号、列番号) になること
+        self.write(contents)
+        parser = commit.Commit()
+        flg, node = parser.parse_file(self.filepath, "utf-8")
+        s_flg, s_node = parse_file_split(commit.Commit, self.filepath, **kwargs)
+        self.assertEqual(s_flg, flg)
+        if flg:
+            self.assertEqual(s_node.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+            self.assertEqual(s_node.get_str(), contents)
+            numbers = [n.nodenum for n in s_node.search_node("Statement", True)]
+            self.assertEqual(len(set(numbers)), len(numbers))
+            for n in s_node.children:
+                self.assertIs(n.parent, s_node)
+        return s_node
+
+    def test_resync(self):
+        contents = "".join(["a = {0};\nf({0}) ;  g(x);\n".format(i) for i in range(200)])
+        self.assertSplit(contents, resync=r"^(?=[a-z])", chunk_size=100, workers=2)
+        # 行の途中で分割する場合も、列番号を移動する
+        self.assertSplit(contents, resync=r"(?<=; )(?=g)", chunk_size=100, workers=2)
+
+    def test_record(self):
+        contents = "".join(["a = {0};\nf({0}\n);\n".format(i) for i in range(200)])
+        # 行の先頭で分割し、レコードの途中で分割した部分文字列は連結して再度解析する
+        node = self.assertSplit(contents, record="Statement", chunk_size=50, workers=2)
+        self.assertEqual(len(node.get_childnode("Statement")), 400)
+        self.assertSplit(contents, record="Statement", chunk_size=50, workers=0)
+        self.assertSplit("", record="Statement", workers=0)
+
+    def test_split_in_record(self):
+        # "ab = 1;" の "b" の前で分割すると、前の部分文字列は失敗し、後ろの部分文字列は単独で解析できる。
+        # 失敗した部分文字列は、成功した次の部分文字列と連結して再度解析する
+        contents = "".join(["a = {0};\nab = {0};\n".format(i) for i in range(100)])
+        node = self.assertSplit(contents, resync=r"(?=b)", chunk_size=50, workers=0)
+        self.assertEqual(len(node.get_childnode("Statement")), 200)
+        self.assertSplit(contents, record="Statement", resync=r"(?=b)", chunk_size=50, workers=2)
+
+    def test_failure(self):
+        contents = "".join(["a = {0};\n".format(i) for i in range(100)])
+        contents = contents.replace("a = 50;", "a = 50")
+        self.write(contents)
+        flg, node = parse_file_split(commit.Commit, self.filepath, record="Statement", chunk_size=50, workers=0)
+        self.assertFalse(flg)
+        self.assertTrue(node.is_failure())
+        self.assertEqual(node.end_linenum, 52)
+        self.assertIn("line:52", node.get_str())
+        with self.assertRaises(ValueError):
+            parse_file_split(commit.Commit, self.filepath)
+
+    def test_main(self):
+        self.write("".join(["a = {0};\nf({0});\n".format(i) for i in range(100)]))
+        argv = sys.argv
+        stdout = io.StringIO()
+        sys.argv = ["tacparser-parse", "tests.testmodules.commit:Commit", "-w", "2",
+                    "--record", "Statement", "--split-size", "100", self.filepath]
+        try:
+            with contextlib.redirect_stdout(stdout), self.assertRaises(SystemExit) as cm:
+                main()
+        finally:
+            sys.argv = argv
+        self.assertEqual(cm.exception.code, 0)
+        self.assertEqual(stdout.getvalue().split("\t")[:2], [self.filepath, "OK"])
+
+
+if __name__ == '__main__':
+    unittest.main()
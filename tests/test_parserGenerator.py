@@ -3,7 +3,7 @@ import sys
 import os
 import unittest
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from logging import config, getLogger
 
 import tacparser
@@ -96,50 +96,6 @@ class TestParserGenerator(unittest.TestCase):
         self.assertEqual(msg[0], expstr)
 
 
-    def test_checker_check_left_recursion_err(self):
-        # ParserChecker :_check_left_recursion の左再帰検出エラー
-        parser = ExPegParser(test_logger)
-        curdir = os.path.join(self.test_path, "peg")
-        filepath = os.path.join(curdir, "doc.peg")
-
-        generator = ParserGenerator(filepath, "utf-8", test_logger)
-        flg, node = generator.parser.parse_file(filepath)
-        self.assertTrue(flg)
-
-        checker = ParserChecker(node, test_logger)
-        checker._find_left_recursive_loop_list = MagicMock(return_value=["A"])
-        checker._eval_def = MagicMock(return_value=["A"])
-        with self.assertRaises(SyntaxCheckFailedException) as err:
-            checker.check_tree(node)
-
-        msg = err.exception.args[0]
-        self.assertEqual(len(msg), 2)
-        experr1 = '!Left Recursive Found! : A'
-        experr2 = "!Error : Can't found Left Recurcive! :"
-        self.assertEqual(msg[0], experr1)
-        self.assertTrue(msg[1].startswith(experr2))
-
-    def test_checker_find_left_recursive_loop_list_err(self):
-        # ParserChecker :_find_left_recursive_loop_list の検出エラー
-        parser = ExPegParser(test_logger)
-        curdir = os.path.join(self.test_path, "check")
-        filepath = os.path.join(curdir, "leftrecursive02.peg")
-
-        generator = ParserGenerator(filepath, "utf-8", test_logger)
-        flg, node = generator.parser.parse_file(filepath)
-        self.assertTrue(flg)
-
-        checker = ParserChecker(node, test_logger)
-        # _search_unresolve_call() の不具合発生時
-        checker._search_unresolve_call = MagicMock(return_value=1)
-        with self.assertRaises(SyntaxCheckFailedException) as err:
-            checker.check_tree(node)
-
-        msg = err.exception.args[0]
-        self.assertEqual(len(msg), 1)
-        experr = "!Unexpected Error! @search_unresolve_call Baz: ['Quux', 1] -> 1"
-        self.assertEqual(msg[0], experr)
-
     def test_check_tree_duplicate(self):
         curdir = os.path.join(self.test_path, "check")
         filepath = os.path.join(curdir, "duplicate01.peg")
@@ -172,80 +128,74 @@ class TestParserGenerator(unittest.TestCase):
         expstr = "!Undefined Identifier <POYO> is Used at (line:2, column:7)!"
         self.assertEqual(msg[1], expstr)
 
-    def test_check_left_recursive01(self):
+    def check_left_recursion(self, filename):
         curdir = os.path.join(self.test_path, "check")
-        filepath = os.path.join(curdir, "leftrecursive01.peg")
+        filepath = os.path.join(curdir, filename)
 
         generator = ParserGenerator(filepath, "utf-8", test_logger)
+        flg, node = generator.parser.parse_file(filepath)
+        self.assertTrue(flg)
 
-        with self.assertRaises(SyntaxCheckFailedException) as err:
-            generator.generate_file("Undefined01", "dummy.txt")
+        checker = ParserChecker(node, test_logger)
+        checker.check_tree(node)
+        return checker.left_recursion
 
-        msg = err.exception.args[0]
-        self.assertEqual(len(msg), 1)
-        expstr = "!Left Recursive Found! : Baz->Baz"
-        self.assertEqual(msg[0], expstr)
+    def test_check_left_recursive01(self):
+        left_recursion = self.check_left_recursion("leftrecursive01.peg")
+        self.assertEqual(left_recursion, {"Baz": True})
 
     def test_check_left_recursive02(self):
+        left_recursion = self.check_left_recursion("leftrecursive02.peg")
+        self.assertEqual(left_recursion, {"Baz": True, "Quux": False})
+
+    def test_check_left_recursive03(self):
+        left_recursion = self.check_left_recursion("leftrecursive03.peg")
+        expected = {"Bar": True, "Baz": True, "Quux": False, "Qux": True}
+        expected.update({name: False for name in ["Grault", "Garply", "Waldo", "Fred",
+                                                  "Plugh", "Xyzzy", "Thud"]})
+        self.assertEqual(left_recursion, expected)
+
+    def test_check_left_recursive04(self):
+        # 複数の循環があっても、すべての循環に含まれる規則 (Qux) を起点とする
+        left_recursion = self.check_left_recursion("leftrecursive04.peg")
+        expected = {"Bar": True, "Baz": True, "Quux": False, "Qux": True}
+        expected.update({name: False for name in ["Grault", "Garply", "Waldo", "Fred",
+                                                  "Plugh", "Xyzzy", "Thud"]})
+        self.assertEqual(left_recursion, expected)
+
+    def test_check_left_recursive05(self):
+        # すべての循環に含まれる規則がない場合はエラー
         curdir = os.path.join(self.test_path, "check")
-        filepath = os.path.join(curdir, "leftrecursive02.peg")
+        filepath = os.path.join(curdir, "leftrecursive05.peg")
 
         generator = ParserGenerator(filepath, "utf-8", test_logger)
 
         with self.assertRaises(SyntaxCheckFailedException) as err:
-            generator.generate_file("Undefined01", "dummy.txt")
+            generator.generate_file("LeftRecursive05", "dummy.txt")
 
         msg = err.exception.args[0]
         self.assertEqual(len(msg), 1)
-        expstr = "!Left Recursive Found! : Baz->Quux->Baz"
-        repr_str = "SyntaxCheckFailedException(['!Left Recursive Found! : Baz->Quux->Baz'])"
+        expstr = "!Unsupported Left Recursion! : A, B, C, D " \
+                 "(no rule is included in all the recursive cycles)"
+        repr_str = "SyntaxCheckFailedException(['" + expstr + "'])"
         self.assertEqual(msg[0], expstr)
         self.assertEqual(str(err.exception), repr_str)
         self.assertEqual(repr(err.exception), repr_str)
 
-    def test_check_left_recursive03(self):
-        curdir = os.path.join(self.test_path, "check")
-        filepath = os.path.join(curdir, "leftrecursive03.peg")
-
-        generator = ParserGenerator(filepath, "utf-8", test_logger)
-
-        with self.assertRaises(SyntaxCheckFailedException) as err:
-            generator.generate_file("Undefined01", "dummy.txt")
-
-        msg = err.exception.args[0]
-        self.assertEqual(len(msg), 3)
-        expstr = "!Left Recursive Found! : Bar->Bar"
-        self.assertEqual(msg[0], expstr)
-        expstr = "!Left Recursive Found! : Baz->Quux->Baz"
-        self.assertEqual(msg[1], expstr)
-        expstr = "!Left Recursive Found! : " \
-                 "Fred->Plugh->Xyzzy->Thud->Qux->Grault->Garply->Waldo->Fred"
-        self.assertEqual(msg[2], expstr)
-
-    def test_check_left_recursive04(self):
+    def test_check_left_recursive06(self):
+        # 左再帰の規則の多重解析はエラー
         curdir = os.path.join(self.test_path, "check")
-        filepath = os.path.join(curdir, "leftrecursive04.peg")
+        filepath = os.path.join(curdir, "leftrecursive06.peg")
 
         generator = ParserGenerator(filepath, "utf-8", test_logger)
 
         with self.assertRaises(SyntaxCheckFailedException) as err:
-            generator.generate_file("Undefined01", "dummy.txt")
+            generator.generate_file("LeftRecursive06", "dummy.txt")
 
         msg = err.exception.args[0]
-        self.assertEqual(len(msg), 5)
-        expstr = "!Left Recursive Found! : Bar->Bar"
+        self.assertEqual(len(msg), 1)
+        expstr = "!Unsupported Left Recursion! : B (sub definition of left recursive rule)"
         self.assertEqual(msg[0], expstr)
-        expstr = "!Left Recursive Found! : Baz->Quux->Baz"
-        self.assertEqual(msg[1], expstr)
-        expstr = "!Left Recursive Found! : " \
-                 "Fred->Plugh->Xyzzy->Thud->Qux->Grault->Garply->Waldo->Fred"
-        self.assertEqual(msg[2], expstr)
-        expstr = "!Left Recursive Found! : " \
-                 "Garply->Waldo->Plugh->Xyzzy->Thud->Qux->Grault->Garply"
-        self.assertEqual(msg[3], expstr)
-        expstr = "!Left Recursive Found! : " \
-                 "Grault->Waldo->Plugh->Xyzzy->Thud->Qux->Grault"
-        self.assertEqual(msg[4], expstr)
 
 
     def test_check_filenotfound(self):
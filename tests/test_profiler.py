@@ -0,0 +1,79 @@
+import os
+import unittest
+
+from tests.testmodules import expeg_direct, leftrecursion
+
+from tacparser import format_profile
+from tacparser.expegparser import ExPegParser
+
+
+class TestRuleProfiler(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def setUp(self):
+        self.filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+
+    def assertConsistent(self, report):
+        for typename, stats in report.items():
+            self.assertEqual(stats["calls"], stats["memo_hits"] + stats["memo_misses"], typename)
+            self.assertEqual(stats["calls"], stats["successes"] + stats["failures"], typename)
+            self.assertGreaterEqual(stats["inclusive_time"], stats["exclusive_time"], typename)
+
+    def test_profile(self):
+        parser = ExPegParser()
+        flg, node = parser.parse_file(self.filepath, "utf-8", "ExPeg")
+        stats = parser.get_parse_stats()
+
+        p_flg, p_node, report = parser.parse_file(self.filepath, "utf-8", "ExPeg", profile=True)
+        self.assertTrue(p_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), p_node.print_tree(detail_flg=True))
+        self.assertEqual(stats, parser.get_parse_stats())
+        self.assertEqual(parser._reader.maxposition, len(node.get_str()))
+
+        self.assertConsistent(report)
+        definition = report["Definition"]
+        self.assertEqual(definition["successes"], len(node.search_node("Definition")))
+        self.assertEqual(definition["consumed"],
+                         sum(len(n.get_str()) for n in node.search_node("Definition")))
+        self.assertGreater(sum(s["memo_hits"] for s in report.values()), 0)
+        self.assertGreater(sum(s["rescanned"] for s in report.values()), 0)
+        self.assertIn("Definition", format_profile(report))
+
+        # 計測後は計測用の関数が残らない
+        self.assertNotIn("_create_non_terminal", vars(parser))
+        self.assertEqual(parser._rule_hooks, [])
+        self.assertEqual(len(parser.parse_file(self.filepath, "utf-8", "ExPeg")), 2)
+
+    def test_profile_string(self):
+        parser = ExPegParser()
+        vm_parser = ExPegParser()
+        vm_parser.use_vm = True
+        string = "A <- B / 'a'\nB <- 'b'\n"
+        _, _, report = parser.parse_string(string, parser.p_expeg, "ExPeg", profile=True)
+        # ParseVM を指定していても、計測中は解析関数で解析する
+        _, _, vm_report = vm_parser.parse_string(string, vm_parser.p_expeg, "ExPeg", profile=True)
+
+        self.assertConsistent(report)
+        counts = ["calls", "memo_hits", "memo_misses", "successes", "failures", "consumed", "rescanned"]
+        self.assertEqual({t: [s[k] for k in counts] for t, s in report.items()},
+                         {t: [s[k] for k in counts] for t, s in vm_report.items()})
+
+    def test_profile_left_recursion(self):
+        parser = leftrecursion.LeftRecursion()
+        flg, _, report = parser.parse_string("1+2*3", parser.p_program, "Program", profile=True)
+        self.assertTrue(flg)
+        self.assertConsistent(report)
+        self.assertEqual(report["Expr"]["memo_misses"], 1)
+        self.assertEqual(report["Expr"]["consumed"], 5)
+
+    def test_profile_direct(self):
+        parser = expeg_direct.ExPegDirect()
+        flg, node, report = parser.parse_file(self.filepath, "utf-8", "ExPeg", profile=True)
+        self.assertTrue(flg)
+        self.assertConsistent(report)
+        self.assertEqual(report["Definition"]["successes"], len(node.search_node("Definition")))
+        self.assertNotIn("d_definition", vars(parser))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,10 @@ import os
 import re
 import unittest
 
-from tacparser.reader import FileReader
+import regex
+
+from tacparser import ExPegParser
+from tacparser.reader import FileReader, StringReader, MmapFileReader, LineIndex, bounded_pattern
 
 
 class TestFileReaderMethods(unittest.TestCase):
@@ -98,6 +101,35 @@ class TestFileReaderMethods(unittest.TestCase):
         self.assertEqual(r.pos2linecolumn(62), (8, 15, "\n"))
         self.assertEqual(r.pos2linecolumn(63), (8, 16, ""))
 
+    def test_line_index(self):
+        # LineIndex : 二分探索による行番号、列番号の変換
+        contents = "ab\r\ncd\reé\u2028\n\x0cxyz"
+        index = LineIndex(contents)
+        self.assertEqual(len(index), len(contents.splitlines()))
+
+        # 行の先頭から順に走査した結果と一致すること
+        lines = contents.splitlines(True)
+        pos = 0
+        for linenum, line in enumerate(lines, 1):
+            self.assertEqual(index.line_startpos(linenum), pos)
+            for column in range(len(line)):
+                self.assertEqual(index.linecolumn(pos + column), (linenum, column))
+            pos += len(line)
+        self.assertEqual(index.linecolumn(len(contents)), (len(lines), len(lines[-1])))
+
+        with self.assertRaises(IndexError):
+            index.linecolumn(len(contents) + 1)
+        with self.assertRaises(IndexError):
+            index.linecolumn(-1)
+
+    def test_line_index_shared(self):
+        # Reader は LineIndex を一度だけ作成する
+        r = StringReader("abc\ndef\n")
+        index = r.get_line_index()
+        self.assertIs(index, r.get_line_index())
+        self.assertEqual(r.pos2linecolumn(5), (2, 1, "e"))
+        self.assertEqual(r.pos2linecolumn(8), (2, 4, ""))
+
     def test_filereader_match_regexp01(self):
         # 正規表現での取得
         file = os.path.join(self.set_path, "test01_02.txt")
@@ -107,6 +139,43 @@ class TestFileReaderMethods(unittest.TestCase):
         self.assertTrue(flg)
         self.assertIsNotNone(rlt)
 
+    def test_match_regexp_partial(self):
+        # 部分解析時、正規表現は終了位置を越えて読み込まない
+        file = os.path.join(self.set_path, "test02.txt")
+        r = FileReader(file, "utf-8")
+
+        r.partial_reposition(5, 7)
+        self.assertEqual(r.peek_char(), "b")
+        flg, rlt = r.match_regexp(re.compile("b+"), True)
+        self.assertEqual((flg, rlt, r.get_position()), (True, "bb", 7))
+        # 終了位置では次の文字はない
+        self.assertEqual(r.peek_char(), "")
+
+        flg, rlt = r.match_literal("b", False)
+        self.assertEqual((flg, rlt), (False, None))
+
+        r.partial_reposition(10, 19)
+        flg, rlt = r.match_regexp(re.compile("c+\\s"), True)
+        self.assertEqual((flg, rlt, r.get_position()), (True, "cccc ", 15))
+
+    def test_match_regexp_anchor(self):
+        # 正規表現は読み込み位置を文字列の先頭とみなして照合する
+        # (行頭 ^、文字列の先頭 \A、単語境界 \b、後読みは読み込み位置より前を参照しない)
+        r = StringReader("ab\ncd")
+        for reg in (re.compile("^[a-z]", re.M), re.compile("\\A[a-z]"), re.compile("\\b[a-z]"),
+                    regex.compile("(?<![a-z])[a-z]")):
+            r.set_position(1)
+            flg, rlt = r.match_regexp(reg, True)
+            self.assertEqual((flg, rlt, r.get_position()), (True, "b", 2))
+
+        # 否定の文字クラスの ^ は、切り出さずに照合する
+        self.assertIs(bounded_pattern(re.compile("[^a]+")).__class__, re.Pattern)
+
+        # 部分解析時は、開始位置を文字列の先頭、終了位置を文字列の終端とみなす
+        r.partial_reposition(1, 2)
+        flg, rlt = r.match_regexp(re.compile("^b$"), True)
+        self.assertEqual((flg, rlt, r.get_position()), (True, "b", 2))
+
     def test_filereader_read(self):
         """
         文字列の読み込み
@@ -199,5 +268,83 @@ class TestFileReaderMethods(unittest.TestCase):
         self.assertEqual((flg, rlt, r.get_position()), (True, "bbbb", 9))
 
 
+class TestMmapFileReaderMethods(unittest.TestCase):
+    set_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles/test_reader"))
+
+    def test_mmap_contents(self):
+        # MmapFileReader : 文字カウントでの位置、内容が FileReader と一致する
+        for filename in ["test01_01.txt", "test01_02.txt", "test02.txt", "test03.txt"]:
+            file = os.path.join(self.set_path, filename)
+            fr = FileReader(file, "utf-8")
+            mr = MmapFileReader(file, "utf-8")
+            self.assertEqual(mr.length, fr.length)
+            self.assertEqual(mr.is_ascii, fr.contents.isascii())
+            self.assertEqual(mr.get_contents(0, mr.length), fr.contents)
+            self.assertEqual(list(mr.get_line_index().linestarts), list(fr.get_line_index().linestarts))
+            for pos in range(fr.length + 1):
+                self.assertEqual(mr.pos2linecolumn(pos), fr.pos2linecolumn(pos))
+            mr.close()
+
+    def test_mmap_match(self):
+        # MmapFileReader : 非ASCII文字を含むファイルの読み込み
+        file = os.path.join(self.set_path, "test03.txt")
+        fr = FileReader(file, "utf-8")
+        mr = MmapFileReader(file, "utf-8")
+        reg = regex.compile("[a-zA-Z0-9 \t\n]+", regex.M)
+        self.assertTrue(mr.is_byte_safe(reg))
+        for pos in range(fr.length + 1):
+            fr.set_position(pos)
+            mr.set_position(pos)
+            self.assertEqual(mr.peek_char(), fr.peek_char())
+            self.assertEqual(mr.match_regexp(reg, True), fr.match_regexp(reg, True))
+            self.assertEqual(mr.get_position(), fr.get_position())
+            mr.set_position(pos)
+            literal = fr.get_contents(pos, pos + 2)
+            self.assertEqual(mr.match_literal(literal, True), (True, literal))
+            self.assertEqual(mr.get_position(), min(pos + 2, fr.length))
+        mr.close()
+
+    def test_mmap_byte_safe(self):
+        # 非ASCII文字を含むファイルでは、1バイトに一致しうるパターンは使用できない
+        mr = MmapFileReader(os.path.join(self.set_path, "test03.txt"), "utf-8")
+        self.assertFalse(mr.is_byte_safe(regex.compile("[^a]")))
+        self.assertFalse(mr.is_byte_safe(regex.compile("a.b")))
+        self.assertFalse(mr.is_byte_safe(regex.compile("\\w+")))
+        self.assertFalse(mr.is_byte_safe(regex.compile("[あ-ん]")))
+        self.assertFalse(mr.is_byte_safe(regex.compile("(?i)abc")))
+        self.assertTrue(mr.is_byte_safe(regex.compile("[.]|\\.|\\\\")))
+        with self.assertRaises(ValueError):
+            mr.match_regexp(regex.compile("."))
+        mr.close()
+
+        # ASCII 文字のみのファイルでは、bytes に変換できるパターンはすべて使用できる
+        mr = MmapFileReader(os.path.join(self.set_path, "test02.txt"), "utf-8")
+        self.assertTrue(mr.is_byte_safe(regex.compile("[^a]\\w.")))
+        mr.close()
+
+    def test_mmap_parse_file(self):
+        # Parser.parse_file : mmap_threshold 以上のファイルは MmapFileReader で解析する
+        file = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                             "./testFiles/test_parsergenerator/peg/peg.peg"))
+        parser = ExPegParser()
+        flg, tree = parser.parse_file(file)
+        self.assertTrue(flg)
+        self.assertIsInstance(parser._reader, FileReader)
+
+        mmap_parser = ExPegParser()
+        mmap_parser.mmap_threshold = 0
+        mmap_flg, mmap_tree = mmap_parser.parse_file(file)
+        self.assertTrue(mmap_flg)
+        self.assertIsInstance(mmap_parser._reader, MmapFileReader)
+        self.assertEqual(mmap_tree.print_tree(detail_flg=True), tree.print_tree(detail_flg=True))
+
+        # 非ASCII文字を含み、1バイトに一致しうるパターンを使用する場合は FileReader を使用する
+        file = os.path.normpath(os.path.join(os.path.dirname(__file__), "../expegfiles/expeg.peg"))
+        mmap_parser = ExPegParser()
+        mmap_parser.mmap_threshold = 0
+        self.assertTrue(mmap_parser.parse_file(file)[0])
+        self.assertIsInstance(mmap_parser._reader, FileReader)
+
+
 if __name__ == '__main__':
     unittest.main()
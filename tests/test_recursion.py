@@ -41,6 +41,16 @@ class TestRecursionReg(unittest.TestCase):
         self.assertFalse(flg)
         self.assertIsNone(node)
 
+    def test_recursion_vm(self):
+        # ParseVM では再帰の深さに制限がないため、入力の終端で通常の解析失敗になる
+        parser = recursion02.Recursion()
+        parser.use_vm = True
+        testfile_path = os.path.join(self.set_path, "test01.txt")
+        flg, node = parser.parse_file(testfile_path, "utf-8", "Recursion")
+        self.assertFalse(flg)
+        self.assertTrue(node.is_failure())
+        self.assertEqual(parser._reader.maxposition, os.path.getsize(testfile_path))
+
 
 def generate(filename):
     path = os.path.normpath(os.path.join(os.path.dirname(__file__),
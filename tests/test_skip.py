@@ -0,0 +1,97 @@
+import os
+import importlib
+import unittest
+
+from tests.testmodules import skip, skip_direct
+
+from tacparser import NonTerminalNode
+from tacparser.parsergenerator import ParserGenerator
+
+
+class TestSkip(unittest.TestCase):
+    strings = ["a = 1 + b; # comment\nf(x + 'y');\n1 + 2 + c;\n",
+               "f();  x=y+1;\n# end",
+               "if = 1;",
+               "a = 'b' + 1 # c"]
+
+    def setUp(self):
+        generate()
+
+    def assertSameTree(self, string):
+        # 規則の呼び出しを置き換えた解析 (読み飛ばし、先読みでもノードを作成する) と同じ構文木になること
+        expected = skip.Skip()
+        flg, node, _ = expected.parse_string(string, expected.p_program, "Program", profile=True)
+        nodes = expected.get_parse_stats()["nodes"]
+
+        parser = skip.Skip()
+        vm_parser = skip.Skip()
+        vm_parser.use_vm = True
+        direct_parser = skip_direct.SkipDirect()
+        trees = []
+        for p in (parser, vm_parser, direct_parser):
+            p_flg, p_node = p.parse_string(string, p.p_program, "Program")
+            trees.append(p_node)
+            self.assertEqual(p_flg, flg)
+            self.assertEqual(p_node.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+            self.assertEqual(p._reader.maxposition, expected._reader.maxposition)
+            self.assertLess(p.get_parse_stats()["nodes"], nodes)
+            # 終了位置のメモを削除、置き換えた場合も、メモの件数が一致すること
+            self.assertEqual(p._memo_entries, sum(p._memo.count()))
+        self.assertEqual(parser.get_parse_stats(), vm_parser.get_parse_stats())
+        return flg, parser, trees[0]
+
+    def test_same_tree(self):
+        for string in self.strings:
+            self.assertSameTree(string)
+
+    def test_memo(self):
+        flg, parser, node = self.assertSameTree(self.strings[0])
+        self.assertTrue(flg)
+        tables = parser._memo_tables
+        rule_ids = parser._rule_ids
+
+        # 先読みで終了位置を登録した規則も、ノードを作成する位置ではノードをメモに登録する
+        for typename in ("Call", "Expr", "Name"):
+            found = node.search_node(typename, True)
+            self.assertGreater(len(found), 0)
+            for n in found:
+                self.assertIsInstance(n.parent, NonTerminalNode)
+                if n.parent.type != typename:
+                    # 左再帰の規則は、成長した最も外側のノードを登録する
+                    self.assertIs(tables[rule_ids[typename]][0][n.startpos][0], n)
+
+        # 読み飛ばしの中でのみ呼び出した規則は、終了位置のみ登録する
+        spacing = tables[rule_ids["Spacing"]][0]
+        self.assertGreater(len(spacing), 0)
+        self.assertTrue(all(isinstance(e, int) for e in spacing.values()))
+        self.assertEqual(node.search_node("Spacing", True), [])
+
+    def test_memo_limit(self):
+        # メモの削除中も同じ構文木になること
+        string = self.strings[0] * 20
+        expected = skip.Skip()
+        flg, node = expected.parse_string(string, expected.p_program, "Program")
+        self.assertTrue(flg)
+        for p in (skip.Skip(), skip_direct.SkipDirect()):
+            p.max_memo_entries = 8
+            p_flg, p_node = p.parse_string(string, p.p_program, "Program")
+            self.assertTrue(p_flg)
+            self.assertEqual(p_node.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+            self.assertGreater(p.get_parse_stats()["memo_evictions"], 0)
+
+
+def generate():
+    path = os.path.normpath(os.path.join(os.path.dirname(__file__),
+                                         "./testmodules"))
+
+    filepath = os.path.join(path, "skip.peg")
+    ParserGenerator(filepath, "utf-8").generate_file("Skip", os.path.join(path, "skip.py"))
+    ParserGenerator(filepath, "utf-8").generate_file("SkipDirect",
+                                                     os.path.join(path, "skip_direct.py"), "direct")
+
+    importlib.reload(skip)
+    importlib.reload(skip_direct)
+
+
+if __name__ == '__main__':
+    unittest.main()
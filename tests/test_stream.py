@@ -0,0 +1,108 @@
+import os
+import unittest
+
+from tests.testmodules import commit, commit_direct, leftrecursion, leftrecursion_direct, macro01, macro01_direct
+
+from tacparser import EventCollector, ParseEventHandler, NonTerminalNode
+from tacparser.expegparser import ExPegParser
+
+
+def tree_events(root):
+    # 構文解析木から、先行順に stream と同じ形式のイベントを作成する
+    events = []
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not isinstance(node, NonTerminalNode):
+            events.append(("terminal", node.get_str(), node.startpos, node.endpos))
+        elif visited:
+            events.append(("exit", node.type, node.startpos, node.endpos))
+        else:
+            events.append(("enter", node.type, node.startpos))
+            stack.append((node, True))
+            stack.extend([(cn, False) for cn in reversed(node.children)])
+    return events
+
+
+class TestStream(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def assertSameEvents(self, parser, string, rootexp, typename):
+        # 構文解析木と同じ順序、内容のイベントを送信し、ノードを作成しないこと
+        flg, node = parser.parse_string(string, rootexp(parser), typename)
+        maxposition = parser._reader.maxposition
+
+        collector = EventCollector()
+        s_flg, diagnostics = parser.stream_string(string, rootexp(parser), collector, typename)
+        self.assertEqual(s_flg, flg)
+        self.assertEqual(diagnostics["maxposition"], maxposition)
+        if flg:
+            self.assertEqual(collector.events, tree_events(node))
+            self.assertEqual(diagnostics["endpos"], node.endpos)
+        else:
+            self.assertEqual(diagnostics["endpos"], -1)
+        self.assertIsNone(parser.get_tree())
+
+        # イベントの送信後も同じ構文木を作成できること
+        flg2, node2 = parser.parse_string(string, rootexp(parser), typename)
+        self.assertEqual(flg2, flg)
+        self.assertEqual(node2.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+
+    def test_commit(self):
+        strings = ["a = 1;\nf(b);\n", "a = 1;\nf(b;\n", "", "a = 1; ~"]
+        for cls in (commit.Commit, commit_direct.CommitDirect):
+            parser = cls()
+            parser.max_memo_entries = 4
+            for string in strings:
+                self.assertSameEvents(parser, string, lambda p: p.p_program, "Program")
+
+    def test_left_recursion(self):
+        strings = ["1-2-3", "a.b[1+2]*3", "(1+a[2])/b.c", "1+", "a[1"]
+        for cls in (leftrecursion.LeftRecursion, leftrecursion_direct.LeftRecursionDirect):
+            for string in strings:
+                self.assertSameEvents(cls(), string, lambda p: p.p_program, "Program")
+
+    def test_macro(self):
+        strings = ["hogeHOGE FUGAFUGA piyoPIYO", "hoge FUGAFUG"]
+        for cls in (macro01.Macro01, macro01_direct.Macro01Direct):
+            for string in strings:
+                self.assertSameEvents(cls(), string, lambda p: p.p_main, "Main")
+
+    def test_stream_file(self):
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        parser = ExPegParser()
+        flg, node = parser.parse_file(filepath, "utf-8", "ExPeg")
+        self.assertTrue(flg)
+
+        class FirstDefinition(ParseEventHandler):
+            # 最初の Definition の終了時に、解析済みの位置を記録する
+            def __init__(self):
+                self.events = EventCollector()
+                self.maxposition = None
+
+            def enter(self, typename, startpos):
+                self.events.enter(typename, startpos)
+
+            def exit(self, typename, startpos, endpos):
+                self.events.exit(typename, startpos, endpos)
+                if typename == "Definition" and self.maxposition is None:
+                    self.maxposition = parser._reader.getmaxposition()
+
+            def terminal(self, text, startpos, endpos):
+                self.events.terminal(text, startpos, endpos)
+
+        handler = FirstDefinition()
+        parser.stream_memo_entries = 16
+        flg, diagnostics = parser.stream_file(filepath, handler, "utf-8", "ExPeg")
+        self.assertTrue(flg)
+        self.assertEqual(diagnostics["endpos"], node.endpos)
+        self.assertEqual(handler.events.events, tree_events(node))
+
+        # イベントは解析の終了を待たずに送信し、送信済みの位置より前のメモは破棄すること
+        self.assertLess(handler.maxposition, node.endpos)
+        self.assertGreater(parser.get_parse_stats()["memo_evictions"], 0)
+        self.assertNotIn("_sel", vars(parser))
+
+
+if __name__ == '__main__':
+    unittest.main()
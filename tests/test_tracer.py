@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+
+from tests.testmodules import expeg_direct
+
+from tacparser import ParseTracer
+from tacparser.expegparser import ExPegParser
+
+
+class TestParseTracer(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def setUp(self):
+        self.filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+
+    def test_trace(self):
+        parser = ExPegParser()
+        _, node = parser.parse_file(self.filepath, "utf-8", "ExPeg")
+
+        tracer = ParseTracer()
+        flg, t_node = parser.parse_file(self.filepath, "utf-8", "ExPeg", trace=tracer)
+        self.assertTrue(flg)
+        self.assertEqual(node.print_tree(detail_flg=True), t_node.print_tree(detail_flg=True))
+        self.assertNotIn("_parse", vars(parser))
+
+        # すべての規則の呼び出しを記録する
+        events = tracer.get_chrome_trace()["traceEvents"]
+        definitions = [e for e in events if e["name"] == "Definition" and e["args"]["result"]]
+        self.assertEqual(len(definitions), len(node.search_node("Definition")))
+        self.assertEqual([(e["args"]["start"], e["args"]["end"]) for e in definitions
+                          if not e["args"]["memo"]],
+                         [(n.startpos, n.endpos) for n in node.search_node("Definition")])
+        root = events[-1]
+        self.assertEqual(root["name"], "ExPeg")
+        self.assertTrue(all(root["ts"] <= e["ts"] and e["ts"] + e["dur"] <= root["ts"] + root["dur"]
+                            for e in events))
+
+        folded = tracer.get_folded().splitlines()
+        self.assertTrue(all(line.startswith("ExPeg") for line in folded))
+        self.assertIn("ExPeg;Definition", [line.rsplit(" ", 1)[0] for line in folded])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracefile = os.path.join(tmpdir, "trace.json")
+            tracer.write_chrome_trace(tracefile)
+            with open(tracefile, encoding="utf-8") as fin:
+                self.assertEqual(len(json.load(fin)["traceEvents"]), len(events))
+
+    def test_sampling(self):
+        parser = ExPegParser()
+        string = "A <- B / 'a'\nB <- 'b'\n" * 200
+        tracer = ParseTracer(sample_interval=0.0005)
+        full_tracer = ParseTracer()
+        flg, _ = parser.parse_string(string, parser.p_expeg, "ExPeg", trace=tracer)
+        parser.parse_string(string, parser.p_expeg, "ExPeg", trace=full_tracer)
+        self.assertTrue(flg)
+
+        # 記録した時点で実行中の規則のみを出力する
+        self.assertGreater(tracer.samples, 0)
+        self.assertLess(len(tracer.events), len(full_tracer.events))
+        self.assertEqual(tracer.events[-1]["name"], "ExPeg")
+        total = sum(int(line.rsplit(" ", 1)[1]) for line in tracer.get_folded().splitlines())
+        self.assertEqual(total, tracer.samples)
+
+    def test_trace_with_profile(self):
+        # 統計情報の計測と同時に記録できる
+        parser = expeg_direct.ExPegDirect()
+        tracer = ParseTracer()
+        flg, node, report = parser.parse_file(self.filepath, "utf-8", "ExPeg", profile=True, trace=tracer)
+        self.assertTrue(flg)
+        self.assertEqual(report["Definition"]["calls"],
+                         len([e for e in tracer.events if e["name"] == "Definition"]))
+        self.assertNotIn("d_definition", vars(parser))
+
+
+if __name__ == '__main__':
+    unittest.main()
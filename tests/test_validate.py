@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+from tests.testmodules import commit, commit_direct, leftrecursion, leftrecursion_direct, macro01, macro01_direct
+
+from tacparser.expegparser import ExPegParser
+
+
+class TestValidate(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def assertSameResult(self, parser, string, rootexp, typename):
+        # 構文解析と同じ成否、終了位置、最大到達位置になり、ノードを作成しないこと
+        flg, node = parser.parse_string(string, rootexp(parser), typename)
+        maxposition = parser._reader.maxposition
+        linenum, column, _ = parser._reader.getmaxlinecolumn()
+
+        v_flg, diagnostics = parser.validate_string(string, rootexp(parser))
+        self.assertEqual(v_flg, flg)
+        self.assertEqual(diagnostics, {"endpos": node.endpos if flg else -1,
+                                       "maxposition": maxposition,
+                                       "linenum": linenum,
+                                       "column": column})
+        self.assertEqual(parser.get_parse_stats()["nodes"], 0)
+        self.assertIsNone(parser.get_tree())
+
+        # 検証後も同じ構文木を作成できること
+        flg2, node2 = parser.parse_string(string, rootexp(parser), typename)
+        self.assertEqual(flg2, flg)
+        self.assertEqual(node2.print_tree(detail_flg=True), node.print_tree(detail_flg=True))
+
+    def test_commit(self):
+        strings = ["a = 1;\nf(b);\n", "a = 1;\nf(b;\n", "", "a = 1; ~"]
+        for cls in (commit.Commit, commit_direct.CommitDirect):
+            parser = cls()
+            parser.max_memo_entries = 4
+            for string in strings:
+                self.assertSameResult(parser, string, lambda p: p.p_program, "Program")
+
+    def test_left_recursion(self):
+        strings = ["1-2-3", "a.b[1+2]*3", "(1+a[2])/b.c", "1+", "a[1"]
+        for cls in (leftrecursion.LeftRecursion, leftrecursion_direct.LeftRecursionDirect):
+            for string in strings:
+                self.assertSameResult(cls(), string, lambda p: p.p_program, "Program")
+
+    def test_macro(self):
+        strings = ["hogeHOGE FUGAFUGA piyoPIYO", "hoge FUGAFUG"]
+        for cls in (macro01.Macro01, macro01_direct.Macro01Direct):
+            for string in strings:
+                self.assertSameResult(cls(), string, lambda p: p.p_main, "Main")
+
+    def test_validate_file(self):
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        parser = ExPegParser()
+        parser.use_vm = True
+        flg, node = parser.parse_file(filepath, "utf-8", "ExPeg")
+        self.assertTrue(flg)
+        self.assertEqual(parser.validate_file(filepath, "utf-8", "ExPeg"),
+                         (True, {"endpos": node.endpos, "maxposition": node.endpos,
+                                 "linenum": node.end_linenum, "column": node.end_column}))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            broken = os.path.join(tmpdir, "broken.peg")
+            with open(broken, "w", encoding="utf-8") as fout:
+                fout.write("A <- \"a\"\nB <- ( \"b\"\n")
+            flg, diagnostics = parser.validate_file(broken, "utf-8", "ExPeg")
+            self.assertFalse(flg)
+            self.assertEqual((diagnostics["endpos"], diagnostics["linenum"]), (-1, 2))
+
+        # 検証用の解析関数は再利用し、構文解析の解析関数とは分ける
+        recognizers = dict(parser._recognizers)
+        parser.validate_file(filepath, "utf-8", "ExPeg")
+        self.assertEqual(parser._recognizers, recognizers)
+        self.assertNotIn("_l", vars(parser))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import unittest
+
+from tests.testmodules import commit, loop, loop_direct, macro01, subdef01
+
+from tacparser import preorder_travel, postorder_travel, reconstruct_tree
+from tacparser.expegparser import ExPegParser
+from tacparser.reader import MmapFileReader
+
+
+class TestParseVM(unittest.TestCase):
+    test_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "./testFiles"))
+
+    def assertSameParse(self, parser, filepath, root, max_memo_entries=None):
+        # 解析関数と ParseVM で同じ構文木、統計情報になること
+        vm_parser = type(parser)()
+        vm_parser.use_vm = True
+        parser.max_memo_entries = max_memo_entries
+        vm_parser.max_memo_entries = max_memo_entries
+        flg, node = parser.parse_file(filepath, "utf-8", root)
+        vm_flg, vm_node = vm_parser.parse_file(filepath, "utf-8", root)
+
+        self.assertTrue(vm_flg)
+        self.assertEqual(flg, vm_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), vm_node.print_tree(detail_flg=True))
+        self.assertEqual(node.print_tree(), vm_node.print_tree())
+        self.assertEqual(parser._reader.maxposition, vm_parser._reader.maxposition)
+        self.assertEqual(parser.get_parse_stats(), vm_parser.get_parse_stats())
+
+    def test_expeg(self):
+        filepath = os.path.join(self.test_path, "test_expegparser", "expeg_test.in")
+        self.assertSameParse(ExPegParser(), filepath, "ExPeg")
+        self.assertSameParse(ExPegParser(), filepath, "ExPeg", max_memo_entries=50)
+
+    def test_macro01(self):
+        filepath = os.path.join(self.test_path, "test_macro", "test01.txt")
+        self.assertSameParse(macro01.Macro01(), filepath, "Main")
+
+    def test_mmap(self):
+        # MmapFileReader で読み込んだファイルも、Reader の照合処理で解析する
+        filepath = os.path.join(self.test_path, "test_macro", "test01.txt")
+        parser = macro01.Macro01()
+        flg, node = parser.parse_file(filepath, "utf-8", "Main")
+        vm_parser = macro01.Macro01()
+        vm_parser.use_vm = True
+        vm_parser.mmap_threshold = 0
+        vm_flg, vm_node = vm_parser.parse_file(filepath, "utf-8", "Main")
+
+        self.assertIsInstance(vm_parser._reader, MmapFileReader)
+        self.assertTrue(vm_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), vm_node.print_tree(detail_flg=True))
+
+    def test_loop(self):
+        filepath = os.path.join(self.test_path, "test_loop", "test01.txt")
+        self.assertSameParse(loop.Loop(), filepath, "Loop")
+        # 構造を持たない解析関数 (direct バックエンドの規則) はそのまま呼び出す
+        self.assertSameParse(loop_direct.LoopDirect(), filepath, "Loop")
+
+    def test_subdef01(self):
+        filepath = os.path.join(self.test_path, "test_reuse_def", "subdef01", "test01.txt")
+        self.assertSameParse(subdef01.SubDef01(), filepath, "Main")
+
+    def test_commit(self):
+        string = "".join(["a = {0};\nf({0});\ng();\n".format(i) for i in range(100)])
+        parser = commit.Commit()
+        vm_parser = commit.Commit()
+        vm_parser.use_vm = True
+        _, node = parser.parse_string(string, parser.p_program, "Program")
+        vm_flg, vm_node = vm_parser.parse_string(string, vm_parser.p_program, "Program")
+
+        self.assertTrue(vm_flg)
+        self.assertEqual(node.print_tree(detail_flg=True), vm_node.print_tree(detail_flg=True))
+        self.assertEqual(parser.get_parse_stats(), vm_parser.get_parse_stats())
+
+    def test_failure(self):
+        # 解析失敗時の最大到達位置も同じになること
+        string = u"r'aaaa:I "
+        parser = ExPegParser()
+        vm_parser = ExPegParser()
+        vm_parser.use_vm = True
+        flg, node = parser.parse_string(string, parser.p_regularexp, "RegularExp")
+        vm_flg, vm_node = vm_parser.parse_string(string, vm_parser.p_regularexp, "RegularExp")
+
+        self.assertFalse(vm_flg)
+        self.assertTrue(vm_node.is_failure())
+        self.assertEqual((flg, node.get_str()), (vm_flg, vm_node.get_str()))
+
+    def test_deep_nesting(self):
+        # 再帰の上限を超える深さの入れ子を解析し、構文木を処理できること
+        depth = 1000
+        string = "A <- " + "(" * depth + "'a'" + ")" * depth + "\nB <- 'b'\n"
+        parser = ExPegParser()
+        parser.use_vm = True
+        flg, node = parser.parse_string(string, parser.p_expeg, "ExPeg")
+
+        self.assertTrue(flg)
+        self.assertEqual(node.get_str(), string)
+        self.assertEqual(len(node.search_node("Primary")), 2)
+        primaries = node.search_node("Primary", True)
+        self.assertEqual(len(primaries), depth + 2)
+        parent = primaries[-2].parent
+        while parent.type != "Primary":
+            parent = parent.parent
+        self.assertIs(parent, primaries[-3])
+
+        tree_str = node.print_tree(node_list=["Primary"])
+        self.assertEqual(len(tree_str.splitlines()), depth + 2)
+
+        newtree = reconstruct_tree(node, ["Primary"])
+        self.assertEqual(newtree.children[0].get_str(), string[5:-9])
+
+        preorder = []
+        postorder = []
+        preorder_travel(node, lambda n: preorder.append(n))
+        postorder_travel(node, lambda n: postorder.append(n))
+        self.assertIs(preorder[0], node)
+        self.assertIs(postorder[-1], node)
+        self.assertEqual(len(preorder), len(postorder))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+from tacparser import Parser
+import regex
+
+
+class Anchor(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self.def_dict = {"Main": self.p_main,
+                         "Item": self.p_item,
+                         "Word": self.p_word,
+                         "Head": self.p_head,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # # 正規表現は照合位置を文字列の先頭とみなして照合する (行頭 ^、単語境界 \b、後読み)
+        # Main <- ( Item Spacing? )+ _EOF
+        return self._seq(self._rpt(self._seq(self._p(self.p_item, "Item"),
+                                             self._opt(self._p(self.p_spacing, "Spacing"))
+                                             ), 1),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_item(self):
+        # Item <- Word Head / Word
+        return self._sel(self._seq(self._p(self.p_word, "Word"),
+                                   self._p(self.p_head, "Head")
+                                   ),
+                         self._p(self.p_word, "Word"),
+                         first=('abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    _reg_p_word0 = regex.compile("[a-z]+", regex.M)
+
+    def p_word(self):
+        # Word <- r"[a-z]+"
+        return self._r(self._reg_p_word0)
+
+    _reg_p_head0 = regex.compile("^[A-Z]", regex.M)
+
+    _reg_p_head1 = regex.compile("\\b[0-9]+", regex.M)
+
+    _reg_p_head2 = regex.compile("(?<![a-z])-[a-z]", regex.M)
+
+    def p_head(self):
+        # Head <- r"^[A-Z]" / r"\b[0-9]+" / r"(?<![a-z])-[a-z]"
+        return self._sel(self._r(self._reg_p_head0),
+                         self._r(self._reg_p_head1),
+                         self._r(self._reg_p_head2),
+                         first=('ABCDEFGHIJKLMNOPQRSTUVWXYZ', None, None)
+                         )
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._r(self._reg_p_spacing0)
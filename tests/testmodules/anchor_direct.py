@@ -0,0 +1,517 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+from tacparser.reader import bounded_pattern
+import regex
+
+
+class AnchorDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self._rule_ids = {"Item": 0,
+                          "Spacing": 1,
+                          "_EOF": 2,
+                          "Word": 3,
+                          "Head": 4}
+        self.def_dict = {"Main": self.p_main,
+                         "Item": self.p_item,
+                         "Word": self.p_word,
+                         "Head": self.p_head,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # # 正規表現は照合位置を文字列の先頭とみなして照合する (行頭 ^、単語境界 \b、後読み)
+        # Main <- ( Item Spacing? )+ _EOF
+        return self._direct(self.d_main, self.v_main)
+
+    def d_main(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        i2 = 0
+        p2 = pos
+        n2 = len(nodes)
+        while True:
+            q2 = pos
+            m2 = len(nodes)
+            p3 = pos
+            n3 = len(nodes)
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_item(pos)
+                    if e >= 0:
+                        res = self._direct_node("Item", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+            if not ok:
+                break
+            if pos == q2:
+                del nodes[m2:]
+                break
+            i2 += 1
+        ok = i2 >= 1
+        if not ok:
+            pos = p2
+            del nodes[n2:]
+        if ok:
+            successes, failures = tables[2]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_main(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        i2 = 0
+        p2 = pos
+        while True:
+            q2 = pos
+            p3 = pos
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_item(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if not ok:
+                pos = p3
+            if not ok:
+                break
+            if pos == q2:
+                break
+            i2 += 1
+        ok = i2 >= 1
+        if not ok:
+            pos = p2
+        if ok:
+            successes, failures = tables[2]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_item(self):
+        # Item <- Word Head / Word
+        return self._direct(self.d_item, self.v_item)
+
+    def d_item(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_word(pos)
+                    if e >= 0:
+                        res = self._direct_node("Word", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[4]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_head(pos)
+                        if e >= 0:
+                            res = self._direct_node("Head", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_word(pos)
+                    if e >= 0:
+                        res = self._direct_node("Word", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_item(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_word(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[4]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_head(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_word(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_word0 = regex.compile("[a-z]+", regex.M)
+
+    def p_word(self):
+        # Word <- r"[a-z]+"
+        return self._direct(self.d_word, self.v_word)
+
+    def d_word(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_word0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_word(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_word0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_head0 = bounded_pattern(regex.compile("^[A-Z]", regex.M))
+
+    _reg_p_head1 = bounded_pattern(regex.compile("\\b[0-9]+", regex.M))
+
+    _reg_p_head2 = bounded_pattern(regex.compile("(?<![a-z])-[a-z]", regex.M))
+
+    def p_head(self):
+        # Head <- r"^[A-Z]" / r"\b[0-9]+" / r"(?<![a-z])-[a-z]"
+        return self._direct(self.d_head, self.v_head)
+
+    def d_head(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            m = self._reg_p_head0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            m = self._reg_p_head1.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            m = self._reg_p_head2.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_head(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            m = self._reg_p_head0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            m = self._reg_p_head1.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            m = self._reg_p_head2.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
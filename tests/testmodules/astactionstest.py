@@ -113,24 +113,23 @@ class ASTActionsTest(Parser):
     def p_morf(self):
         # MorF <- Male / Female
         return self._sel(self._p(self.p_male, "Male"),
-                         self._p(self.p_female, "Female")
+                         self._p(self.p_female, "Female"),
+                         first=('M', 'FW')
                          )
 
+    _reg_p_male0 = regex.compile('Man|Male|M')
+
     def p_male(self):
         # Male <- >>( 'Man' / 'Male' / 'M' ) >>S?
-        return self._seq(self._skip(self._sel(self._l('Man'),
-                                             self._l('Male'),
-                                             self._l('M')
-                                             )),
+        return self._seq(self._skip(self._r(self._reg_p_male0)),
                          self._skip(self._opt(self._p(self.p_s, "S")))
                          )
 
+    _reg_p_female0 = regex.compile('Woman|Female|F')
+
     def p_female(self):
         # Female <- >>( 'Woman' / 'Female' / 'F' ) >>S?
-        return self._seq(self._skip(self._sel(self._l('Woman'),
-                                             self._l('Female'),
-                                             self._l('F')
-                                             )),
+        return self._seq(self._skip(self._r(self._reg_p_female0)),
                          self._skip(self._opt(self._p(self.p_s, "S")))
                          )
 
@@ -147,7 +146,8 @@ class ASTActionsTest(Parser):
                                    self._seq(self._skip(self._l('"')),
                                              self._r(self._reg_p_literal1),
                                              self._skip(self._l('"'))
-                                             )
+                                             ),
+                                   first=("'", '"')
                                    ),
                          self._skip(self._opt(self._p(self.p_s, "S")))
                          )
@@ -0,0 +1,89 @@
+from tacparser import Parser
+import regex
+
+
+class Commit(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self.def_dict = {"Program": self.p_program,
+                         "Statement": self.p_statement,
+                         "Assign": self.p_assign,
+                         "Call": self.p_call,
+                         "Value": self.p_value,
+                         "Name": self.p_name,
+                         "Number": self.p_number,
+                         "Spacing": self.p_spacing}
+
+    def p_program(self):
+        # # 文ごとに確定し、メモを破棄する
+        # Program <- Spacing? ( Statement ~ )* _EOF
+        return self._seq(self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._rpt(self._seq(self._p(self.p_statement, "Statement"),
+                                             self._commit()
+                                             ), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_statement(self):
+        # Statement <- Assign / Call
+        return self._sel(self._p(self.p_assign, "Assign"),
+                         self._p(self.p_call, "Call"),
+                         first=('abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    def p_assign(self):
+        # Assign <- Name "=" Spacing? Value ";" Spacing?
+        return self._seq(self._p(self.p_name, "Name"),
+                         self._l("="),
+                         self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._p(self.p_value, "Value"),
+                         self._l(";"),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    def p_call(self):
+        # Call <- Name "(" Spacing? Value? ")" Spacing? ";" Spacing?
+        return self._seq(self._p(self.p_name, "Name"),
+                         self._l("("),
+                         self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._opt(self._p(self.p_value, "Value")),
+                         self._l(")"),
+                         self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._l(";"),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    def p_value(self):
+        # Value <- Number / Name
+        return self._sel(self._p(self.p_number, "Number"),
+                         self._p(self.p_name, "Name"),
+                         first=('0123456789', 'abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+" Spacing?
+        return self._seq(self._r(self._reg_p_name0),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+" Spacing?
+        return self._seq(self._r(self._reg_p_number0),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._r(self._reg_p_spacing0)
@@ -0,0 +1,1106 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class CommitDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self._rule_ids = {"Spacing": 0,
+                          "Statement": 1,
+                          "_EOF": 2,
+                          "Assign": 3,
+                          "Call": 4,
+                          "Name": 5,
+                          "Value": 6,
+                          "Number": 7}
+        self.def_dict = {"Program": self.p_program,
+                         "Statement": self.p_statement,
+                         "Assign": self.p_assign,
+                         "Call": self.p_call,
+                         "Value": self.p_value,
+                         "Name": self.p_name,
+                         "Number": self.p_number,
+                         "Spacing": self.p_spacing}
+
+    def p_program(self):
+        # # 文ごとに確定し、メモを破棄する
+        # Program <- Spacing? ( Statement ~ )* _EOF
+        return self._direct(self.d_program, self.v_program)
+
+    def d_program(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[0]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_spacing(pos)
+                if e >= 0:
+                    res = self._direct_node("Spacing", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_statement(pos)
+                        if e >= 0:
+                            res = self._direct_node("Statement", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    self._commit_memo(pos)
+                    ok = True
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[2]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_program(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[0]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_spacing(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            while True:
+                q2 = pos
+                p3 = pos
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_statement(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    self._commit_memo(pos)
+                    ok = True
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[2]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_statement(self):
+        # Statement <- Assign / Call
+        return self._direct(self.d_statement, self.v_statement)
+
+    def d_statement(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_assign(pos)
+                    if e >= 0:
+                        res = self._direct_node("Assign", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_call(pos)
+                    if e >= 0:
+                        res = self._direct_node("Call", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_statement(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_assign(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_call(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_assign(self):
+        # Assign <- Name "=" Spacing? Value ";" Spacing?
+        return self._direct(self.d_assign, self.v_assign)
+
+    def d_assign(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[5]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_name(pos)
+                if e >= 0:
+                    res = self._direct_node("Name", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            if contents.startswith("=", pos, end):
+                nodes.append(self._terminal("=", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[6]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_value(pos)
+                    if e >= 0:
+                        res = self._direct_node("Value", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            if contents.startswith(";", pos, end):
+                nodes.append(self._terminal(";", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_assign(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[5]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_name(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            if contents.startswith("=", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[6]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_value(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            if contents.startswith(";", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_call(self):
+        # Call <- Name "(" Spacing? Value? ")" Spacing? ";" Spacing?
+        return self._direct(self.d_call, self.v_call)
+
+    def d_call(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[5]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_name(pos)
+                if e >= 0:
+                    res = self._direct_node("Name", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            if contents.startswith("(", pos, end):
+                nodes.append(self._terminal("(", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[6]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_value(pos)
+                    if e >= 0:
+                        res = self._direct_node("Value", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith(")", pos, end):
+                nodes.append(self._terminal(")", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith(";", pos, end):
+                nodes.append(self._terminal(";", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_call(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[5]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_name(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            if contents.startswith("(", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[6]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_value(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith(")", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith(";", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_value(self):
+        # Value <- Number / Name
+        return self._direct(self.d_value, self.v_value)
+
+    def d_value(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '0123456789':
+            successes, failures = tables[7]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_number(pos)
+                    if e >= 0:
+                        res = self._direct_node("Number", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[5]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_name(pos)
+                    if e >= 0:
+                        res = self._direct_node("Name", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_value(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '0123456789':
+            successes, failures = tables[7]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_number(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[5]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_name(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+" Spacing?
+        return self._direct(self.d_name, self.v_name)
+
+    def d_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+" Spacing?
+        return self._direct(self.d_number, self.v_number)
+
+    def d_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
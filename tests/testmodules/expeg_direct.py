@@ -0,0 +1,9451 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class ExPegDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_expeg
+        self.toptypename = "ExPeg"
+        self._rule_ids = {"Spacing": 0,
+                          "PegComment": 1,
+                          "RootDefinition": 2,
+                          "Definition": 3,
+                          "SubDefinition": 4,
+                          "MacroDefinition": 5,
+                          "_EOF": 6,
+                          "Comment": 7,
+                          "DefinitionComment": 8,
+                          "DefinitionIdentifier": 9,
+                          "LEFTARROW": 10,
+                          "DefinitionExpression": 11,
+                          "Expression": 12,
+                          "SUB_LEFTARROW": 13,
+                          "Identifier": 14,
+                          "Selection": 15,
+                          "Sequence": 16,
+                          "SLASH": 17,
+                          "MultiSequence": 18,
+                          "SingleSequence": 19,
+                          "Prefix": 20,
+                          "AndPrefix": 21,
+                          "NotPrefix": 22,
+                          "SkipPrefix": 23,
+                          "Commit": 24,
+                          "Suffix": 25,
+                          "AMPERSAND": 26,
+                          "EXCLAMATION": 27,
+                          "MUCH_GREATER_THAN": 28,
+                          "TILDE": 29,
+                          "QuestionSuffix": 30,
+                          "StarSuffix": 31,
+                          "PlusSuffix": 32,
+                          "RepeatSuffix": 33,
+                          "Primary": 34,
+                          "QUESTION": 35,
+                          "STAR": 36,
+                          "PLUS": 37,
+                          "RepeatNum": 38,
+                          "CURL_OPEN": 39,
+                          "MinRepeat": 40,
+                          "COMMA": 41,
+                          "MaxRepeat": 42,
+                          "CURL_CLOSE": 43,
+                          "RepeatCnt": 44,
+                          "Number": 45,
+                          "RegularExp": 46,
+                          "IdentifierCall": 47,
+                          "COLON": 48,
+                          "MacroIdentifier": 49,
+                          "OPEN": 50,
+                          "CLOSE": 51,
+                          "Literal": 52,
+                          "MacroExpression": 53,
+                          "MacroSelection": 54,
+                          "MacroSequence": 55,
+                          "MacroMultiSequence": 56,
+                          "MacroSingleSequence": 57,
+                          "MacroTerm": 58,
+                          "MacroPrefix": 59,
+                          "MacroAndPrefix": 60,
+                          "MacroNotPrefix": 61,
+                          "MacroSuffix": 62,
+                          "MacroQuestionSuffix": 63,
+                          "MacroStarSuffix": 64,
+                          "MacroPlusSuffix": 65,
+                          "MacroRepeatSuffix": 66,
+                          "MacroPrimary": 67,
+                          "REGPREFIX": 68,
+                          "SingleQuotesLiteral": 69,
+                          "DoubleQuotesLiteral": 70,
+                          "RegularExpOptions": 71,
+                          "ENDOFFILE": 72,
+                          "LiteralOption": 73,
+                          "SingleQuotesLiteralContents": 74,
+                          "DoubleQuotesLiteralContents": 75,
+                          "Space": 76,
+                          "EndOfLine": 77}
+        self.def_dict = {"ExPeg": self.p_expeg,
+                         "PegComment": self.p_pegcomment,
+                         "RootDefinition": self.p_rootdefinition,
+                         "Definition": self.p_definition,
+                         "DefinitionExpression": self.p_definitionexpression,
+                         "SubDefinition": self.p_subdefinition,
+                         "DefinitionComment": self.p_definitioncomment,
+                         "DefinitionIdentifier": self.p_definitionidentifier,
+                         "Expression": self.p_expression,
+                         "Selection": self.p_selection,
+                         "Sequence": self.p_sequence,
+                         "MultiSequence": self.p_multisequence,
+                         "SingleSequence": self.p_singlesequence,
+                         "Prefix": self.p_prefix,
+                         "AndPrefix": self.p_andprefix,
+                         "NotPrefix": self.p_notprefix,
+                         "SkipPrefix": self.p_skipprefix,
+                         "Commit": self.p_commit,
+                         "Suffix": self.p_suffix,
+                         "QuestionSuffix": self.p_questionsuffix,
+                         "StarSuffix": self.p_starsuffix,
+                         "PlusSuffix": self.p_plussuffix,
+                         "RepeatSuffix": self.p_repeatsuffix,
+                         "RepeatNum": self.p_repeatnum,
+                         "MinRepeat": self.p_minrepeat,
+                         "MaxRepeat": self.p_maxrepeat,
+                         "RepeatCnt": self.p_repeatcnt,
+                         "Primary": self.p_primary,
+                         "IdentifierCall": self.p_identifiercall,
+                         "MacroDefinition": self.p_macrodefinition,
+                         "MacroExpression": self.p_macroexpression,
+                         "MacroSelection": self.p_macroselection,
+                         "MacroSequence": self.p_macrosequence,
+                         "MacroMultiSequence": self.p_macromultisequence,
+                         "MacroSingleSequence": self.p_macrosinglesequence,
+                         "MacroTerm": self.p_macroterm,
+                         "MacroPrefix": self.p_macroprefix,
+                         "MacroAndPrefix": self.p_macroandprefix,
+                         "MacroNotPrefix": self.p_macronotprefix,
+                         "MacroSuffix": self.p_macrosuffix,
+                         "MacroQuestionSuffix": self.p_macroquestionsuffix,
+                         "MacroStarSuffix": self.p_macrostarsuffix,
+                         "MacroPlusSuffix": self.p_macroplussuffix,
+                         "MacroRepeatSuffix": self.p_macrorepeatsuffix,
+                         "MacroPrimary": self.p_macroprimary,
+                         "RegularExp": self.p_regularexp,
+                         "RegularExpOptions": self.p_regularexpoptions,
+                         "Identifier": self.p_identifier,
+                         "MacroIdentifier": self.p_macroidentifier,
+                         "Literal": self.p_literal,
+                         "SingleQuotesLiteral": self.p_singlequotesliteral,
+                         "SingleQuotesLiteralContents": self.p_singlequotesliteralcontents,
+                         "DoubleQuotesLiteral": self.p_doublequotesliteral,
+                         "DoubleQuotesLiteralContents": self.p_doublequotesliteralcontents,
+                         "LiteralOption": self.p_literaloption,
+                         "Number": self.p_number,
+                         "ENDOFFILE": self.p_endoffile,
+                         "LEFTARROW": self.p_leftarrow,
+                         "SUB_LEFTARROW": self.p_sub_leftarrow,
+                         "SLASH": self.p_slash,
+                         "AMPERSAND": self.p_ampersand,
+                         "EXCLAMATION": self.p_exclamation,
+                         "MUCH_GREATER_THAN": self.p_much_greater_than,
+                         "TILDE": self.p_tilde,
+                         "QUESTION": self.p_question,
+                         "STAR": self.p_star,
+                         "PLUS": self.p_plus,
+                         "OPEN": self.p_open,
+                         "CLOSE": self.p_close,
+                         "CURL_OPEN": self.p_curl_open,
+                         "CURL_CLOSE": self.p_curl_close,
+                         "COLON": self.p_colon,
+                         "COMMA": self.p_comma,
+                         "REGPREFIX": self.p_regprefix,
+                         "Spacing": self.p_spacing,
+                         "Comment": self.p_comment,
+                         "Space": self.p_space,
+                         "EndOfLine": self.p_endofline}
+
+    def p_expeg(self):
+        # # 構文解析のルート
+        # ExPeg    <- Spacing? ( PegComment? RootDefinition )
+        #             ( PegComment / Definition / SubDefinition / MacroDefinition )+ _EOF
+        return self._direct(self.d_expeg, self.v_expeg)
+
+    def d_expeg(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[0]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_spacing(pos)
+                if e >= 0:
+                    res = self._direct_node("Spacing", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_pegcomment(pos)
+                    if e >= 0:
+                        res = self._direct_node("PegComment", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+            if ok:
+                successes, failures = tables[2]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_rootdefinition(pos)
+                        if e >= 0:
+                            res = self._direct_node("RootDefinition", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if ok:
+            i3 = 0
+            p3 = pos
+            n3 = len(nodes)
+            while True:
+                q3 = pos
+                m3 = len(nodes)
+                c4 = contents[pos] if pos < end else ""
+                ok = False
+                if not c4 or c4 in '#':
+                    successes, failures = tables[1]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_pegcomment(pos)
+                            if e >= 0:
+                                res = self._direct_node("PegComment", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok and (not c4 or c4 in '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+                    successes, failures = tables[3]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_definition(pos)
+                            if e >= 0:
+                                res = self._direct_node("Definition", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok and (not c4 or c4 in '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+                    successes, failures = tables[4]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_subdefinition(pos)
+                            if e >= 0:
+                                res = self._direct_node("SubDefinition", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok and (not c4 or c4 in '#_'):
+                    successes, failures = tables[5]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_macrodefinition(pos)
+                            if e >= 0:
+                                res = self._direct_node("MacroDefinition", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok:
+                    break
+                if pos == q3:
+                    del nodes[m3:]
+                    break
+                i3 += 1
+            ok = i3 >= 1
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if ok:
+            successes, failures = tables[6]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_expeg(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[0]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_spacing(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            p2 = pos
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_pegcomment(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+            if ok:
+                successes, failures = tables[2]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_rootdefinition(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if ok:
+            i3 = 0
+            p3 = pos
+            while True:
+                q3 = pos
+                c4 = contents[pos] if pos < end else ""
+                ok = False
+                if not c4 or c4 in '#':
+                    successes, failures = tables[1]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_pegcomment(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok and (not c4 or c4 in '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+                    successes, failures = tables[3]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_definition(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok and (not c4 or c4 in '#ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+                    successes, failures = tables[4]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_subdefinition(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok and (not c4 or c4 in '#_'):
+                    successes, failures = tables[5]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_macrodefinition(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok:
+                    break
+                if pos == q3:
+                    break
+                i3 += 1
+            ok = i3 >= 1
+            if not ok:
+                pos = p3
+        if ok:
+            successes, failures = tables[6]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_pegcomment(self):
+        # # PEGファイル内のコメント
+        # PegComment <- Comment+ Spacing
+        return self._direct(self.d_pegcomment, self.v_pegcomment)
+
+    def d_pegcomment(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        i2 = 0
+        p2 = pos
+        n2 = len(nodes)
+        while True:
+            q2 = pos
+            m2 = len(nodes)
+            successes, failures = tables[7]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_comment(pos)
+                    if e >= 0:
+                        res = self._direct_node("Comment", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if not ok:
+                break
+            if pos == q2:
+                del nodes[m2:]
+                break
+            i2 += 1
+        ok = i2 >= 1
+        if not ok:
+            pos = p2
+            del nodes[n2:]
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_pegcomment(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        i2 = 0
+        p2 = pos
+        while True:
+            q2 = pos
+            successes, failures = tables[7]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_comment(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if not ok:
+                break
+            if pos == q2:
+                break
+            i2 += 1
+        ok = i2 >= 1
+        if not ok:
+            pos = p2
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_rootdefinition(self):
+        # # RootDefinition : 構文全体の定義、文法は通常の定義と同じ
+        # RootDefinition <- Definition
+        return self._direct(self.d_rootdefinition, self.v_rootdefinition)
+
+    def d_rootdefinition(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[3]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_definition(pos)
+                if e >= 0:
+                    res = self._direct_node("Definition", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_rootdefinition(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[3]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_definition(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_definition(self):
+        # # Definition : １つの構文規則
+        # #   DefinitionComment : 構文規則の直前に書かれたコメント
+        # #   DefinitionIdentifier : 構文規則名, PEGの規則に加えてパラメータの受け取りを許可
+        # Definition <- DefinitionComment? DefinitionIdentifier Spacing? LEFTARROW DefinitionExpression
+        return self._direct(self.d_definition, self.v_definition)
+
+    def d_definition(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[8]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_definitioncomment(pos)
+                if e >= 0:
+                    res = self._direct_node("DefinitionComment", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[9]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_definitionidentifier(pos)
+                    if e >= 0:
+                        res = self._direct_node("DefinitionIdentifier", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[10]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_leftarrow(pos)
+                    if e >= 0:
+                        res = self._direct_node("LEFTARROW", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[11]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_definitionexpression(pos)
+                    if e >= 0:
+                        res = self._direct_node("DefinitionExpression", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_definition(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[8]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_definitioncomment(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[9]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_definitionidentifier(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[10]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_leftarrow(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[11]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_definitionexpression(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_definitionexpression(self):
+        # DefinitionExpression <- Expression
+        return self._direct(self.d_definitionexpression, self.v_definitionexpression)
+
+    def d_definitionexpression(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[12]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_expression(pos)
+                if e >= 0:
+                    res = self._direct_node("Expression", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_definitionexpression(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[12]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_expression(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_subdefinition(self):
+        # # SubDefinition : 多重解析のための１つの構文規則
+        # #   （多重解析の例）
+        # #   A <- B
+        # #   A <-- C
+        # #     上記のように同名の規則を記載できる。この時、１度目の解析は A <- B で行い、
+        # #     一度ASTを作成したのち、Aで取得した文字列を再度 A <-- C で解析してASTを再作成する。
+        # #     再帰呼び出しがあった場合は、それぞれ１回目、２回目の規則を用いる。
+        # #     また、多重解析はファイルの上部に書かれた各SubDefinitionから順に適用する。
+        # SubDefinition <- DefinitionComment? DefinitionIdentifier Spacing? SUB_LEFTARROW DefinitionExpression
+        return self._direct(self.d_subdefinition, self.v_subdefinition)
+
+    def d_subdefinition(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[8]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_definitioncomment(pos)
+                if e >= 0:
+                    res = self._direct_node("DefinitionComment", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[9]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_definitionidentifier(pos)
+                    if e >= 0:
+                        res = self._direct_node("DefinitionIdentifier", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[13]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_sub_leftarrow(pos)
+                    if e >= 0:
+                        res = self._direct_node("SUB_LEFTARROW", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[11]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_definitionexpression(pos)
+                    if e >= 0:
+                        res = self._direct_node("DefinitionExpression", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_subdefinition(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[8]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_definitioncomment(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[9]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_definitionidentifier(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[13]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_sub_leftarrow(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[11]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_definitionexpression(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_definitioncomment(self):
+        # # 構文規則のコメント
+        # DefinitionComment <- Comment+
+        return self._direct(self.d_definitioncomment, self.v_definitioncomment)
+
+    def d_definitioncomment(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        i1 = 0
+        p1 = pos
+        n1 = len(nodes)
+        while True:
+            q1 = pos
+            m1 = len(nodes)
+            successes, failures = tables[7]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_comment(pos)
+                    if e >= 0:
+                        res = self._direct_node("Comment", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                del nodes[m1:]
+                break
+            i1 += 1
+        ok = i1 >= 1
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_definitioncomment(self, pos):
+        tables = self._memo_tables
+        i1 = 0
+        p1 = pos
+        while True:
+            q1 = pos
+            successes, failures = tables[7]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_comment(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                break
+            i1 += 1
+        ok = i1 >= 1
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_definitionidentifier(self):
+        # # DefinitionIdentifier <- Identifier ParameterList / Identifier
+        # # ParameterList <- COLON OPEN Parameter ( COMMA Parameter )* CLOSE
+        # # Parameter <- COMMERCIAL_AT ParameterName
+        # DefinitionIdentifier <- Identifier
+        return self._direct(self.d_definitionidentifier, self.v_definitionidentifier)
+
+    def d_definitionidentifier(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[14]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_identifier(pos)
+                if e >= 0:
+                    res = self._direct_node("Identifier", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_definitionidentifier(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[14]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_identifier(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_expression(self):
+        # # Expression : 構文規則の本体
+        # Expression <- Selection / Sequence
+        return self._direct(self.d_expression, self.v_expression)
+
+    def d_expression(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~':
+            successes, failures = tables[15]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_selection(pos)
+                    if e >= 0:
+                        res = self._direct_node("Selection", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~'):
+            successes, failures = tables[16]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_sequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("Sequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_expression(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~':
+            successes, failures = tables[15]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_selection(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~'):
+            successes, failures = tables[16]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_sequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_selection(self):
+        # Selection <- Sequence (SLASH Sequence)+
+        return self._direct(self.d_selection, self.v_selection)
+
+    def d_selection(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[16]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_sequence(pos)
+                if e >= 0:
+                    res = self._direct_node("Sequence", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            n2 = len(nodes)
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                successes, failures = tables[17]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_slash(pos)
+                        if e >= 0:
+                            res = self._direct_node("SLASH", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    successes, failures = tables[16]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_sequence(pos)
+                            if e >= 0:
+                                res = self._direct_node("Sequence", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_selection(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[16]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_sequence(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            while True:
+                q2 = pos
+                p3 = pos
+                successes, failures = tables[17]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_slash(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    successes, failures = tables[16]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_sequence(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_sequence(self):
+        # Sequence   <- MultiSequence / SingleSequence
+        return self._direct(self.d_sequence, self.v_sequence)
+
+    def d_sequence(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~':
+            successes, failures = tables[18]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_multisequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("MultiSequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~'):
+            successes, failures = tables[19]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_singlesequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("SingleSequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_sequence(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~':
+            successes, failures = tables[18]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_multisequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(>ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz~'):
+            successes, failures = tables[19]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_singlesequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_multisequence(self):
+        # MultiSequence <- Prefix Prefix+
+        return self._direct(self.d_multisequence, self.v_multisequence)
+
+    def d_multisequence(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[20]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_prefix(pos)
+                if e >= 0:
+                    res = self._direct_node("Prefix", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            n2 = len(nodes)
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                successes, failures = tables[20]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_prefix(pos)
+                        if e >= 0:
+                            res = self._direct_node("Prefix", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_multisequence(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[20]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_prefix(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            while True:
+                q2 = pos
+                successes, failures = tables[20]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_prefix(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_singlesequence(self):
+        # SingleSequence <- Prefix
+        return self._direct(self.d_singlesequence, self.v_singlesequence)
+
+    def d_singlesequence(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[20]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_prefix(pos)
+                if e >= 0:
+                    res = self._direct_node("Prefix", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_singlesequence(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[20]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_prefix(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_prefix(self):
+        # # Prefix : 読み取り方法の表現
+        # #   Andprefix : 先読み &Xxxxx
+        # #   NotPrefix : 否定先読み !Xxxxx
+        # #   Suffix : 通常の読み取り
+        # #   (追加構文)
+        # #   SkipPrefix : 読み飛ばし >>Xxxxx
+        # #                通常の読み取りと同じだが、最後の解析木にノードを登録しない。
+        # #                （読み飛ばしの中ではノードを作成せず、呼び出した規則のメモには終了位置のみ登録する）
+        # #   Commit : 確定 ~
+        # #            文字列を読み取らずに成功し、現在位置より前のメモを破棄する。
+        # #            例) Statements <- ( Statement ~ )*
+        # #            以降、確定した位置より前に戻って解析する場合は、規則を再度解析する。
+        # Prefix    <- AndPrefix / NotPrefix / SkipPrefix / Commit / Suffix
+        return self._direct(self.d_prefix, self.v_prefix)
+
+    def d_prefix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '&':
+            successes, failures = tables[21]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_andprefix(pos)
+                    if e >= 0:
+                        res = self._direct_node("AndPrefix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!'):
+            successes, failures = tables[22]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_notprefix(pos)
+                    if e >= 0:
+                        res = self._direct_node("NotPrefix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '>'):
+            successes, failures = tables[23]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_skipprefix(pos)
+                    if e >= 0:
+                        res = self._direct_node("SkipPrefix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '~'):
+            successes, failures = tables[24]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_commit(pos)
+                    if e >= 0:
+                        res = self._direct_node("Commit", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[25]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_suffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("Suffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_prefix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '&':
+            successes, failures = tables[21]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_andprefix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!'):
+            successes, failures = tables[22]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_notprefix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '>'):
+            successes, failures = tables[23]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_skipprefix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '~'):
+            successes, failures = tables[24]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_commit(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[25]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_suffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_andprefix(self):
+        # AndPrefix <- AMPERSAND Suffix
+        return self._direct(self.d_andprefix, self.v_andprefix)
+
+    def d_andprefix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[26]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_ampersand(pos)
+                if e >= 0:
+                    res = self._direct_node("AMPERSAND", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_suffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("Suffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_andprefix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[26]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_ampersand(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_suffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_notprefix(self):
+        # NotPrefix <- EXCLAMATION Suffix
+        return self._direct(self.d_notprefix, self.v_notprefix)
+
+    def d_notprefix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[27]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_exclamation(pos)
+                if e >= 0:
+                    res = self._direct_node("EXCLAMATION", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_suffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("Suffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_notprefix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[27]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_exclamation(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_suffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_skipprefix(self):
+        # SkipPrefix <- MUCH_GREATER_THAN Suffix
+        return self._direct(self.d_skipprefix, self.v_skipprefix)
+
+    def d_skipprefix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[28]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_much_greater_than(pos)
+                if e >= 0:
+                    res = self._direct_node("MUCH_GREATER_THAN", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_suffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("Suffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_skipprefix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[28]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_much_greater_than(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[25]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_suffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_commit(self):
+        # Commit <- TILDE
+        return self._direct(self.d_commit, self.v_commit)
+
+    def d_commit(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[29]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_tilde(pos)
+                if e >= 0:
+                    res = self._direct_node("TILDE", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_commit(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[29]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_tilde(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_suffix(self):
+        # # Suffix:: 読み込み回数に関する表現
+        # #   QuestionSuffix : 省略可能, :: Xxxxx?
+        # #   StarSuffix : ゼロ個以上の繰り返し :: Xxxxx*
+        # #   PlusSuffix : １回以上の繰り返し :: Xxxxx+
+        # #   Primary : 繰り返しなし
+        # #   (追加構文)
+        # #   RepeatSuffix : n回繰り返し :: Xxxxx{n}
+        # #                  n回以上m回以下の繰り返し :: Xxxxx{n,m}
+        # Suffix    <- QuestionSuffix / StarSuffix / PlusSuffix / RepeatSuffix / Primary
+        return self._direct(self.d_suffix, self.v_suffix)
+
+    def d_suffix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz':
+            successes, failures = tables[30]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_questionsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("QuestionSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[31]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_starsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("StarSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[32]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_plussuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("PlusSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[33]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_repeatsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("RepeatSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[34]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_primary(pos)
+                    if e >= 0:
+                        res = self._direct_node("Primary", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_suffix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz':
+            successes, failures = tables[30]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_questionsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[31]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_starsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[32]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_plussuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[33]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_repeatsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[34]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_primary(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_questionsuffix(self):
+        # QuestionSuffix <- Primary QUESTION
+        return self._direct(self.d_questionsuffix, self.v_questionsuffix)
+
+    def d_questionsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[34]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_primary(pos)
+                if e >= 0:
+                    res = self._direct_node("Primary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[35]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_question(pos)
+                    if e >= 0:
+                        res = self._direct_node("QUESTION", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_questionsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[34]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_primary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[35]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_question(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_starsuffix(self):
+        # StarSuffix <- Primary STAR
+        return self._direct(self.d_starsuffix, self.v_starsuffix)
+
+    def d_starsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[34]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_primary(pos)
+                if e >= 0:
+                    res = self._direct_node("Primary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[36]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_star(pos)
+                    if e >= 0:
+                        res = self._direct_node("STAR", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_starsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[34]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_primary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[36]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_star(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_plussuffix(self):
+        # PlusSuffix <- Primary PLUS
+        return self._direct(self.d_plussuffix, self.v_plussuffix)
+
+    def d_plussuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[34]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_primary(pos)
+                if e >= 0:
+                    res = self._direct_node("Primary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[37]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_plus(pos)
+                    if e >= 0:
+                        res = self._direct_node("PLUS", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_plussuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[34]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_primary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[37]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_plus(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_repeatsuffix(self):
+        # RepeatSuffix <- Primary RepeatNum
+        return self._direct(self.d_repeatsuffix, self.v_repeatsuffix)
+
+    def d_repeatsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[34]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_primary(pos)
+                if e >= 0:
+                    res = self._direct_node("Primary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[38]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_repeatnum(pos)
+                    if e >= 0:
+                        res = self._direct_node("RepeatNum", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_repeatsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[34]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_primary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[38]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_repeatnum(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_repeatnum(self):
+        # RepeatNum <- CURL_OPEN MinRepeat COMMA MaxRepeat CURL_CLOSE
+        #            / CURL_OPEN RepeatCnt CURL_CLOSE
+        return self._direct(self.d_repeatnum, self.v_repeatnum)
+
+    def d_repeatnum(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '{':
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[39]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_curl_open(pos)
+                    if e >= 0:
+                        res = self._direct_node("CURL_OPEN", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[40]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_minrepeat(pos)
+                        if e >= 0:
+                            res = self._direct_node("MinRepeat", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[41]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_comma(pos)
+                        if e >= 0:
+                            res = self._direct_node("COMMA", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[42]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_maxrepeat(pos)
+                        if e >= 0:
+                            res = self._direct_node("MaxRepeat", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[43]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_curl_close(pos)
+                        if e >= 0:
+                            res = self._direct_node("CURL_CLOSE", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '{'):
+            p3 = pos
+            n3 = len(nodes)
+            successes, failures = tables[39]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_curl_open(pos)
+                    if e >= 0:
+                        res = self._direct_node("CURL_OPEN", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[44]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_repeatcnt(pos)
+                        if e >= 0:
+                            res = self._direct_node("RepeatCnt", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[43]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_curl_close(pos)
+                        if e >= 0:
+                            res = self._direct_node("CURL_CLOSE", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_repeatnum(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '{':
+            p2 = pos
+            successes, failures = tables[39]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_curl_open(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[40]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_minrepeat(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[41]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_comma(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[42]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_maxrepeat(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[43]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_curl_close(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '{'):
+            p3 = pos
+            successes, failures = tables[39]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_curl_open(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[44]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_repeatcnt(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[43]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_curl_close(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p3
+        if ok:
+            return pos
+        return -1
+
+    def p_minrepeat(self):
+        # MinRepeat <- Number
+        return self._direct(self.d_minrepeat, self.v_minrepeat)
+
+    def d_minrepeat(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[45]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_number(pos)
+                if e >= 0:
+                    res = self._direct_node("Number", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_minrepeat(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[45]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_number(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_maxrepeat(self):
+        # MaxRepeat <- Number
+        return self._direct(self.d_maxrepeat, self.v_maxrepeat)
+
+    def d_maxrepeat(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[45]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_number(pos)
+                if e >= 0:
+                    res = self._direct_node("Number", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_maxrepeat(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[45]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_number(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_repeatcnt(self):
+        # RepeatCnt <- Number
+        return self._direct(self.d_repeatcnt, self.v_repeatcnt)
+
+    def d_repeatcnt(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[45]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_number(pos)
+                if e >= 0:
+                    res = self._direct_node("Number", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_repeatcnt(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[45]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_number(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_primary(self):
+        # # Primary :: 構文解析の１単位を示す表現
+        # #   Identifier : 非終端記号
+        # #   Expression : サブ構文
+        # #   Literal : リテラル
+        # #   (追加構文)
+        # #   RegularExp : 正規表現 r"[a-z0-9]|b|c" など
+        # #   IdentifierCall : パラメータ付の規則呼び出し
+        # Primary   <- RegularExp
+        #            / IdentifierCall
+        #            / Identifier !LEFTARROW !COLON !SUB_LEFTARROW
+        #            / MacroIdentifier !LEFTARROW !COLON !SUB_LEFTARROW
+        #            / OPEN Expression CLOSE
+        #            / Literal
+        return self._direct(self.d_primary, self.v_primary)
+
+    def d_primary(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'r':
+            successes, failures = tables[46]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_regularexp(pos)
+                    if e >= 0:
+                        res = self._direct_node("RegularExp", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[47]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_identifiercall(pos)
+                    if e >= 0:
+                        res = self._direct_node("IdentifierCall", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[14]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_identifier(pos)
+                    if e >= 0:
+                        res = self._direct_node("Identifier", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                p3 = pos
+                successes, failures = tables[10]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p3
+                ok = not ok
+            if ok:
+                p4 = pos
+                successes, failures = tables[48]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_colon(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p4
+                ok = not ok
+            if ok:
+                p5 = pos
+                successes, failures = tables[13]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_sub_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p5
+                ok = not ok
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '_'):
+            p6 = pos
+            n6 = len(nodes)
+            successes, failures = tables[49]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroidentifier(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroIdentifier", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                p7 = pos
+                successes, failures = tables[10]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p7
+                ok = not ok
+            if ok:
+                p8 = pos
+                successes, failures = tables[48]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_colon(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p8
+                ok = not ok
+            if ok:
+                p9 = pos
+                successes, failures = tables[13]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_sub_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p9
+                ok = not ok
+            if not ok:
+                pos = p6
+                del nodes[n6:]
+        if not ok and (not c1 or c1 in '('):
+            p10 = pos
+            n10 = len(nodes)
+            successes, failures = tables[50]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_open(pos)
+                    if e >= 0:
+                        res = self._direct_node("OPEN", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[12]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_expression(pos)
+                        if e >= 0:
+                            res = self._direct_node("Expression", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[51]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_close(pos)
+                        if e >= 0:
+                            res = self._direct_node("CLOSE", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p10
+                del nodes[n10:]
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[52]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_literal(pos)
+                    if e >= 0:
+                        res = self._direct_node("Literal", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_primary(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'r':
+            successes, failures = tables[46]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_regularexp(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[47]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_identifiercall(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'):
+            p2 = pos
+            successes, failures = tables[14]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_identifier(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                p3 = pos
+                successes, failures = tables[10]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p3
+                ok = not ok
+            if ok:
+                p4 = pos
+                successes, failures = tables[48]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_colon(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p4
+                ok = not ok
+            if ok:
+                p5 = pos
+                successes, failures = tables[13]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_sub_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p5
+                ok = not ok
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '_'):
+            p6 = pos
+            successes, failures = tables[49]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroidentifier(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                p7 = pos
+                successes, failures = tables[10]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p7
+                ok = not ok
+            if ok:
+                p8 = pos
+                successes, failures = tables[48]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_colon(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p8
+                ok = not ok
+            if ok:
+                p9 = pos
+                successes, failures = tables[13]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_sub_leftarrow(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                pos = p9
+                ok = not ok
+            if not ok:
+                pos = p6
+        if not ok and (not c1 or c1 in '('):
+            p10 = pos
+            successes, failures = tables[50]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_open(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[12]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_expression(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[51]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_close(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p10
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[52]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_literal(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_identifiercall(self):
+        # # IdentifierCall : パラメータ付の規則呼び出し
+        # #   例)
+        # #   HtmlStartTag:(@p) <- "<" @p Spacing HtmlTagAttributes ">"
+        # #   HtmlLinkTag <- HtmlStartTag:( "A" / "a" ) HtmlContents HtmlEndTag:( "A" / "a" )
+        # IdentifierCall <- Identifier COLON OPEN Expression ( COMMA Expression )* CLOSE
+        return self._direct(self.d_identifiercall, self.v_identifiercall)
+
+    def d_identifiercall(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[14]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_identifier(pos)
+                if e >= 0:
+                    res = self._direct_node("Identifier", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[48]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_colon(pos)
+                    if e >= 0:
+                        res = self._direct_node("COLON", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[50]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_open(pos)
+                    if e >= 0:
+                        res = self._direct_node("OPEN", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[12]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_expression(pos)
+                    if e >= 0:
+                        res = self._direct_node("Expression", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                successes, failures = tables[41]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_comma(pos)
+                        if e >= 0:
+                            res = self._direct_node("COMMA", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    successes, failures = tables[12]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_expression(pos)
+                            if e >= 0:
+                                res = self._direct_node("Expression", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[51]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_close(pos)
+                    if e >= 0:
+                        res = self._direct_node("CLOSE", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_identifiercall(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[14]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_identifier(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[48]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_colon(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[50]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_open(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[12]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_expression(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            while True:
+                q2 = pos
+                p3 = pos
+                successes, failures = tables[41]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_comma(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    successes, failures = tables[12]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_expression(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[51]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_close(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrodefinition(self):
+        # # Macro（追加構文） : マクロ
+        # #   構文解析時にノードを作成せず、呼び出した規則の一部として展開する。
+        # #   定義には他のマクロおよび規則を利用できないが、連続、選択、suffixおよびprefixは利用できる。
+        # MacroDefinition <- DefinitionComment? MacroIdentifier Spacing? LEFTARROW MacroExpression
+        return self._direct(self.d_macrodefinition, self.v_macrodefinition)
+
+    def d_macrodefinition(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[8]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_definitioncomment(pos)
+                if e >= 0:
+                    res = self._direct_node("DefinitionComment", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[49]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroidentifier(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroIdentifier", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[10]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_leftarrow(pos)
+                    if e >= 0:
+                        res = self._direct_node("LEFTARROW", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[53]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroexpression(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroExpression", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrodefinition(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[8]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_definitioncomment(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            successes, failures = tables[49]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroidentifier(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[10]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_leftarrow(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[53]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroexpression(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macroexpression(self):
+        # MacroExpression     <- MacroSelection / MacroSequence
+        return self._direct(self.d_macroexpression, self.v_macroexpression)
+
+    def d_macroexpression(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(r':
+            successes, failures = tables[54]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroselection(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSelection", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(r'):
+            successes, failures = tables[55]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrosequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroexpression(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(r':
+            successes, failures = tables[54]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroselection(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(r'):
+            successes, failures = tables[55]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrosequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macroselection(self):
+        # MacroSelection      <- MacroSequence ( SLASH MacroSequence )+
+        return self._direct(self.d_macroselection, self.v_macroselection)
+
+    def d_macroselection(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[55]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macrosequence(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroSequence", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            n2 = len(nodes)
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                successes, failures = tables[17]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_slash(pos)
+                        if e >= 0:
+                            res = self._direct_node("SLASH", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    successes, failures = tables[55]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_macrosequence(pos)
+                            if e >= 0:
+                                res = self._direct_node("MacroSequence", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroselection(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[55]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macrosequence(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            while True:
+                q2 = pos
+                p3 = pos
+                successes, failures = tables[17]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_slash(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    successes, failures = tables[55]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_macrosequence(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrosequence(self):
+        # MacroSequence       <- MacroMultiSequence / MacroSingleSequence
+        return self._direct(self.d_macrosequence, self.v_macrosequence)
+
+    def d_macrosequence(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(r':
+            successes, failures = tables[56]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macromultisequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroMultiSequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(r'):
+            successes, failures = tables[57]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrosinglesequence(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSingleSequence", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrosequence(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '!"&\'(r':
+            successes, failures = tables[56]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macromultisequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!"&\'(r'):
+            successes, failures = tables[57]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrosinglesequence(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macromultisequence(self):
+        # MacroMultiSequence  <- MacroTerm MacroTerm+
+        return self._direct(self.d_macromultisequence, self.v_macromultisequence)
+
+    def d_macromultisequence(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[58]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroterm(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroTerm", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            n2 = len(nodes)
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                successes, failures = tables[58]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_macroterm(pos)
+                        if e >= 0:
+                            res = self._direct_node("MacroTerm", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macromultisequence(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[58]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroterm(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            i2 = 0
+            p2 = pos
+            while True:
+                q2 = pos
+                successes, failures = tables[58]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_macroterm(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+                i2 += 1
+            ok = i2 >= 1
+            if not ok:
+                pos = p2
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrosinglesequence(self):
+        # MacroSingleSequence <- MacroTerm
+        return self._direct(self.d_macrosinglesequence, self.v_macrosinglesequence)
+
+    def d_macrosinglesequence(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[58]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroterm(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroTerm", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrosinglesequence(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[58]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroterm(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macroterm(self):
+        # MacroTerm           <- MacroPrefix
+        return self._direct(self.d_macroterm, self.v_macroterm)
+
+    def d_macroterm(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[59]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroprefix(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroPrefix", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroterm(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[59]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroprefix(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macroprefix(self):
+        # MacroPrefix         <- MacroAndPrefix / MacroNotPrefix / MacroSuffix
+        return self._direct(self.d_macroprefix, self.v_macroprefix)
+
+    def d_macroprefix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '&':
+            successes, failures = tables[60]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroandprefix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroAndPrefix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '!'):
+            successes, failures = tables[61]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macronotprefix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroNotPrefix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[62]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrosuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroprefix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '&':
+            successes, failures = tables[60]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroandprefix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '!'):
+            successes, failures = tables[61]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macronotprefix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[62]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrosuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macroandprefix(self):
+        # MacroAndPrefix      <- AMPERSAND MacroSuffix
+        return self._direct(self.d_macroandprefix, self.v_macroandprefix)
+
+    def d_macroandprefix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[26]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_ampersand(pos)
+                if e >= 0:
+                    res = self._direct_node("AMPERSAND", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[62]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrosuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroandprefix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[26]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_ampersand(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[62]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrosuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macronotprefix(self):
+        # MacroNotPrefix      <- EXCLAMATION MacroSuffix
+        return self._direct(self.d_macronotprefix, self.v_macronotprefix)
+
+    def d_macronotprefix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[27]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_exclamation(pos)
+                if e >= 0:
+                    res = self._direct_node("EXCLAMATION", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[62]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrosuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macronotprefix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[27]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_exclamation(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[62]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrosuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrosuffix(self):
+        # MacroSuffix         <- MacroQuestionSuffix
+        #                      / MacroStarSuffix
+        #                      / MacroPlusSuffix
+        #                      / MacroRepeatSuffix
+        #                      / MacroPrimary
+        return self._direct(self.d_macrosuffix, self.v_macrosuffix)
+
+    def d_macrosuffix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '"\'(r':
+            successes, failures = tables[63]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroquestionsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroQuestionSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[64]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrostarsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroStarSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[65]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroplussuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroPlusSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[66]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macrorepeatsuffix(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroRepeatSuffix", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[67]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_macroprimary(pos)
+                    if e >= 0:
+                        res = self._direct_node("MacroPrimary", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrosuffix(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '"\'(r':
+            successes, failures = tables[63]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroquestionsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[64]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrostarsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[65]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroplussuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[66]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macrorepeatsuffix(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\'(r'):
+            successes, failures = tables[67]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_macroprimary(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_macroquestionsuffix(self):
+        # MacroQuestionSuffix <- MacroPrimary QUESTION
+        return self._direct(self.d_macroquestionsuffix, self.v_macroquestionsuffix)
+
+    def d_macroquestionsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[67]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroprimary(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroPrimary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[35]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_question(pos)
+                    if e >= 0:
+                        res = self._direct_node("QUESTION", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroquestionsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[67]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroprimary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[35]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_question(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrostarsuffix(self):
+        # MacroStarSuffix     <- MacroPrimary STAR
+        return self._direct(self.d_macrostarsuffix, self.v_macrostarsuffix)
+
+    def d_macrostarsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[67]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroprimary(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroPrimary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[36]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_star(pos)
+                    if e >= 0:
+                        res = self._direct_node("STAR", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrostarsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[67]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroprimary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[36]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_star(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macroplussuffix(self):
+        # MacroPlusSuffix     <- MacroPrimary PLUS
+        return self._direct(self.d_macroplussuffix, self.v_macroplussuffix)
+
+    def d_macroplussuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[67]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroprimary(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroPrimary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[37]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_plus(pos)
+                    if e >= 0:
+                        res = self._direct_node("PLUS", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroplussuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[67]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroprimary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[37]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_plus(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macrorepeatsuffix(self):
+        # MacroRepeatSuffix   <- MacroPrimary RepeatNum
+        return self._direct(self.d_macrorepeatsuffix, self.v_macrorepeatsuffix)
+
+    def d_macrorepeatsuffix(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[67]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_macroprimary(pos)
+                if e >= 0:
+                    res = self._direct_node("MacroPrimary", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[38]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_repeatnum(pos)
+                    if e >= 0:
+                        res = self._direct_node("RepeatNum", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macrorepeatsuffix(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[67]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_macroprimary(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[38]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_repeatnum(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_macroprimary(self):
+        # MacroPrimary        <- RegularExp
+        #                      / OPEN MacroExpression CLOSE
+        #                      / Literal
+        return self._direct(self.d_macroprimary, self.v_macroprimary)
+
+    def d_macroprimary(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'r':
+            successes, failures = tables[46]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_regularexp(pos)
+                    if e >= 0:
+                        res = self._direct_node("RegularExp", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '('):
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[50]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_open(pos)
+                    if e >= 0:
+                        res = self._direct_node("OPEN", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[53]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_macroexpression(pos)
+                        if e >= 0:
+                            res = self._direct_node("MacroExpression", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                successes, failures = tables[51]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_close(pos)
+                        if e >= 0:
+                            res = self._direct_node("CLOSE", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[52]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_literal(pos)
+                    if e >= 0:
+                        res = self._direct_node("Literal", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroprimary(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'r':
+            successes, failures = tables[46]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_regularexp(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '('):
+            p2 = pos
+            successes, failures = tables[50]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_open(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[53]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_macroexpression(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                successes, failures = tables[51]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_close(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[52]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_literal(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_regularexp(self):
+        # # 正規表現, r"[正規表現]" の形式で表す。
+        # RegularExp <- REGPREFIX ( SingleQuotesLiteral / DoubleQuotesLiteral ) RegularExpOptions Spacing?
+        return self._direct(self.d_regularexp, self.v_regularexp)
+
+    def d_regularexp(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[68]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_regprefix(pos)
+                if e >= 0:
+                    res = self._direct_node("REGPREFIX", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            c2 = contents[pos] if pos < end else ""
+            ok = False
+            if not c2 or c2 in "'":
+                successes, failures = tables[69]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_singlequotesliteral(pos)
+                        if e >= 0:
+                            res = self._direct_node("SingleQuotesLiteral", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok and (not c2 or c2 in '"'):
+                successes, failures = tables[70]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_doublequotesliteral(pos)
+                        if e >= 0:
+                            res = self._direct_node("DoubleQuotesLiteral", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+        if ok:
+            successes, failures = tables[71]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_regularexpoptions(pos)
+                    if e >= 0:
+                        res = self._direct_node("RegularExpOptions", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_regularexp(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[68]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_regprefix(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            c2 = contents[pos] if pos < end else ""
+            ok = False
+            if not c2 or c2 in "'":
+                successes, failures = tables[69]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_singlequotesliteral(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok and (not c2 or c2 in '"'):
+                successes, failures = tables[70]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_doublequotesliteral(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+        if ok:
+            successes, failures = tables[71]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_regularexpoptions(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_regularexpoptions0 = regex.compile("(m|X|A|I|S)+", regex.M)
+
+    def p_regularexpoptions(self):
+        # # 正規表現のオプション :
+        # #    デフォルトでは、マルチライン re.M を適用しており、
+        # #    '^', '$' はそれぞれ行頭と改行直前にマッチする。
+        # #      m : マルチラインを解除
+        # #           '^', '$' を行頭、および改行直前にマッチさせない。
+        # #      X : パターンの論理的なセクションを視覚的に区切り、コメントの入力を可能にする。
+        # #          Number_A <- r"\d +  # the integral part
+        # #                        \.    # the decimal point
+        # #                        \d *  # some fractional digits"
+        # #          Number_B <- r"\d+\.\d*"
+        # #      A : \w、\W、\b、\B、\d、\D、\s、および \S において、ASCII 文字のみでマッチングを行う。
+        # #      I : 英大文字・小文字を区別せずにマッチングを行う。
+        # #          [A-Z] のような表現は小文字ともマッチします。
+        # #          これは現在のロケールの影響を受けず、Unicode 文字に対しても動作します。
+        # #      S : 特殊文字 '.' を、改行を含む任意の文字と、とにかくマッチさせます。
+        # #          このフラグがなければ、 '.' は、改行 以外の 任意の文字とマッチします。
+        # RegularExpOptions <- ( COLON r"(m|X|A|I|S)+" )?
+        return self._direct(self.d_regularexpoptions, self.v_regularexpoptions)
+
+    def d_regularexpoptions(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[48]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_colon(pos)
+                if e >= 0:
+                    res = self._direct_node("COLON", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            m = self._reg_p_regularexpoptions0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        ok = True
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_regularexpoptions(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[48]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_colon(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            m = self._reg_p_regularexpoptions0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        ok = True
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_identifier0 = regex.compile("[a-zA-Z][a-zA-Z0-9_]*", regex.M)
+
+    def p_identifier(self):
+        # Identifier <- ( r"[a-zA-Z][a-zA-Z0-9_]*" / ENDOFFILE ) Spacing?
+        return self._direct(self.d_identifier, self.v_identifier)
+
+    def d_identifier(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        c2 = contents[pos] if pos < end else ""
+        ok = False
+        if not c2 or c2 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz':
+            m = self._reg_p_identifier0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c2 or c2 in '_'):
+            successes, failures = tables[72]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_endoffile(pos)
+                    if e >= 0:
+                        res = self._direct_node("ENDOFFILE", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_identifier(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        c2 = contents[pos] if pos < end else ""
+        ok = False
+        if not c2 or c2 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz':
+            m = self._reg_p_identifier0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c2 or c2 in '_'):
+            successes, failures = tables[72]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_endoffile(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_macroidentifier0 = regex.compile("_[A-Z][A-Z0-9_]*", regex.M)
+
+    def p_macroidentifier(self):
+        # # マクロ定義
+        # #    マクロ定義は、"_" で開始し、英大文字のみ使用可能とする。
+        # MacroIdentifier <- r"_[A-Z][A-Z0-9_]*" Spacing?
+        return self._direct(self.d_macroidentifier, self.v_macroidentifier)
+
+    def d_macroidentifier(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_macroidentifier0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_macroidentifier(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        m = self._reg_p_macroidentifier0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_literal(self):
+        # # リテラル
+        # # (追加構文)
+        # #   :I を付加することで、Case-Insensitive にする。
+        # #   ※「"hoge":I」は hoge, Hoge, hOgE 等にマッチ
+        # Literal <- ( SingleQuotesLiteral / DoubleQuotesLiteral ) LiteralOption? Spacing?
+        return self._direct(self.d_literal, self.v_literal)
+
+    def d_literal(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        c2 = contents[pos] if pos < end else ""
+        ok = False
+        if not c2 or c2 in "'":
+            successes, failures = tables[69]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_singlequotesliteral(pos)
+                    if e >= 0:
+                        res = self._direct_node("SingleQuotesLiteral", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c2 or c2 in '"'):
+            successes, failures = tables[70]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_doublequotesliteral(pos)
+                    if e >= 0:
+                        res = self._direct_node("DoubleQuotesLiteral", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[73]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_literaloption(pos)
+                    if e >= 0:
+                        res = self._direct_node("LiteralOption", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_literal(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        c2 = contents[pos] if pos < end else ""
+        ok = False
+        if not c2 or c2 in "'":
+            successes, failures = tables[69]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_singlequotesliteral(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c2 or c2 in '"'):
+            successes, failures = tables[70]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_doublequotesliteral(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[73]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_literaloption(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_singlequotesliteral(self):
+        # SingleQuotesLiteral <- "'" SingleQuotesLiteralContents "'"
+        return self._direct(self.d_singlequotesliteral, self.v_singlequotesliteral)
+
+    def d_singlequotesliteral(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith("'", pos, end):
+            nodes.append(self._terminal("'", pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[74]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_singlequotesliteralcontents(pos)
+                    if e >= 0:
+                        res = self._direct_node("SingleQuotesLiteralContents", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            if contents.startswith("'", pos, end):
+                nodes.append(self._terminal("'", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_singlequotesliteral(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith("'", pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[74]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_singlequotesliteralcontents(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            if contents.startswith("'", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_singlequotesliteralcontents0 = regex.compile("(\\\\.|[^'\\\\])*", regex.M)
+
+    def p_singlequotesliteralcontents(self):
+        # SingleQuotesLiteralContents <- r"(\\.|[^'\\])*"
+        return self._direct(self.d_singlequotesliteralcontents, self.v_singlequotesliteralcontents)
+
+    def d_singlequotesliteralcontents(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_singlequotesliteralcontents0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_singlequotesliteralcontents(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_singlequotesliteralcontents0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    def p_doublequotesliteral(self):
+        # DoubleQuotesLiteral <- '"' DoubleQuotesLiteralContents '"'
+        return self._direct(self.d_doublequotesliteral, self.v_doublequotesliteral)
+
+    def d_doublequotesliteral(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('"', pos, end):
+            nodes.append(self._terminal('"', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[75]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_doublequotesliteralcontents(pos)
+                    if e >= 0:
+                        res = self._direct_node("DoubleQuotesLiteralContents", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            if contents.startswith('"', pos, end):
+                nodes.append(self._terminal('"', pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_doublequotesliteral(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('"', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[75]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_doublequotesliteralcontents(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            if contents.startswith('"', pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_doublequotesliteralcontents0 = regex.compile('(\\\\.|[^"\\\\])*', regex.M)
+
+    def p_doublequotesliteralcontents(self):
+        # DoubleQuotesLiteralContents <- r'(\\.|[^"\\])*'
+        return self._direct(self.d_doublequotesliteralcontents, self.v_doublequotesliteralcontents)
+
+    def d_doublequotesliteralcontents(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_doublequotesliteralcontents0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_doublequotesliteralcontents(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_doublequotesliteralcontents0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    def p_literaloption(self):
+        # LiteralOption <- COLON "I"
+        return self._direct(self.d_literaloption, self.v_literaloption)
+
+    def d_literaloption(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[48]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_colon(pos)
+                if e >= 0:
+                    res = self._direct_node("COLON", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            if contents.startswith("I", pos, end):
+                nodes.append(self._terminal("I", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_literaloption(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[48]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_colon(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            if contents.startswith("I", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_number0 = regex.compile("0|[1-9][0-9]*", regex.M)
+
+    def p_number(self):
+        # # 数字
+        # Number <- r"0|[1-9][0-9]*" Spacing?
+        return self._direct(self.d_number, self.v_number)
+
+    def d_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_endoffile(self):
+        # # PEG に追加： 終端を示す記号
+        # ENDOFFILE <- '_EOF' Spacing?
+        return self._direct(self.d_endoffile, self.v_endoffile)
+
+    def d_endoffile(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('_EOF', pos, end):
+            nodes.append(self._terminal('_EOF', pos, pos + 4))
+            pos += 4
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_endoffile(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('_EOF', pos, end):
+            pos += 4
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_leftarrow(self):
+        # LEFTARROW <- '<-' Spacing?
+        return self._direct(self.d_leftarrow, self.v_leftarrow)
+
+    def d_leftarrow(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('<-', pos, end):
+            nodes.append(self._terminal('<-', pos, pos + 2))
+            pos += 2
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_leftarrow(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('<-', pos, end):
+            pos += 2
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_sub_leftarrow(self):
+        # # 追加構文：サブ解析を表現する
+        # SUB_LEFTARROW <- '<--' Spacing?
+        return self._direct(self.d_sub_leftarrow, self.v_sub_leftarrow)
+
+    def d_sub_leftarrow(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('<--', pos, end):
+            nodes.append(self._terminal('<--', pos, pos + 3))
+            pos += 3
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_sub_leftarrow(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('<--', pos, end):
+            pos += 3
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_slash(self):
+        # SLASH <- '/' Spacing?
+        return self._direct(self.d_slash, self.v_slash)
+
+    def d_slash(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('/', pos, end):
+            nodes.append(self._terminal('/', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_slash(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('/', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_ampersand(self):
+        # AMPERSAND <- '&' Spacing?
+        return self._direct(self.d_ampersand, self.v_ampersand)
+
+    def d_ampersand(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('&', pos, end):
+            nodes.append(self._terminal('&', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_ampersand(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('&', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_exclamation(self):
+        # EXCLAMATION <- '!' Spacing?
+        return self._direct(self.d_exclamation, self.v_exclamation)
+
+    def d_exclamation(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('!', pos, end):
+            nodes.append(self._terminal('!', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_exclamation(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('!', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_much_greater_than(self):
+        # MUCH_GREATER_THAN <- '>>' Spacing?
+        return self._direct(self.d_much_greater_than, self.v_much_greater_than)
+
+    def d_much_greater_than(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('>>', pos, end):
+            nodes.append(self._terminal('>>', pos, pos + 2))
+            pos += 2
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_much_greater_than(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('>>', pos, end):
+            pos += 2
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_tilde(self):
+        # TILDE <- '~' Spacing?
+        return self._direct(self.d_tilde, self.v_tilde)
+
+    def d_tilde(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('~', pos, end):
+            nodes.append(self._terminal('~', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_tilde(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('~', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_question(self):
+        # QUESTION <- '?' Spacing?
+        return self._direct(self.d_question, self.v_question)
+
+    def d_question(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('?', pos, end):
+            nodes.append(self._terminal('?', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_question(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('?', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_star(self):
+        # STAR <- '*' Spacing?
+        return self._direct(self.d_star, self.v_star)
+
+    def d_star(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('*', pos, end):
+            nodes.append(self._terminal('*', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_star(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('*', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_plus(self):
+        # PLUS <- '+' Spacing?
+        return self._direct(self.d_plus, self.v_plus)
+
+    def d_plus(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('+', pos, end):
+            nodes.append(self._terminal('+', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_plus(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('+', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_open(self):
+        # OPEN <- '(' Spacing?
+        return self._direct(self.d_open, self.v_open)
+
+    def d_open(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('(', pos, end):
+            nodes.append(self._terminal('(', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_open(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('(', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_close(self):
+        # CLOSE <- ')' Spacing?
+        return self._direct(self.d_close, self.v_close)
+
+    def d_close(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith(')', pos, end):
+            nodes.append(self._terminal(')', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_close(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith(')', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_curl_open(self):
+        # CURL_OPEN <- '{'  Spacing?
+        return self._direct(self.d_curl_open, self.v_curl_open)
+
+    def d_curl_open(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('{', pos, end):
+            nodes.append(self._terminal('{', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_curl_open(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('{', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_curl_close(self):
+        # CURL_CLOSE <- '}' Spacing?
+        return self._direct(self.d_curl_close, self.v_curl_close)
+
+    def d_curl_close(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('}', pos, end):
+            nodes.append(self._terminal('}', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_curl_close(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('}', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_colon(self):
+        # COLON <- ':' Spacing?
+        return self._direct(self.d_colon, self.v_colon)
+
+    def d_colon(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith(':', pos, end):
+            nodes.append(self._terminal(':', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_colon(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith(':', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_comma(self):
+        # COMMA <- ',' Spacing?
+        return self._direct(self.d_comma, self.v_comma)
+
+    def d_comma(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith(',', pos, end):
+            nodes.append(self._terminal(',', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_comma(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith(',', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_regprefix(self):
+        # # COMMERCIAL_AT <- '@'
+        # # DOLLAR_SIGN <- '$'
+        # # EQUAL <- '=' Spacing?
+        # REGPREFIX <- 'r'
+        return self._direct(self.d_regprefix, self.v_regprefix)
+
+    def d_regprefix(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        if contents.startswith('r', pos, end):
+            nodes.append(self._terminal('r', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_regprefix(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        if contents.startswith('r', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    def p_spacing(self):
+        # Spacing <- Space+
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        i1 = 0
+        p1 = pos
+        n1 = len(nodes)
+        while True:
+            q1 = pos
+            m1 = len(nodes)
+            successes, failures = tables[76]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_space(pos)
+                    if e >= 0:
+                        res = self._direct_node("Space", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                del nodes[m1:]
+                break
+            i1 += 1
+        ok = i1 >= 1
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        tables = self._memo_tables
+        i1 = 0
+        p1 = pos
+        while True:
+            q1 = pos
+            successes, failures = tables[76]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_space(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                break
+            i1 += 1
+        ok = i1 >= 1
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_comment0 = regex.compile("[^\\r\\n]*", regex.M)
+
+    def p_comment(self):
+        # Comment <- '#' r"[^\r\n]*" EndOfLine
+        return self._direct(self.d_comment, self.v_comment)
+
+    def d_comment(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        if contents.startswith('#', pos, end):
+            nodes.append(self._terminal('#', pos, pos + 1))
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            m = self._reg_p_comment0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[77]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_endofline(pos)
+                    if e >= 0:
+                        res = self._direct_node("EndOfLine", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_comment(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        if contents.startswith('#', pos, end):
+            pos += 1
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            m = self._reg_p_comment0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[77]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_endofline(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_space0 = regex.compile("\\t", regex.M)
+
+    def p_space(self):
+        # Space <- ' ' / r"\t" / EndOfLine
+        return self._direct(self.d_space, self.v_space)
+
+    def d_space(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in ' ':
+            if contents.startswith(' ', pos, end):
+                nodes.append(self._terminal(' ', pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '\t'):
+            m = self._reg_p_space0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            successes, failures = tables[77]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_endofline(pos)
+                    if e >= 0:
+                        res = self._direct_node("EndOfLine", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_space(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in ' ':
+            if contents.startswith(' ', pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '\t'):
+            m = self._reg_p_space0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            successes, failures = tables[77]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_endofline(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_endofline0 = regex.compile("\\r\\n|\\n|\\r", regex.M)
+
+    def p_endofline(self):
+        # EndOfLine <- r"\r\n|\n|\r"
+        return self._direct(self.d_endofline, self.v_endofline)
+
+    def d_endofline(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_endofline0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_endofline(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_endofline0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
@@ -0,0 +1,122 @@
+from tacparser import Parser
+import regex
+
+
+class First(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self.def_dict = {"Main": self.p_main,
+                         "Item": self.p_item,
+                         "Keyword": self.p_keyword,
+                         "Number": self.p_number,
+                         "Name": self.p_name,
+                         "Str": self.p_str,
+                         "Op": self.p_op,
+                         "Empty": self.p_empty,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # # 選択肢の先頭文字による絞り込み
+        # Main <- Spacing? ( Item Spacing? )* _EOF
+        return self._seq(self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._rpt(self._seq(self._p(self.p_item, "Item"),
+                                             self._opt(self._p(self.p_spacing, "Spacing"))
+                                             ), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_item(self):
+        # Item <- Keyword / Number / Name / Str / Op / Empty
+        return self._sel(self._p(self.p_keyword, "Keyword"),
+                         self._p(self.p_number, "Number"),
+                         self._p(self.p_name, "Name"),
+                         self._p(self.p_str, "Str"),
+                         self._p(self.p_op, "Op"),
+                         self._p(self.p_empty, "Empty"),
+                         first=('EIKeikİıK', '0123456789', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyzİıſK', '"\'', '()*+-/=', None)
+                         )
+
+    _reg_p_keyword0 = regex.compile("[a-z0-9_]", regex.I | regex.M)
+
+    _reg_p_keyword1 = regex.compile('[iI][fF]|[eE][lL][sS][eE]|[kKK][eE][lL][vV][iI][nN]')
+
+    def p_keyword(self):
+        # Keyword <- ( "if":I / "else":I / "kelvin":I ) !r"[a-z0-9_]":I
+        return self._seq(self._r(self._reg_p_keyword1),
+                         self._not(self._r(self._reg_p_keyword0))
+                         )
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    _reg_p_number1 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+" ( "." r"[0-9]+" )?
+        return self._seq(self._r(self._reg_p_number1),
+                         self._opt(self._seq(self._l("."),
+                                             self._r(self._reg_p_number1)
+                                             ))
+                         )
+
+    _reg_p_name0 = regex.compile("[a-z_][a-z0-9_]*", regex.I | regex.M)
+
+    def p_name(self):
+        # Name <- !Keyword r"[a-z_][a-z0-9_]*":I
+        return self._seq(self._not(self._p(self.p_keyword, "Keyword")),
+                         self._r(self._reg_p_name0)
+                         )
+
+    def p_str(self):
+        # Str <- _STR
+        return self._trm(self.t__str)
+
+    _reg_p_op0 = regex.compile("[-+*/]", regex.M)
+
+    _reg_p_op1 = regex.compile("\\(", regex.M)
+
+    _reg_p_op2 = regex.compile("\\)", regex.M)
+
+    def p_op(self):
+        # Op <- r"[-+*/]" / r"\(" / r"\)" / "==" / "="
+        return self._sel(self._r(self._reg_p_op0),
+                         self._r(self._reg_p_op1),
+                         self._r(self._reg_p_op2),
+                         self._l("=="),
+                         self._l("="),
+                         first=('*+-/', '(', ')', '=', '=')
+                         )
+
+    _reg_p_empty0 = regex.compile(';|')
+
+    def p_empty(self):
+        # Empty <- ";" / ""
+        return self._r(self._reg_p_empty0)
+
+    _reg_t__str0 = regex.compile("[^']*", regex.M)
+
+    _reg_t__str1 = regex.compile('[^"]*', regex.M)
+
+    def t__str(self):
+        # _STR <- "'" r"[^']*" "'" / '"' r'[^"]*' '"'
+        return self._sel(self._seq(self._l("'"),
+                                   self._r(self._reg_t__str0),
+                                   self._l("'")
+                                   ),
+                         self._seq(self._l('"'),
+                                   self._r(self._reg_t__str1),
+                                   self._l('"')
+                                   ),
+                         first=("'", '"')
+                         )
+
+    _reg_p_spacing0 = regex.compile("[ \\t]+|\\r?\\n", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"[ \t]+|\r?\n"
+        return self._r(self._reg_p_spacing0)
@@ -0,0 +1,1057 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class FirstDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self._rule_ids = {"Spacing": 0,
+                          "Item": 1,
+                          "_EOF": 2,
+                          "Keyword": 3,
+                          "Number": 4,
+                          "Name": 5,
+                          "Str": 6,
+                          "Op": 7,
+                          "Empty": 8}
+        self.def_dict = {"Main": self.p_main,
+                         "Item": self.p_item,
+                         "Keyword": self.p_keyword,
+                         "Number": self.p_number,
+                         "Name": self.p_name,
+                         "Str": self.p_str,
+                         "Op": self.p_op,
+                         "Empty": self.p_empty,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # # 選択肢の先頭文字による絞り込み
+        # Main <- Spacing? ( Item Spacing? )* _EOF
+        return self._direct(self.d_main, self.v_main)
+
+    def d_main(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[0]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_spacing(pos)
+                if e >= 0:
+                    res = self._direct_node("Spacing", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        ok = True
+        if ok:
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_item(pos)
+                        if e >= 0:
+                            res = self._direct_node("Item", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    successes, failures = tables[0]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_spacing(pos)
+                            if e >= 0:
+                                res = self._direct_node("Spacing", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                    ok = True
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[2]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_main(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[0]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_spacing(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        ok = True
+        if ok:
+            while True:
+                q2 = pos
+                p3 = pos
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_item(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    successes, failures = tables[0]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_spacing(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                    ok = True
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+            ok = True
+        if ok:
+            successes, failures = tables[2]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_item(self):
+        # Item <- Keyword / Number / Name / Str / Op / Empty
+        return self._direct(self.d_item, self.v_item)
+
+    def d_item(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'EIKeikİıK':
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_keyword(pos)
+                    if e >= 0:
+                        res = self._direct_node("Keyword", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '0123456789'):
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_number(pos)
+                    if e >= 0:
+                        res = self._direct_node("Number", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyzİıſK'):
+            successes, failures = tables[5]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_name(pos)
+                    if e >= 0:
+                        res = self._direct_node("Name", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[6]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_str(pos)
+                    if e >= 0:
+                        res = self._direct_node("Str", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '()*+-/='):
+            successes, failures = tables[7]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_op(pos)
+                    if e >= 0:
+                        res = self._direct_node("Op", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            successes, failures = tables[8]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_empty(pos)
+                    if e >= 0:
+                        res = self._direct_node("Empty", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_item(self, pos):
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'EIKeikİıK':
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_keyword(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '0123456789'):
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_number(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyzİıſK'):
+            successes, failures = tables[5]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_name(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '"\''):
+            successes, failures = tables[6]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_str(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '()*+-/='):
+            successes, failures = tables[7]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_op(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            successes, failures = tables[8]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_empty(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_keyword0 = regex.compile("[a-z0-9_]", regex.I | regex.M)
+
+    _reg_p_keyword1 = regex.compile('[iI][fF]|[eE][lL][sS][eE]|[kKK][eE][lL][vV][iI][nN]')
+
+    def p_keyword(self):
+        # Keyword <- ( "if":I / "else":I / "kelvin":I ) !r"[a-z0-9_]":I
+        return self._direct(self.d_keyword, self.v_keyword)
+
+    def d_keyword(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_keyword1.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            p2 = pos
+            m = self._reg_p_keyword0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            pos = p2
+            ok = not ok
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_keyword(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        p1 = pos
+        m = self._reg_p_keyword1.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            p2 = pos
+            m = self._reg_p_keyword0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            pos = p2
+            ok = not ok
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    _reg_p_number1 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+" ( "." r"[0-9]+" )?
+        return self._direct(self.d_number, self.v_number)
+
+    def d_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        m = self._reg_p_number1.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            p2 = pos
+            n2 = len(nodes)
+            if contents.startswith(".", pos, end):
+                nodes.append(self._terminal(".", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                m = self._reg_p_number1.match(contents, pos, end)
+                if m:
+                    e = m.end()
+                    nodes.append(self._terminal(m.group(), pos, e))
+                    pos = e
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        p1 = pos
+        m = self._reg_p_number1.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            p2 = pos
+            if contents.startswith(".", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                m = self._reg_p_number1.match(contents, pos, end)
+                if m:
+                    pos = m.end()
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_name0 = regex.compile("[a-z_][a-z0-9_]*", regex.I | regex.M)
+
+    def p_name(self):
+        # Name <- !Keyword r"[a-z_][a-z0-9_]*":I
+        return self._direct(self.d_name, self.v_name)
+
+    def d_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        p2 = pos
+        successes, failures = tables[3]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_keyword(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        pos = p2
+        ok = not ok
+        if ok:
+            m = self._reg_p_name0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        p2 = pos
+        successes, failures = tables[3]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_keyword(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        pos = p2
+        ok = not ok
+        if ok:
+            m = self._reg_p_name0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_str(self):
+        # Str <- _STR
+        return self._direct(self.d_str, self.v_str)
+
+    def d_str(self, pos):
+        nodes = []
+        e, res = self.dt__str(pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_str(self, pos):
+        e = self.vt__str(pos)
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_op0 = regex.compile("[-+*/]", regex.M)
+
+    _reg_p_op1 = regex.compile("\\(", regex.M)
+
+    _reg_p_op2 = regex.compile("\\)", regex.M)
+
+    def p_op(self):
+        # Op <- r"[-+*/]" / r"\(" / r"\)" / "==" / "="
+        return self._direct(self.d_op, self.v_op)
+
+    def d_op(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '*+-/':
+            m = self._reg_p_op0.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '('):
+            m = self._reg_p_op1.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in ')'):
+            m = self._reg_p_op2.match(contents, pos, end)
+            if m:
+                e = m.end()
+                nodes.append(self._terminal(m.group(), pos, e))
+                pos = e
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '='):
+            if contents.startswith("==", pos, end):
+                nodes.append(self._terminal("==", pos, pos + 2))
+                pos += 2
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '='):
+            if contents.startswith("=", pos, end):
+                nodes.append(self._terminal("=", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_op(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '*+-/':
+            m = self._reg_p_op0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '('):
+            m = self._reg_p_op1.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in ')'):
+            m = self._reg_p_op2.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '='):
+            if contents.startswith("==", pos, end):
+                pos += 2
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok and (not c1 or c1 in '='):
+            if contents.startswith("=", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_empty0 = regex.compile(';|')
+
+    def p_empty(self):
+        # Empty <- ";" / ""
+        return self._direct(self.d_empty, self.v_empty)
+
+    def d_empty(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_empty0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_empty(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_empty0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_t__str0 = regex.compile("[^']*", regex.M)
+
+    _reg_t__str1 = regex.compile('[^"]*', regex.M)
+
+    def dt__str(self, pos):
+        # _STR <- "'" r"[^']*" "'" / '"' r'[^"]*' '"'
+        e = self.vt__str(pos)
+        if e < 0:
+            return -1, None
+        if e > pos:
+            return e, [self._terminal(self._contents[pos:e], pos, e)]
+        return e, []
+
+    def vt__str(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in "'":
+            p2 = pos
+            if contents.startswith("'", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                m = self._reg_t__str0.match(contents, pos, end)
+                if m:
+                    pos = m.end()
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                if contents.startswith("'", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '"'):
+            p3 = pos
+            if contents.startswith('"', pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                m = self._reg_t__str1.match(contents, pos, end)
+                if m:
+                    pos = m.end()
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                if contents.startswith('"', pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p3
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_spacing0 = regex.compile("[ \\t]+|\\r?\\n", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"[ \t]+|\r?\n"
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
@@ -0,0 +1,97 @@
+from tacparser import Parser
+import regex
+
+
+class LeftRecursion(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self.def_dict = {"Program": self.p_program,
+                         "Expr": self.p_expr,
+                         "Term": self.p_term,
+                         "Primary": self.p_primary,
+                         "Postfix": self.p_postfix,
+                         "Number": self.p_number,
+                         "Name": self.p_name}
+        self.left_recursion = {"Expr": True,
+                               "Term": True,
+                               "Primary": True,
+                               "Postfix": False}
+
+    def p_program(self):
+        # # 左再帰 (直接、間接) の規則
+        # Program <- Expr _EOF
+        return self._seq(self._p(self.p_expr, "Expr"),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_expr(self):
+        # Expr <- Expr "+" Term / Expr "-" Term / Term
+        return self._sel(self._seq(self._p(self.p_expr, "Expr"),
+                                   self._l("+"),
+                                   self._p(self.p_term, "Term")
+                                   ),
+                         self._seq(self._p(self.p_expr, "Expr"),
+                                   self._l("-"),
+                                   self._p(self.p_term, "Term")
+                                   ),
+                         self._p(self.p_term, "Term"),
+                         first=('(0123456789abcdefghijklmnopqrstuvwxyz', '(0123456789abcdefghijklmnopqrstuvwxyz', '(0123456789abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    def p_term(self):
+        # Term <- Term "*" Primary / Term "/" Primary / Primary
+        return self._sel(self._seq(self._p(self.p_term, "Term"),
+                                   self._l("*"),
+                                   self._p(self.p_primary, "Primary")
+                                   ),
+                         self._seq(self._p(self.p_term, "Term"),
+                                   self._l("/"),
+                                   self._p(self.p_primary, "Primary")
+                                   ),
+                         self._p(self.p_primary, "Primary"),
+                         first=('(0123456789abcdefghijklmnopqrstuvwxyz', '(0123456789abcdefghijklmnopqrstuvwxyz', '(0123456789abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    def p_primary(self):
+        # Primary <- Postfix / Number / Name / "(" Expr ")"
+        return self._sel(self._p(self.p_postfix, "Postfix"),
+                         self._p(self.p_number, "Number"),
+                         self._p(self.p_name, "Name"),
+                         self._seq(self._l("("),
+                                   self._p(self.p_expr, "Expr"),
+                                   self._l(")")
+                                   ),
+                         first=('(0123456789abcdefghijklmnopqrstuvwxyz', '0123456789', 'abcdefghijklmnopqrstuvwxyz', '(')
+                         )
+
+    def p_postfix(self):
+        # Postfix <- Primary "[" Expr "]" / Primary "." Name
+        return self._sel(self._seq(self._p(self.p_primary, "Primary"),
+                                   self._l("["),
+                                   self._p(self.p_expr, "Expr"),
+                                   self._l("]")
+                                   ),
+                         self._seq(self._p(self.p_primary, "Primary"),
+                                   self._l("."),
+                                   self._p(self.p_name, "Name")
+                                   ),
+                         first=('(0123456789abcdefghijklmnopqrstuvwxyz', '(0123456789abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+"
+        return self._r(self._reg_p_number0)
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+"
+        return self._r(self._reg_p_name0)
@@ -0,0 +1,779 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class LeftRecursionDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self._rule_ids = {"Expr": 0,
+                          "_EOF": 1,
+                          "Term": 2,
+                          "Primary": 3,
+                          "Postfix": 4,
+                          "Number": 5,
+                          "Name": 6}
+        self.def_dict = {"Program": self.p_program,
+                         "Expr": self.p_expr,
+                         "Term": self.p_term,
+                         "Primary": self.p_primary,
+                         "Postfix": self.p_postfix,
+                         "Number": self.p_number,
+                         "Name": self.p_name}
+        self.left_recursion = {"Expr": True,
+                               "Term": True,
+                               "Primary": True,
+                               "Postfix": False}
+
+    def p_program(self):
+        # # 左再帰 (直接、間接) の規則
+        # Program <- Expr _EOF
+        return self._direct(self.d_program, self.v_program)
+
+    def d_program(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 0)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_program(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        e = self._recognize_direct_left_recursive(self.v_expr, pos, 0)
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_expr(self):
+        # Expr <- Expr "+" Term / Expr "-" Term / Term
+        return self._direct(self.d_expr, self.v_expr)
+
+    def d_expr(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 0)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("+", pos, end):
+                    nodes.append(self._terminal("+", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_term, pos, "Term", 2)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            n3 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 0)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("-", pos, end):
+                    nodes.append(self._terminal("-", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_term, pos, "Term", 2)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            e, res = self._direct_left_recursive(self.d_term, pos, "Term", 2)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_expr(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            e = self._recognize_direct_left_recursive(self.v_expr, pos, 0)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("+", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_term, pos, 2)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            e = self._recognize_direct_left_recursive(self.v_expr, pos, 0)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("-", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_term, pos, 2)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p3
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            e = self._recognize_direct_left_recursive(self.v_term, pos, 2)
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_term(self):
+        # Term <- Term "*" Primary / Term "/" Primary / Primary
+        return self._direct(self.d_term, self.v_term)
+
+    def d_term(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_term, pos, "Term", 2)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("*", pos, end):
+                    nodes.append(self._terminal("*", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_primary, pos, "Primary", 3)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            n3 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_term, pos, "Term", 2)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("/", pos, end):
+                    nodes.append(self._terminal("/", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_primary, pos, "Primary", 3)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            e, res = self._direct_left_recursive(self.d_primary, pos, "Primary", 3)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_term(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            e = self._recognize_direct_left_recursive(self.v_term, pos, 2)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("*", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_primary, pos, 3)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            e = self._recognize_direct_left_recursive(self.v_term, pos, 2)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("/", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_primary, pos, 3)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p3
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            e = self._recognize_direct_left_recursive(self.v_primary, pos, 3)
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_primary(self):
+        # Primary <- Postfix / Number / Name / "(" Expr ")"
+        return self._direct(self.d_primary, self.v_primary)
+
+    def d_primary(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            e, res = self.d_postfix(pos)
+            if e >= 0:
+                res = self._create_result("Postfix", tuple(res), pos, e)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '0123456789'):
+            successes, failures = tables[5]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_number(pos)
+                    if e >= 0:
+                        res = self._direct_node("Number", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[6]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_name(pos)
+                    if e >= 0:
+                        res = self._direct_node("Name", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok and (not c1 or c1 in '('):
+            p2 = pos
+            n2 = len(nodes)
+            if contents.startswith("(", pos, end):
+                nodes.append(self._terminal("(", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 0)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                if contents.startswith(")", pos, end):
+                    nodes.append(self._terminal(")", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_primary(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            e = self.v_postfix(pos)
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '0123456789'):
+            successes, failures = tables[5]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_number(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[6]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_name(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok and (not c1 or c1 in '('):
+            p2 = pos
+            if contents.startswith("(", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_expr, pos, 0)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                if contents.startswith(")", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+        if ok:
+            return pos
+        return -1
+
+    def p_postfix(self):
+        # Postfix <- Primary "[" Expr "]" / Primary "." Name
+        return self._direct(self.d_postfix, self.v_postfix)
+
+    def d_postfix(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_primary, pos, "Primary", 3)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("[", pos, end):
+                    nodes.append(self._terminal("[", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 0)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if ok:
+                if contents.startswith("]", pos, end):
+                    nodes.append(self._terminal("]", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            n3 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_primary, pos, "Primary", 3)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith(".", pos, end):
+                    nodes.append(self._terminal(".", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                successes, failures = tables[6]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_name(pos)
+                        if e >= 0:
+                            res = self._direct_node("Name", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_postfix(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            e = self._recognize_direct_left_recursive(self.v_primary, pos, 3)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("[", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                e = self._recognize_direct_left_recursive(self.v_expr, pos, 0)
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if ok:
+                if contents.startswith("]", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in '(0123456789abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            e = self._recognize_direct_left_recursive(self.v_primary, pos, 3)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith(".", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                successes, failures = tables[6]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_name(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p3
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+"
+        return self._direct(self.d_number, self.v_number)
+
+    def d_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_number(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_number0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+"
+        return self._direct(self.d_name, self.v_name)
+
+    def d_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
@@ -0,0 +1,97 @@
+from tacparser import Parser
+import regex
+
+
+class Links(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self.def_dict = {"Program": self.p_program,
+                         "Statement": self.p_statement,
+                         "Wrap": self.p_wrap,
+                         "Other": self.p_other,
+                         "Call": self.p_call,
+                         "Expr": self.p_expr,
+                         "Name": self.p_name,
+                         "Spacing": self.p_spacing}
+        self.left_recursion = {"Expr": True}
+
+    def p_program(self):
+        # # メモから再利用したノードが、後で作成されて構文木に含まれない別のノードの子にもなる規則
+        # # Wrap と Other は同じ Call を子に持ち、Other は Call の後ろに Spacing を持つ
+        # Program <- ( Statement Spacing? )* _EOF
+        return self._seq(self._rpt(self._seq(self._p(self.p_statement, "Statement"),
+                                             self._opt(self._p(self.p_spacing, "Spacing"))
+                                             ), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_statement(self):
+        # Statement <- Wrap Spacing? ";" / Other ";" / Wrap Spacing? "." / Expr "!"
+        return self._sel(self._seq(self._p(self.p_wrap, "Wrap"),
+                                   self._opt(self._p(self.p_spacing, "Spacing")),
+                                   self._l(";")
+                                   ),
+                         self._seq(self._p(self.p_other, "Other"),
+                                   self._l(";")
+                                   ),
+                         self._seq(self._p(self.p_wrap, "Wrap"),
+                                   self._opt(self._p(self.p_spacing, "Spacing")),
+                                   self._l(".")
+                                   ),
+                         self._seq(self._p(self.p_expr, "Expr"),
+                                   self._l("!")
+                                   ),
+                         first=('abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    def p_wrap(self):
+        # Wrap <- Call
+        return self._p(self.p_call, "Call")
+
+    def p_other(self):
+        # Other <- Call Spacing?
+        return self._seq(self._p(self.p_call, "Call"),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    def p_call(self):
+        # Call <- Name Spacing? "(" Spacing? ( Expr Spacing? )* ")"
+        return self._seq(self._p(self.p_name, "Name"),
+                         self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._l("("),
+                         self._opt(self._p(self.p_spacing, "Spacing")),
+                         self._rpt(self._seq(self._p(self.p_expr, "Expr"),
+                                             self._opt(self._p(self.p_spacing, "Spacing"))
+                                             ), 0),
+                         self._l(")")
+                         )
+
+    def p_expr(self):
+        # Expr <- Expr Spacing? "+" Spacing? Name / Name
+        return self._sel(self._seq(self._p(self.p_expr, "Expr"),
+                                   self._opt(self._p(self.p_spacing, "Spacing")),
+                                   self._l("+"),
+                                   self._opt(self._p(self.p_spacing, "Spacing")),
+                                   self._p(self.p_name, "Name")
+                                   ),
+                         self._p(self.p_name, "Name"),
+                         first=('abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+"
+        return self._r(self._reg_p_name0)
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._r(self._reg_p_spacing0)
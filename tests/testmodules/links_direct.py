@@ -0,0 +1,1222 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class LinksDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self._rule_ids = {"Statement": 0,
+                          "Spacing": 1,
+                          "_EOF": 2,
+                          "Wrap": 3,
+                          "Other": 4,
+                          "Expr": 5,
+                          "Call": 6,
+                          "Name": 7}
+        self.def_dict = {"Program": self.p_program,
+                         "Statement": self.p_statement,
+                         "Wrap": self.p_wrap,
+                         "Other": self.p_other,
+                         "Call": self.p_call,
+                         "Expr": self.p_expr,
+                         "Name": self.p_name,
+                         "Spacing": self.p_spacing}
+        self.left_recursion = {"Expr": True}
+
+    def p_program(self):
+        # # メモから再利用したノードが、後で作成されて構文木に含まれない別のノードの子にもなる規則
+        # # Wrap と Other は同じ Call を子に持ち、Other は Call の後ろに Spacing を持つ
+        # Program <- ( Statement Spacing? )* _EOF
+        return self._direct(self.d_program, self.v_program)
+
+    def d_program(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        while True:
+            q2 = pos
+            m2 = len(nodes)
+            p3 = pos
+            n3 = len(nodes)
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_statement(pos)
+                    if e >= 0:
+                        res = self._direct_node("Statement", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+            if not ok:
+                break
+            if pos == q2:
+                del nodes[m2:]
+                break
+        ok = True
+        if ok:
+            successes, failures = tables[2]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_program(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        while True:
+            q2 = pos
+            p3 = pos
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_statement(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if not ok:
+                pos = p3
+            if not ok:
+                break
+            if pos == q2:
+                break
+        ok = True
+        if ok:
+            successes, failures = tables[2]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_statement(self):
+        # Statement <- Wrap Spacing? ";" / Other ";" / Wrap Spacing? "." / Expr "!"
+        return self._direct(self.d_statement, self.v_statement)
+
+    def d_statement(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_wrap(pos)
+                    if e >= 0:
+                        res = self._direct_node("Wrap", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith(";", pos, end):
+                    nodes.append(self._terminal(";", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            n3 = len(nodes)
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_other(pos)
+                    if e >= 0:
+                        res = self._direct_node("Other", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith(";", pos, end):
+                    nodes.append(self._terminal(";", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p3
+                del nodes[n3:]
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p4 = pos
+            n4 = len(nodes)
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_wrap(pos)
+                    if e >= 0:
+                        res = self._direct_node("Wrap", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith(".", pos, end):
+                    nodes.append(self._terminal(".", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p4
+                del nodes[n4:]
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p5 = pos
+            n5 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 5)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                if contents.startswith("!", pos, end):
+                    nodes.append(self._terminal("!", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p5
+                del nodes[n5:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_statement(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_wrap(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith(";", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p3 = pos
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_other(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith(";", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p3
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p4 = pos
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_wrap(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith(".", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p4
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            p5 = pos
+            e = self._recognize_direct_left_recursive(self.v_expr, pos, 5)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                if contents.startswith("!", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if not ok:
+                pos = p5
+        if ok:
+            return pos
+        return -1
+
+    def p_wrap(self):
+        # Wrap <- Call
+        return self._direct(self.d_wrap, self.v_wrap)
+
+    def d_wrap(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        successes, failures = tables[6]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_call(pos)
+                if e >= 0:
+                    res = self._direct_node("Call", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_wrap(self, pos):
+        tables = self._memo_tables
+        successes, failures = tables[6]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_call(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            return pos
+        return -1
+
+    def p_other(self):
+        # Other <- Call Spacing?
+        return self._direct(self.d_other, self.v_other)
+
+    def d_other(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[6]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_call(pos)
+                if e >= 0:
+                    res = self._direct_node("Call", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_other(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[6]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_call(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_call(self):
+        # Call <- Name Spacing? "(" Spacing? ( Expr Spacing? )* ")"
+        return self._direct(self.d_call, self.v_call)
+
+    def d_call(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[7]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_name(pos)
+                if e >= 0:
+                    res = self._direct_node("Name", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith("(", pos, end):
+                nodes.append(self._terminal("(", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if ok:
+            while True:
+                q2 = pos
+                m2 = len(nodes)
+                p3 = pos
+                n3 = len(nodes)
+                e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 5)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                if ok:
+                    successes, failures = tables[1]
+                    res = successes.get(pos)
+                    if res is not None and res.__class__ is not int:
+                        e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                    else:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e, res = self.d_spacing(pos)
+                            if e >= 0:
+                                res = self._direct_node("Spacing", successes, res, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    ok = e >= 0
+                    if ok:
+                        nodes += res
+                        pos = e
+                    ok = True
+                if not ok:
+                    pos = p3
+                    del nodes[n3:]
+                if not ok:
+                    break
+                if pos == q2:
+                    del nodes[m2:]
+                    break
+            ok = True
+        if ok:
+            if contents.startswith(")", pos, end):
+                nodes.append(self._terminal(")", pos, pos + 1))
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_call(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[7]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_name(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            if contents.startswith("(", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if ok:
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if ok:
+            while True:
+                q2 = pos
+                p3 = pos
+                e = self._recognize_direct_left_recursive(self.v_expr, pos, 5)
+                ok = e >= 0
+                if ok:
+                    pos = e
+                if ok:
+                    successes, failures = tables[1]
+                    e = successes.get(pos)
+                    if e is None:
+                        block = failures.get(pos >> BLOCK_BITS)
+                        if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                            e = -1
+                        else:
+                            e = self.v_spacing(pos)
+                            if e >= 0:
+                                self._recognize_success(successes, pos, e)
+                            else:
+                                self._direct_failure(failures, pos)
+                    elif e.__class__ is not int:
+                        e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                    ok = e >= 0
+                    if ok:
+                        pos = e
+                    ok = True
+                if not ok:
+                    pos = p3
+                if not ok:
+                    break
+                if pos == q2:
+                    break
+            ok = True
+        if ok:
+            if contents.startswith(")", pos, end):
+                pos += 1
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_expr(self):
+        # Expr <- Expr Spacing? "+" Spacing? Name / Name
+        return self._direct(self.d_expr, self.v_expr)
+
+    def d_expr(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        nodes = []
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            n2 = len(nodes)
+            e, res = self._direct_left_recursive(self.d_expr, pos, "Expr", 5)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith("+", pos, end):
+                    nodes.append(self._terminal("+", pos, pos + 1))
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                successes, failures = tables[1]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_spacing(pos)
+                        if e >= 0:
+                            res = self._direct_node("Spacing", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+                ok = True
+            if ok:
+                successes, failures = tables[7]
+                res = successes.get(pos)
+                if res is not None and res.__class__ is not int:
+                    e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+                else:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e, res = self.d_name(pos)
+                        if e >= 0:
+                            res = self._direct_node("Name", successes, res, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                ok = e >= 0
+                if ok:
+                    nodes += res
+                    pos = e
+            if not ok:
+                pos = p2
+                del nodes[n2:]
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[7]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_name(pos)
+                    if e >= 0:
+                        res = self._direct_node("Name", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_expr(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        tables = self._memo_tables
+        c1 = contents[pos] if pos < end else ""
+        ok = False
+        if not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz':
+            p2 = pos
+            e = self._recognize_direct_left_recursive(self.v_expr, pos, 5)
+            ok = e >= 0
+            if ok:
+                pos = e
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if ok:
+                if contents.startswith("+", pos, end):
+                    pos += 1
+                    if pos > r.maxposition:
+                        r.maxposition = pos
+                    ok = True
+                else:
+                    ok = False
+            if ok:
+                successes, failures = tables[1]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_spacing(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+                ok = True
+            if ok:
+                successes, failures = tables[7]
+                e = successes.get(pos)
+                if e is None:
+                    block = failures.get(pos >> BLOCK_BITS)
+                    if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                        e = -1
+                    else:
+                        e = self.v_name(pos)
+                        if e >= 0:
+                            self._recognize_success(successes, pos, e)
+                        else:
+                            self._direct_failure(failures, pos)
+                elif e.__class__ is not int:
+                    e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+                ok = e >= 0
+                if ok:
+                    pos = e
+            if not ok:
+                pos = p2
+        if not ok and (not c1 or c1 in 'abcdefghijklmnopqrstuvwxyz'):
+            successes, failures = tables[7]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_name(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+"
+        return self._direct(self.d_name, self.v_name)
+
+    def d_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_name(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_name0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
@@ -0,0 +1,60 @@
+from tacparser import Parser
+import regex
+
+
+class LiteralChoice(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self.def_dict = {"Main": self.p_main,
+                         "Word": self.p_word,
+                         "Keyword": self.p_keyword,
+                         "Op": self.p_op,
+                         "Name": self.p_name,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # # リテラルのみの選択は、一つの正規表現で照合する
+        # Main <- ( Word Spacing? )* _EOF
+        return self._seq(self._rpt(self._seq(self._p(self.p_word, "Word"),
+                                             self._opt(self._p(self.p_spacing, "Spacing"))
+                                             ), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_word(self):
+        # Word <- Keyword / Op / Name
+        return self._sel(self._p(self.p_keyword, "Keyword"),
+                         self._p(self.p_op, "Op"),
+                         self._p(self.p_name, "Name"),
+                         first=('FKSfiksſK', '*.<=', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz')
+                         )
+
+    _reg_p_keyword0 = regex.compile('[sS][eE][lL][eE][cC][tT]|[fF][rR][oO][mM]|k|[kKK][eE][lL][vV][iI][nN]|in|int')
+
+    def p_keyword(self):
+        # Keyword <- "select":I / "from":I / "k" / "kelvin":I / "in" / "int"
+        return self._r(self._reg_p_keyword0)
+
+    _reg_p_op0 = regex.compile('<|<=|<>|=|\\.|\\*')
+
+    def p_op(self):
+        # Op <- "<" / "<=" / "<>" / "=" / "." / "*"
+        return self._r(self._reg_p_op0)
+
+    _reg_p_name0 = regex.compile("[a-zA-Z_][a-zA-Z0-9_]*", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-zA-Z_][a-zA-Z0-9_]*"
+        return self._r(self._reg_p_name0)
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._r(self._reg_p_spacing0)
@@ -0,0 +1,198 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class LoopDirect(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_loop
+        self.toptypename = "Loop"
+        self._rule_ids = {"LoopLine": 0,
+                          "Word": 1}
+        self.def_dict = {"Loop": self.p_loop,
+                         "LoopLine": self.p_loopline,
+                         "Word": self.p_word}
+
+    def p_loop(self):
+        # Loop <- LoopLine*
+        return self._direct(self.d_loop, self.v_loop)
+
+    def d_loop(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        while True:
+            q1 = pos
+            m1 = len(nodes)
+            successes, failures = tables[0]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_loopline(pos)
+                    if e >= 0:
+                        res = self._direct_node("LoopLine", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                del nodes[m1:]
+                break
+        ok = True
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_loop(self, pos):
+        tables = self._memo_tables
+        while True:
+            q1 = pos
+            successes, failures = tables[0]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_loopline(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                break
+        ok = True
+        if ok:
+            return pos
+        return -1
+
+    def p_loopline(self):
+        # LoopLine <- Word*
+        return self._direct(self.d_loopline, self.v_loopline)
+
+    def d_loopline(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        while True:
+            q1 = pos
+            m1 = len(nodes)
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_word(pos)
+                    if e >= 0:
+                        res = self._direct_node("Word", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                del nodes[m1:]
+                break
+        ok = True
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_loopline(self, pos):
+        tables = self._memo_tables
+        while True:
+            q1 = pos
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_word(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            if not ok:
+                break
+            if pos == q1:
+                break
+        ok = True
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_word0 = regex.compile("[a-zA-Z]*", regex.M)
+
+    def p_word(self):
+        # Word <- r"[a-zA-Z]*"
+        return self._direct(self.d_word, self.v_word)
+
+    def d_word(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_word0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_word(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_word0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
@@ -53,11 +53,11 @@ class Macro01(Parser):
         # _FUGA <- "FUGA"*
         return self._rpt(self._l("FUGA"), 0)
 
+    _reg_t__piyo0 = regex.compile('PIYO|piyo')
+
     def t__piyo(self):
         # _PIYO <- ( "PIYO" / "piyo" )*
-        return self._rpt(self._sel(self._l("PIYO"),
-                                   self._l("piyo")
-                                   ), 0)
+        return self._rpt(self._r(self._reg_t__piyo0), 0)
 
     _reg_p_spacing0 = regex.compile("\\s+", regex.M)
 
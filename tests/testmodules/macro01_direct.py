@@ -0,0 +1,549 @@
+from tacparser import Parser
+from tacparser.memo import BLOCK_BITS, BYTE_MASK, SplicedNodes
+import regex
+
+
+class Macro01Direct(Parser):
+
+    needs_str_contents = True
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self._rule_ids = {"Hoge": 0,
+                          "Fuga": 1,
+                          "Piyo": 2,
+                          "_EOF": 3,
+                          "Spacing": 4}
+        self.def_dict = {"Main": self.p_main,
+                         "Hoge": self.p_hoge,
+                         "Fuga": self.p_fuga,
+                         "Piyo": self.p_piyo,
+                         "Spacing": self.p_spacing}
+
+    def p_main(self):
+        # Main <- Hoge Fuga Piyo _EOF
+        return self._direct(self.d_main, self.v_main)
+
+    def d_main(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        successes, failures = tables[0]
+        res = successes.get(pos)
+        if res is not None and res.__class__ is not int:
+            e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+        else:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e, res = self.d_hoge(pos)
+                if e >= 0:
+                    res = self._direct_node("Hoge", successes, res, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_fuga(pos)
+                    if e >= 0:
+                        res = self._direct_node("Fuga", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[2]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_piyo(pos)
+                    if e >= 0:
+                        res = self._direct_node("Piyo", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if ok:
+            successes, failures = tables[3]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self._direct_eof(pos)
+                    if e >= 0:
+                        res = self._direct_node("_EOF", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_main(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        successes, failures = tables[0]
+        e = successes.get(pos)
+        if e is None:
+            block = failures.get(pos >> BLOCK_BITS)
+            if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                e = -1
+            else:
+                e = self.v_hoge(pos)
+                if e >= 0:
+                    self._recognize_success(successes, pos, e)
+                else:
+                    self._direct_failure(failures, pos)
+        elif e.__class__ is not int:
+            e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[1]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_fuga(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[2]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_piyo(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if ok:
+            successes, failures = tables[3]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self._recognize_eof(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_hoge(self):
+        # Hoge <- _HOGE Spacing?
+        return self._direct(self.d_hoge, self.v_hoge)
+
+    def d_hoge(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        e, res = self.dt__hoge(pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_hoge(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        e = self.vt__hoge(pos)
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_fuga(self):
+        # Fuga <- _FUGA Spacing?
+        return self._direct(self.d_fuga, self.v_fuga)
+
+    def d_fuga(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        e, res = self.dt__fuga(pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_fuga(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        e = self.vt__fuga(pos)
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    def p_piyo(self):
+        # Piyo <- _PIYO Spacing?
+        return self._direct(self.d_piyo, self.v_piyo)
+
+    def d_piyo(self, pos):
+        tables = self._memo_tables
+        nodes = []
+        p1 = pos
+        n1 = len(nodes)
+        e, res = self.dt__piyo(pos)
+        ok = e >= 0
+        if ok:
+            nodes += res
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            res = successes.get(pos)
+            if res is not None and res.__class__ is not int:
+                e = res.endpos if res.__class__ is SplicedNodes else res[0].endpos
+            else:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e, res = self.d_spacing(pos)
+                    if e >= 0:
+                        res = self._direct_node("Spacing", successes, res, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            ok = e >= 0
+            if ok:
+                nodes += res
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+            del nodes[n1:]
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_piyo(self, pos):
+        tables = self._memo_tables
+        p1 = pos
+        e = self.vt__piyo(pos)
+        ok = e >= 0
+        if ok:
+            pos = e
+        if ok:
+            successes, failures = tables[4]
+            e = successes.get(pos)
+            if e is None:
+                block = failures.get(pos >> BLOCK_BITS)
+                if block is not None and block[(pos >> 3) & BYTE_MASK] & (1 << (pos & 7)):
+                    e = -1
+                else:
+                    e = self.v_spacing(pos)
+                    if e >= 0:
+                        self._recognize_success(successes, pos, e)
+                    else:
+                        self._direct_failure(failures, pos)
+            elif e.__class__ is not int:
+                e = e.endpos if e.__class__ is SplicedNodes else e[0].endpos
+            ok = e >= 0
+            if ok:
+                pos = e
+            ok = True
+        if not ok:
+            pos = p1
+        if ok:
+            return pos
+        return -1
+
+    _reg_t__hoge0 = regex.compile("(hoge)+", regex.I | regex.M)
+
+    def dt__hoge(self, pos):
+        # _HOGE <- r"(hoge)+":I
+        e = self.vt__hoge(pos)
+        if e < 0:
+            return -1, None
+        if e > pos:
+            return e, [self._terminal(self._contents[pos:e], pos, e)]
+        return e, []
+
+    def vt__hoge(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_t__hoge0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
+
+    def dt__fuga(self, pos):
+        # _FUGA <- "FUGA"*
+        e = self.vt__fuga(pos)
+        if e < 0:
+            return -1, None
+        if e > pos:
+            return e, [self._terminal(self._contents[pos:e], pos, e)]
+        return e, []
+
+    def vt__fuga(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        while True:
+            q1 = pos
+            if contents.startswith("FUGA", pos, end):
+                pos += 4
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if not ok:
+                break
+            if pos == q1:
+                break
+        ok = True
+        if ok:
+            return pos
+        return -1
+
+    _reg_t__piyo0 = regex.compile('PIYO|piyo')
+
+    def dt__piyo(self, pos):
+        # _PIYO <- ( "PIYO" / "piyo" )*
+        e = self.vt__piyo(pos)
+        if e < 0:
+            return -1, None
+        if e > pos:
+            return e, [self._terminal(self._contents[pos:e], pos, e)]
+        return e, []
+
+    def vt__piyo(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        while True:
+            q1 = pos
+            m = self._reg_t__piyo0.match(contents, pos, end)
+            if m:
+                pos = m.end()
+                if pos > r.maxposition:
+                    r.maxposition = pos
+                ok = True
+            else:
+                ok = False
+            if not ok:
+                break
+            if pos == q1:
+                break
+        ok = True
+        if ok:
+            return pos
+        return -1
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._direct(self.d_spacing, self.v_spacing)
+
+    def d_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        nodes = []
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            e = m.end()
+            nodes.append(self._terminal(m.group(), pos, e))
+            pos = e
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos, nodes
+        return -1, None
+
+    def v_spacing(self, pos):
+        r = self._reader
+        contents = self._contents
+        end = self._endpos
+        m = self._reg_p_spacing0.match(contents, pos, end)
+        if m:
+            pos = m.end()
+            if pos > r.maxposition:
+                r.maxposition = pos
+            ok = True
+        else:
+            ok = False
+        if ok:
+            return pos
+        return -1
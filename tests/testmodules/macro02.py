@@ -43,7 +43,8 @@ class Macro02(Parser):
                          self._seq(self._trm(self.t__hoge),
                                    self._opt(self._p(self.p_spacing, "Spacing")),
                                    self._and(self._trm(self.t__fuga))
-                                   )
+                                   ),
+                         first=('M', None)
                          )
 
     def p_fuga(self):
@@ -80,11 +81,11 @@ class Macro02(Parser):
         # _FUGA <- "FUGA"+
         return self._rpt(self._l("FUGA"), 1)
 
+    _reg_t__piyo0 = regex.compile('PIYO|piyo')
+
     def t__piyo(self):
         # _PIYO <- ( "PIYO" / "piyo" ){1,3}
-        return self._rpt(self._sel(self._l("PIYO"),
-                                   self._l("piyo")
-                                   ), 1,3)
+        return self._rpt(self._r(self._reg_t__piyo0), 1,3)
 
     _reg_t__miss0 = regex.compile("\\s+", regex.M)
 
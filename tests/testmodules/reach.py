@@ -0,0 +1,99 @@
+from tacparser import Parser
+import regex
+
+
+class Reach(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_main
+        self.toptypename = "Main"
+        self.def_dict = {"Main": self.p_main,
+                         "Token": self.p_token,
+                         "Str": self.p_str,
+                         "Word": self.p_word,
+                         "Spacing": self.p_spacing,
+                         "S": self.p_s,
+                         "X": self.p_x,
+                         "Y": self.p_y,
+                         "A": self.p_a,
+                         "NL": self.p_nl}
+
+    def p_main(self):
+        # # 差分の再解析 (incremental) で、メモの参照範囲を確認する規則
+        # # Str は、閉じていない引用符から改行をまたいで照合して失敗する
+        # Main <- Token* _EOF
+        return self._seq(self._rpt(self._p(self.p_token, "Token"), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_token(self):
+        # Token <- Str / Word / Spacing
+        return self._sel(self._p(self.p_str, "Str"),
+                         self._p(self.p_word, "Word"),
+                         self._p(self.p_spacing, "Spacing"),
+                         first=('"', 'abcdefghijklmnopqrstuvwxyz', None)
+                         )
+
+    _reg_p_str0 = regex.compile('"[^"]*"', regex.M)
+
+    def p_str(self):
+        # Str <- r'"[^"]*"' Spacing?
+        return self._seq(self._r(self._reg_p_str0),
+                         self._opt(self._p(self.p_spacing, "Spacing"))
+                         )
+
+    _reg_p_word0 = regex.compile("[a-z]+", regex.M)
+
+    def p_word(self):
+        # Word <- r"[a-z]+"
+        return self._r(self._reg_p_word0)
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- r"\s+"
+        return self._r(self._reg_p_spacing0)
+
+    def p_s(self):
+        # # Y は X で失敗した A のメモを使用する
+        # S <- X / Y
+        return self._sel(self._p(self.p_x, "X"),
+                         self._p(self.p_y, "Y"),
+                         first=('a', 'az')
+                         )
+
+    def p_x(self):
+        # X <- A "!"
+        return self._seq(self._p(self.p_a, "A"),
+                         self._l("!")
+                         )
+
+    def p_y(self):
+        # Y <- A "?" / "z"
+        return self._sel(self._seq(self._p(self.p_a, "A"),
+                                   self._l("?")
+                                   ),
+                         self._l("z"),
+                         first=('a', 'z')
+                         )
+
+    def p_a(self):
+        # A <- "a" NL "b" NL "c" NL "d"
+        return self._seq(self._l("a"),
+                         self._p(self.p_nl, "NL"),
+                         self._l("b"),
+                         self._p(self.p_nl, "NL"),
+                         self._l("c"),
+                         self._p(self.p_nl, "NL"),
+                         self._l("d")
+                         )
+
+    _reg_p_nl0 = regex.compile("\\n", regex.M)
+
+    def p_nl(self):
+        # NL <- r"\n"
+        return self._r(self._reg_p_nl0)
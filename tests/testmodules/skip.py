@@ -0,0 +1,142 @@
+from tacparser import Parser
+import regex
+
+
+class Skip(Parser):
+
+    def __init__(self, logger=None):
+        if logger is not None:
+            Parser.__init__(self, logger)
+        else:
+            Parser.__init__(self)
+        self.top = self.p_program
+        self.toptypename = "Program"
+        self.def_dict = {"Program": self.p_program,
+                         "Statement": self.p_statement,
+                         "Assign": self.p_assign,
+                         "Call": self.p_call,
+                         "Expr": self.p_expr,
+                         "Term": self.p_term,
+                         "Keyword": self.p_keyword,
+                         "Name": self.p_name,
+                         "Number": self.p_number,
+                         "Spacing": self.p_spacing,
+                         "Comment": self.p_comment}
+        self.left_recursion = {"Expr": True}
+
+    def p_program(self):
+        # # 読み飛ばし (>>)、先読み (&, !) の中で呼び出した規則はノードを作成しない
+        # # Call, Expr, Name は先読みとノードを作成する位置の両方から呼び出す
+        # Program <- >>Spacing? ( Statement >>Spacing? )* _EOF
+        return self._seq(self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                         self._rpt(self._seq(self._p(self.p_statement, "Statement"),
+                                             self._skip(self._opt(self._p(self.p_spacing, "Spacing")))
+                                             ), 0),
+                         self._p(self._eof, "_EOF")
+                         )
+
+    def p_statement(self):
+        # Statement <- Assign / &Call Call / &Expr Expr >>";"
+        return self._sel(self._p(self.p_assign, "Assign"),
+                         self._seq(self._and(self._p(self.p_call, "Call")),
+                                   self._p(self.p_call, "Call")
+                                   ),
+                         self._seq(self._and(self._p(self.p_expr, "Expr")),
+                                   self._p(self.p_expr, "Expr"),
+                                   self._skip(self._l(";"))
+                                   ),
+                         first=('abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz', "'0123456789abcdefghijklmnopqrstuvwxyz")
+                         )
+
+    def p_assign(self):
+        # Assign <- !Keyword Name >>Spacing? >>"=" >>Spacing? Expr >>";"
+        return self._seq(self._not(self._p(self.p_keyword, "Keyword")),
+                         self._p(self.p_name, "Name"),
+                         self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                         self._skip(self._l("=")),
+                         self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                         self._p(self.p_expr, "Expr"),
+                         self._skip(self._l(";"))
+                         )
+
+    def p_call(self):
+        # Call <- Name >>"(" >>Spacing? Expr? >>Spacing? >>")" >>";"
+        return self._seq(self._p(self.p_name, "Name"),
+                         self._skip(self._l("(")),
+                         self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                         self._opt(self._p(self.p_expr, "Expr")),
+                         self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                         self._skip(self._l(")")),
+                         self._skip(self._l(";"))
+                         )
+
+    def p_expr(self):
+        # Expr <- Expr >>Spacing? "+" >>Spacing? Term / Term
+        return self._sel(self._seq(self._p(self.p_expr, "Expr"),
+                                   self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                                   self._l("+"),
+                                   self._skip(self._opt(self._p(self.p_spacing, "Spacing"))),
+                                   self._p(self.p_term, "Term")
+                                   ),
+                         self._p(self.p_term, "Term"),
+                         first=("'0123456789abcdefghijklmnopqrstuvwxyz", "'0123456789abcdefghijklmnopqrstuvwxyz")
+                         )
+
+    def p_term(self):
+        # Term <- Number / !_STR &Name Name / _STR
+        return self._sel(self._p(self.p_number, "Number"),
+                         self._seq(self._not(self._trm(self.t__str)),
+                                   self._and(self._p(self.p_name, "Name")),
+                                   self._p(self.p_name, "Name")
+                                   ),
+                         self._trm(self.t__str),
+                         first=('0123456789', "'abcdefghijklmnopqrstuvwxyz", "'")
+                         )
+
+    _reg_p_keyword0 = regex.compile("[a-z]", regex.M)
+
+    _reg_p_keyword1 = regex.compile('if|while')
+
+    def p_keyword(self):
+        # Keyword <- ( "if" / "while" ) !r"[a-z]"
+        return self._seq(self._r(self._reg_p_keyword1),
+                         self._not(self._r(self._reg_p_keyword0))
+                         )
+
+    _reg_p_name0 = regex.compile("[a-z]+", regex.M)
+
+    def p_name(self):
+        # Name <- r"[a-z]+"
+        return self._r(self._reg_p_name0)
+
+    _reg_p_number0 = regex.compile("[0-9]+", regex.M)
+
+    def p_number(self):
+        # Number <- r"[0-9]+"
+        return self._r(self._reg_p_number0)
+
+    _reg_t__str0 = regex.compile("[^']*", regex.M)
+
+    def t__str(self):
+        # _STR <- "'" r"[^']*" "'"
+        return self._seq(self._l("'"),
+                         self._r(self._reg_t__str0),
+                         self._l("'")
+                         )
+
+    _reg_p_spacing0 = regex.compile("\\s+", regex.M)
+
+    def p_spacing(self):
+        # Spacing <- ( r"\s+" / Comment )+
+        return self._rpt(self._sel(self._r(self._reg_p_spacing0),
+                                   self._p(self.p_comment, "Comment"),
+                                   first=(None, '#')
+                                   ), 1)
+
+    _reg_p_comment0 = regex.compile("[^\\n]*", regex.M)
+
+    def p_comment(self):
+        # Comment <- "#" r"[^\n]*"
+        return self._seq(self._l("#"),
+                         self._r(self._reg_p_comment0)
+                         )
@@ -44,7 +44,8 @@ class SubDef01(Parser):
         return self._rpt(self._sel(self._p(self.p_foo, "Foo"),
                                    self._p(self.p_bar, "Bar"),
                                    self._p(self.p_baz, "Baz"),
-                                   self._p(self.p_qux, "Qux")
+                                   self._p(self.p_qux, "Qux"),
+                                   first=('F', 'B', 'B', 'Q')
                                    ), 1)
 
     def p_foo(self):
@@ -93,7 +94,8 @@ class SubDef01(Parser):
                                    self._p(self.p_foo, "Foo"),
                                    self._p(self.p_bar, "Bar"),
                                    self._p(self.p_baz, "Baz"),
-                                   self._p(self.p_qux, "Qux")
+                                   self._p(self.p_qux, "Qux"),
+                                   first=('F', 'B', 'B', 'Q', 'F', 'B', 'B', 'Q')
                                    ), 1)
 
     def p_foofoo(self):
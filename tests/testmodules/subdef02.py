@@ -24,7 +24,8 @@ class SubDef02(Parser):
         # Subdef02 <- ( Comment / Literal / Other )*
         return self._rpt(self._sel(self._p(self.p_comment, "Comment"),
                                    self._p(self.p_literal, "Literal"),
-                                   self._p(self.p_other, "Other")
+                                   self._p(self.p_other, "Other"),
+                                   first=('#', None, None)
                                    ), 0)
 
     _reg_p_comment0 = regex.compile("#.+$", regex.M)
@@ -48,7 +49,8 @@ class SubDef02(Parser):
     def s_other(self):
         # Other <-- ( Word / Spacing )+
         return self._rpt(self._sel(self._p(self.p_word, "Word"),
-                                   self._p(self.p_spacing, "Spacing")
+                                   self._p(self.p_spacing, "Spacing"),
+                                   first=(None, '\t\n\r ')
                                    ), 1)
 
     _reg_p_word0 = regex.compile("[a-zA-Z0-9_.-:&%$!/|\\\\]+", regex.M)